@@ -0,0 +1,410 @@
+import math, time, heapq, itertools, threading
+
+# 우선순위 (숫자가 작을수록 먼저 입장)
+PRIORITY_HIGH   = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW    = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_HIGH   : 'high',
+    PRIORITY_NORMAL : 'normal',
+    PRIORITY_LOW    : 'low'
+}
+PRIORITY_VALUES = {name : priority for priority, name in PRIORITY_NAMES.items()}
+
+# DB_ADMISSION 설정이 없을 때 사용하는 기본값
+DEFAULT_ADMISSION_CONFIG = {
+    'max_active'     : 10,
+    'max_queue'      : 50,
+    'reserved_slots' : 2,
+    'wait_timeout'   : {
+        PRIORITY_HIGH   : 5.0,
+        PRIORITY_NORMAL : 2.0,
+        PRIORITY_LOW    : 1.0
+    }
+}
+
+class AdmissionRejected(Exception):
+
+    """
+
+    DB 가 포화 상태라 요청을 받을 수 없을 때 발생합니다.
+
+    Args:
+        reason      : 거절 사유 (QUEUE_FULL, DEADLINE_EXCEEDED, EVICTED, WAIT_TIMEOUT)
+        retry_after : 다시 요청하기까지 권장 대기 시간(초)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason      = reason
+        self.retry_after = retry_after
+
+class AdmissionTicket:
+
+    """
+
+    입장한 요청이 가지고 있는 표입니다. release() 시 자리를 반납합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self, controller, priority):
+        self._controller = controller
+        self._priority   = priority
+        self._admitted   = time.monotonic()
+        self._released   = False
+
+    def release(self):
+
+        # 여러번 release 해도 한번만 반납
+        if self._released:
+            return
+
+        self._released = True
+        self._controller.release(time.monotonic() - self._admitted)
+
+class AdmissionController:
+
+    """
+
+    DB 를 사용하는 요청의 동시 실행 수를 제한하는 admission control 입니다.
+
+    - 동시에 max_active 개의 요청만 입장시키고, 나머지는 우선순위 순서로 대기열(최대 max_queue)에서 기다립니다.
+    - reserved_slots 개의 자리는 PRIORITY_HIGH 요청만 사용할 수 있습니다. (결제 요청이 관리자 목록 조회에 밀리지 않도록)
+    - 대기열이 가득 차면 새 요청보다 우선순위가 낮은 대기 요청을 내보내고, 없으면 새 요청을 거절합니다.
+    - 평균 점유시간으로 예상한 대기시간이 우선순위 별 wait_timeout 을 넘으면 기다리지 않고 바로 거절합니다.
+
+    Args:
+        max_active     : 동시에 입장 가능한 요청 수 (보통 primary pool 의 max_size)
+        max_queue      : 최대 대기 요청 수
+        reserved_slots : PRIORITY_HIGH 전용 자리 수
+        wait_timeout   : 우선순위(또는 'high', 'normal', 'low') 별 최대 대기시간(초) Dictionary
+        name           : 모니터링 시 구분을 위한 이름
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(
+        self,
+        max_active     = 10,
+        max_queue      = 50,
+        reserved_slots = 2,
+        wait_timeout   = None,
+        name           = 'database'
+    ):
+        if reserved_slots >= max_active:
+            raise ValueError('RESERVED_SLOTS_MUST_BE_SMALLER_THAN_MAX_ACTIVE')
+
+        self.max_active     = max_active
+        self.max_queue      = max_queue
+        self.reserved_slots = reserved_slots
+        self.wait_timeout   = {
+            **DEFAULT_ADMISSION_CONFIG['wait_timeout'],
+            **{PRIORITY_VALUES.get(key, key) : value for key, value in (wait_timeout or {}).items()}
+        }
+        self.name           = name
+
+        # (priority, 도착 순서, waiter) heap
+        self._waiters   = []
+        self._sequence  = itertools.count()
+        self._active    = 0
+        self._condition = threading.Condition(threading.Lock())
+
+        # 평균 점유시간(초, 지수 이동 평균)
+        self._avg_hold_time = 0.0
+
+        # 모니터링용 통계
+        self._stats = {
+            PRIORITY_NAMES[priority] : {
+                'admitted'          : 0,
+                'queued'            : 0,
+                'queue_full'        : 0,
+                'deadline_exceeded' : 0,
+                'evicted'           : 0,
+                'wait_timeout'      : 0,
+                'total_wait_time'   : 0.0,
+                'max_wait_time'     : 0.0
+            }
+            for priority in PRIORITY_NAMES
+        }
+
+    def _limit(self, priority):
+
+        # PRIORITY_HIGH 가 아닌 요청은 예약된 자리를 사용할 수 없음
+        return self.max_active if priority == PRIORITY_HIGH else self.max_active - self.reserved_slots
+
+    def _estimate_wait(self, ahead):
+
+        # 앞에 기다리는 요청이 모두 평균 점유시간 만큼 사용한다고 가정한 예상 대기시간
+        return (ahead + 1) * self._avg_hold_time / self.max_active
+
+    def _retry_after(self):
+        return max(1, math.ceil(self._estimate_wait(len(self._waiters))))
+
+    def _dispatch(self):
+
+        # 자리가 있으면 우선순위가 높은 대기 요청부터 입장 (lock 안에서 호출)
+        while self._waiters:
+            priority, sequence, waiter = self._waiters[0]
+
+            if self._active >= self._limit(priority):
+                break
+
+            heapq.heappop(self._waiters)
+            waiter['admitted']  = True
+            self._active       += 1
+
+        self._condition.notify_all()
+
+    def _reject(self, priority, reason, stat_key):
+        self._stats[PRIORITY_NAMES[priority]][stat_key] += 1
+
+        return AdmissionRejected(reason, self._retry_after())
+
+    def _record_admit(self, priority, wait_time):
+        stats = self._stats[PRIORITY_NAMES[priority]]
+
+        stats['admitted']        += 1
+        stats['total_wait_time'] += wait_time
+        stats['max_wait_time']    = max(stats['max_wait_time'], wait_time)
+
+    def acquire(self, priority=PRIORITY_NORMAL):
+
+        """
+
+        요청을 입장시키고 AdmissionTicket 을 Return 합니다.
+
+        Args:
+            priority : PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW
+
+        Returns:
+            AdmissionTicket
+
+        Raises:
+            AdmissionRejected : 대기열이 가득 찼거나, 대기시간이 wait_timeout 을 넘는(넘을 것으로 예상되는) 경우
+
+        """
+
+        started  = time.monotonic()
+        deadline = started + self.wait_timeout[priority]
+
+        with self._condition:
+
+            # 대기 요청이 없고 자리가 있으면 바로 입장
+            if not self._waiters and self._active < self._limit(priority):
+                self._active += 1
+                self._record_admit(priority, 0.0)
+
+                return AdmissionTicket(self, priority)
+
+            # 예상 대기시간이 deadline 을 넘으면 기다리지 않고 바로 거절
+            ahead = sum(1 for waiter in self._waiters if waiter[0] <= priority)
+
+            if self._estimate_wait(ahead) > self.wait_timeout[priority]:
+                raise self._reject(priority, 'DEADLINE_EXCEEDED', 'deadline_exceeded')
+
+            # 대기열이 가득 찬 경우 우선순위가 더 낮은 대기 요청을 내보냄
+            if len(self._waiters) >= self.max_queue:
+                lowest = max(self._waiters)
+
+                if lowest[0] <= priority:
+                    raise self._reject(priority, 'QUEUE_FULL', 'queue_full')
+
+                self._waiters.remove(lowest)
+                heapq.heapify(self._waiters)
+                lowest[2]['evicted'] = True
+
+            waiter = {'admitted' : False, 'evicted' : False}
+            entry  = (priority, next(self._sequence), waiter)
+
+            heapq.heappush(self._waiters, entry)
+            self._stats[PRIORITY_NAMES[priority]]['queued'] += 1
+
+            # 내보내진 요청의 자리에 들어갈 수 있는지 확인
+            self._dispatch()
+
+            while not waiter['admitted']:
+                if waiter['evicted']:
+                    raise self._reject(priority, 'EVICTED', 'evicted')
+
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    raise self._reject(priority, 'WAIT_TIMEOUT', 'wait_timeout')
+
+                self._condition.wait(remaining)
+
+            self._record_admit(priority, time.monotonic() - started)
+
+        return AdmissionTicket(self, priority)
+
+    def release(self, hold_time):
+
+        """
+
+        자리를 반납하고 대기중인 요청을 입장시킵니다.
+
+        Args:
+            hold_time : 자리를 점유한 시간(초)
+
+        """
+
+        with self._condition:
+            self._active        -= 1
+            self._avg_hold_time  = hold_time if not self._avg_hold_time else self._avg_hold_time * 0.9 + hold_time * 0.1
+
+            self._dispatch()
+
+    def stats(self):
+
+        """
+
+        모니터링을 위한 admission control 상태를 Return 합니다.
+
+        Returns:
+            {
+                name           : 이름,
+                active         : 입장한 요청 수,
+                max_active     : 최대 입장 가능 요청 수,
+                reserved_slots : PRIORITY_HIGH 전용 자리 수,
+                queue_depth    : 대기 요청 수,
+                max_queue      : 최대 대기 요청 수,
+                avg_hold_time  : 평균 점유시간(초),
+                priorities     : {
+                    high/normal/low : {
+                        waiting, admitted, queued, queue_full, deadline_exceeded,
+                        evicted, wait_timeout, rejected, avg_wait_time, max_wait_time
+                    }
+                }
+            }
+
+        """
+
+        with self._condition:
+            stats         = {name : dict(stat) for name, stat in self._stats.items()}
+            waiting       = [PRIORITY_NAMES[waiter[0]] for waiter in self._waiters]
+            active        = self._active
+            avg_hold_time = self._avg_hold_time
+
+        for name, stat in stats.items():
+            total_wait_time = stat.pop('total_wait_time')
+
+            stat['waiting']       = waiting.count(name)
+            stat['rejected']      = stat['queue_full'] + stat['deadline_exceeded'] + stat['evicted'] + stat['wait_timeout']
+            stat['avg_wait_time'] = round(total_wait_time / stat['admitted'], 6) if stat['admitted'] else 0.0
+            stat['max_wait_time'] = round(stat['max_wait_time'], 6)
+
+        return {
+            'name'           : self.name,
+            'active'         : active,
+            'max_active'     : self.max_active,
+            'reserved_slots' : self.reserved_slots,
+            'queue_depth'    : len(waiting),
+            'max_queue'      : self.max_queue,
+            'avg_hold_time'  : round(avg_hold_time, 6),
+            'priorities'     : stats
+        }
+
+# create_app() 에서 설정값으로 다시 생성
+admission_controller = None
+
+def init_admission_control(app):
+
+    """
+
+    create_app() 시점에 admission control 을 생성합니다.
+    config 의 DB_ADMISSION 으로 설정하며, 설정이 없으면 primary pool 의 max_size 를 동시 입장 수로 사용합니다.
+    DB_ADMISSION 의 enabled 가 False 이면 admission control 을 사용하지 않습니다.
+
+    Args:
+        app : 플라스크 앱 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    global admission_controller
+
+    config = dict(app.config.get('DB_ADMISSION', {}))
+
+    if not config.pop('enabled', True):
+        admission_controller = None
+        return
+
+    pool_config = app.config.get('DATABASE_POOL', {})
+
+    if 'max_active' not in config and 'max_size' in pool_config:
+        config['max_active'] = pool_config['max_size']
+
+    admission_controller = AdmissionController(**{**DEFAULT_ADMISSION_CONFIG, **config})
+
+def admit(priority=PRIORITY_NORMAL):
+
+    """
+
+    현재 요청을 입장시킵니다. admission control 을 사용하지 않는 경우 None 을 Return 합니다.
+
+    Args:
+        priority : 요청 우선순위
+
+    Returns:
+        AdmissionTicket 또는 None
+
+    Raises:
+        AdmissionRejected : 요청을 받을 수 없는 경우
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if admission_controller is None:
+        return None
+
+    return admission_controller.acquire(priority)
+
+def get_admission_stats():
+
+    """
+
+    admission control 상태를 Return 합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if admission_controller is None:
+        return None
+
+    return admission_controller.stats()
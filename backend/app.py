@@ -5,6 +5,15 @@ from flask      import Flask
 from flask.json import JSONEncoder
 from flask_cors import CORS
 
+from admission       import init_admission_control
+from cache           import register_cache, DEFAULT_CACHE_CONFIG
+from commands        import init_commands
+from connection      import init_connection_pool
+from db_session      import init_db_session
+from dimensions      import init_dimension_cache
+from instrumentation import init_query_instrumentation
+from price_scheduler import init_price_scheduler
+
 from model      import (
     UserDao,
     OrderDao,
@@ -22,6 +31,7 @@ from controller       import (
     service_product_endpoint,
     create_admin_product_endpoints,
     create_service_order_endpoints,
+    create_monitor_endpoints
 )
 
 class CustomJSONEncoder(JSONEncoder):
@@ -63,26 +73,60 @@ def create_app():
     History :
         2020-08-19 (tnwjd060124@gmail.com)  : 초기 생성
         2020-08-25 (sincerity410@gmail.com) : AdminProduct 관련 추가
+        2026-10-18 (tnwjd060124@gmail.com)  : connection pool pre-warm, 모니터링 endpoint 추가
+        2026-10-18 (tnwjd060124@gmail.com)  : request 단위 DB session 반납 등록
+        2026-10-18 (tnwjd060124@gmail.com)  : query 통계 수집 등록
+        2026-10-18 (tnwjd060124@gmail.com)  : DB admission control(load shedding) 등록
+        2026-10-18 (tnwjd060124@gmail.com)  : 상품 catalog cache 생성
+        2026-10-18 (tnwjd060124@gmail.com)  : rebuild-product-catalog 명령 등록
+        2026-10-18 (tnwjd060124@gmail.com)  : ETag / Last-Modified header expose
+        2026-10-18 (tnwjd060124@gmail.com)  : 주문 service 와 catalog cache 공유 (결제 시 재고 cache invalidate)
+        2026-10-18 (tnwjd060124@gmail.com)  : 색상, 사이즈, 카테고리 dimension cache 생성 및 preload
+        2026-10-18 (tnwjd060124@gmail.com)  : 할인 시작/종료 시 할인가를 다시 계산하는 가격 scheduler 등록
     """
 
     app = Flask(__name__)
     app.json_encoder = CustomJSONEncoder
 
-    #CORS 설정
-    CORS(app)
+    #CORS 설정 (query 통계, Retry-After, ETag / Last-Modified header 를 front 에서 읽을 수 있도록 expose)
+    CORS(app, expose_headers=['X-DB-Query-Count', 'X-DB-Time', 'Server-Timing', 'Retry-After', 'ETag', 'Last-Modified'])
 
     #config 설정
     app.config.from_pyfile("config.py")
 
+    # connection pool 생성 및 pre-warm
+    init_connection_pool(app)
+
+    # DB 포화 시 우선순위 별 대기 및 503 Retry-After 응답
+    init_admission_control(app)
+
+    # 요청 종료 시 DB session 반납
+    init_db_session(app)
+
+    # 요청 별 query 수, DB 시간 측정 및 query budget, N+1 확인
+    init_query_instrumentation(app)
+
+    # flask CLI 명령 등록
+    init_commands(app)
+
     # DAO 생성
     user_dao = UserDao()
     order_dao = OrderDao()
     product_dao = ProductDao()
 
+    # 상품 catalog cache (결제 시 재고 변경도 invalidate 하도록 주문 service 와 함께 사용)
+    catalog_cache = register_cache(name='catalog', **{**DEFAULT_CACHE_CONFIG, **app.config.get('CATALOG_CACHE', {})})
+
+    # 색상, 사이즈, 카테고리 snapshot (시작 시 미리 읽고 DIMENSION_CACHE_TTL 마다 다시 읽음)
+    dimension_cache = init_dimension_cache(app, product_dao)
+
     # Service 생성
     user_service = UserService(user_dao)
-    order_service = OrderService(order_dao)
-    product_service = ProductService(product_dao)
+    order_service = OrderService(order_dao, catalog_cache)
+    product_service = ProductService(product_dao, catalog_cache, dimension_cache)
+
+    # 할인 시작/종료 시 product_catalog_current 의 적용 할인율, 할인가 계산 (첫 요청 시 시작)
+    init_price_scheduler(app, product_service)
 
     # view blueprint 등록
     app.register_blueprint(create_user_endpoints(user_service))
@@ -91,5 +135,6 @@ def create_app():
     app.register_blueprint(service_product_endpoint(product_service))
     app.register_blueprint(create_admin_product_endpoints(product_service))
     app.register_blueprint(create_service_order_endpoints(order_service))
+    app.register_blueprint(create_monitor_endpoints())
 
     return app
@@ -0,0 +1,606 @@
+import time, copy, random, decimal, datetime, statistics
+
+from cache             import TTLCache
+from model             import ProductDao
+from model.product_dao import PRODUCT_LIST_SORTS, build_product_list_query
+from pricing           import get_database_now, get_effective_price
+from service           import ProductService
+
+# 기본 측정 카탈로그 크기
+DEFAULT_BENCHMARK_SIZES = (1000, 10000, 100000)
+
+# 가상 상품 insert 단위
+BENCHMARK_INSERT_BATCH = 1000
+
+# 상품수정 옵션 비교 측정 시 상품 별 옵션 수
+DEFAULT_BENCHMARK_OPTION_COUNTS = (10, 100, 300)
+
+# 측정할 카테고리 범위 : (이름, main_category_id, sub_category_id)
+BENCHMARK_SCOPES = (
+    ('all',  None, None),
+    ('main', 1,    None),
+    ('sub',  None, 1)
+)
+
+def create_benchmark_catalog(db_connection, size, seed=0):
+
+    """
+
+    현재 연결(session) 에만 보이는 TEMPORARY product_catalog_current 를 만들고 가상 상품 size 개를 채웁니다.
+    같은 이름의 temporary table 은 이 연결에서 실제 테이블을 가리므로
+    DAO 의 SQL 을 실제 데이터 변경 없이 원하는 크기의 카탈로그로 측정할 수 있습니다.
+
+    Args:
+        db_connection : DATABASE Connection Instance
+        size          : 가상 상품 수
+        seed          : 가상 데이터 random seed
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    generator = random.Random(seed)
+    now       = get_database_now().replace(microsecond=0)
+    day       = datetime.timedelta(days=1)
+
+    with db_connection.cursor() as cursor:
+
+        # index 까지 같은 구조로 생성 (같은 이름으로 바로 LIKE 할 수 없어 다른 이름을 거쳐 생성)
+        drop_benchmark_catalog(db_connection)
+        cursor.execute("CREATE TEMPORARY TABLE benchmark_catalog LIKE product_catalog_current")
+        cursor.execute("CREATE TEMPORARY TABLE product_catalog_current LIKE benchmark_catalog")
+        cursor.execute("DROP TEMPORARY TABLE benchmark_catalog")
+
+        insert_query = """
+        INSERT INTO product_catalog_current (
+            product_id,
+            product_code,
+            created_at,
+            is_activated,
+            is_displayed,
+            main_category_id,
+            sub_category_id,
+            name,
+            detail_information,
+            price,
+            discount_rate,
+            discount_start_date,
+            discount_end_date,
+            applied_discount_rate,
+            sales_price,
+            price_expires_at,
+            min_sales_quantity,
+            max_sales_quantity,
+            thumbnail_image_medium,
+            thumbnail_image_small
+        ) VALUES (
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+        )
+        """
+
+        rows = []
+
+        for product_id in range(1, size + 1):
+            discount_rate, discount_start_date, discount_end_date = None, None, None
+
+            # 40% 는 할인 설정 (현재 할인중, 할인 종료, 무기한 할인이 1/3 씩)
+            if generator.random() < 0.4:
+                discount_rate = generator.randint(5, 70)
+                window        = generator.randint(0, 2)
+
+                if window == 0:
+                    discount_start_date, discount_end_date = now - day, now + day
+
+                elif window == 1:
+                    discount_start_date, discount_end_date = now - 2 * day, now - day
+
+            price = generator.randrange(5000, 200000, 100)
+
+            # 적용 할인율, 할인가는 가격 scheduler 와 같은 방법으로 계산
+            effective_price = get_effective_price({
+                'price'               : price,
+                'discount_rate'       : discount_rate,
+                'discount_start_date' : discount_start_date,
+                'discount_end_date'   : discount_end_date
+            }, now)
+
+            rows.append((
+                product_id,
+                f'benchmark-{product_id}',
+                now,
+                int(generator.random() < 0.9),
+                int(generator.random() < 0.9),
+                generator.randint(1, 11),
+                generator.randint(1, 62),
+                f'benchmark product {product_id}',
+                '',
+                price,
+                discount_rate,
+                discount_start_date,
+                discount_end_date,
+                effective_price['applied_discount_rate'],
+                effective_price['sales_price'],
+                effective_price['price_expires_at'],
+                1,
+                20,
+                'benchmark-M.jpg',
+                'benchmark-S.jpg'
+            ))
+
+            if len(rows) >= BENCHMARK_INSERT_BATCH:
+                cursor.executemany(insert_query, rows)
+                rows = []
+
+        if rows:
+            cursor.executemany(insert_query, rows)
+
+        cursor.execute("ANALYZE TABLE product_catalog_current")
+        cursor.fetchall()
+
+def drop_benchmark_catalog(db_connection):
+
+    """
+
+    create_benchmark_catalog 로 만든 TEMPORARY table 을 지웁니다.
+    pool 에 반납하기 전에 반드시 호출해야 이후 요청이 실제 테이블을 조회합니다.
+
+    Args:
+        db_connection : DATABASE Connection Instance
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    with db_connection.cursor() as cursor:
+        cursor.execute("DROP TEMPORARY TABLE IF EXISTS benchmark_catalog")
+        cursor.execute("DROP TEMPORARY TABLE IF EXISTS product_catalog_current")
+
+def get_benchmark_pages(size):
+
+    """
+
+    정렬 기준 별로 측정할 페이지 위치(첫 페이지, 카탈로그 중간 페이지)를 Return 합니다.
+
+    Args:
+        size : 가상 상품 수
+
+    Returns:
+        [(정렬 기준, 페이지 이름, cursor, sort_key)]
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    middle = {
+        'newest'     : (size // 2, None),
+        'price_asc'  : (0, decimal.Decimal(100000)),
+        'price_desc' : (size + 1, decimal.Decimal(100000)),
+        'discount'   : (size + 1, decimal.Decimal(35))
+    }
+
+    return [
+        (sort, page, *position)
+        for sort in PRODUCT_LIST_SORTS
+        for page, position in (('first', (None, None)), ('middle', middle[sort]))
+    ]
+
+def explain_product_list(page_info, db_connection):
+
+    """
+
+    서비스 상품 리스트 SQL 의 실행 계획 중 product_catalog_current 의 사용 index, 예상 row 수, filesort 여부를 Return 합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    with db_connection.cursor() as cursor:
+        cursor.execute('EXPLAIN ' + build_product_list_query(page_info), page_info)
+        plan = cursor.fetchone()
+
+    return {
+        'key'      : plan['key'],
+        'rows'     : plan['rows'],
+        'filesort' : 'filesort' in (plan['Extra'] or '')
+    }
+
+def run_product_list_benchmark(db_connection, sizes=DEFAULT_BENCHMARK_SIZES, repeat=20, limit=30):
+
+    """
+
+    카탈로그 크기 별로 서비스 상품 리스트의 (카테고리 범위 x 정렬 기준 x 페이지 위치) 조합을 측정합니다.
+    keyset pagination + index range scan 이면 카탈로그 크기가 커져도 조회 시간과 예상 row 수가 거의 같아야 합니다.
+
+    Args:
+        db_connection : DATABASE Connection Instance
+        sizes         : 측정할 카탈로그 크기 목록
+        repeat        : 조합 별 반복 횟수
+        limit         : 페이지 크기
+
+    Returns:
+        [{size, scope, sort, page, key, rows, filesort, p50_ms, p95_ms}]
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    product_dao = ProductDao()
+    results     = []
+
+    try:
+        for size in sizes:
+            create_benchmark_catalog(db_connection, size)
+
+            for scope, main_category_id, sub_category_id in BENCHMARK_SCOPES:
+                for sort, page, cursor, sort_key in get_benchmark_pages(size):
+                    page_info = {
+                        'sort'             : sort,
+                        'main_category_id' : main_category_id,
+                        'sub_category_id'  : sub_category_id,
+                        'cursor'           : cursor,
+                        'sort_key'         : sort_key,
+                        'limit'            : limit + 1
+                    }
+
+                    # 첫 실행은 buffer pool warm up 으로 제외
+                    product_dao.select_product_list(page_info, db_connection)
+
+                    timings = []
+
+                    for _ in range(repeat):
+                        started = time.perf_counter()
+                        product_dao.select_product_list(page_info, db_connection)
+                        timings.append((time.perf_counter() - started) * 1000)
+
+                    timings.sort()
+
+                    results.append({
+                        'size'   : size,
+                        'scope'  : scope,
+                        'sort'   : sort,
+                        'page'   : page,
+                        **explain_product_list(page_info, db_connection),
+                        'p50_ms' : round(statistics.median(timings), 3),
+                        'p95_ms' : round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3)
+                    })
+
+    finally:
+        db_connection.rollback()
+        drop_benchmark_catalog(db_connection)
+
+    return results
+
+def format_product_list_benchmark(results):
+
+    """
+
+    run_product_list_benchmark 결과를 표 형태의 문자열 목록으로 만듭니다.
+    마지막에 조합 별로 가장 큰 카탈로그와 가장 작은 카탈로그의 p50 비율을 함께 표시합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    lines = [f'{"size":>8} {"scope":<5} {"sort":<10} {"page":<6} {"key":<56} {"rows":>7} {"filesort":<8} {"p50_ms":>8} {"p95_ms":>8}']
+
+    for result in results:
+        lines.append(
+            f'{result["size"]:>8} {result["scope"]:<5} {result["sort"]:<10} {result["page"]:<6} '
+            f'{str(result["key"]):<56} {result["rows"]:>7} {str(result["filesort"]):<8} '
+            f'{result["p50_ms"]:>8} {result["p95_ms"]:>8}'
+        )
+
+    # 조합 별 카탈로그 크기에 따른 p50 변화
+    combinations = {}
+
+    for result in results:
+        combinations.setdefault((result['scope'], result['sort'], result['page']), []).append(result)
+
+    lines.append('')
+    lines.append(f'{"scope":<5} {"sort":<10} {"page":<6} {"p50 largest / smallest":>24}')
+
+    for (scope, sort, page), rows in combinations.items():
+        smallest = min(rows, key=lambda row : row['size'])
+        largest  = max(rows, key=lambda row : row['size'])
+        ratio    = largest['p50_ms'] / smallest['p50_ms'] if smallest['p50_ms'] else 0
+
+        lines.append(f'{scope:<5} {sort:<10} {page:<6} {ratio:>24.2f}')
+
+    return lines
+
+class StatementCounter:
+
+    """
+
+    DB 연결을 감싸서 cursor 로 실행된 SQL 수를 셉니다.
+    executemany 의 multi-row insert 는 실제로 전송된 SQL 수만큼(보통 1번) 셉니다.
+
+    Args:
+        db_connection : DATABASE Connection Instance
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self, db_connection):
+        self.db_connection = db_connection
+        self.count         = 0
+
+    def cursor(self, *args, **kwargs):
+        cursor  = self.db_connection.cursor(*args, **kwargs)
+        execute = cursor.execute
+
+        def counted_execute(*execute_args, **execute_kwargs):
+            self.count += 1
+            return execute(*execute_args, **execute_kwargs)
+
+        # executemany 도 내부에서 cursor.execute 를 호출하므로 execute 만 감쌈
+        cursor.execute = counted_execute
+
+        return cursor
+
+# 옵션 diff 변경 전 상품수정에서 옵션을 하나씩 저장하던 SQL (ProductDao.insert_product_option 은 multi-row insert 로 대체되어 제거됨)
+LEGACY_INSERT_PRODUCT_OPTION_QUERY = """
+INSERT INTO product_options (
+    product_id,
+    color_id,
+    size_id,
+    current_quantity,
+    is_deleted
+) VALUES (
+    %s,
+    %s,
+    %s,
+    %s,
+    DEFAULT
+)
+"""
+
+def legacy_update_options(product_dao, product_id, db_options, request_options, now, db_connection):
+
+    """
+
+    옵션 diff 변경 전 상품수정의 옵션 비교와 저장(중첩 loop, 옵션 별 id 조회, 추가 옵션 한 개씩 insert)을 그대로 재현합니다. (비교 측정용)
+    제거된 DAO 함수는 사용하지 않고, 옵션 한 개 insert 는 기존 SQL(LEGACY_INSERT_PRODUCT_OPTION_QUERY)을 직접 실행합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    request_only_option = request_options
+
+    for db_option in db_options:
+        is_option_db = False
+
+        for request_option in request_options:
+            if request_option['color'] == db_option['color'] and request_option['size'] == db_option['size'] and request_option['quantity'] != db_option['quantity']:
+                request_option['color_id'] = product_dao.select_color_id(request_option, db_connection)
+                request_option['size_id']  = product_dao.select_size_id(request_option, db_connection)
+
+                product_option_id = product_dao.select_product_option_number(product_id, request_option, db_connection)
+
+                product_dao.close_quantity(now, product_option_id, db_connection)
+                product_dao.insert_quantity(now, product_option_id, request_option, db_connection)
+
+                is_option_db = True
+                request_only_option.remove(request_option)
+                break
+
+            if request_option['color'] == db_option['color'] and request_option['size'] == db_option['size']:
+                is_option_db = True
+                request_only_option.remove(request_option)
+                break
+
+        if not is_option_db:
+            db_option['color_id'] = product_dao.select_color_id(db_option, db_connection)
+            db_option['size_id']  = product_dao.select_size_id(db_option, db_connection)
+
+            product_option_id = product_dao.select_product_option_number(product_id, db_option, db_connection)
+            product_dao.delete_product_option(now, product_option_id, db_connection)
+
+    # request 에만 있는 옵션은 한 개씩 id 조회, 옵션 insert, 수량 insert
+    for option in request_only_option:
+        option['color_id'] = product_dao.select_color_id(option, db_connection)
+        option['size_id']  = product_dao.select_size_id(option, db_connection)
+
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                LEGACY_INSERT_PRODUCT_OPTION_QUERY,
+                (product_id, option['color_id'], option['size_id'], option['quantity'])
+            )
+            product_option_id = cursor.lastrowid
+
+        product_dao.insert_quantity(now, product_option_id, option, db_connection)
+
+    return request_only_option
+
+def get_benchmark_option_sets(colors, sizes, count):
+
+    """
+
+    옵션 count 개의 상품과, 그 중 1/3 은 그대로, 1/3 은 수량 변경, 1/3 은 삭제하고 count/3 개를 추가한 수정 request 옵션을 만듭니다.
+
+    Args:
+        colors : 색상 이름 목록
+        sizes  : 사이즈 이름 목록
+        count  : 상품의 옵션 수
+
+    Returns:
+        (상품 옵션 List, 수정 request 옵션 List)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    combinations = [(color, size) for color in colors for size in sizes]
+    added_count  = count // 3
+
+    if len(combinations) < count + added_count:
+        raise Exception('NOT_ENOUGH_COLOR_SIZE')
+
+    options = [
+        {'color' : color, 'size' : size, 'quantity' : 10}
+        for color, size in combinations[:count]
+    ]
+
+    request_options = [
+        {**option, 'quantity' : 10 if index % 3 == 0 else 20}
+        for index, option in enumerate(options)
+        if index % 3 != 2
+    ] + [
+        {'color' : color, 'size' : size, 'quantity' : 5}
+        for color, size in combinations[count:count + added_count]
+    ]
+
+    return options, request_options
+
+def run_option_update_benchmark(db_connection, option_counts=DEFAULT_BENCHMARK_OPTION_COUNTS, repeat=5):
+
+    """
+
+    옵션 수 별로 상품수정의 옵션 비교/저장을 기존 방식(legacy)과 diff_options 방식(diff)으로 측정합니다.
+    하나의 transaction 안에서 가상 상품을 만들고 매 실행 후 SAVEPOINT 로 되돌리며, 마지막에 모두 rollback 하므로
+    실제 데이터는 변경되지 않습니다.
+
+    Args:
+        db_connection : DATABASE Connection Instance
+        option_counts : 측정할 상품 별 옵션 수 목록
+        repeat        : 방식 별 반복 횟수
+
+    Returns:
+        [{options, path, added, removed, changed, statements, p50_ms, p95_ms}]
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    product_dao     = ProductDao()
+    product_service = ProductService(product_dao, TTLCache(name='benchmark'))
+    results         = []
+
+    try:
+        colors = [color['name'] for color in product_dao.select_color_list(db_connection)]
+        sizes  = [size['name'] for size in product_dao.select_size_list(db_connection)]
+
+        for count in option_counts:
+            options, request_options = get_benchmark_option_sets(colors, sizes, count)
+
+            now        = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            product_id = product_dao.insert_product(db_connection)
+            product_service.insert_options(product_id, copy.deepcopy(options), now, db_connection)
+
+            with db_connection.cursor() as cursor:
+                cursor.execute("SAVEPOINT option_benchmark")
+
+            def legacy(counter):
+                db_options = product_dao.select_product_option_to_compare(product_id, counter)['optionQuantity']
+                legacy_update_options(product_dao, product_id, db_options, copy.deepcopy(request_options), now, counter)
+
+            def diff(counter):
+                db_options = product_dao.select_product_option_to_compare(product_id, counter)['optionQuantity']
+                product_service.update_options(product_id, db_options, copy.deepcopy(request_options), now, counter)
+
+            for path, update in (('legacy', legacy), ('diff', diff)):
+                timings = []
+
+                for _ in range(repeat):
+                    counter = StatementCounter(db_connection)
+                    started = time.perf_counter()
+                    update(counter)
+                    timings.append((time.perf_counter() - started) * 1000)
+
+                    with db_connection.cursor() as cursor:
+                        cursor.execute("ROLLBACK TO SAVEPOINT option_benchmark")
+
+                timings.sort()
+
+                results.append({
+                    'options'    : count,
+                    'path'       : path,
+                    'added'      : count // 3,
+                    'removed'    : count // 3,
+                    'changed'    : (count + 1) // 3,
+                    'statements' : counter.count,
+                    'p50_ms'     : round(statistics.median(timings), 3),
+                    'p95_ms'     : round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3)
+                })
+
+    finally:
+        db_connection.rollback()
+
+    return results
+
+def format_option_update_benchmark(results):
+
+    """
+
+    run_option_update_benchmark 결과를 표 형태의 문자열 목록으로 만들고, 옵션 수 별 legacy / diff p50 비율을 함께 표시합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    lines = [f'{"options":>7} {"path":<6} {"added":>5} {"removed":>7} {"changed":>7} {"statements":>10} {"p50_ms":>9} {"p95_ms":>9}']
+
+    for result in results:
+        lines.append(
+            f'{result["options"]:>7} {result["path"]:<6} {result["added"]:>5} {result["removed"]:>7} {result["changed"]:>7} '
+            f'{result["statements"]:>10} {result["p50_ms"]:>9} {result["p95_ms"]:>9}'
+        )
+
+    paths = {(result['options'], result['path']) : result for result in results}
+
+    lines.append('')
+    lines.append(f'{"options":>7} {"p50 legacy / diff":>18}')
+
+    for count in sorted({result['options'] for result in results}):
+        legacy, diff = paths.get((count, 'legacy')), paths.get((count, 'diff'))
+
+        if legacy and diff and diff['p50_ms']:
+            lines.append(f'{count:>7} {legacy["p50_ms"] / diff["p50_ms"]:>18.2f}')
+
+    return lines
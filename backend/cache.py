@@ -0,0 +1,344 @@
+import sys, time, threading, collections
+
+# cache 에 값이 없음을 나타내는 값 (None 도 cache 할 수 있도록 별도 객체 사용)
+MISSING = object()
+
+# CATALOG_CACHE 설정이 없을 때 사용하는 기본값
+DEFAULT_CACHE_CONFIG = {
+    'ttl'         : 60,
+    'max_entries' : 1024,
+    'max_bytes'   : 16 * 1024 * 1024
+}
+
+def get_size(obj):
+
+    """
+
+    cache 에 저장할 값이 차지하는 메모리를 대략적으로 계산합니다.
+    dict, list, tuple, set 은 안의 값까지 더합니다.
+
+    Args:
+        obj : 계산할 값
+
+    Returns:
+        byte 수
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(get_size(key) + get_size(value) for key, value in obj.items())
+
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(get_size(item) for item in obj)
+
+    return size
+
+class TTLCache:
+
+    """
+
+    thread-safe TTL + LRU in-process cache 입니다.
+
+    - ttl 초가 지난 값은 조회 시점에 만료됩니다.
+    - max_entries 개 또는 max_bytes 를 넘으면 가장 오래 사용하지 않은 값부터 내보냅니다(LRU).
+      max_bytes 보다 큰 값은 저장하지 않습니다.
+    - 값마다 tag 를 붙여 두고 invalidate_tags() 로 관련된 값을 한번에 지울 수 있습니다.
+    - 조회(load) 도중 그 값의 tag 가 invalidate 되거나 clear() 된 경우 load 한 값은 오래된 값일 수 있으므로 저장하지 않습니다.
+      다른 tag 의 invalidate 는 영향을 주지 않습니다.
+
+    cache 된 값은 여러 요청이 함께 사용하므로 꺼내 쓴 값을 수정하면 안됩니다.
+
+    Args:
+        ttl         : 값의 유효 시간(초)
+        max_entries : 최대 저장 개수
+        max_bytes   : 최대 메모리(byte, get_size 기준)
+        name        : 모니터링 시 구분을 위한 이름
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : 오래된 load 판단을 cache 전체 generation 대신 tag 별 invalidate 시점으로 변경
+
+    """
+
+    def __init__(self, ttl=60, max_entries=1024, max_bytes=16 * 1024 * 1024, name='cache'):
+        self.ttl         = ttl
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self.name        = name
+
+        # key : (value, expires_at, size, tags)
+        self._entries    = collections.OrderedDict()
+        self._tags       = collections.defaultdict(set)
+        self._bytes      = 0
+        self._lock       = threading.Lock()
+
+        # invalidate 할 때마다 증가하는 generation 과 tag 별 / clear() 의 마지막 invalidate generation
+        # (tag 별 값은 invalidate 된 적이 있는 tag 수 만큼만 남음)
+        self._generation     = 0
+        self._invalidated_at = {}
+        self._cleared_at     = 0
+
+        # 모니터링용 통계
+        self._stats = {
+            'hits'          : 0,
+            'misses'        : 0,
+            'expired'       : 0,
+            'evictions'     : 0,
+            'invalidations' : 0,
+            'oversized'     : 0,
+            'stale_loads'   : 0
+        }
+
+    def _is_stale(self, tags, generation):
+
+        # lock 안에서 호출, generation 이후에 tag 가 invalidate 되었거나 clear() 된 경우
+        if self._cleared_at > generation:
+            return True
+
+        return any(self._invalidated_at.get(tag, 0) > generation for tag in tags)
+
+    def _remove(self, key):
+
+        # lock 안에서 호출
+        value, expires_at, size, tags = self._entries.pop(key)
+        self._bytes -= size
+
+        for tag in tags:
+            keys = self._tags.get(tag)
+
+            if keys is not None:
+                keys.discard(key)
+
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, key, default=MISSING):
+
+        """
+
+        key 에 해당하는 값을 Return 합니다. 없거나 만료된 경우 default 를 Return 합니다.
+
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._stats['misses'] += 1
+                return default
+
+            if entry[1] <= time.monotonic():
+                self._remove(key)
+                self._stats['expired'] += 1
+                self._stats['misses']  += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+
+            return entry[0]
+
+    def set(self, key, value, tags=(), ttl=None, generation=None):
+
+        """
+
+        값을 저장합니다.
+
+        Args:
+            key        : cache key (hashable)
+            value      : 저장할 값
+            tags       : invalidate_tags() 로 함께 지울 tag 목록
+            ttl        : 값의 유효 시간(초), None 이면 기본 ttl
+            generation : load 시작 시점의 generation, 그 사이 tags 중 하나가 invalidate 되었거나 clear() 되었다면 저장하지 않음
+
+        Returns:
+            저장 여부
+
+        """
+
+        size = get_size(value)
+
+        with self._lock:
+            if generation is not None and self._is_stale(tags, generation):
+                self._stats['stale_loads'] += 1
+                return False
+
+            if size > self.max_bytes:
+                self._stats['oversized'] += 1
+                return False
+
+            if key in self._entries:
+                self._remove(key)
+
+            expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+            self._entries[key]  = (value, expires_at, size, tuple(tags))
+            self._bytes        += size
+
+            for tag in tags:
+                self._tags[tag].add(key)
+
+            # 개수 / 메모리 제한을 넘으면 가장 오래 사용하지 않은 값부터 제거
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+
+            return True
+
+    def get_or_load(self, key, loader, tags=(), ttl=None):
+
+        """
+
+        cache 된 값이 있으면 Return 하고, 없으면 loader() 의 결과를 저장한 뒤 Return 합니다.
+
+        Args:
+            key    : cache key
+            loader : 값을 만드는 함수 (인자 없음)
+            tags   : 값에 붙일 tag 목록
+            ttl    : 값의 유효 시간(초)
+                     load 한 값에 따라 달라지는 경우 함수를 넘기면 load 후 호출하며,
+                     기본 ttl 보다 긴 값이나 None 은 기본 ttl 을 사용합니다.
+
+        Returns:
+            cache 된 값 또는 loader() 의 결과
+
+        """
+
+        value = self.get(key)
+
+        if value is not MISSING:
+            return value
+
+        with self._lock:
+            generation = self._generation
+
+        value = loader()
+
+        # 할인 종료 시각처럼 load 한 값으로 정해지는 유효 시간
+        if callable(ttl):
+            ttl = ttl()
+            ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+
+        self.set(key, value, tags, ttl, generation)
+
+        return value
+
+    def invalidate_tags(self, *tags):
+
+        """
+
+        tag 가 붙은 모든 값을 지웁니다.
+
+        Returns:
+            지운 값의 수
+
+        """
+
+        with self._lock:
+            self._generation += 1
+
+            keys = set()
+
+            for tag in tags:
+                self._invalidated_at[tag] = self._generation
+                keys |= self._tags.get(tag, set())
+
+            for key in keys:
+                self._remove(key)
+
+            self._stats['invalidations'] += len(keys)
+
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._cleared_at = self._generation
+            self._invalidated_at.clear()
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    def stats(self):
+
+        """
+
+        모니터링을 위한 cache 상태를 Return 합니다.
+
+        Returns:
+            {
+                name, entries, max_entries, bytes, max_bytes, ttl, hit_ratio,
+                hits, misses, expired, evictions, invalidations, oversized, stale_loads
+            }
+
+        """
+
+        with self._lock:
+            stats   = dict(self._stats)
+            entries = len(self._entries)
+            size    = self._bytes
+
+        requests = stats['hits'] + stats['misses']
+
+        return {
+            'name'        : self.name,
+            'entries'     : entries,
+            'max_entries' : self.max_entries,
+            'bytes'       : size,
+            'max_bytes'   : self.max_bytes,
+            'ttl'         : self.ttl,
+            'hit_ratio'   : round(stats['hits'] / requests, 4) if requests else 0.0,
+            **stats
+        }
+
+# 생성된 모든 cache (모니터링용)
+caches = []
+
+def register_cache(*args, **kwargs):
+
+    """
+
+    TTLCache 를 생성하고 모니터링 목록에 등록합니다.
+
+    Returns:
+        TTLCache 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    cache = TTLCache(*args, **kwargs)
+    caches.append(cache)
+
+    return cache
+
+def get_cache_stats():
+
+    """
+
+    등록된 모든 cache 의 상태를 Return 합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    return [cache.stats() for cache in caches]
@@ -0,0 +1,146 @@
+import click
+
+from benchmark  import (
+    DEFAULT_BENCHMARK_SIZES,
+    DEFAULT_BENCHMARK_OPTION_COUNTS,
+    run_product_list_benchmark,
+    format_product_list_benchmark,
+    run_option_update_benchmark,
+    format_option_update_benchmark
+)
+from connection import get_connection
+from model      import ProductDao
+from service    import ProductService
+
+def init_commands(app):
+
+    """
+
+    운영에 필요한 flask CLI 명령을 등록합니다.
+
+        FLASK_APP=manage.py flask rebuild-product-catalog
+            : history 테이블(product_details, product_images, images)로부터 product_catalog_current 를 다시 만듭니다.
+
+        FLASK_APP=manage.py flask reprice-product-catalog
+            : 할인이 시작/종료된(price_expires_at 이 지난) 상품의 적용 할인율, 할인가를 다시 계산합니다.
+              서버의 가격 scheduler 가 하는 일을 한번 실행하며, schema 의 초기 데이터처럼
+              price_expires_at 을 지금으로 넣은 상품도 계산합니다.
+
+        FLASK_APP=manage.py flask benchmark-product-list [--sizes 1000,10000,100000] [--repeat 20]
+            : 카탈로그 크기 별 서비스 상품 리스트(카테고리 x 정렬 x 페이지 위치) 조회 시간과 실행 계획을 측정합니다.
+              연결(session) 전용 TEMPORARY table 에 가상 상품을 만들어 측정하므로 실제 데이터는 변경되지 않습니다.
+
+        FLASK_APP=manage.py flask benchmark-option-update [--options 10,100,300] [--repeat 5]
+            : 옵션 수 별 상품수정 옵션 비교/저장 시간과 SQL 수를 기존 방식(legacy)과 diff 방식으로 측정합니다.
+              가상 상품은 rollback 되므로 실제 데이터는 변경되지 않습니다.
+
+    Args:
+        app : 플라스크 앱 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : benchmark-product-list 명령 추가
+        2026-10-18 (tnwjd060124@gmail.com) : benchmark-option-update 명령 추가
+        2026-10-18 (tnwjd060124@gmail.com) : reprice-product-catalog 명령 추가, rebuild 시 할인가 계산
+
+    """
+
+    @app.cli.command('rebuild-product-catalog')
+    def rebuild_product_catalog():
+
+        """
+
+        product_catalog_current 를 history 테이블로부터 다시 만듭니다.
+
+        """
+
+        db_connection = get_connection()
+
+        try:
+            # 하나의 transaction 으로 교체하여 조회중인 요청은 이전 또는 새 데이터만 보게 됨
+            count = ProductDao().rebuild_product_catalog(db_connection)
+
+            # 다시 만든 상품의 적용 할인율, 할인가도 같은 transaction 에서 계산
+            ProductService(ProductDao()).reprice_catalog(db_connection)
+            db_connection.commit()
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+        finally:
+            db_connection.close()
+
+        click.echo(f'product_catalog_current : {count} rows rebuilt')
+
+    @app.cli.command('reprice-product-catalog')
+    def reprice_product_catalog():
+
+        """
+
+        product_catalog_current 의 적용 할인율, 할인가를 다시 계산합니다.
+        실행중인 서버의 cache 는 price_expires_at 으로 정한 유효 시간이 지나면 만료됩니다.
+
+        """
+
+        db_connection = get_connection()
+
+        try:
+            changed = ProductService(ProductDao()).reprice_catalog(db_connection)
+            db_connection.commit()
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+        finally:
+            db_connection.close()
+
+        click.echo(f'product_catalog_current : {len(changed)} prices changed')
+
+    @app.cli.command('benchmark-product-list')
+    @click.option('--sizes', default=','.join(map(str, DEFAULT_BENCHMARK_SIZES)), help='측정할 카탈로그 크기 (, 로 구분)')
+    @click.option('--repeat', default=20, help='조합 별 반복 횟수')
+    def benchmark_product_list(sizes, repeat):
+
+        """
+
+        카탈로그 크기 별 서비스 상품 리스트 조회 시간을 측정합니다.
+
+        """
+
+        db_connection = get_connection()
+
+        try:
+            results = run_product_list_benchmark(db_connection, [int(size) for size in sizes.split(',')], repeat)
+
+        finally:
+            db_connection.close()
+
+        for line in format_product_list_benchmark(results):
+            click.echo(line)
+
+    @app.cli.command('benchmark-option-update')
+    @click.option('--options', default=','.join(map(str, DEFAULT_BENCHMARK_OPTION_COUNTS)), help='측정할 상품 별 옵션 수 (, 로 구분)')
+    @click.option('--repeat', default=5, help='방식 별 반복 횟수')
+    def benchmark_option_update(options, repeat):
+
+        """
+
+        옵션 수 별 상품수정 옵션 비교/저장 시간과 SQL 수를 측정합니다.
+
+        """
+
+        db_connection = get_connection()
+
+        try:
+            results = run_option_update_benchmark(db_connection, [int(count) for count in options.split(',')], repeat)
+
+        finally:
+            db_connection.close()
+
+        for line in format_option_update_benchmark(results):
+            click.echo(line)
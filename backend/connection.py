@@ -1,12 +1,187 @@
+import threading
 import pymysql, boto3
 
-from config import DATABASE
-from config import S3
+from config  import DATABASE
+from config  import S3
+from pool    import ConnectionPool, PoolTimeoutError
+from routing import is_pinned_to_primary
+
+# DATABASE_POOL 설정이 없을 때 사용하는 connection pool 기본값
+DEFAULT_POOL_CONFIG = {
+    'min_size'      : 2,
+    'max_size'      : 10,
+    'max_lifetime'  : 3600,
+    'ping_interval' : 30,
+    'wait_timeout'  : 5
+}
+
+# 생성된 connection pool 저장
+connection_pools     = {}
+connection_pool_lock = threading.Lock()
+
+def get_connect_kwargs(database):
+
+    """
+
+    DATABASE 설정으로 pymysql.connect 에 전달할 인자를 만들어줍니다.
+    time_zone 설정은 init_command 로 실제 연결 생성 시 한번만 실행됩니다.
+
+    Args:
+        database : DATABASE 설정 Dictionary
+
+    Returns:
+        pymysql.connect 인자 Dictionary
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    return {
+        'host'         : database["host"],
+        'port'         : database["port"],
+        'user'         : database["user"],
+        'password'     : database["password"],
+        'database'     : database["database"],
+        'charset'      : database["charset"],
+        'cursorclass'  : pymysql.cursors.DictCursor,
+        'init_command' : "SET time_zone='Asia/Seoul'"
+    }
+
+def create_connection_pool(pool_config=None, name='primary', database=DATABASE):
+
+    """
+
+    connection pool 을 생성하여 connection_pools 에 저장합니다.
+
+    Args:
+        pool_config : min_size, max_size, max_lifetime, ping_interval, wait_timeout 설정
+        name        : pool 이름
+        database    : DATABASE 설정 Dictionary
+
+    Returns:
+        생성된 ConnectionPool 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    config = {**DEFAULT_POOL_CONFIG, **(pool_config or {})}
+    pool   = ConnectionPool(get_connect_kwargs(database), name=name, **config)
+
+    with connection_pool_lock:
+        previous_pool          = connection_pools.get(name)
+        connection_pools[name] = pool
+
+    # 다시 생성하는 경우 기존 pool 의 유휴 연결 정리
+    if previous_pool:
+        previous_pool.close_all()
+
+    return pool
+
+def get_connection_pool(name='primary'):
 
-def get_connection():
     """
 
-    import 되어서 사용될 때마다 connection 생성
+    이름에 해당하는 connection pool 을 Return 합니다.
+    create_app() 을 거치지 않은 경우(script 등) 기본 설정으로 생성합니다.
+
+    Args:
+        name : pool 이름
+
+    Returns:
+        ConnectionPool 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    pool = connection_pools.get(name)
+
+    if pool:
+        return pool
+
+    with connection_pool_lock:
+        if name not in connection_pools:
+            connection_pools[name] = ConnectionPool(
+                get_connect_kwargs(DATABASE),
+                name = name,
+                **DEFAULT_POOL_CONFIG
+            )
+
+        return connection_pools[name]
+
+def init_connection_pool(app):
+
+    """
+
+    create_app() 시점에 connection pool 을 생성하고 미리 연결을 만들어 둡니다(pre-warm).
+    DATABASE_REPLICA 설정이 있으면 조회 전용 replica pool 도 함께 생성합니다.
+    DB가 아직 준비되지 않은 경우에도 앱은 실행되며, 요청 시점에 연결을 생성합니다.
+
+    Args:
+        app : 플라스크 앱 객체 (config 의 DATABASE_POOL, DATABASE_REPLICA, DATABASE_REPLICA_POOL 사용)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : replica pool 생성 추가
+
+    """
+
+    pools = [create_connection_pool(app.config.get('DATABASE_POOL'))]
+
+    replica = app.config.get('DATABASE_REPLICA')
+
+    if replica:
+        pools.append(create_connection_pool(
+            app.config.get('DATABASE_REPLICA_POOL', app.config.get('DATABASE_POOL')),
+            name     = 'replica',
+            database = replica
+        ))
+
+    else:
+        # 설정이 빠진 채로 다시 생성하는 경우 이전 replica pool 제거
+        with connection_pool_lock:
+            previous_pool = connection_pools.pop('replica', None)
+
+        if previous_pool:
+            previous_pool.close_all()
+
+    for pool in pools:
+        try:
+            pool.prewarm()
+
+        except pymysql.err.MySQLError as e:
+            app.logger.warning(f'{pool.name.upper()}_CONNECTION_POOL_PREWARM_FAILED : {e}')
+
+def get_connection(read_only=False):
+
+    """
+
+    connection pool 에서 connection 을 빌려옵니다.
+    사용 후 close() 를 호출하면 연결을 끊지 않고 pool 에 반납합니다.
+
+    read_only 인 경우 replica 에서 빌려오지만, 아래의 경우에는 primary 를 사용합니다.
+        - replica 가 설정되지 않은 경우
+        - 같은 client 가 최근 READ_YOUR_WRITES_WINDOW 초 안에 쓰기를 한 경우(read-your-writes)
+        - replica 에 연결할 수 없는 경우
+
+    Args:
+        read_only : 조회만 하는 요청인지 여부
 
     Returns :
         database connection 객체
@@ -16,21 +191,41 @@ def get_connection():
 
     History :
         2020-08-19 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : 매 요청마다 연결하지 않고 connection pool 에서 빌려오도록 변경
+        2026-10-18 (tnwjd060124@gmail.com) : read_only 요청을 replica 로 분산
 
     """
 
-    connection = pymysql.connect(
-        host        = DATABASE["host"],
-        port        = DATABASE["port"],
-        user        = DATABASE["user"],
-        password    = DATABASE["password"],
-        database    = DATABASE["database"],
-        charset     = DATABASE["charset"],
-        cursorclass = pymysql.cursors.DictCursor
-    )
-    connection.cursor().execute("""SET time_zone='Asia/Seoul'""")
+    replica_pool = connection_pools.get('replica')
 
-    return connection
+    if read_only and replica_pool and not is_pinned_to_primary():
+        try:
+            return replica_pool.acquire()
+
+        # replica 장애/포화 시에는 primary 로 조회
+        except (pymysql.err.MySQLError, PoolTimeoutError):
+            pass
+
+    return get_connection_pool().acquire()
+
+def get_pool_stats():
+
+    """
+
+    모니터링을 위한 connection pool 상태를 Return 합니다.
+
+    Returns:
+        pool 이름 별 ConnectionPool.stats()
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    return {name : pool.stats() for name, pool in list(connection_pools.items())}
 
 def get_s3_connection():
     s3_connection = boto3.client(
@@ -40,4 +235,3 @@ def get_s3_connection():
     )
 
     return s3_connection
-
@@ -7,12 +7,14 @@ from .product_controller import (
     service_product_endpoint,
     create_admin_product_endpoints
 )
+from .monitor_controller import create_monitor_endpoints
 
 __all__ = [
     'create_user_endpoints',
     'create_admin_user_endpoints',
     'create_admin_order_endpoints',
-    'service_product_endpoint'
+    'service_product_endpoint',
     'create_admin_product_endpoints',
-    'create_service_order_endpoints'
+    'create_service_order_endpoints',
+    'create_monitor_endpoints'
 ]
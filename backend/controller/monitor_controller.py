@@ -0,0 +1,217 @@
+from flask import Blueprint, jsonify, request
+
+from admission         import get_admission_stats
+from cache             import get_cache_stats
+from connection        import get_pool_stats
+from instrumentation   import query_metrics
+from model.query_plan import get_query_plan_stats
+
+def create_monitor_endpoints():
+
+    # '/monitor' end point prefix 설정
+    monitor_app = Blueprint('monitor_app', __name__, url_prefix='/monitor')
+
+    @monitor_app.route('/db-pool', methods=['GET'])
+    def db_pool_stats():
+
+        """
+
+        connection pool 상태 모니터링 api
+
+        Returns:
+            200, {
+                "data" : {
+                    "primary" : {
+                        "size"          : 현재 연결 수,
+                        "in_use"        : 사용중인 연결 수,
+                        "idle"          : 유휴 연결 수,
+                        "waits"         : 대기가 발생한 대여 수,
+                        "avg_wait_time" : 평균 대기시간(초),
+                        "max_wait_time" : 최대 대기시간(초),
+                        ...
+                    }
+                }
+            }
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        return jsonify({"data" : get_pool_stats()}), 200
+
+    @monitor_app.route('/admission', methods=['GET'])
+    def admission_stats():
+
+        """
+
+        DB admission control(대기열, 거절) 상태 모니터링 api
+
+        Returns:
+            200, {
+                "data" : {
+                    "active"         : 입장한 요청 수,
+                    "max_active"     : 최대 입장 가능 요청 수,
+                    "reserved_slots" : 우선순위 high 전용 자리 수,
+                    "queue_depth"    : 대기 요청 수,
+                    "max_queue"      : 최대 대기 요청 수,
+                    "avg_hold_time"  : 평균 점유시간(초),
+                    "priorities"     : {
+                        "high" : {
+                            "waiting"           : 대기 요청 수,
+                            "admitted"          : 누적 입장 수,
+                            "rejected"          : 누적 거절 수,
+                            "queue_full"        : 대기열이 가득 차서 거절된 수,
+                            "deadline_exceeded" : 예상 대기시간 초과로 바로 거절된 수,
+                            "evicted"           : 우선순위가 높은 요청에 밀려 거절된 수,
+                            "wait_timeout"      : 대기 중 시간 초과로 거절된 수,
+                            "avg_wait_time"     : 평균 대기시간(초),
+                            "max_wait_time"     : 최대 대기시간(초),
+                            ...
+                        },
+                        "normal" : {...},
+                        "low"    : {...}
+                    }
+                }
+            }
+            admission control 을 사용하지 않는 경우 data 는 null
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        return jsonify({"data" : get_admission_stats()}), 200
+
+    @monitor_app.route('/caches', methods=['GET'])
+    def cache_stats():
+
+        """
+
+        in-process cache 상태 모니터링 api
+
+        Returns:
+            200, {
+                "data" : [
+                    {
+                        "name"          : cache 이름,
+                        "entries"       : 저장된 값의 수,
+                        "bytes"         : 사용중인 메모리(byte),
+                        "max_bytes"     : 최대 메모리(byte),
+                        "hit_ratio"     : hit 비율,
+                        "hits"          : hit 수,
+                        "misses"        : miss 수,
+                        "evictions"     : LRU 로 내보낸 수,
+                        "invalidations" : 상품 등록/수정으로 지운 수,
+                        ...
+                    },
+                    {
+                        "name"    : "dimension",
+                        "version" : 색상, 사이즈, 카테고리 snapshot version,
+                        "reloads" : 다시 읽은 수,
+                        "changes" : 다시 읽었을 때 내용이 바뀐 수,
+                        ...
+                    }
+                ]
+            }
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : dimension cache 상태 추가
+
+        """
+
+        return jsonify({"data" : get_cache_stats()}), 200
+
+    @monitor_app.route('/query-plans', methods=['GET'])
+    def query_plan_stats():
+
+        """
+
+        필터 조합 별 SQL cache 상태 모니터링 api
+
+        Returns:
+            200, {
+                "data" : [
+                    {
+                        "name"         : plan 이름,
+                        "variants"     : cache 된 SQL 조합 수,
+                        "max_variants" : 가능한 SQL 조합 수,
+                        "hits"         : cache 사용 횟수,
+                        "misses"       : SQL 생성 횟수
+                    }
+                ]
+            }
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        return jsonify({"data" : get_query_plan_stats()}), 200
+
+    @monitor_app.route('/queries', methods=['GET'])
+    def query_stats():
+
+        """
+
+        query 실행 통계 모니터링 api
+
+        Args:
+            limit : 누적 실행시간이 긴 순서로 조회할 query 수 (기본 50)
+
+        Returns:
+            200, {
+                "data" : {
+                    "queries" : [
+                        {
+                            "fingerprint" : literal 값을 제거한 SQL,
+                            "callers"     : 실행한 DAO method 목록,
+                            "count"       : 실행 횟수,
+                            "total_time"  : 누적 실행시간(초),
+                            "avg_time"    : 평균 실행시간(초),
+                            "max_time"    : 최대 실행시간(초),
+                            "rows"        : 누적 조회/변경 row 수
+                        }
+                    ],
+                    "endpoints" : [
+                        {
+                            "endpoint"          : method, url rule,
+                            "requests"          : 요청 수,
+                            "avg_queries"       : 요청 당 평균 query 수,
+                            "max_queries"       : 요청 당 최대 query 수,
+                            "avg_db_time"       : 요청 당 평균 DB 시간(초),
+                            "over_budget"       : QUERY_BUDGET 을 넘은 요청 수,
+                            "repeated_requests" : 같은 query 가 반복 실행된(N+1 의심) 요청 수,
+                            ...
+                        }
+                    ],
+                    "recent_repeats" : 최근 N+1 의심 요청 목록
+                }
+            }
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        limit = request.args.get('limit', 50, type=int)
+
+        return jsonify({"data" : query_metrics.snapshot(limit)}), 200
+
+    return monitor_app
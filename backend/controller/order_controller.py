@@ -11,7 +11,8 @@ from flask_request_validator    import (
     validate_params
 )
 
-from connection import get_connection
+from admission  import PRIORITY_HIGH, PRIORITY_LOW
+from db_session import get_session, transactional, read_only
 from utils      import DatetimeRule, catch_exception, login_required
 
 def create_admin_order_endpoints(order_service):
@@ -31,14 +32,13 @@ def create_admin_order_endpoints(order_service):
         Param('productName', GET, str, required=False),
         Param('toDate', GET, int, required=False, rules=[DatetimeRule()])
     )
+    @read_only(priority=PRIORITY_LOW)
     def order_list(*args):
 
-        db_connection = None
-
         try:
 
             # db 연결
-            db_connection = get_connection()
+            db_connection = get_session()
 
             # request의 filter 정보 저장
             filter_info = {
@@ -55,37 +55,32 @@ def create_admin_order_endpoints(order_service):
                 'to_date'           : args[9]
             }
 
-            if db_connection:
-
-                # filter 유효성 검사
-                filters = order_service.check_filter_list(filter_info)
-
-                if filters:
+            # filter 유효성 검사
+            filters = order_service.check_filter_list(filter_info)
 
-                    # filter 조건 정보에 해당하는 총 결제 완료 건수 조회
-                    count = order_service.get_total_number(filters, db_connection)
+            if filters:
 
-                    if count:
+                # filter 조건 정보에 해당하는 총 결제 완료 건수 조회
+                count = order_service.get_total_number(filters, db_connection)
 
-                        # filter 정보를 전달하여 결제 완료 리스트 가져와서 result에 저장
-                        result = order_service.get_order_list(filters, db_connection)
+                if count:
 
-                        if result:
+                    # filter 정보를 전달하여 결제 완료 리스트 가져와서 result에 저장
+                    result = order_service.get_order_list(filters, db_connection)
 
-                            # 총 갯수와 result return
-                            return jsonify({"total_number" : count['total_number'], "data" : result}), 200
+                    if result:
 
-                        # page에 해당하는 data 없을 시
-                        return jsonify({"total_number" : count['total_number'], "data" : []}),200
+                        # 총 갯수와 result return
+                        return jsonify({"total_number" : count['total_number'], "data" : result}), 200
 
-                    # 존재하는 데이터 없음
-                    return jsonify({"total_number" : 0, "data" : []}), 200
+                    # page에 해당하는 data 없을 시
+                    return jsonify({"total_number" : count['total_number'], "data" : []}),200
 
-                # filter 조건 불충족
-                return jsonify({"message" : "INVALID_FILTER"}), 401
+                # 존재하는 데이터 없음
+                return jsonify({"total_number" : 0, "data" : []}), 200
 
-            # db 연결이 없을 시
-            return jsonify({"message" : "NO_DATABASE_CONNECTION"}), 500
+            # filter 조건 불충족
+            return jsonify({"message" : "INVALID_FILTER"}), 401
 
         except ValueError as e:
             return jsonify({"message" : f"VALUE_ERROR_AS_{e}"}), 400
@@ -94,42 +89,31 @@ def create_admin_order_endpoints(order_service):
         except Exception as e:
             return jsonify({"message" : f'{e}'}), 400
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     @admin_order_app.route('/detail/<order_detail_id>', methods=['GET'], endpoint='get_order_detail')
     @catch_exception
     @validate_params(
         Param('order_detail_id', PATH, int)
     )
+    @read_only
     def get_order_detail(*args):
 
-        db_connection = None
-
         try:
             # db 연결
-            db_connection = get_connection()
-
-            if db_connection:
+            db_connection = get_session()
 
-                # order_detail_id에 해당하는 주문 상세정보를 가져옴
-                result = order_service.get_order_detail({"order_detail_id" : args[0]}, db_connection)
+            # order_detail_id에 해당하는 주문 상세정보를 가져옴
+            result = order_service.get_order_detail({"order_detail_id" : args[0]}, db_connection)
 
-                if result:
-                    return jsonify({"data" : result}), 200
+            if result:
+                return jsonify({"data" : result}), 200
 
-                # parameter로 들어온 주문 상세정보에 해당하는 data가 없을 때
-                return jsonify({"data" : []}), 200
+            # parameter로 들어온 주문 상세정보에 해당하는 data가 없을 때
+            return jsonify({"data" : []}), 200
 
         # 정의하지 않은 모든 에러를 잡아줌
         except Exception as e:
             return jsonify({"message" : f"{e}"}), 400
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     return admin_order_app
 
 def create_service_order_endpoints(order_service):
@@ -144,6 +128,7 @@ def create_service_order_endpoints(order_service):
         Param('quantity', GET, int),
     )
     @login_required
+    @transactional(priority=PRIORITY_HIGH)
     def product_info_to_purchase(user_info, *args):
 
         """
@@ -200,73 +185,62 @@ def create_service_order_endpoints(order_service):
             2020-09-10 (minho.lee0716@gmail.com) : 추가
                 해당 상품의 구매 가능한 최소, 최대 수량을 가져와 받아온 수량을 확인하여
                 최소 구매 수량보다 적게 샀을 경우와 최대 구매 수량보다 많이 샀을 경우에 대한 에러처리를 하였습니다.
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @transactional 로 commit/rollback 처리
+            2026-10-18 (tnwjd060124@gmail.com) : admission control 우선순위 지정
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
-            db_connection = get_connection()
-
-            # DB에 연결이 잘 되었다면,
-            if db_connection:
-
-                # 유효성 검사를 통과한 Params로 들어온 정보를 product_info에 담습니다.
-                product_info = {
-                    'product_id' : args[0],
-                    'color_id'   : args[1],
-                    'size_id'    : args[2],
-                    'quantity'   : args[3]
-                }
-
-                # 받아온 user_info객체에서 유저의 id를 가져옵니다.
-                user_no = user_info['user_no']
+            db_connection = get_session()
+
+            # 유효성 검사를 통과한 Params로 들어온 정보를 product_info에 담습니다.
+            product_info = {
+                'product_id' : args[0],
+                'color_id'   : args[1],
+                'size_id'    : args[2],
+                'quantity'   : args[3]
+            }
 
-                # 해당 유저의 정보가 올바른 유저인지 검사해줍니다.
-                user_existence = order_service.check_user_existence(user_no, db_connection)
+            # 받아온 user_info객체에서 유저의 id를 가져옵니다.
+            user_no = user_info['user_no']
 
-                # 해당 유저의 정보가 없다면,
-                if user_existence is None:
+            # 해당 유저의 정보가 올바른 유저인지 검사해줍니다.
+            user_existence = order_service.check_user_existence(user_no, db_connection)
 
-                    # UNAUTHORIZED 에러 메세지를 보내줍니다.
-                    return jsonify({'message' : 'UNAUTHORIZED'}), 401
+            # 해당 유저의 정보가 없다면,
+            if user_existence is None:
 
-                # 해당 상품의 구매가능한 최소수량과 최대수량의 개수를 가져옵니다.
-                product_quantity_range = order_service.get_product_quantity_range(product_info, db_connection)
+                # UNAUTHORIZED 에러 메세지를 보내줍니다.
+                return jsonify({'message' : 'UNAUTHORIZED'}), 401
 
-                # 가져온 최소, 최대 구매 가능한 상품의 수량을 각 변수에 담아줍니다.
-                min_q = product_quantity_range['min_sales_quantity']
-                max_q = product_quantity_range['max_sales_quantity']
+            # 해당 상품의 구매가능한 최소수량과 최대수량의 개수를 가져옵니다.
+            product_quantity_range = order_service.get_product_quantity_range(product_info, db_connection)
 
-                # 구매하려고 하는 상품의 수량이 최소 구매 가능한 수량보다 작을 때
-                if product_info['quantity'] < min_q:
-                    return jsonify({'message' : f"The minimum number of products that can be purchased is {min_q} or more."}), 400
+            # 가져온 최소, 최대 구매 가능한 상품의 수량을 각 변수에 담아줍니다.
+            min_q = product_quantity_range['min_sales_quantity']
+            max_q = product_quantity_range['max_sales_quantity']
 
-                # 구매하려고 하는 상품의 수량이 최대 구매 가능한 수량보다 많을 때
-                if product_info['quantity'] > max_q:
-                    return jsonify({'message' : f"The maximum number of products that can be purchased is {max_q} or less."}), 400
+            # 구매하려고 하는 상품의 수량이 최소 구매 가능한 수량보다 작을 때
+            if product_info['quantity'] < min_q:
+                return jsonify({'message' : f"The minimum number of products that can be purchased is {min_q} or more."}), 400
 
-                # 상세페이지에서 옵션을 선택 후, 구매하기 클릭시 상품 구매정보를 purchase_info에 담기
-                # 로그인이 되어있는 사용자만이 구매를 할 수 있기 때문에 user_no도 넘겨줍니다.
-                purchase_info = order_service.get_product_info_to_purchase(product_info, user_no, db_connection)
+            # 구매하려고 하는 상품의 수량이 최대 구매 가능한 수량보다 많을 때
+            if product_info['quantity'] > max_q:
+                return jsonify({'message' : f"The maximum number of products that can be purchased is {max_q} or less."}), 400
 
-                # 구매 정보에 수량을 추가해 줍니다.
-                purchase_info['quantity'] = product_info['quantity']
+            # 상세페이지에서 옵션을 선택 후, 구매하기 클릭시 상품 구매정보를 purchase_info에 담기
+            # 로그인이 되어있는 사용자만이 구매를 할 수 있기 때문에 user_no도 넘겨줍니다.
+            purchase_info = order_service.get_product_info_to_purchase(product_info, user_no, db_connection)
 
-                return jsonify({'data' : purchase_info}), 200
+            # 구매 정보에 수량을 추가해 줍니다.
+            purchase_info['quantity'] = product_info['quantity']
 
-            # DB에 연결이 되지 않았을 경우, DB에 연결되지 않았다는 에러메시지를 보내줍니다.
-            return jsonify({'message' : 'NO_DATABASE_CONNECTION'}), 500
+            return jsonify({'data' : purchase_info}), 200
 
         # 정의하지 않은 모든 에러를 잡아줍니다.
         except Exception as e:
             return jsonify({'message' : f"{e}"}), 400
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     @service_order_app.route('/completed', methods=['POST'], endpoint="order_completed")
     @catch_exception
     @validate_params(
@@ -283,6 +257,7 @@ def create_service_order_endpoints(order_service):
         Param('delivery_request', JSON, str),
     )
     @login_required
+    @transactional(priority=PRIORITY_HIGH)
     def order_completed(user_info, *args):
 
         """
@@ -328,118 +303,102 @@ def create_service_order_endpoints(order_service):
             2020-09-10 (minho.lee0716@gmail.com) : 추가
                 프론트에서 받아온 구매할 상품에 대한 총 가격에이 DB에 있는 상품의 정보를 이용한 총 가격과 일치하는지
                 검사를 하였고, 일치해야만 주문이 진행되게 하였습니다.
+            2026-10-18 (tnwjd060124@gmail.com) : commit 후 primary 고정(read-your-writes)
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @transactional 로 commit/rollback 처리
+            2026-10-18 (tnwjd060124@gmail.com) : admission control 우선순위 지정
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
-            db_connection = get_connection()
-
-            # DB에 연결이 됐다면
-            if db_connection:
-
-                # 유효성 검사를 통과한 Body로 들어온 정보를 order_info에 담습니다.
-                order_info = {
-                    "product_id"         : args[0],
-                    "color_id"           : args[1],
-                    "size_id"            : args[2],
-                    "quantity"           : args[3],
-                    "total_price"        : args[4],
-                    "receiver"           : args[5],
-                    "phone_number"       : args[6],
-                    "zip_code"           : args[7],
-                    "address"            : args[8],
-                    "additional_address" : args[9],
-                    "delivery_request"   : args[10]
-                }
-
-                # 데코레이터에서 받은 user_info객체에서 user_no을 가져옵니다.
-                user_no = user_info['user_no']
-
-                # 해당 유저의 정보가 올바른 유저인지 검사해줍니다.
-                user_existence = order_service.check_user_existence(user_no, db_connection)
+            db_connection = get_session()
+
+            # 유효성 검사를 통과한 Body로 들어온 정보를 order_info에 담습니다.
+            order_info = {
+                "product_id"         : args[0],
+                "color_id"           : args[1],
+                "size_id"            : args[2],
+                "quantity"           : args[3],
+                "total_price"        : args[4],
+                "receiver"           : args[5],
+                "phone_number"       : args[6],
+                "zip_code"           : args[7],
+                "address"            : args[8],
+                "additional_address" : args[9],
+                "delivery_request"   : args[10]
+            }
 
-                # 해당 유저의 정보가 없다면,
-                if user_existence is None:
+            # 데코레이터에서 받은 user_info객체에서 user_no을 가져옵니다.
+            user_no = user_info['user_no']
 
-                    # UNAUTHORIZED 에러 메세지를 보내줍니다.
-                    return jsonify({'message' : 'UNAUTHORIZED'}), 401
+            # 해당 유저의 정보가 올바른 유저인지 검사해줍니다.
+            user_existence = order_service.check_user_existence(user_no, db_connection)
 
-                # user_no의 값을 쓰기 편하도록 order_info에 넣어줍니다.
-                order_info['user_no'] = user_no
+            # 해당 유저의 정보가 없다면,
+            if user_existence is None:
 
-                # 해당 상품의 구매가능한 최소수량과 최대수량의 개수를 가져와 product_quantity_range라는 변수에 담아줍니다.
-                product_quantity_range = order_service.get_product_quantity_range(order_info, db_connection)
+                # UNAUTHORIZED 에러 메세지를 보내줍니다.
+                return jsonify({'message' : 'UNAUTHORIZED'}), 401
 
-                # 가져온 최소, 최대 구매 가능한 상품의 수량을 각 변수에 담아줍니다.
-                min_q = product_quantity_range['min_sales_quantity']
-                max_q = product_quantity_range['max_sales_quantity']
+            # user_no의 값을 쓰기 편하도록 order_info에 넣어줍니다.
+            order_info['user_no'] = user_no
 
-                # 구매하려고 하는 상품의 수량이 최소 구매 가능한 수량보다 적을 때
-                if order_info['quantity'] < min_q:
+            # 해당 상품의 구매가능한 최소수량과 최대수량의 개수를 가져와 product_quantity_range라는 변수에 담아줍니다.
+            product_quantity_range = order_service.get_product_quantity_range(order_info, db_connection)
 
-                    # 최소한 n개 이상의 수량을 구매해야 한다고 에러 메세지를 보내줍니다.
-                    return jsonify({'message' : f"The minimum number of products that can be purchased is {min_q} or more."}), 400
+            # 가져온 최소, 최대 구매 가능한 상품의 수량을 각 변수에 담아줍니다.
+            min_q = product_quantity_range['min_sales_quantity']
+            max_q = product_quantity_range['max_sales_quantity']
 
-                # 구매하려고 하는 상품의 수량이 최대 구매 가능한 수량보다 많을 때
-                if order_info['quantity'] > max_q:
+            # 구매하려고 하는 상품의 수량이 최소 구매 가능한 수량보다 적을 때
+            if order_info['quantity'] < min_q:
 
-                    # 최대 n개 이하의 수량을 구매해야 한다고 에러 메세지를 보내줍니다.
-                    return jsonify({'message' : f"The maximum number of products that can be purchased is {max_q} or less."}), 400
+                # 최소한 n개 이상의 수량을 구매해야 한다고 에러 메세지를 보내줍니다.
+                return jsonify({'message' : f"The minimum number of products that can be purchased is {min_q} or more."}), 400
 
-                # 상품을 주문하기 전, 현재 선택한 옵션의 상품 재고를 가져오는 메소드를 실행 후, 변수에 담아줍니다.
-                current_quantity = order_service.get_current_quantity(order_info, db_connection)
+            # 구매하려고 하는 상품의 수량이 최대 구매 가능한 수량보다 많을 때
+            if order_info['quantity'] > max_q:
 
-                # 만약 사용자가 구매하려는 상품의 개수가 현재 재고보다 많다면,
-                if order_info['quantity'] > current_quantity['current_quantity']:
+                # 최대 n개 이하의 수량을 구매해야 한다고 에러 메세지를 보내줍니다.
+                return jsonify({'message' : f"The maximum number of products that can be purchased is {max_q} or less."}), 400
 
-                    # 구매 가능한 상품의 수가 초과되었다고 에러를 보내줍니다.
-                    return jsonify({'message' : 'The number of products available for purchase has been exceeded.'}), 400
+            # 상품을 주문하기 전, 현재 선택한 옵션의 상품 재고를 가져오는 메소드를 실행 후, 변수에 담아줍니다.
+            current_quantity = order_service.get_current_quantity(order_info, db_connection)
 
-                # 구매하고자 하는 수량에 문제가 없다면, 유저가 구매하고자 하는 수량에 대해 총 가격에 대한 검사를 해줍니다.
-                # 먼저 주문 정보를 알려준 후, 총 가격을 계산해주는 메소드를 실행하여 total_price라는 변수에 넣어줍니다.
-                total_price = order_service.check_total_price(order_info, db_connection)
+            # 만약 사용자가 구매하려는 상품의 개수가 현재 재고보다 많다면,
+            if order_info['quantity'] > current_quantity['current_quantity']:
 
-                # 만약 프론트에서 계산한 총 가격과, DB에서 계산한 총 가격이 다르다면,
-                if order_info['total_price'] != total_price:
+                # 구매 가능한 상품의 수가 초과되었다고 에러를 보내줍니다.
+                return jsonify({'message' : 'The number of products available for purchase has been exceeded.'}), 400
 
-                    # 결제를 진행하지 않고 에러 메세지를 보내줍니다.
-                    return jsonify({'message' : 'Total price is incorrect.'}), 400
+            # 구매하고자 하는 수량에 문제가 없다면, 유저가 구매하고자 하는 수량에 대해 총 가격에 대한 검사를 해줍니다.
+            # 먼저 주문 정보를 알려준 후, 총 가격을 계산해주는 메소드를 실행하여 total_price라는 변수에 넣어줍니다.
+            total_price = order_service.check_total_price(order_info, db_connection)
 
-                # 프론트에서 계산한 총 가격이 문제가 없다면 결제를 이어서 진행합니다.
-                # 만약 사용자가 구매하려는 상품의 개수가 현재 재고와 작거나 같다면 이어서 결제를 진행합니다.
-                # 구매하기전, 해당 유저의 배송지 정보를 추가 또는 변경해주는 메소드를 호출합니다.
-                order_service.modify_user_shipping_details(order_info, db_connection)
+            # 만약 프론트에서 계산한 총 가격과, DB에서 계산한 총 가격이 다르다면,
+            if order_info['total_price'] != total_price:
 
-                # order의 정보를 인자로 넘겨 주문이력을 생성하는 메소드를 호출해 줍니다.
-                order_service.create_order_completed(order_info, db_connection)
+                # 결제를 진행하지 않고 에러 메세지를 보내줍니다.
+                return jsonify({'message' : 'Total price is incorrect.'}), 400
 
-                # 마지막으로 상품결제를 하고, 한번 더 검사를 해줍니다.
-                # DB에 현재 옵션에 대한 재고가 0보다 작다면,
-                if order_service.get_current_quantity(order_info, db_connection)['current_quantity'] < 0:
+            # 프론트에서 계산한 총 가격이 문제가 없다면 결제를 이어서 진행합니다.
+            # 만약 사용자가 구매하려는 상품의 개수가 현재 재고와 작거나 같다면 이어서 결제를 진행합니다.
+            # 구매하기전, 해당 유저의 배송지 정보를 추가 또는 변경해주는 메소드를 호출합니다.
+            order_service.modify_user_shipping_details(order_info, db_connection)
 
-                    # 똑같이 구매 가능한 상품의 수가 초과되었다고 에러를 보내줍니다.
-                    return jsonify({'message' : 'The number of products available for purchase has been exceeded.'}), 400
+            # order의 정보를 인자로 넘겨 주문이력을 생성하는 메소드를 호출해 줍니다.
+            order_service.create_order_completed(order_info, db_connection)
 
-                # 만약 재고가 0개 이상이라면 DB에 정상적으로 저장을 해줍니다.
-                db_connection.commit()
+            # 마지막으로 상품결제를 하고, 한번 더 검사를 해줍니다.
+            # DB에 현재 옵션에 대한 재고가 0보다 작다면,
+            if order_service.get_current_quantity(order_info, db_connection)['current_quantity'] < 0:
 
-                return jsonify({'message' : 'SUCCESS'}), 200
+                # 똑같이 구매 가능한 상품의 수가 초과되었다고 에러를 보내줍니다.
+                return jsonify({'message' : 'The number of products available for purchase has been exceeded.'}), 400
 
-            # DB에 연결이 되지 않았을 경우, DB에 연결되지 않았다는 에러메시지를 보내줍니다.
-            return jsonify({'message' : 'NO_DATABASE_CONNECTION'}), 500
+            return jsonify({'message' : 'SUCCESS'}), 200
 
         # 에러가 발생한 경우,
         except Exception as e:
-
-            # DB를 원래대로 되돌립니다.
-            db_connection.rollback()
             return jsonify({"message" : f"{e}"}), 400
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     return service_order_app
@@ -6,25 +6,64 @@ import pymysql, json
 from flask import (
     request,
     Blueprint,
-    jsonify
+    jsonify,
+    current_app
 )
 from flask_request_validator    import (
     GET,
     PATH,
     FORM,
+    JSON,
     Param,
     Pattern,
     validate_params
 )
 
-from connection import get_connection, get_s3_connection
+from admission  import PRIORITY_LOW
+from connection import get_s3_connection
+from db_session import get_session, transactional, manual_commit, read_only
 from utils      import (
     DatetimeRule,
     PageRule,
     LimitRule,
-    catch_exception
+    CursorRule,
+    IdListRule,
+    catch_exception,
+    is_not_modified,
+    conditional_json_response,
+    stream_csv_response
 )
 
+# 서비스 상품 리스트의 기본 페이지 크기
+PRODUCT_LIST_LIMIT = 30
+
+# 관리자 상품 CSV export 컬럼 : (row key, CSV header)
+REGISTERED_PRODUCT_EXPORT_COLUMNS = (
+    ('productRegistDate',    '등록일'),
+    ('productSmallImageUrl', '대표이미지'),
+    ('productName',          '상품명'),
+    ('productNo',            '상품번호'),
+    ('productCode',          '상품코드'),
+    ('sellPrice',            '판매가'),
+    ('discountPrice',        '할인가'),
+    ('discountRate',         '할인율'),
+    ('discountYn',           '할인여부'),
+    ('productSellYn',        '판매여부'),
+    ('productExhibitYn',     '진열여부')
+)
+
+# 상품 일괄등록 시 한번에 요청할 수 있는 상품 수 (PRODUCT_IMPORT_LIMIT 설정이 없을 때 사용)
+DEFAULT_PRODUCT_IMPORT_LIMIT = 10000
+
+# 상품 일괄등록 시 한 transaction 으로 저장하는 상품 수 (PRODUCT_IMPORT_CHUNK_SIZE 설정이 없을 때 사용)
+DEFAULT_PRODUCT_IMPORT_CHUNK_SIZE = 500
+
+# 판매/진열여부 일괄변경 시 한번에 요청할 수 있는 상품 수 (PRODUCT_STATUS_LIMIT 설정이 없을 때 사용)
+DEFAULT_PRODUCT_STATUS_LIMIT = 5000
+
+# 서비스 상품 여러 개 조회 시 한번에 요청할 수 있는 상품 수 (PRODUCT_BATCH_LIMIT 설정이 없을 때 사용)
+DEFAULT_PRODUCT_BATCH_LIMIT = 50
+
 def create_admin_product_endpoints(product_service):
 
     # 'admin/product' end point prefix 설정
@@ -51,6 +90,7 @@ def create_admin_product_endpoints(product_service):
         Param('maxSalesQuantity', FORM, str, rules = [Pattern(r"^([1-9]|1[0-9]|20)$")]),
         Param('optionQuantity', FORM, str)
     )
+    @transactional
     def product_register(*args):
 
         """
@@ -99,87 +139,71 @@ def create_admin_product_endpoints(product_service):
             2020-09-02 (sincerity410@gmail.com) : product_code column 추가에 따른 구조 수정
             2020-09-08 (sincerity410@gmail.com) : request Validation Check 추가
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2026-10-18 (tnwjd060124@gmail.com) : commit 후 primary 고정(read-your-writes)
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @transactional 로 commit/rollback 처리
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
 
-            db_connection = get_connection()
-
-            if db_connection:
-
-                product_info = {
-                    'mainCategoryId'    : args[0],
-                    'subCategoryId'     : args[1],
-                    'sellYn'            : args[2],
-                    'exhibitionYn'      : args[3],
-                    'productName'       : args[4],
-                    'simpleDescription' : args[5],
-                    'detailInformation' : args[6],
-                    'price'             : args[7],
-                    'discountRate'      : args[8],
-                    'discountStartDate' : args[9],
-                    'discountEndDate'   : args[10],
-                    'minSalesQuantity'  : args[11],
-                    'maxSalesQuantity'  : args[12],
-                    'optionQuantity'    : args[13]
-                }
-
-                if product_info['minSalesQuantity'] > product_info['maxSalesQuantity']:
-                    product_info['minSalesQuantity'] = product_info['maxSalesQuantity']
-
-                # 사이즈 별(Large, Medium, Small) 상품이미지 저장 위한 S3 Connection Instance 생성
-                s3_connection = get_s3_connection()
-                images        = request.files
-
-                # 상품정보를 DB에 저장하는 Function 실행
-                product_id = product_service.create_product(product_info, db_connection)
+            db_connection = get_session()
+
+            product_info = {
+                'mainCategoryId'    : args[0],
+                'subCategoryId'     : args[1],
+                'sellYn'            : args[2],
+                'exhibitionYn'      : args[3],
+                'productName'       : args[4],
+                'simpleDescription' : args[5],
+                'detailInformation' : args[6],
+                'price'             : args[7],
+                'discountRate'      : args[8],
+                'discountStartDate' : args[9],
+                'discountEndDate'   : args[10],
+                'minSalesQuantity'  : args[11],
+                'maxSalesQuantity'  : args[12],
+                'optionQuantity'    : args[13]
+            }
+
+            if product_info['minSalesQuantity'] > product_info['maxSalesQuantity']:
+                product_info['minSalesQuantity'] = product_info['maxSalesQuantity']
+
+            # 사이즈 별(Large, Medium, Small) 상품이미지 저장 위한 S3 Connection Instance 생성
+            s3_connection = get_s3_connection()
+            images        = request.files
 
-                # 상품이미지를 사이즈 별로 S3에 저장 및 URL을 DB에 Insert 하는 Function 실행
-                product_service.upload_product_image(
-                    images,
-                    product_id,
-                    s3_connection,
-                    db_connection
-                )
+            # 상품정보를 DB에 저장하는 Function 실행
+            product_id = product_service.create_product(product_info, db_connection)
 
-                # Exception이 발생하지 않았다면, commit 처리
-                db_connection.commit()
+            # 상품이미지를 사이즈 별로 S3에 저장 및 URL을 DB에 Insert 하는 Function 실행
+            product_service.upload_product_image(
+                images,
+                product_id,
+                s3_connection,
+                db_connection
+            )
 
-                return jsonify({'message' : 'SUCCESS'}), 200
+            return jsonify({'message' : 'SUCCESS'}), 200
 
         except pymysql.err.InternalError:
-            db_connection.rollback()
             return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
         except pymysql.err.OperationalError:
             return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
         except pymysql.err.ProgrammingError:
-            db_connection.rollback()
             return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
         except pymysql.err.IntegrityError:
-            db_connection.rollback()
             return jsonify({'message' : 'FOREIGN_KEY_CONSTRAINT_ERROR'}), 500
         except pymysql.err.DataError:
-            db_connection.rollback()
             return jsonify({'message' : 'DATA_ERROR'}), 400
         except KeyError:
-            db_connection.rollback()
             return jsonify({'message' 'KEY_ERROR'}), 400
         except json.decoder.JSONDecodeError as e:
-            db_connection.rollback()
             return jsonify({'message' : 'optionQuantity_VALUE_INVALID_JSON'}), 400
         except Exception as e:
-            db_connection.rollback()
             return jsonify({'message' : f'{e}'}), 500
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     @admin_product_app.route('/option', methods=['GET'])
+    @read_only
     def option_list():
 
         """
@@ -213,20 +237,18 @@ def create_admin_product_endpoints(product_service):
             2020-08-29 (sincerity410@gmail.com) : 초기생성
             2020-09-02 (sincerity410@gmail.com) : 옵션(색상, 사이즈) 통합 형태로 제공
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2026-10-18 (tnwjd060124@gmail.com) : 조회는 replica 사용
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @read_only 적용
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
-            db_connection = get_connection()
-            if db_connection:
+            db_connection = get_session()
 
-                # get_option_list 함수 호출해 색상 List 받아오기
-                options = product_service.get_option_list(db_connection)
+            # get_option_list 함수 호출해 색상 List 받아오기
+            options = product_service.get_option_list(db_connection)
 
-                return jsonify({'data' : options}), 200
+            return jsonify({'data' : options}), 200
 
         except pymysql.err.InternalError:
             return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
@@ -241,11 +263,8 @@ def create_admin_product_endpoints(product_service):
         except Exception as e:
             return jsonify({'message' : f'{e}'}), 500
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     @admin_product_app.route('/category', methods=['GET'])
+    @read_only
     def main_category_list():
 
         """
@@ -270,21 +289,18 @@ def create_admin_product_endpoints(product_service):
         History:
             2020-08-30 (sincerity410@gmail.com) : 초기생성
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2026-10-18 (tnwjd060124@gmail.com) : 조회는 replica 사용
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @read_only 적용
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
-            db_connection = get_connection()
-
-            if db_connection:
+            db_connection = get_session()
 
-                # get_main_category_list 함수 호출해 Main Category List 받아오기
-                main_category = product_service.get_main_category_list(db_connection)
+            # get_main_category_list 함수 호출해 Main Category List 받아오기
+            main_category = product_service.get_main_category_list(db_connection)
 
-                return jsonify({'data' : main_category}), 200
+            return jsonify({'data' : main_category}), 200
 
         except pymysql.err.InternalError:
             return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
@@ -299,15 +315,12 @@ def create_admin_product_endpoints(product_service):
         except Exception as e:
             return jsonify({'message' : f'{e}'}), 500
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     @admin_product_app.route('/category/<main_category_id>', methods=['GET'])
     @catch_exception
     @validate_params(
         Param('main_category_id', PATH, int)
     )
+    @read_only
     def sub_category_list(*args):
 
         """
@@ -336,23 +349,20 @@ def create_admin_product_endpoints(product_service):
         History:
             2020-08-30 (sincerity410@gmail.com) : 초기생성
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2026-10-18 (tnwjd060124@gmail.com) : 조회는 replica 사용
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @read_only 적용
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
-            db_connection = get_connection()
+            db_connection = get_session()
 
-            if db_connection:
+            main_category_id = args[0]
 
-                main_category_id = args[0]
+            # sub_category_list 함수 호출해 Sub Category List 받아오기
+            sub_category = product_service.get_sub_category_list(main_category_id, db_connection)
 
-                # sub_category_list 함수 호출해 Sub Category List 받아오기
-                sub_category = product_service.get_sub_category_list(main_category_id, db_connection)
-
-                return jsonify({'data' : sub_category}), 200
+            return jsonify({'data' : sub_category}), 200
 
         except pymysql.err.InternalError:
             return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
@@ -369,10 +379,6 @@ def create_admin_product_endpoints(product_service):
         except Exception as e:
             return jsonify({'message' : f'{e}'}), 500
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     @admin_product_app.route('', methods=['GET'])
     @catch_exception
     @validate_params(
@@ -384,10 +390,12 @@ def create_admin_product_endpoints(product_service):
         Param('productName', GET, str, required=False),
         Param('productNo', GET, int, required=False),
         Param('productCode', GET, str, required=False),
-        Param('page', GET, int, rules=[PageRule()]),
-        Param('limit', GET, int, rules=[LimitRule()])
+        Param('page', GET, int, required=False, rules=[PageRule()]),
+        Param('limit', GET, int, rules=[LimitRule()]),
+        Param('after', GET, int, required=False),
+        Param('before', GET, int, required=False)
     )
-
+    @read_only(priority=PRIORITY_LOW)
     def registered_product_list(*args):
 
         """
@@ -409,7 +417,9 @@ def create_admin_product_endpoints(product_service):
                 productNo    : 상품 번호
                 productCode  : 상품 코드
                 limit        : 페이지 당 상품 수
-                page         : 페이지 리스트 시작 기준
+                page         : 페이지 번호 (기본 1, after / before 가 없는 경우 사용)
+                after        : 응답의 next (다음 페이지)
+                before       : 응답의 prev (이전 페이지)
 
         Returns:
             200 :
@@ -430,7 +440,10 @@ def create_admin_product_endpoints(product_service):
                         }
                     ],
                         {
-                            "total": 검색된 상품 개수
+                            "total"       : 검색된 상품 개수,
+                            "approximate" : cache 된 개수 여부 (최근 등록/수정된 상품이 반영되지 않았을 수 있음),
+                            "next"        : 다음 페이지 after (마지막 페이지면 null),
+                            "prev"        : 이전 페이지 before (첫 페이지면 null)
                         }
                 ]
             400 : VALIDATION_ERROR
@@ -442,34 +455,36 @@ def create_admin_product_endpoints(product_service):
         History:
             2020-08-31 (sincerity410@gmail.com) : 초기생성
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2026-10-18 (tnwjd060124@gmail.com) : 조회는 replica 사용
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @read_only 적용
+            2026-10-18 (tnwjd060124@gmail.com) : admission control 우선순위 지정
+            2026-10-18 (tnwjd060124@gmail.com) : Total Count 에 approximate 추가
+            2026-10-18 (tnwjd060124@gmail.com) : after / before keyset pagination, page 생략 가능
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
-            db_connection = get_connection()
-
-            if db_connection:
-
-                filter_info = {
-                    'sellYn'       : args[0],
-                    'discountYn'   : args[1],
-                    'exhibitionYn' : args[2],
-                    'startDate'    : args[3],
-                    'endDate'      : args[4],
-                    'productName'  : args[5],
-                    'productNo'    : args[6],
-                    'productCode'  : args[7],
-                    'page'         : args[8],
-                    'limit'        : args[9]
-                }
-
-                # 상품 List, Totacl Count 받는 service 함수 호출 
-                product_list = product_service.get_registered_product_list(filter_info, db_connection)
-
-                return jsonify({'data' : product_list}), 200
+            db_connection = get_session()
+
+            filter_info = {
+                'sellYn'       : args[0],
+                'discountYn'   : args[1],
+                'exhibitionYn' : args[2],
+                'startDate'    : args[3],
+                'endDate'      : args[4],
+                'productName'  : args[5],
+                'productNo'    : args[6],
+                'productCode'  : args[7],
+                'page'         : args[8] or 1,
+                'limit'        : args[9],
+                'after'        : args[10],
+                'before'       : args[11]
+            }
+
+            # 상품 List, Totacl Count 받는 service 함수 호출 
+            product_list = product_service.get_registered_product_list(filter_info, db_connection)
+
+            return jsonify({'data' : product_list}), 200
 
         except pymysql.err.InternalError:
             return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
@@ -486,9 +501,229 @@ def create_admin_product_endpoints(product_service):
         except Exception as e:
             return jsonify({'message' : f'{e}'}), 500
 
-        finally:
-            if db_connection:
-                db_connection.close()
+    @admin_product_app.route('/export', methods=['GET'])
+    @catch_exception
+    @validate_params(
+        Param('sellYn', GET, str, required=False, rules = [Pattern(r'^([0-1])$')]),
+        Param('discountYn', GET, str, required=False, rules = [Pattern(r'^([0-1])$')]),
+        Param('exhibitionYn', GET, str, required=False, rules = [Pattern(r'^([0-1])$')]),
+        Param('startDate', GET, int, required=False, rules=[DatetimeRule()]),
+        Param('endDate', GET, int, required=False, rules=[DatetimeRule()]),
+        Param('productName', GET, str, required=False),
+        Param('productNo', GET, int, required=False),
+        Param('productCode', GET, str, required=False)
+    )
+    @read_only(priority=PRIORITY_LOW)
+    def registered_product_export(*args):
+
+        """
+
+        [ 상품관리 > 상품관리 ] 전체상품 CSV 다운로드 엔드포인트
+        [GET] http://ip:5000/admin/product/export
+
+        상품 List 와 같은 filter 에 해당하는 상품 전체를 한번에 CSV 로 내려줍니다.
+        unbuffered cursor 에서 읽은 row 를 바로 전송하므로 상품 수와 관계없이 메모리 사용량이 일정합니다.
+
+        Args:
+            Parameter: 미적용시 filter에서 제외 (상품 List 와 같음, page / limit 없음)
+                sellYN       : 판매 여부(1|0)
+                exhibitionYn : 진열 여부(1|0)
+                discountYn   : 할인 여부(1|0)
+                startDate    : 등록 기준 시작일 (YYYYmmdd)
+                endDate      : 등록 기준 종료일 (YYYYmmdd)
+                productName  : 상품 이름
+                productNo    : 상품 번호
+                productCode  : 상품 코드
+
+        Returns:
+            200 : products.csv (REGISTERED_PRODUCT_EXPORT_COLUMNS 순서의 CSV)
+            400 : VALIDATION_ERROR
+            500 : NO_DATABASE_CONNECTION_ERROR
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            db_connection = get_session()
+
+            filter_info = {
+                'sellYn'       : args[0],
+                'discountYn'   : args[1],
+                'exhibitionYn' : args[2],
+                'startDate'    : args[3],
+                'endDate'      : args[4],
+                'productName'  : args[5],
+                'productNo'    : args[6],
+                'productCode'  : args[7]
+            }
+
+            # 상품 row generator (SQL 은 여기서 실행되고, row 는 전송하면서 읽음)
+            products = product_service.export_registered_product_list(filter_info, db_connection)
+
+            return stream_csv_response(products, REGISTERED_PRODUCT_EXPORT_COLUMNS, 'products.csv')
+
+        except pymysql.err.InternalError:
+            return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
+        except pymysql.err.OperationalError:
+            return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
+        except pymysql.err.ProgrammingError:
+            return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
+        except pymysql.err.DataError:
+            return jsonify({'message' : 'DATA_ERROR'}), 400
+        except Exception as e:
+            return jsonify({'message' : f'{e}'}), 500
+
+    @admin_product_app.route('/import', methods=['POST'])
+    @catch_exception
+    @manual_commit(priority=PRIORITY_LOW)
+    def product_import():
+
+        """
+
+        [상품관리 > 상품 일괄등록] - 엔드포인트 Function
+        [POST] http://ip:5000/admin/product/import
+
+        상품등록과 같은 정보를 가진 상품 여러 개를 한번에 등록합니다.
+        모든 row 를 먼저 확인한 뒤 PRODUCT_IMPORT_CHUNK_SIZE 개씩 나누어 chunk 마다 commit 하므로
+        일부 row 가 잘못되었거나 chunk 저장에 실패해도 나머지 상품은 등록되고, 실패한 row 는 응답의 errors 로 알려줍니다.
+        상품 이미지는 등록하지 않으므로 상품수정에서 이미지를 등록해야 상품 리스트에 노출됩니다.
+
+        Args:
+            request.json : {"products" : [상품]} 또는 [상품]
+                상품 : 상품등록 form 과 같은 key (optionQuantity 대신 options)
+                    options : [{color : 색상 이름, size : 사이즈 이름, quantity : 재고수량}]
+
+            request.files['file'] 또는 text/csv body : 상품등록 form 과 같은 header 의 CSV
+                options : "색상:사이즈:수량|색상:사이즈:수량"
+
+        Returns:
+            200 : {total, imported, failed, products, errors, chunks, elapsed_seconds, products_per_second}
+            400 : INVALID_IMPORT_BODY, EMPTY_IMPORT, TOO_MANY_PRODUCTS
+            500 : NO_DATABASE_CONNECTION_ERROR
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            db_connection = get_session()
+
+            # CSV 파일 업로드, CSV body, JSON body 순서로 확인
+            if 'file' in request.files:
+                rows = product_service.parse_import_csv(request.files['file'].read().decode('utf-8'))
+
+            elif request.mimetype == 'text/csv':
+                rows = product_service.parse_import_csv(request.get_data(as_text=True))
+
+            else:
+                body = request.get_json(silent=True)
+                rows = body.get('products') if isinstance(body, dict) else body
+
+            if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+                return jsonify({'message' : 'INVALID_IMPORT_BODY'}), 400
+
+            if not rows:
+                return jsonify({'message' : 'EMPTY_IMPORT'}), 400
+
+            if len(rows) > current_app.config.get('PRODUCT_IMPORT_LIMIT', DEFAULT_PRODUCT_IMPORT_LIMIT):
+                return jsonify({'message' : 'TOO_MANY_PRODUCTS'}), 400
+
+            chunk_size = current_app.config.get('PRODUCT_IMPORT_CHUNK_SIZE', DEFAULT_PRODUCT_IMPORT_CHUNK_SIZE)
+            report     = product_service.import_products(rows, chunk_size, db_connection)
+
+            return jsonify(report), 200
+
+        except UnicodeDecodeError:
+            return jsonify({'message' : 'INVALID_IMPORT_BODY'}), 400
+        except pymysql.err.InternalError:
+            return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
+        except pymysql.err.OperationalError:
+            return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
+        except pymysql.err.ProgrammingError:
+            return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
+        except pymysql.err.DataError:
+            return jsonify({'message' : 'DATA_ERROR'}), 400
+        except Exception as e:
+            return jsonify({'message' : f'{e}'}), 500
+
+    @admin_product_app.route('/status', methods=['PUT'])
+    @catch_exception
+    @validate_params(
+        Param('productIds', JSON, list),
+        Param('sellYn', JSON, int, required=False),
+        Param('exhibitionYn', JSON, int, required=False)
+    )
+    @transactional(priority=PRIORITY_LOW)
+    def product_status_modify(*args):
+
+        """
+
+        [상품관리 > 상품관리] 판매/진열여부 일괄변경 - 엔드포인트 Function
+        [PUT] http://ip:5000/admin/product/status
+
+        상품수정(PUT /admin/product/<id>) 을 거치지 않고 여러 상품의 판매/진열여부만 한번에 변경합니다.
+        모든 상품은 하나의 transaction 으로 변경됩니다.
+
+        Args:
+            request.json:
+                productIds   : 상품 id 리스트 (최대 PRODUCT_STATUS_LIMIT 개)
+                sellYn       : 판매여부(1|0), 미적용시 변경하지 않음
+                exhibitionYn : 진열여부(1|0), 미적용시 변경하지 않음
+
+        Returns:
+            200 : {updated, unchanged, missing} 상품 id 리스트
+            400 : VALIDATION_ERROR, INVALID_PRODUCT_IDS, INVALID_STATUS, TOO_MANY_IDS
+            500 : NO_DATABASE_CONNECTION_ERROR
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            db_connection = get_session()
+
+            product_ids = args[0]
+            status      = {
+                'sellYn'       : args[1],
+                'exhibitionYn' : args[2]
+            }
+
+            if not product_ids or any(type(product_id) is not int or product_id < 1 for product_id in product_ids):
+                return jsonify({'message' : 'INVALID_PRODUCT_IDS'}), 400
+
+            if all(value is None for value in status.values()) or any(value not in (None, 0, 1) for value in status.values()):
+                return jsonify({'message' : 'INVALID_STATUS'}), 400
+
+            if len(product_ids) > current_app.config.get('PRODUCT_STATUS_LIMIT', DEFAULT_PRODUCT_STATUS_LIMIT):
+                return jsonify({'message' : 'TOO_MANY_IDS'}), 400
+
+            result = product_service.update_product_status(product_ids, status, db_connection)
+
+            return jsonify({'data' : result}), 200
+
+        except pymysql.err.InternalError:
+            return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
+        except pymysql.err.OperationalError:
+            return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
+        except pymysql.err.ProgrammingError:
+            return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
+        except pymysql.err.DataError:
+            return jsonify({'message' : 'DATA_ERROR'}), 400
+        except Exception as e:
+            return jsonify({'message' : f'{e}'}), 500
 
     @admin_product_app.route('/detail-image', methods=['POST'])
     def product_detail_image_upload():
@@ -537,6 +772,7 @@ def create_admin_product_endpoints(product_service):
     @validate_params(
         Param('product_id', PATH, int)
     )
+    @read_only
     def product_detail(*args):
 
         """
@@ -565,23 +801,20 @@ def create_admin_product_endpoints(product_service):
         History:
             2020-09-05 (sincerity410@gmail.com) : 초기생성
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2026-10-18 (tnwjd060124@gmail.com) : 조회는 replica 사용
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @read_only 적용
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
-            db_connection = get_connection()
-
-            if db_connection:
+            db_connection = get_session()
 
-                product_id = args[0]
+            product_id = args[0]
 
-                # sub_category_list 함수 호출해 Sub Category List 받아오기
-                product_info = product_service.get_product_detail(product_id, db_connection)
+            # sub_category_list 함수 호출해 Sub Category List 받아오기
+            product_info = product_service.get_product_detail(product_id, db_connection)
 
-                return jsonify({'data' : product_info}), 200
+            return jsonify({'data' : product_info}), 200
 
         except pymysql.err.InternalError:
             return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
@@ -598,10 +831,6 @@ def create_admin_product_endpoints(product_service):
         except Exception as e:
             return jsonify({'message' : f'{e}'}), 500
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     @admin_product_app.route('/<product_id>', methods=['PUT'])
     @catch_exception
     @validate_params(
@@ -624,6 +853,7 @@ def create_admin_product_endpoints(product_service):
         Param('maxSalesQuantity', FORM, str, rules = [Pattern(r"^([1-9]|1[0-9]|20)$")]),
         Param('optionQuantity', FORM, str)
     )
+    @transactional
     def product_modify(*args):
 
         """
@@ -667,97 +897,80 @@ def create_admin_product_endpoints(product_service):
         History:
             2020-09-06 (sincerity410@gmail.com) : 초기생성
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2026-10-18 (tnwjd060124@gmail.com) : commit 후 primary 고정(read-your-writes)
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @transactional 로 commit/rollback 처리
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
 
-            db_connection = get_connection()
-
-            if db_connection:
-
-                product_id   = args[0]
-                product_info = {
-                    'mainCategoryId'    : int(args[1]),
-                    'subCategoryId'     : int(args[2]),
-                    'sellYn'            : int(args[3]),
-                    'exhibitionYn'      : int(args[4]),
-                    'productName'       : args[5],
-                    'simpleDescription' : args[6],
-                    'detailInformation' : args[7],
-                    'price'             : args[8],
-                    'discountRate'      : int(args[9]),
-                    'discountStartDate' : args[10],
-                    'discountEndDate'   : args[11],
-                    'minSalesQuantity'  : int(args[12]),
-                    'maxSalesQuantity'  : int(args[13]),
-                    'optionQuantity'    : args[14]
-                }
-
-                if product_info['minSalesQuantity'] > product_info['maxSalesQuantity']:
-                    product_info['minSalesQuantity'] = product_info['maxSalesQuantity']
-
-                # DB 저장 내역과 비교를 위한 price value Decimal 변경
-                product_info['price'] = round(Decimal(product_info['price']),2)
-
-                # DB 저장 내역과 비교를 위한 discountStartDate, discountEndDate datetime 형태로 변경
-                if product_info['discountStartDate'] is not None:
-                    product_info['discountStartDate'] = datetime.strptime(product_info['discountStartDate'], '%Y-%m-%d %H:%M')
-                if product_info['discountEndDate'] is not None:
-                    product_info['discountEndDate'] = datetime.strptime(product_info['discountEndDate'], '%Y-%m-%d %H:%M')
-
-                # 사이즈 별(Large, Medium, Small) 상품이미지 저장 위한 S3 Connection Instance 생성
-                s3_connection = get_s3_connection()
-                images        = request.files
-
-                # 상품정보를 DB에 저장하는 Function 실행
-                product_service.update_product(product_id, product_info, db_connection)
-
-                # 기존 상품 이미지(product_images, images)를 제거하고
-                # 업데이트한 상품이미지를 사이즈 별로 S3에 저장 및 URL을 DB에 Insert 하는 Function 실행
-                product_service.update_product_image(
-                    images,
-                    product_id,
-                    s3_connection,
-                    db_connection
-                )
-
-                # Exception이 발생하지 않았다면, commit 처리
-                db_connection.commit()
+            db_connection = get_session()
+
+            product_id   = args[0]
+            product_info = {
+                'mainCategoryId'    : int(args[1]),
+                'subCategoryId'     : int(args[2]),
+                'sellYn'            : int(args[3]),
+                'exhibitionYn'      : int(args[4]),
+                'productName'       : args[5],
+                'simpleDescription' : args[6],
+                'detailInformation' : args[7],
+                'price'             : args[8],
+                'discountRate'      : int(args[9]),
+                'discountStartDate' : args[10],
+                'discountEndDate'   : args[11],
+                'minSalesQuantity'  : int(args[12]),
+                'maxSalesQuantity'  : int(args[13]),
+                'optionQuantity'    : args[14]
+            }
+
+            if product_info['minSalesQuantity'] > product_info['maxSalesQuantity']:
+                product_info['minSalesQuantity'] = product_info['maxSalesQuantity']
+
+            # DB 저장 내역과 비교를 위한 price value Decimal 변경
+            product_info['price'] = round(Decimal(product_info['price']),2)
+
+            # DB 저장 내역과 비교를 위한 discountStartDate, discountEndDate datetime 형태로 변경
+            if product_info['discountStartDate'] is not None:
+                product_info['discountStartDate'] = datetime.strptime(product_info['discountStartDate'], '%Y-%m-%d %H:%M')
+            if product_info['discountEndDate'] is not None:
+                product_info['discountEndDate'] = datetime.strptime(product_info['discountEndDate'], '%Y-%m-%d %H:%M')
+
+            # 사이즈 별(Large, Medium, Small) 상품이미지 저장 위한 S3 Connection Instance 생성
+            s3_connection = get_s3_connection()
+            images        = request.files
+
+            # 상품정보를 DB에 저장하는 Function 실행
+            product_service.update_product(product_id, product_info, db_connection)
+
+            # 기존 상품 이미지(product_images, images)를 제거하고
+            # 업데이트한 상품이미지를 사이즈 별로 S3에 저장 및 URL을 DB에 Insert 하는 Function 실행
+            product_service.update_product_image(
+                images,
+                product_id,
+                s3_connection,
+                db_connection
+            )
 
-                return jsonify({'message' : 'SUCCESS'}), 200
+            return jsonify({'message' : 'SUCCESS'}), 200
 
         except pymysql.err.InternalError:
-            db_connection.rollback()
             return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
         except pymysql.err.OperationalError:
             return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
         except pymysql.err.ProgrammingError:
-            db_connection.rollback()
             return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
         except pymysql.err.IntegrityError:
-            db_connection.rollback()
             return jsonify({'message' : 'FOREIGN_KEY_CONSTRAINT_ERROR'}), 500
         except pymysql.err.DataError:
-            db_connection.rollback()
             return jsonify({'message' : 'DATA_ERROR'}), 400
         except KeyError:
-            db_connection.rollback()
             return jsonify({'message' 'KEY_ERROR'}), 400
         except json.decoder.JSONDecodeError as e:
-            db_connection.rollback()
             return jsonify({'message' : 'optionQuantity_VALUE_INVALID_JSON'}), 400
         except Exception as e:
-            db_connection.rollback()
             return jsonify({'message' : f'{e}'}), 500
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     return admin_product_app
 
 def service_product_endpoint(product_service):
@@ -766,20 +979,45 @@ def service_product_endpoint(product_service):
     service_product_app = Blueprint('service_product_app', __name__, url_prefix='/product')
 
     @service_product_app.route('', methods=['GET'])
-    def product_list():
+    @catch_exception
+    @validate_params(
+        Param('cursor', GET, str, required=False, rules=[CursorRule()]),
+        Param('limit', GET, int, required=False, rules=[LimitRule()]),
+        Param('main_category_id', GET, int, required=False),
+        Param('sub_category_id', GET, int, required=False),
+        Param('sort', GET, str, required=False, rules=[Pattern(r'^(newest|price_asc|price_desc|discount)$')])
+    )
+    @read_only
+    def product_list(*args):
 
         """
 
-        [ 서비스 > 상품 전체 리스트 ] 엔드포인트
-        [GET] http://ip:5000/product
+        [ 서비스 > 상품 리스트 ] 엔드포인트
+        [GET] http://ip:5000/product?limit=30&cursor=<next_cursor>&main_category_id=1&sub_category_id=3&sort=price_asc
+
+        정렬 기준에 따라 한 페이지씩 조회합니다. (무한 스크롤)
+        다음 페이지는 응답의 next_cursor 를 cursor 로 전달하여 조회하며, 마지막 페이지의 next_cursor 는 null 입니다.
+        cursor 는 같은 정렬 기준으로만 사용할 수 있습니다.
+
+        Args:
+            cursor           : 이전 페이지 응답의 next_cursor (첫 페이지는 생략)
+            limit            : 한 페이지의 상품 수 (1 ~ 150, 기본 30)
+            main_category_id : 1차 카테고리 (생략 시 전체)
+            sub_category_id  : 2차 카테고리 (생략 시 전체)
+            sort             : 정렬 기준 (생략 시 newest)
+                newest     : 최신 등록순
+                price_asc  : 낮은 가격순 (할인가 기준)
+                price_desc : 높은 가격순 (할인가 기준)
+                discount   : 할인율 높은순 (현재 할인중인 상품만)
 
         Returns:
-            200 : "data": [
+            200 : {
+                    "data": [
                         {
                           "discount_rate": 30,
                           "price": 11250.0,
                           "product_name": "반팔티",
-                          "product_no": 1,
+                          "product_no": 3,
                           "thumbnail_image": "(생략)~M.jpg"
                         },
                         {
@@ -788,17 +1026,12 @@ def service_product_endpoint(product_service):
                           "product_name": "티셔츠",
                           "product_no": 2,
                           "thumbnail_image": "(생략)~M.jpg"
-                        },
-                        {
-                          "discount_rate": 30,
-                          "price": 13700.0,
-                          "product_name": "티셔츠",
-                          "product_no": 3,
-                          "thumbnail_image": "(생략)~M.jpg"
                         }
-                  ]
-            400 : VALIDATION_ERROR
-            500 : NO_DATABASE_CONNECTION_ERROR
+                    ],
+                    "next_cursor": "eyJwcm9kdWN0X25vIjoyfQ"
+                  }
+            304 : If-None-Match 의 ETag 와 같은 페이지인 경우 (body 없음)
+            400 : VALIDATION_ERROR, INVALID_CURSOR
 
         Author:
             minho.lee0716@gmail.com (이민호)
@@ -809,45 +1042,108 @@ def service_product_endpoint(product_service):
                 엔드포인트를 찾아가지 못하는 문제 해결
             2020-08-27 (minho.lee0716@gmail.com) : 수정
                 상품이 하나도 존재하지 않을 경우 빈 배열을 리턴
+            2026-10-18 (tnwjd060124@gmail.com) : 조회는 replica 사용
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @read_only 적용
+            2026-10-18 (tnwjd060124@gmail.com) : cursor 기반 pagination 적용 (전체 리스트 대신 페이지 단위 조회)
+            2026-10-18 (tnwjd060124@gmail.com) : ETag / Last-Modified 조건부 요청(304) 지원 (상품 조회 전에 version 확인)
+            2026-10-18 (tnwjd060124@gmail.com) : 카테고리 필터, 가격순(할인가 기준)/할인순 정렬 추가
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
-            db_connection = get_connection()
+            db_connection = get_session()
+
+            page_info = {
+                'cursor'           : args[0],
+                'limit'            : args[1] or PRODUCT_LIST_LIMIT,
+                'main_category_id' : args[2],
+                'sub_category_id'  : args[3],
+                'sort'             : args[4] or 'newest'
+            }
+
+            # 응답 version 은 페이지를 조회하지 않고 상품 갱신일시로 계산
+            version = product_service.get_product_list_version(page_info, db_connection)
+
+            # 이전 응답과 같은 페이지면 상품을 조회하지 않고 304
+            # 아니면 한 페이지의 상품과 다음 페이지 cursor 를 가져옵니다. (상품이 없는 경우 빈 배열)
+            return conditional_json_response(
+                lambda : product_service.get_product_list(page_info, version, db_connection),
+                version
+            )
+
+        except Exception as e:
+            return jsonify({'message' : f'{e}'}), 400
 
-            # DB에 연결이 잘 되었을 경우
-            if db_connection:
+    @service_product_app.route('/batch', methods=['GET'])
+    @catch_exception
+    @validate_params(
+        Param('ids', GET, str, rules=[IdListRule()])
+    )
+    @read_only
+    def product_batch(*args):
 
-                # 모든 상품을 products라는 변수에 가져와 담습니다.
-                products = product_service.get_product_list(db_connection)
+        """
 
-                # 상품이 1개라도 존재하지 않을 경우 json 리턴값이 null 인걸 확인하였고, 그럴 경우엔
-                if not products:
+        [ 서비스 > 상품 여러 개 조회 ] 엔드포인트
+        [GET] http://ip:5000/product/batch?ids=3,1,2
+
+        장바구니, 최근 본 상품처럼 여러 상품을 그릴 때 상품마다 상세정보를 요청하지 않고
+        상품 정보, 대표 이미지, 색상을 한번에 조회합니다. (상품 수와 관계없이 DB 왕복 1번)
+        판매/진열중이 아니거나 없는 상품은 missing 으로 알려줍니다.
+
+        Args:
+            ids : 쉼표로 구분된 상품 id (최대 PRODUCT_BATCH_LIMIT 개, 기본 50개)
 
-                    # 빈 배열을 리턴해줍니다.
-                    return jsonify({'data' : []}), 200
+        Returns:
+            200 : {
+                    "data": {
+                        "3": {
+                            "colors": [{"color_id": 1, "color_name": "Black"}],
+                            "discount_rate": 30,
+                            "max_sales_quantity": 20,
+                            "min_sales_quantity": 1,
+                            "name": "반팔티",
+                            "original_price": 16070.0,
+                            "product_id": 3,
+                            "sales_price": 11250.0,
+                            "thumbnail_image": "(생략)~M.jpg"
+                        }
+                    },
+                    "missing": [1, 2]
+                  }
+            400 : VALIDATION_ERROR, TOO_MANY_IDS
 
-                # 상품이 1개 이상 존재할 경우, 모든 상품 리스트를 리턴해줍니다.
-                return jsonify({'data' : products}), 200
+        Author:
+            tnwjd060124@gmail.com (손수정)
 
-            # DB에 연결이 되지 않았을 경우, DB에 연결되지 않았다는 에러메시지를 보내줍니다.
-            return jsonify({'message' : 'NO_DATABASE_CONNECTION'}), 500
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
 
-        except Exception as e:
-            return jsonify({'message' : e}), 400
+        """
 
-        finally:
-            if db_connection:
-                db_connection.close()
+        try:
+            db_connection = get_session()
+
+            # 요청 순서를 유지하며 중복 제거
+            product_ids = list(dict.fromkeys(int(product_id) for product_id in args[0].split(',')))
+
+            if len(product_ids) > current_app.config.get('PRODUCT_BATCH_LIMIT', DEFAULT_PRODUCT_BATCH_LIMIT):
+                return jsonify({'message' : 'TOO_MANY_IDS'}), 400
+
+            # 상품 id 별 상품 정보와 조회되지 않은 상품 id 를 가져옵니다.
+            products = product_service.get_product_batch(product_ids, db_connection)
+
+            return jsonify(products), 200
+
+        except Exception as e:
+            return jsonify({'message' : f'{e}'}), 400
 
     @service_product_app.route('/<product_id>', methods=['GET'])
     @catch_exception
     @validate_params(
         Param('product_id', PATH, int)
     )
+    @read_only
     def product_details(product_id):
 
         """
@@ -861,6 +1157,7 @@ def service_product_endpoint(product_service):
 
         Returns:
             200 : 상품에 대한 상세정보
+            304 : If-None-Match 의 ETag 와 같은 상세정보인 경우 (body 없음)
             400 : VALIDATION_ERROR
             401 : product_id에 해당하는 상품이 없는경우
             500 : NO_DATABASE_CONNECTION_ERROR
@@ -894,49 +1191,54 @@ def service_product_endpoint(product_service):
                 색상의 조건이 들어올 시, 나머지 사이즈와 재고를 리턴
             2020-09-09 (tnwjd060124@gmail.com) : 수정
                 path parameter로 들어온 product_id에 해당하는 제품이 없을 때 401에러 리턴
+            2026-10-18 (tnwjd060124@gmail.com) : 조회는 replica 사용
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @read_only 적용
+            2026-10-18 (tnwjd060124@gmail.com) : 나머지 옵션 요청 시 상세정보를 조회하지 않도록 변경
+            2026-10-18 (tnwjd060124@gmail.com) : 상세정보 ETag / Last-Modified 조건부 요청(304) 지원 (상세정보 조회 전에 version 확인, 재고 응답 제외)
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
         try:
-            db_connection = get_connection()
+            db_connection = get_session()
 
-            # DB에 연결이 됐다면
-            if db_connection:
+            # Query Parameter의 요청이 존재할 경우 상세정보 없이 나머지 옵션만 조회
+            if request.args:
 
-                # service에서 상세정보, 이미지, 옵션을 묶은 정보들을 details에 저장
-                details = product_service.get_product_details(product_id, db_connection)
+                # color_id로 들어온 키의 값을 color_id라는 변수에 저장
+                color_id = request.args['color_id']
 
-                # 상품id에 해당하는 정보가 존재하는 경우에만 실행
-                if details:
+                # 나머지 옵션을 가져오기 위해 딕셔너리를 생성
+                product_info = {
+                    'product_id' : product_id,
+                    'color_id'   : color_id
+                }
 
-                    # Query Parameter의 요청이 존재할 경우
-                    if request.args:
+                # service에서 나머지 옵션(사이즈, 재고)을 묶은 정보들을 etc_options에 저장
+                # 나머지 옵션들의 정보가 없다면 service에서 raise를 이용한 에러 처리
+                etc_options = product_service.get_etc_options(product_info, db_connection)
 
-                        # color_id로 들어온 키의 값을 color_id라는 변수에 저장
-                        color_id = request.args['color_id']
+                # 상품id에 해당하는 정보가 존재하는 경우에만 리턴
+                if etc_options is not None:
+                    return jsonify({'data' : etc_options}), 200
 
-                        # 나머지 옵션을 가져오기 위해 딕셔너리를 생성
-                        product_info = {
-                            'product_id' : product_id,
-                            'color_id'   : color_id
-                        }
+                return jsonify({'message' : 'NON_EXISTING_DATA'}), 401
 
-                        # service에서 나머지 옵션(사이즈, 재고)을 묶은 정보들을 etc_options에 저장
-                        # 나머지 옵션들의 정보가 없다면 service에서 raise를 이용한 에러 처리
-                        etc_options = product_service.get_etc_options(product_info, db_connection)
+            # 응답 version 은 상세정보를 조회하지 않고 상품 갱신일시로 계산 (판매/진열중인 상품이 없으면 None)
+            version = product_service.get_product_details_version(product_id, db_connection)
 
-                        return jsonify({'data' : etc_options}), 200
+            # 이전 응답과 같은 상세정보면 상세정보를 조회하지 않고 304
+            if version is not None and is_not_modified(version):
+                return conditional_json_response(None, version)
 
-                    return jsonify({'data' : details}), 200
+            # service에서 상세정보, 이미지, 옵션을 묶은 정보들을 details에 저장
+            details = product_service.get_product_details(product_id, version, db_connection) if version else None
 
-                # 상품 id에 해당하는 data가 존재하지 않은 경
-                return jsonify({'message' : 'NON_EXISTING_DATA'}), 401
+            # 상품id에 해당하는 정보가 존재하는 경우에만 실행
+            if details:
+                return conditional_json_response({'data' : details}, version)
 
-            # DB에 연결이 되지 않았을 경우, DB에 연결되지 않았다는 에러메시지를 보내줍니다.
-            return jsonify({'message' : 'NO_DATABASE_CONNECTION'}), 500
+            # 상품 id에 해당하는 data가 존재하지 않은 경우
+            return jsonify({'message' : 'NON_EXISTING_DATA'}), 401
 
         # 요청은 들어오지만, Query Parameter의 키 값이 잘못 요청된 경우
         except KeyError:
@@ -945,8 +1247,4 @@ def service_product_endpoint(product_service):
         except Exception as e:
             return jsonify({'message' : f"{e}"}), 400
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     return service_product_app
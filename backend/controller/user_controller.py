@@ -8,13 +8,16 @@ from flask_request_validator import (
     JSON
 )
 
-from connection import get_connection
+from admission  import PRIORITY_LOW
+from db_session import get_session, transactional, read_only
 from utils      import (
     login_required,
     catch_exception,
     PageRule,
     LimitRule,
-    DatetimeRule
+    DatetimeRule,
+    is_stream_response_enabled,
+    stream_json_response
 )
 
 def create_user_endpoints(user_service):
@@ -22,6 +25,7 @@ def create_user_endpoints(user_service):
     user_app = Blueprint('user_app', __name__, url_prefix='/user')
 
     @user_app.route('/signin', methods=['POST'])
+    @transactional
     def signin():
 
         """
@@ -44,48 +48,38 @@ def create_user_endpoints(user_service):
             2020-08-20 (tnwjd060124@gmail.com) : 초기 생성
             2020-08-26 (tnwjd060124@gmail.com) : 수정
                 controller에서 db commit하도록 변경
+            2026-10-18 (tnwjd060124@gmail.com) : commit 후 primary 고정(read-your-writes)
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @transactional 로 commit/rollback 처리
 
         """
 
-        db_connection = None
-
         try:
 
             # db 연결
-            db_connection = get_connection()
+            db_connection = get_session()
 
             # body 정보를 data에 저장
             data = request.json
 
-            if db_connection:
-
-                # 유저 로그인 메소드 실행
-                sign_in_user = user_service.sign_in(data, db_connection)
-
-                if sign_in_user:
-
-                    #access_token 생성 메소드 실행 결과를 access_token 에 저장
-                    access_token = user_service.generate_access_token(sign_in_user)
+            # 유저 로그인 메소드 실행
+            sign_in_user = user_service.sign_in(data, db_connection)
 
-                    db_connection.commit()
+            if sign_in_user:
 
-                    return jsonify({'access_token' : access_token}), 200
+                #access_token 생성 메소드 실행 결과를 access_token 에 저장
+                access_token = user_service.generate_access_token(sign_in_user)
 
-                # login 실패
-                return jsonify({'message' : 'UNAUTHORIZED'}), 401
+                return jsonify({'access_token' : access_token}), 200
 
-            # db 연결되지 않은경우
-            return jsonify({"message" : "NO_DATABASE_CONNECTION"}), 500
+            # login 실패
+            return jsonify({'message' : 'UNAUTHORIZED'}), 401
 
         # 정의하지 않은 에러 잡아줌
         except Exception as e:
             return jsonify({"message" : f'{e}'}), 400
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     @user_app.route('/google-signin', methods=['POST'])
+    @transactional
     def googlesignin():
 
         """
@@ -107,65 +101,55 @@ def create_user_endpoints(user_service):
             2020-08-20 (tnwjd060124@gmail.com) : 초기 생성
             2020-08-26 (tnwjd060124@gmail.com) : 수정
                 controller에서 db commit하도록 변경
+            2026-10-18 (tnwjd060124@gmail.com) : commit 후 primary 고정(read-your-writes)
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @transactional 로 commit/rollback 처리
 
         """
 
-        db_connection = None
-
         try:
 
             # db 연결
-            db_connection = get_connection()
-
-            if db_connection:
+            db_connection = get_session()
 
-                # header에 담긴 token을 id_token에 저장
-                id_token = request.headers['Authorization']
+            # header에 담긴 token을 id_token에 저장
+            id_token = request.headers['Authorization']
 
-                # google oauth에 id_token을 담아 request 전송
-                user_request = requests.get(f'https://oauth2.googleapis.com/tokeninfo?id_token={id_token}')
+            # google oauth에 id_token을 담아 request 전송
+            user_request = requests.get(f'https://oauth2.googleapis.com/tokeninfo?id_token={id_token}')
 
-                # request 결과를 user_info에 저장
-                user_info = user_request.json()
+            # request 결과를 user_info에 저장
+            user_info = user_request.json()
 
-                # 유저의 email, name, social_id 저장
-                google_email = user_info.get('email')
-                google_name = user_info.get('name')
-                google_id = user_info.get('sub')
+            # 유저의 email, name, social_id 저장
+            google_email = user_info.get('email')
+            google_name = user_info.get('name')
+            google_id = user_info.get('sub')
 
-                # 저장된 결과로 소셜 로그인 메소드 실행, 결과를 sign_in_user에 저장
-                sign_in_user = user_service.google_social_login(
-                    {
-                        "email"             : google_email,
-                        "name"              : google_name,
-                        "user_social_id"    : google_id
-                    }, db_connection)
-
-                if sign_in_user:
+            # 저장된 결과로 소셜 로그인 메소드 실행, 결과를 sign_in_user에 저장
+            sign_in_user = user_service.google_social_login(
+                {
+                    "email"             : google_email,
+                    "name"              : google_name,
+                    "user_social_id"    : google_id
+                }, db_connection)
 
-                    # 소셜 로그인 성공 시 access_token 생성 메소드 실행
-                    access_token = user_service.generate_access_token(sign_in_user)
+            if sign_in_user:
 
-                    db_connection.commit()
+                # 소셜 로그인 성공 시 access_token 생성 메소드 실행
+                access_token = user_service.generate_access_token(sign_in_user)
 
-                    return jsonify({"access_token" : access_token}), 200
+                return jsonify({"access_token" : access_token}), 200
 
-                # 소셜 로그인 실패
-                return jsonify({"message" : "FAIL_SOCIAL_LOGIN"}), 401
-
-            # db 연결 되지 않았을 때
-            return jsonify({"message" : "NO_DATABASE_CONNECTION"}), 500
+            # 소셜 로그인 실패
+            return jsonify({"message" : "FAIL_SOCIAL_LOGIN"}), 401
 
         # 정의하지 않은 모든 에러를 잡아줌
         except Exception as e:
             return jsonify({"message" : f'{e}'}), 400
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     @user_app.route('/mypage/orderlist', methods=['GET'])
     @login_required
+    @read_only
     def get_user_orderlist(user_info):
         """
 
@@ -183,47 +167,45 @@ def create_user_endpoints(user_service):
 
             History:
                 2020-08-28 (tnwjd060124@gmail.com) : 초기 생성
+                2026-10-18 (tnwjd060124@gmail.com) : 조회는 replica 사용
+                2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @read_only 적용
+                2026-10-18 (tnwjd060124@gmail.com) : STREAM_LIST_RESPONSE 설정 시 chunked JSON 응답
 
         """
 
-        db_connection = None
-
         try:
 
             # db 연결
-            db_connection = get_connection()
+            db_connection = get_session()
 
-            if db_connection:
+            # STREAM_LIST_RESPONSE 설정 시 주문 정보를 나누어 전송
+            if is_stream_response_enabled():
+                result = user_service.get_user_orders(user_info, db_connection, stream=True)
 
-                # 유저의 주문 정보를 가져오는 메소드 실행
-                result = user_service.get_user_orders(user_info, db_connection)
+                return stream_json_response(result or [])
 
-                if result:
+            # 유저의 주문 정보를 가져오는 메소드 실행
+            result = user_service.get_user_orders(user_info, db_connection)
 
-                    # 주문정보가 리턴
-                    return jsonify({"data" : result}), 200
+            if result:
 
-                # 주문정보가 없는 경우 빈 list 리턴
-                return jsonify({"data" : []}), 200
+                # 주문정보가 리턴
+                return jsonify({"data" : result}), 200
 
-            # db 연결이 되지 않은 경우
-            return jsonify({"message" : "NO_DATABASE_CONNECTION"}), 500
+            # 주문정보가 없는 경우 빈 list 리턴
+            return jsonify({"data" : []}), 200
 
         # 정의하지 않은 error를 잡아줌
         except Exception as e:
             return jsonify({"message" : f"{e}"}), 400
 
-        finally:
-
-            if db_connection:
-                db_connection.close()
-
     @user_app.route('/mypage/orderdetail/<order_detail_no>', methods=['GET'], endpoint='user_order_detail')
     @catch_exception
     @validate_params(
         Param('order_detail_no', PATH, int)
     )
     @login_required
+    @read_only
     def user_order_detail(user_info, *args):
         """
 
@@ -243,38 +225,29 @@ def create_user_endpoints(user_service):
 
             History:
                 2020-08-30 (tnwjd060124@gmail.com) : 초기 생성
+                2026-10-18 (tnwjd060124@gmail.com) : 조회는 replica 사용
+                2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @read_only 적용
 
         """
 
-        db_connection = None
-
         try:
 
-            db_connection = get_connection()
-
-            if db_connection:
+            db_connection = get_session()
 
-                # path parameter로 받은 order_detail_no를 user_info에 넣어줌
-                user_info['order_detail_no'] = args[0]
+            # path parameter로 받은 order_detail_no를 user_info에 넣어줌
+            user_info['order_detail_no'] = args[0]
 
-                result = user_service.get_order_detail(user_info, db_connection)
+            result = user_service.get_order_detail(user_info, db_connection)
 
-                if result:
+            if result:
 
-                    return jsonify({"data" : result}), 200
+                return jsonify({"data" : result}), 200
 
-                return jsonify({"message" : "NO_MATCH_DATA"}), 401
-
-            # db 연결 실패
-            return jsonify({"NO_DATABASE_CONNECTION"}), 500
+            return jsonify({"message" : "NO_MATCH_DATA"}), 401
 
         except Exception as e:
             return jsonify ({"message" : f"{e}"}), 400
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     return user_app
 
 def create_admin_user_endpoints(user_service):
@@ -296,6 +269,7 @@ def create_admin_user_endpoints(user_service):
         Param('email', GET, str, required=False),
         Param('sort', GET, bool)
     )
+    @read_only(priority=PRIORITY_LOW)
     def user_list(*args):
 
         """
@@ -336,65 +310,57 @@ def create_admin_user_endpoints(user_service):
         History:
             2020-08-20 (tnwjd060124@gmail.com) : 초기 생성
             2020-09-02 (tnwjd060124@gmail.com) : filter 기능 추가
+            2026-10-18 (tnwjd060124@gmail.com) : 조회는 replica 사용
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @read_only 적용
+            2026-10-18 (tnwjd060124@gmail.com) : admission control 우선순위 지정
 
         """
 
-        db_connection = None
-
         try:
 
             # db 연결
-            db_connection = get_connection()
-
-            if db_connection:
-
-                # request로 들어온 page, limit, filter 정보 저장
-                filter_info = {
-                    'page'            : args[0],
-                    'limit'           : args[1],
-                    'lastaccess_from' : args[2],
-                    'lastaccess_to'   : args[3],
-                    'created_from'    : args[4],
-                    'created_to'      : args[5],
-                    'user_no'         : args[6],
-                    'user_name'       : args[7],
-                    'social_network'  : args[8],
-                    'phone_number'    : args[9],
-                    'email'           : args[10],
-                    'sort'            : args[11]
-                }
+            db_connection = get_session()
 
-                # 총 유저의 수를 가져와서 total_user에 저장
-                total_user = user_service.get_total_user_number(filter_info, db_connection)
+            # request로 들어온 page, limit, filter 정보 저장
+            filter_info = {
+                'page'            : args[0],
+                'limit'           : args[1],
+                'lastaccess_from' : args[2],
+                'lastaccess_to'   : args[3],
+                'created_from'    : args[4],
+                'created_to'      : args[5],
+                'user_no'         : args[6],
+                'user_name'       : args[7],
+                'social_network'  : args[8],
+                'phone_number'    : args[9],
+                'email'           : args[10],
+                'sort'            : args[11]
+            }
 
-                # 총 유저가 존재할 경우에만 유저리스트 가져옴
-                if total_user['total_number']:
+            # 총 유저의 수를 가져와서 total_user에 저장
+            total_user = user_service.get_total_user_number(filter_info, db_connection)
 
-                    # 요청으로 들어온 페이지가 총 유저수 / limit 한 페이지보다 작은 경우에만 유저리스트 가져옴
-                    if math.ceil(total_user['total_number']/filter_info['limit']) >= filter_info['page']:
+            # 총 유저가 존재할 경우에만 유저리스트 가져옴
+            if total_user['total_number']:
 
-                        # 유저 리스트 가져와서 result에 저장
-                        result = user_service.get_user_list(filter_info, db_connection)
+                # 요청으로 들어온 페이지가 총 유저수 / limit 한 페이지보다 작은 경우에만 유저리스트 가져옴
+                if math.ceil(total_user['total_number']/filter_info['limit']) >= filter_info['page']:
 
-                        return jsonify({"total_user_number" : total_user['total_number'], "data" : result}), 200
+                    # 유저 리스트 가져와서 result에 저장
+                    result = user_service.get_user_list(filter_info, db_connection)
 
-                    # 요청으로 들어온 page가 바르지 않은 경우
-                    return jsonify({"message" : "INVALID_PAGE"}), 400
+                    return jsonify({"total_user_number" : total_user['total_number'], "data" : result}), 200
 
-                # 총 유저가 없을 경우 빈 배열 리턴
-                return jsonify({"total_user_number" : 0, "data" : []}), 200
+                # 요청으로 들어온 page가 바르지 않은 경우
+                return jsonify({"message" : "INVALID_PAGE"}), 400
 
-            # db 연결 되지 않았을 때
-            return jsonify({"message" : "NO_DATABASE_CONNECTION"}), 500
+            # 총 유저가 없을 경우 빈 배열 리턴
+            return jsonify({"total_user_number" : 0, "data" : []}), 200
 
         # 정의하지 않은 모든 에러를 잡아줌
         except Exception as e:
             return jsonify({"message" : f'{e}'}), 400
 
-        finally:
-            if db_connection:
-                db_connection.close()
-
     @admin_user_app.route('/shippingDetail', methods=['PATCH'], endpoint='update_user_shippng_detail')
     @catch_exception
     @validate_params(
@@ -404,6 +370,7 @@ def create_admin_user_endpoints(user_service):
         Param('additionalAddress', JSON, str),
         Param('zipCode', JSON, int)
     )
+    @transactional
     def update_user_shipping_detail(*args):
 
         """
@@ -426,49 +393,37 @@ def create_admin_user_endpoints(user_service):
 
         History:
             2020-09-07 (tnwjd060124@gmail.com)
+            2026-10-18 (tnwjd060124@gmail.com) : commit 후 primary 고정(read-your-writes)
+            2026-10-18 (tnwjd060124@gmail.com) : request 단위 DB session 사용, @transactional 로 commit/rollback 처리
 
         """
 
-        db_connection = None
-
         try:
 
-            db_connection = get_connection()
-
-            if db_connection:
-
-                # 파라미터 유효성 검사를 거친 정보들을 user_info 에 저장
-                user_info = {
-                    'user_no'               : args[0],
-                    'phone_number'          : args[1],
-                    'address'               : args[2],
-                    'additional_address'    : args[3],
-                    'zip_code'              : args[4]
-                }
+            db_connection = get_session()
 
-                # 유저의 배송정보 변경하는 메소드 실행
-                user = user_service.update_user_shipping_detail(user_info, db_connection)
+            # 파라미터 유효성 검사를 거친 정보들을 user_info 에 저장
+            user_info = {
+                'user_no'               : args[0],
+                'phone_number'          : args[1],
+                'address'               : args[2],
+                'additional_address'    : args[3],
+                'zip_code'              : args[4]
+            }
 
-                # 메소드 실행 결과가 None이 아닐 경우
-                if user:
+            # 유저의 배송정보 변경하는 메소드 실행
+            user = user_service.update_user_shipping_detail(user_info, db_connection)
 
-                    db_connection.commit()
+            # 메소드 실행 결과가 None이 아닐 경우
+            if user:
 
-                    return jsonify({"message" : "SUCCESS"}), 200
+                return jsonify({"message" : "SUCCESS"}), 200
 
-                # 메소드 실행 결과가 None일 경우
-                return jsonify({"message" : "UNAUTHORIZED"}), 401
-
-            # DB 연결 실패
-            return jsonify({"message" : "NO_DATABASE_CONNECTION"}), 500
+            # 메소드 실행 결과가 None일 경우
+            return jsonify({"message" : "UNAUTHORIZED"}), 401
 
         # 정의하지 않은 에러를 잡아줌
         except Exception as e:
             return jsonify({"message" : f"{e}"}), 400
 
-        finally:
-
-            if db_connection:
-                db_connection.close()
-
     return admin_user_app
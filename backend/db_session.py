@@ -0,0 +1,424 @@
+import pymysql
+
+from contextlib      import contextmanager
+from functools       import wraps, partial
+from flask           import g, jsonify, current_app, has_app_context
+
+from admission       import admit, AdmissionRejected, PRIORITY_NORMAL
+from connection      import get_connection
+from instrumentation import InstrumentedCursor
+from routing         import pin_to_primary
+
+class LazyConnection:
+
+    """
+
+    요청(request) 단위로 사용하는 DB session 입니다.
+    생성 시점에는 연결을 빌려오지 않고, DAO 에서 처음 cursor() 등을 호출할 때 pool 에서 빌려옵니다.
+    validation, 토큰 확인 등에서 실패한 요청은 DB 연결을 사용하지 않습니다.
+    cursor() 는 query 통계를 기록하는 InstrumentedCursor 를 Return 합니다.
+    admission control 로 입장한 요청은 close() 시 자리(ticket)도 함께 반납합니다.
+    after_commit() 으로 등록한 함수는 commit 이 성공한 뒤 실행되고, rollback 시 버려집니다.
+
+    Args:
+        read_only : True 이면 replica 에서 autocommit 으로 연결을 빌려옵니다.
+        ticket    : admission control 의 AdmissionTicket
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : query 통계 기록 추가
+        2026-10-18 (tnwjd060124@gmail.com) : admission ticket 반납 추가
+        2026-10-18 (tnwjd060124@gmail.com) : commit 이후 실행할 함수(after_commit) 추가
+
+    """
+
+    def __init__(self, read_only=False, ticket=None):
+        self.read_only    = read_only
+        self.after_commit = []
+        self._connection  = None
+        self._ticket      = ticket
+
+    @property
+    def acquired(self):
+        return self._connection is not None
+
+    def _get_connection(self):
+        if self._connection is None:
+            connection = get_connection(read_only=self.read_only)
+
+            # 조회 전용 요청은 transaction 없이 실행
+            if self.read_only:
+                try:
+                    connection.autocommit(True)
+                except Exception:
+                    connection.close()
+                    raise
+
+            self._connection = connection
+
+        return self._connection
+
+    def __getattr__(self, name):
+        return getattr(self._get_connection(), name)
+
+    def cursor(self, cursor=None):
+
+        # 모든 DAO 의 query 실행시간, row 수 등을 기록
+        return InstrumentedCursor(self._get_connection().cursor(cursor))
+
+    def commit(self):
+        if self._connection is not None and not self.read_only:
+            self._connection.commit()
+
+        # cache invalidation 등 commit 된 데이터 기준으로 실행해야 하는 작업
+        callbacks, self.after_commit = self.after_commit, []
+
+        for callback in callbacks:
+            callback()
+
+    def rollback(self):
+        if self._connection is not None and not self.read_only:
+            self._connection.rollback()
+
+        self.after_commit = []
+
+    def close(self):
+
+        # pool 에 반납 (반납 시 autocommit, 미완료 transaction 은 pool 에서 정리)
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            connection.close()
+
+        # stream 응답은 teardown 시점(전송 완료 후)에 반납
+        if self._ticket is not None:
+            ticket, self._ticket = self._ticket, None
+            ticket.release()
+
+def open_session(read_only=False, ticket=None):
+
+    """
+
+    현재 요청의 DB session 을 새로 만들어 g 에 저장합니다.
+    이미 연결을 빌려온 session 이 있다면 반납 후 새로 만듭니다.
+
+    Args:
+        read_only : 조회 전용 session 여부
+        ticket    : admission control 의 AdmissionTicket
+
+    Returns:
+        LazyConnection 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : admission ticket 추가
+
+    """
+
+    close_session()
+
+    g.db_session = LazyConnection(read_only, ticket)
+
+    return g.db_session
+
+def get_session():
+
+    """
+
+    현재 요청의 DB session 을 Return 합니다.
+    @transactional / @read_only 가 적용되지 않은 경우 쓰기 가능한 session 을 만듭니다.
+
+    Returns:
+        LazyConnection 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if 'db_session' not in g:
+        g.db_session = LazyConnection()
+
+    return g.db_session
+
+def close_session(exception=None):
+
+    """
+
+    현재 요청의 DB session 이 빌려온 연결을 pool 에 반납합니다.
+    app teardown 시 호출됩니다.
+
+    Args:
+        exception : teardown 시 전달되는 exception
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    session = g.pop('db_session', None)
+
+    if session:
+        session.close()
+
+def after_commit(callback):
+
+    """
+
+    현재 요청의 transaction 이 commit 된 뒤 실행할 함수를 등록합니다.
+    commit 전에 실행하면 다른 요청이 commit 전의 데이터를 다시 cache 할 수 있기 때문입니다.
+    transaction 이 없는 경우(script, 조회 전용 session) 바로 실행합니다.
+
+    Args:
+        callback : 인자가 없는 함수
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    session = g.get('db_session') if has_app_context() else None
+
+    if session is None or session.read_only:
+        callback()
+        return
+
+    session.after_commit.append(callback)
+
+def init_db_session(app):
+
+    """
+
+    요청이 끝나면 DB session 을 반납하도록 teardown 함수를 등록합니다.
+
+    Args:
+        app : 플라스크 앱 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    app.teardown_appcontext(close_session)
+
+def service_unavailable(rejected):
+
+    """
+
+    admission control 에서 거절된 요청의 503 응답을 만듭니다.
+
+    Args:
+        rejected : AdmissionRejected
+
+    Returns:
+        503 {'message' : 'DATABASE_BUSY', 'reason' : 거절 사유}, Retry-After header
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    response = jsonify({'message' : 'DATABASE_BUSY', 'reason' : rejected.reason})
+
+    response.status_code            = 503
+    response.headers['Retry-After'] = str(rejected.retry_after)
+
+    return response
+
+def transactional(func=None, *, priority=PRIORITY_NORMAL):
+
+    """
+
+    endpoint 함수를 하나의 transaction 으로 실행하는 decorator 입니다.
+        - 응답 status code 가 400 미만이면 commit 하고, 이후 조회를 primary 로 고정합니다.
+        - 400 이상이거나 exception 이 발생하면 rollback 합니다.
+        - DB 를 사용하지 않은 요청은 연결을 빌려오지 않습니다.
+        - DB 가 포화 상태라 admission control 에서 거절되면 503 과 Retry-After 를 응답합니다.
+
+    @transactional 또는 @transactional(priority=PRIORITY_HIGH) 로 사용합니다.
+
+    Args:
+        priority : admission control 우선순위 (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : admission control 우선순위 추가
+
+    """
+
+    if func is None:
+        return partial(transactional, priority=priority)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            ticket = admit(priority)
+
+        except AdmissionRejected as rejected:
+            return service_unavailable(rejected)
+
+        session = open_session(read_only=False, ticket=ticket)
+
+        try:
+            response = current_app.make_response(func(*args, **kwargs))
+
+        except Exception:
+            session.rollback()
+            raise
+
+        if response.status_code >= 400:
+            session.rollback()
+            return response
+
+        try:
+            session.commit()
+
+        except pymysql.err.MySQLError:
+            session.rollback()
+            return jsonify({'message' : 'DATABASE_COMMIT_FAILED'}), 500
+
+        if session.acquired:
+            pin_to_primary()
+
+        return response
+
+    return wrapper
+
+def manual_commit(func=None, *, priority=PRIORITY_NORMAL):
+
+    """
+
+    service 가 transaction 을 직접 나누어 commit 하는 endpoint 에 사용하는 decorator 입니다.
+    상품 일괄등록처럼 chunk 마다 commit 하는 요청에서 @transactional 과 service 가 같은 transaction 을 함께 관리하지 않도록
+    쓰기 가능한 session 만 만들고, transaction 은 service 에서 transaction() 으로 묶어 commit/rollback 합니다.
+        - 응답 후 commit 되지 않은 작업은 rollback 합니다.
+        - DB 를 사용한 요청은 이후 조회를 primary 로 고정합니다.
+        - DB 가 포화 상태라 admission control 에서 거절되면 503 과 Retry-After 를 응답합니다.
+
+    @manual_commit 또는 @manual_commit(priority=PRIORITY_LOW) 로 사용합니다.
+
+    Args:
+        priority : admission control 우선순위 (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if func is None:
+        return partial(manual_commit, priority=priority)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            ticket = admit(priority)
+
+        except AdmissionRejected as rejected:
+            return service_unavailable(rejected)
+
+        session = open_session(read_only=False, ticket=ticket)
+
+        try:
+            return func(*args, **kwargs)
+
+        finally:
+            # transaction() 밖에서 실행된 작업은 commit 하지 않음
+            session.rollback()
+
+            if session.acquired:
+                pin_to_primary()
+
+    return wrapper
+
+@contextmanager
+def transaction(db_connection):
+
+    """
+
+    with 블록 안의 작업을 하나의 transaction 으로 실행합니다.
+    블록이 끝나면 commit 하고(after_commit 으로 등록한 함수 실행), exception 이 발생하면 rollback 후 다시 raise 합니다.
+    @manual_commit 을 사용한 요청에서 service 가 transaction 을 나눌 때 사용합니다.
+
+    Args:
+        db_connection : DATABASE Connection Instance (LazyConnection)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    try:
+        yield db_connection
+        db_connection.commit()
+
+    except Exception:
+        db_connection.rollback()
+        raise
+
+def read_only(func=None, *, priority=PRIORITY_NORMAL):
+
+    """
+
+    조회 전용 endpoint 에 사용하는 decorator 입니다.
+    replica(없으면 primary) 에서 autocommit 으로 연결을 빌려오므로 commit/rollback 이 필요 없습니다.
+    DB 가 포화 상태라 admission control 에서 거절되면 503 과 Retry-After 를 응답합니다.
+
+    @read_only 또는 @read_only(priority=PRIORITY_LOW) 로 사용합니다.
+
+    Args:
+        priority : admission control 우선순위 (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : admission control 우선순위 추가
+
+    """
+
+    if func is None:
+        return partial(read_only, priority=priority)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            ticket = admit(priority)
+
+        except AdmissionRejected as rejected:
+            return service_unavailable(rejected)
+
+        open_session(read_only=True, ticket=ticket)
+
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,277 @@
+import time, threading
+import pymysql
+
+from cache      import caches
+from connection import get_connection
+from utils      import make_version
+
+# DIMENSION_CACHE_TTL 설정이 없을 때 사용하는 snapshot 유효 시간(초)
+DEFAULT_DIMENSION_TTL = 300
+
+class DimensionSnapshot:
+
+    """
+
+    한 시점에 읽은 색상, 사이즈, 1차/2차 카테고리와 이름 <-> id 조회용 map, 카테고리 tree 입니다.
+    만든 뒤에는 바꾸지 않고, 새로 읽으면 snapshot 을 통째로 교체합니다.
+    여러 요청이 함께 사용하므로 꺼내 쓴 list, dict 를 수정하면 안됩니다.
+
+    Args:
+        colors          : [{color_no, name}]
+        sizes           : [{size_no, name}]
+        main_categories : [{main_category_no, name}]
+        sub_categories  : [{sub_category_no, main_category_id, name}]
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self, colors, sizes, main_categories, sub_categories):
+        self.colors          = tuple(colors)
+        self.sizes           = tuple(sizes)
+        self.main_categories = tuple(main_categories)
+
+        # 이름 -> id
+        self.color_ids = {color['name'] : color['color_no'] for color in self.colors}
+        self.size_ids  = {size['name'] : size['size_no'] for size in self.sizes}
+
+        # 2차 카테고리 -> 1차 카테고리, 1차 카테고리 -> 2차 카테고리 목록(tree)
+        self.sub_category_main_ids = {}
+        self.sub_categories        = {}
+
+        for sub_category in sub_categories:
+            self.sub_category_main_ids[sub_category['sub_category_no']] = sub_category['main_category_id']
+            self.sub_categories.setdefault(sub_category['main_category_id'], []).append({
+                'sub_category_no' : sub_category['sub_category_no'],
+                'name'            : sub_category['name']
+            })
+
+        self.sub_categories = {main_id : tuple(children) for main_id, children in self.sub_categories.items()}
+
+        # 내용이 같으면 같은 version
+        self.version = make_version((
+            self.colors,
+            self.sizes,
+            self.main_categories,
+            sorted(self.sub_category_main_ids.items())
+        ))['etag']
+
+class DimensionCache:
+
+    """
+
+    거의 바뀌지 않는 색상, 사이즈, 카테고리를 process 메모리에 DimensionSnapshot 으로 들고 있습니다.
+
+    - ttl 초가 지나거나 invalidate() 로 version 을 올리면 다음 get() 에서 다시 읽습니다.
+    - 유효한 snapshot 이 있으면 get() 은 DB 를 조회하지 않습니다.
+    - 다시 읽는 동안 다른 요청은 기다리지 않고 이전 snapshot 을 사용합니다. (처음 읽는 경우만 대기)
+
+    Args:
+        product_dao : 색상, 사이즈, 카테고리를 조회할 ProductDao
+        ttl         : snapshot 유효 시간(초)
+        name        : 모니터링 시 구분을 위한 이름
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self, product_dao, ttl=DEFAULT_DIMENSION_TTL, name='dimension'):
+        self.product_dao = product_dao
+        self.ttl         = ttl
+        self.name        = name
+
+        self._snapshot   = None
+        self._expires_at = 0
+        self._generation = 0
+        self._lock       = threading.Lock()
+        self._load_lock  = threading.Lock()
+
+        # 모니터링용 통계
+        self._stats = {
+            'hits'    : 0,
+            'reloads' : 0,
+            'changes' : 0
+        }
+
+    def load(self, db_connection):
+
+        """
+
+        색상, 사이즈, 카테고리를 다시 읽어 snapshot 을 교체합니다.
+
+        Args:
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            새 DimensionSnapshot
+
+        """
+
+        with self._lock:
+            generation = self._generation
+
+        snapshot = DimensionSnapshot(
+            self.product_dao.select_color_list(db_connection),
+            self.product_dao.select_size_list(db_connection),
+            self.product_dao.select_main_category_list(db_connection),
+            self.product_dao.select_all_sub_category_list(db_connection)
+        )
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != snapshot.version:
+                self._stats['changes'] += 1
+
+            self._snapshot        = snapshot
+            self._stats['reloads'] += 1
+
+            # 읽는 도중 invalidate 된 경우 다음 get() 에서 한번 더 읽음
+            self._expires_at = time.monotonic() + self.ttl if generation == self._generation else 0
+
+        return snapshot
+
+    def get(self, db_connection):
+
+        """
+
+        현재 snapshot 을 Return 합니다. 만료되었거나 invalidate 된 경우 db_connection 으로 다시 읽습니다.
+        request 단위 session 처럼 실제로 사용할 때 연결을 빌려오는 connection 을 넘기면
+        유효한 snapshot 이 있는 요청은 연결을 빌려오지 않습니다.
+
+        Args:
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            DimensionSnapshot
+
+        """
+
+        with self._lock:
+            snapshot = self._snapshot
+
+            if snapshot is not None and self._expires_at > time.monotonic():
+                self._stats['hits'] += 1
+                return snapshot
+
+        # 다른 요청이 읽는 중이면 이전 snapshot 사용
+        if not self._load_lock.acquire(blocking=snapshot is None):
+            with self._lock:
+                self._stats['hits'] += 1
+
+            return snapshot
+
+        try:
+            with self._lock:
+                if self._snapshot is not None and self._expires_at > time.monotonic():
+                    return self._snapshot
+
+            return self.load(db_connection)
+
+        finally:
+            self._load_lock.release()
+
+    def invalidate(self):
+
+        """
+
+        version 을 올려 다음 get() 에서 다시 읽도록 합니다.
+        색상, 사이즈, 카테고리를 변경했거나, 요청에 snapshot 에 없는 이름이 들어온 경우 호출합니다.
+
+        """
+
+        with self._lock:
+            self._generation += 1
+            self._expires_at  = 0
+
+    def stats(self):
+
+        """
+
+        모니터링을 위한 snapshot 상태를 Return 합니다.
+
+        Returns:
+            {name, version, ttl, colors, sizes, main_categories, sub_categories, hits, reloads, changes}
+
+        """
+
+        with self._lock:
+            snapshot = self._snapshot
+            stats    = dict(self._stats)
+
+        return {
+            'name'            : self.name,
+            'version'         : snapshot.version if snapshot else None,
+            'ttl'             : self.ttl,
+            'colors'          : len(snapshot.colors) if snapshot else 0,
+            'sizes'           : len(snapshot.sizes) if snapshot else 0,
+            'main_categories' : len(snapshot.main_categories) if snapshot else 0,
+            'sub_categories'  : len(snapshot.sub_category_main_ids) if snapshot else 0,
+            **stats
+        }
+
+def register_dimension_cache(*args, **kwargs):
+
+    """
+
+    DimensionCache 를 생성하고 cache 모니터링 목록에 등록합니다.
+
+    Returns:
+        DimensionCache 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    dimension_cache = DimensionCache(*args, **kwargs)
+    caches.append(dimension_cache)
+
+    return dimension_cache
+
+def init_dimension_cache(app, product_dao):
+
+    """
+
+    DimensionCache 를 생성하고 앱 시작 시 snapshot 을 미리 읽어둡니다.
+    DB 에 연결할 수 없으면 경고만 남기고 첫 요청에서 읽습니다.
+
+    Args:
+        app         : 플라스크 앱 객체 (DIMENSION_CACHE_TTL 설정)
+        product_dao : 색상, 사이즈, 카테고리를 조회할 ProductDao
+
+    Returns:
+        DimensionCache 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    dimension_cache = register_dimension_cache(product_dao, app.config.get('DIMENSION_CACHE_TTL', DEFAULT_DIMENSION_TTL))
+    db_connection   = None
+
+    try:
+        db_connection = get_connection(read_only=True)
+        dimension_cache.load(db_connection)
+
+    except pymysql.err.MySQLError as e:
+        app.logger.warning(f'DIMENSION_CACHE_PRELOAD_FAILED : {e}')
+
+    finally:
+        if db_connection is not None:
+            db_connection.close()
+
+    return dimension_cache
@@ -0,0 +1,398 @@
+import re, sys, time, threading, collections
+
+from flask import g, request, has_app_context, current_app
+
+# 요청 당 query 수 기본 제한 (초과 시 warning log)
+DEFAULT_QUERY_BUDGET = 30
+
+# 한 요청 안에서 같은 fingerprint 가 이 횟수 이상 실행되면 N+1 의심으로 판단
+DEFAULT_QUERY_REPEAT_THRESHOLD = 3
+
+# 모니터링용으로 보관하는 최근 N+1 의심 요청 수
+MAX_RECENT_REPEATS = 50
+
+# fingerprint 생성을 위한 정규식 (주석, 문자열/숫자 literal, 공백)
+COMMENT_PATTERN = re.compile(r'--[^\n]*')
+STRING_PATTERN  = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+NUMBER_PATTERN  = re.compile(r'\b\d+(?:\.\d+)?\b')
+VALUES_PATTERN  = re.compile(r'(\(\s*(?:%\(\w+\)s|%s|\?)(?:\s*,\s*(?:%\(\w+\)s|%s|\?))*\s*\))(?:\s*,\s*\(.*?\))+', re.S)
+SPACE_PATTERN   = re.compile(r'\s+')
+
+# 호출한 DAO 를 찾을 때 건너뛸 model 모듈
+SKIP_CALLER_MODULES = ('model.streaming', 'model.query_plan')
+
+def get_fingerprint(query):
+
+    """
+
+    SQL 에서 주석, literal 값, 공백 차이를 제거하여 같은 형태의 query 를 하나로 묶을 수 있는 fingerprint 를 만듭니다.
+
+    Args:
+        query : SQL
+
+    Returns:
+        fingerprint 문자열
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if isinstance(query, bytes):
+        query = query.decode('utf-8', 'replace')
+
+    query = COMMENT_PATTERN.sub(' ', query)
+    query = STRING_PATTERN.sub('?', query)
+    query = NUMBER_PATTERN.sub('?', query)
+    query = VALUES_PATTERN.sub(r'\1, ...', query)
+
+    return SPACE_PATTERN.sub(' ', query).strip()
+
+def get_caller():
+
+    """
+
+    query 를 실행한 DAO method 이름(Class.method) 을 Return 합니다.
+    DAO 밖에서 실행된 경우 가장 가까운 호출 함수 이름을 Return 합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    frame    = sys._getframe(2)
+    fallback = None
+
+    while frame:
+        module = frame.f_globals.get('__name__', '')
+
+        if module != __name__:
+            if module.startswith('model.') and module not in SKIP_CALLER_MODULES:
+                instance = frame.f_locals.get('self')
+                name     = frame.f_code.co_name
+
+                return f'{type(instance).__name__}.{name}' if instance is not None else name
+
+            if fallback is None:
+                fallback = f'{module}.{frame.f_code.co_name}'
+
+        frame = frame.f_back
+
+    return fallback
+
+class QueryMetrics:
+
+    """
+
+    process 전체의 query 실행 통계입니다.
+    fingerprint 별 / endpoint 별 누적값과 최근 N+1 의심 요청을 보관합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self):
+        self._lock           = threading.Lock()
+        self._queries        = {}
+        self._endpoints      = {}
+        self._recent_repeats = collections.deque(maxlen=MAX_RECENT_REPEATS)
+
+    def record_query(self, fingerprint, caller, duration, rows):
+        with self._lock:
+            stat = self._queries.get(fingerprint)
+
+            if stat is None:
+                stat = self._queries[fingerprint] = {
+                    'fingerprint' : fingerprint,
+                    'callers'     : set(),
+                    'count'       : 0,
+                    'total_time'  : 0.0,
+                    'max_time'    : 0.0,
+                    'rows'        : 0
+                }
+
+            stat['count']      += 1
+            stat['total_time'] += duration
+            stat['max_time']    = max(stat['max_time'], duration)
+            stat['rows']       += rows or 0
+
+            if caller:
+                stat['callers'].add(caller)
+
+    def record_request(self, endpoint, query_count, db_time, over_budget, repeats):
+        with self._lock:
+            stat = self._endpoints.get(endpoint)
+
+            if stat is None:
+                stat = self._endpoints[endpoint] = {
+                    'endpoint'          : endpoint,
+                    'requests'          : 0,
+                    'queries'           : 0,
+                    'db_time'           : 0.0,
+                    'max_queries'       : 0,
+                    'over_budget'       : 0,
+                    'repeated_requests' : 0
+                }
+
+            stat['requests']    += 1
+            stat['queries']     += query_count
+            stat['db_time']     += db_time
+            stat['max_queries']  = max(stat['max_queries'], query_count)
+
+            if over_budget:
+                stat['over_budget'] += 1
+
+            if repeats:
+                stat['repeated_requests'] += 1
+                self._recent_repeats.append({
+                    'endpoint' : endpoint,
+                    'time'     : time.strftime('%Y-%m-%d %H:%M:%S'),
+                    'repeats'  : repeats
+                })
+
+    def snapshot(self, limit=50):
+
+        """
+
+        모니터링을 위한 통계를 Return 합니다.
+
+        Args:
+            limit : 누적 실행 시간이 긴 순서로 Return 할 fingerprint 수
+
+        """
+
+        with self._lock:
+            queries = [
+                {
+                    **stat,
+                    'callers'    : sorted(stat['callers']),
+                    'total_time' : round(stat['total_time'], 6),
+                    'avg_time'   : round(stat['total_time'] / stat['count'], 6),
+                    'max_time'   : round(stat['max_time'], 6)
+                }
+                for stat in self._queries.values()
+            ]
+            endpoints = [
+                {
+                    **stat,
+                    'db_time'     : round(stat['db_time'], 6),
+                    'avg_queries' : round(stat['queries'] / stat['requests'], 2),
+                    'avg_db_time' : round(stat['db_time'] / stat['requests'], 6)
+                }
+                for stat in self._endpoints.values()
+            ]
+            recent_repeats = list(self._recent_repeats)
+
+        queries.sort(key=lambda stat : stat['total_time'], reverse=True)
+        endpoints.sort(key=lambda stat : stat['db_time'], reverse=True)
+
+        return {
+            'queries'        : queries[:limit],
+            'endpoints'      : endpoints,
+            'recent_repeats' : recent_repeats
+        }
+
+    def reset(self):
+        with self._lock:
+            self._queries.clear()
+            self._endpoints.clear()
+            self._recent_repeats.clear()
+
+query_metrics = QueryMetrics()
+
+class RequestQueryStats:
+
+    """
+
+    한 요청 안에서 실행된 query 기록입니다. g.query_stats 에 저장됩니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self):
+        self.count        = 0
+        self.total_time   = 0.0
+        self.fingerprints = collections.Counter()
+        self.callers      = {}
+
+    def add(self, fingerprint, caller, duration):
+        self.count        += 1
+        self.total_time   += duration
+        self.fingerprints[fingerprint] += 1
+        self.callers.setdefault(fingerprint, caller)
+
+    def get_repeats(self, threshold):
+
+        """
+
+        threshold 번 이상 반복된 fingerprint 를 Return 합니다.
+
+        Returns:
+            [{fingerprint, caller, count}]
+
+        """
+
+        return [
+            {
+                'fingerprint' : fingerprint,
+                'caller'      : self.callers.get(fingerprint),
+                'count'       : count
+            }
+            for fingerprint, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+def record_query(query, duration, rows):
+
+    """
+
+    실행된 query 를 요청 통계와 전체 통계에 기록합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    fingerprint = get_fingerprint(query)
+    caller      = get_caller()
+
+    query_metrics.record_query(fingerprint, caller, duration, rows)
+
+    if has_app_context():
+        stats = g.get('query_stats')
+
+        if stats is not None:
+            stats.add(fingerprint, caller, duration)
+
+class InstrumentedCursor:
+
+    """
+
+    pymysql cursor 를 감싸서 execute/executemany 마다
+    fingerprint, 실행시간, 조회/변경된 row 수, 호출한 DAO method 를 기록합니다.
+    그 외의 속성은 원래 cursor 에 그대로 위임합니다.
+
+    Args:
+        cursor : pymysql cursor 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._cursor.close()
+
+    def _record(self, query, started):
+        duration = time.perf_counter() - started
+        rowcount = self._cursor.rowcount
+
+        # unbuffered cursor 는 실행 시점에 row 수를 알 수 없음
+        record_query(query, duration, rowcount if rowcount and rowcount > 0 else 0)
+
+    def execute(self, query, args=None):
+        started = time.perf_counter()
+
+        try:
+            return self._cursor.execute(query, args)
+        finally:
+            self._record(query, started)
+
+    def executemany(self, query, args):
+        started = time.perf_counter()
+
+        try:
+            return self._cursor.executemany(query, args)
+        finally:
+            self._record(query, started)
+
+def init_query_instrumentation(app):
+
+    """
+
+    요청 별 query 통계를 수집하도록 before/after request 함수를 등록합니다.
+
+    - 응답 header 에 X-DB-Query-Count, X-DB-Time(ms), Server-Timing 을 추가합니다.
+    - QUERY_BUDGET(기본 30) 보다 많은 query 를 실행한 요청은 warning log 를 남깁니다.
+    - QUERY_REPEAT_THRESHOLD(기본 3) 번 이상 같은 fingerprint 가 실행된 요청은 N+1 의심으로 warning log 를 남깁니다.
+
+    Args:
+        app : 플라스크 앱 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    @app.before_request
+    def start_query_stats():
+        g.query_stats = RequestQueryStats()
+
+    @app.after_request
+    def finish_query_stats(response):
+        stats = g.pop('query_stats', None)
+
+        if stats is None:
+            return response
+
+        budget    = current_app.config.get('QUERY_BUDGET', DEFAULT_QUERY_BUDGET)
+        threshold = current_app.config.get('QUERY_REPEAT_THRESHOLD', DEFAULT_QUERY_REPEAT_THRESHOLD)
+        endpoint  = f'{request.method} {request.url_rule.rule if request.url_rule else request.path}'
+        db_time   = stats.total_time * 1000
+
+        over_budget = stats.count > budget
+        repeats     = stats.get_repeats(threshold)
+
+        if over_budget:
+            current_app.logger.warning(
+                f'QUERY_BUDGET_EXCEEDED : {endpoint} executed {stats.count} queries (budget {budget}, {db_time:.1f}ms)'
+            )
+
+        for repeat in repeats:
+            current_app.logger.warning(
+                f'REPEATED_QUERY : {endpoint} executed {repeat["count"]} times from {repeat["caller"]} : {repeat["fingerprint"][:200]}'
+            )
+
+        query_metrics.record_request(endpoint, stats.count, stats.total_time, over_budget, repeats)
+
+        response.headers['X-DB-Query-Count'] = str(stats.count)
+        response.headers['X-DB-Time']        = f'{db_time:.2f}'
+        response.headers.add('Server-Timing', f'db;dur={db_time:.2f};desc="{stats.count} queries"')
+
+        return response
@@ -0,0 +1,98 @@
+import re
+
+# 상품명 FULLTEXT index 를 만드는 ngram parser 의 token 길이 (MySQL ngram_token_size 기본값)
+NGRAM_TOKEN_SIZE = 2
+
+# 검색어를 단어로 나누는 기준 (ngram parser 는 공백이 포함된 token 을 만들지 않음, " 는 boolean mode 의 구문 구분자)
+NAME_SEARCH_SEPARATOR = re.compile(r'[\s"]+')
+
+def get_name_search_query(name):
+
+    """
+
+    상품명 일부 일치 검색어를 ngram FULLTEXT index 로 찾을 수 있는 BOOLEAN MODE 검색식으로 바꿉니다.
+
+    검색어의 각 단어를 구문("...") 으로 묶어 모두 포함(+)하도록 만들며,
+    ngram 구문 검색은 단어의 연속된 n-gram 을 모두 포함하는 상품명을 찾으므로 한글 상품명도 일부 일치로 찾을 수 있습니다.
+    token 보다 짧은 단어는 index 로 찾을 수 없어 제외하고, 모든 단어가 짧은 경우 None 을 Return 합니다.
+
+    index 로 찾은 상품은 후보(candidate) 이므로 조회 SQL 에서 LIKE 로 한번 더 확인해야 합니다.
+
+    Args:
+        name : 상품명 검색어
+
+    Returns:
+        BOOLEAN MODE 검색식 (index 로 찾을 수 없는 검색어는 None)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if not name:
+        return None
+
+    words = [
+        word
+        for word in NAME_SEARCH_SEPARATOR.split(name)
+        if len(word) >= NGRAM_TOKEN_SIZE
+    ]
+
+    if not words:
+        return None
+
+    return ' '.join(f'+"{word}"' for word in words)
+
+def get_name_search_join(product_id_column, query_param, current_only=True):
+
+    """
+
+    상품명 검색식으로 찾은 후보 상품_id 와 JOIN 하는 SQL 을 Return 합니다.
+    leading wildcard LIKE 로 전체 상품명을 읽는 대신 FULLTEXT index 로 찾은 후보 상품만 조회합니다.
+
+    - current_only=True  : 현재 상품명(product_catalog_current.name, FT_product_catalog_current_name) 에서 찾습니다.
+                           상품 별 한 row 이므로 이력이 쌓여도 index 크기가 늘지 않고 중복 제거도 필요 없습니다.
+    - current_only=False : 주문관리처럼 주문 시의 상품명으로 검색해야 하는 경우
+                           이력의 상품명(product_details.name, FT_product_details_name) 에서 찾습니다.
+
+    Args:
+        product_id_column : JOIN 할 상품_id 컬럼 (ex. PC.product_id)
+        query_param       : get_name_search_query() 결과를 넘기는 SQL parameter 이름
+        current_only      : True 이면 현재 상품명으로만, False 이면 이력의 상품명까지 후보를 찾습니다.
+
+    Returns:
+        INNER JOIN SQL
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if current_only:
+        return f"""
+            INNER JOIN (
+                SELECT
+                    NS_PC.product_id
+                FROM product_catalog_current AS NS_PC
+                WHERE
+                    MATCH(NS_PC.name) AGAINST(%({query_param})s IN BOOLEAN MODE)
+            ) AS NS
+            ON NS.product_id = {product_id_column}
+    """
+
+    return f"""
+            INNER JOIN (
+                SELECT DISTINCT
+                    NS_PD.product_id
+                FROM product_details AS NS_PD
+                WHERE
+                    MATCH(NS_PD.name) AGAINST(%({query_param})s IN BOOLEAN MODE)
+            ) AS NS
+            ON NS.product_id = {product_id_column}
+    """
@@ -1,37 +1,30 @@
 import datetime
 
-class OrderDao:
-
-    def get_ordercompleted_list(self, filter_info, db_connection):
+from .query_plan  import register_query_plan
+from .name_search import get_name_search_join
 
-        """
+def build_ordercompleted_query(used):
 
-        결제 완료 리스트 표출
+    """
 
-        Args:
-            db_connection : 연결된 db 객체
+    결제 완료 리스트 / 총 결제 완료 건수 조회 SQL 을 사용중인 필터에 맞게 만듭니다.
 
-        Returns:
-            결제 완료 리스트
+    Args:
+        used : 사용중인 필터 이름 set
 
-        Author:
-            tnwjd060124@gmail.com (손수정)
+    Returns:
+        (select 컬럼, FROM 이하 본문, ORDER BY 절)
 
-        History:
-            2020-08-24 (tnwjd060124@gmail.com) : 초기 생성
-            2020-09-01 (tnwjd060124@gmail.com) : 수정
-                주문 시 유효한 데이터만 조회하도록 조건 추가
-            2020-09-04 (tnwjd060124@gmail.com) : 수정
-                제품명 검색조건 LIKE로 변경
-            2020-09-05 (tnwjd060124@gmail.com) : 수정
-                할인 기간에 따른 할인율 조건 추가
+    Author:
+        tnwjd060124@gmail.com (손수정)
 
-        """
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : get_ordercompleted_list, get_total_num 의 SQL 생성 부분을 분리
+        2026-10-18 (tnwjd060124@gmail.com) : 상품명 검색을 ngram FULLTEXT index 후보 JOIN 으로 변경
 
-        with db_connection.cursor() as cursor:
+    """
 
-            select_list = """
-            SELECT
+    columns = """
                 P3.start_time AS order_time,
                 P1.order_no,
                 P3.order_detail_no,
@@ -43,47 +36,42 @@ class OrderDao:
                 P7.phone_number,
                 P9.name AS order_status,
                 P3.total_price
+    """
 
+    body = """
             FROM
                 orders AS P1
-            """
 
-            # 조회 기간 필터 존재하는 경우 추가
-            if filter_info['from_date']:
-                select_list += """
-                INNER JOIN orders_details AS P3
-                ON P1.order_no = P3.order_id
-                AND P3.order_status_id=1
-                AND P3.start_time > %(from_date)s
-                """
-            else:
-                select_list += """
-                INNER JOIN orders_details AS P3
-                ON P1.order_no = P3.order_id
-                AND P3.order_status_id=1
-                """
+            INNER JOIN orders_details AS P3
+            ON P1.order_no = P3.order_id
+            AND P3.order_status_id=1
+    """
 
-            # 조회 기간 endDate 필터 존재하는 경우 추가
-            if filter_info['to_date']:
-                select_list += """
-                AND P3.start_time < %(to_date)s
-                """
+    # 조회 기간 필터 존재하는 경우 추가
+    if 'from_date' in used:
+        body += """
+            AND P3.start_time > %(from_date)s
+        """
 
-            # 주문 상세정보 필터 존재하는 경우 추가
-            if filter_info['order_detail_id']:
-                select_list += """
-                INNER JOIN order_product AS P2
-                ON P3.order_detail_no = P2.order_detail_id
-                AND P2.order_product_no = %(order_detail_id)s
-                """
-            else:
-                select_list += """
-                INNER JOIN order_product AS P2
-                ON P3.order_detail_no = P2.order_detail_id
-                """
+    # 조회 기간 endDate 필터 존재하는 경우 추가
+    if 'to_date' in used:
+        body += """
+            AND P3.start_time < %(to_date)s
+        """
 
-            # JOIN 추가
-            select_list += """
+    body += """
+            INNER JOIN order_product AS P2
+            ON P3.order_detail_no = P2.order_detail_id
+    """
+
+    # 주문 상세정보 필터 존재하는 경우 추가
+    if 'order_detail_id' in used:
+        body += """
+            AND P2.order_product_no = %(order_detail_id)s
+        """
+
+    # JOIN 추가
+    body += """
             INNER JOIN product_options AS P8
             ON P2.product_option_id = P8.product_option_no
 
@@ -92,224 +80,154 @@ class OrderDao:
 
             INNER JOIN colors AS P5
             ON P8.color_id = P5.color_no
-            """
 
-            # 제품명 필터 존재하는 경우 추가
-            if filter_info['product_name']:
-                select_list += """
-                INNER JOIN product_details AS P6
-                ON P8.product_id = P6.product_id
-                AND P3.start_time >= P6.start_time -- 주문 시에 유효한 정보
-                AND P6.close_time >= P3.start_time -- 주문 시에 유효한 정보
-                AND P6.name LIKE %(product_name)s
-                """
-            else:
-                select_list += """
-                INNER JOIN product_details AS P6
-                ON P8.product_id = P6.product_id
-                AND P3.start_time >= P6.start_time -- 주문 시에 유효한 정보
-                AND P6.close_time >= P3.start_time -- 주문 시에 유효한 정보
-                """
+            INNER JOIN product_details AS P6
+            ON P8.product_id = P6.product_id
+            AND P3.start_time >= P6.start_time -- 주문 시에 유효한 정보
+            AND P6.close_time >= P3.start_time -- 주문 시에 유효한 정보
+    """
+
+    # 제품명 검색어가 index 로 찾을 수 있는 길이이면 FULLTEXT(ngram) index 로 찾은 후보 상품만 조회
+    # 주문 시의 상품명으로 검색하므로 이력의 상품명까지 후보로 찾음
+    if 'product_name_query' in used:
+        body += get_name_search_join('P8.product_id', 'product_name_query', current_only=False)
+
+    # 제품명 필터 존재하는 경우 추가 (index 로 찾은 후보도 주문 시 상품명의 실제 일치 여부를 확인)
+    if 'product_name' in used:
+        body += """
+            AND P6.name LIKE %(product_name)s
+        """
 
-            # JOIN 추가
-            select_list += """
+    # JOIN 추가
+    body += """
             INNER JOIN order_status AS P9
             ON P3.order_status_id = P9.order_status_no
-            """
 
-            # 핸드폰번호 필터 존재하는 경우 추가
-            if filter_info['phone_number']:
-                select_list += """
-                INNER JOIN user_shipping_details AS P7
-                ON P3.user_shipping_id = P7.user_shipping_detail_no
-                AND P7.phone_number = %(phone_number)s
-                """
-            else:
-                select_list += """
-                INNER JOIN user_shipping_details AS P7
-                ON P3.user_shipping_id = P7.user_shipping_detail_no
-                """
+            INNER JOIN user_shipping_details AS P7
+            ON P3.user_shipping_id = P7.user_shipping_detail_no
+    """
 
-            # 주문자명 필터 존재하는 경우 추가
-            if filter_info['orderer']:
-                select_list += """
-                INNER JOIN users AS P11
-                ON P1.user_id = P11.user_no
-                AND P11.name = %(orderer)s
-                """
-            else:
-                select_list +="""
-                INNER JOIN users AS P11
-                ON P1.user_id = P11.user_no
-                """
+    # 핸드폰번호 필터 존재하는 경우 추가
+    if 'phone_number' in used:
+        body += """
+            AND P7.phone_number = %(phone_number)s
+        """
 
-            # 주문 id 필터 존재하는 경우 추가
-            if filter_info['order_id']:
-                select_list += """
-                WHERE order_no = %(order_id)s
-                """
+    body += """
+            INNER JOIN users AS P11
+            ON P1.user_id = P11.user_no
+    """
 
-            # 정렬 필터 존재하는 경우 주문일 오래된 순
-            if filter_info['sort']:
-                select_list += """
-                ORDER BY P3.start_time ASC
-                """
-            else:
-                select_list += """
-                ORDER BY P3.start_time DESC
-                """
+    # 주문자명 필터 존재하는 경우 추가
+    if 'orderer' in used:
+        body += """
+            AND P11.name = %(orderer)s
+        """
 
-            # limit, offset 설정 추가
-            select_list += """
-            LIMIT
-                %(limit)s
-            OFFSET
-                %(offset)s
-            """
+    # 주문 id 필터 존재하는 경우 추가
+    if 'order_id' in used:
+        body += """
+            WHERE order_no = %(order_id)s
+        """
 
-            cursor.execute(select_list, filter_info)
+    # 정렬 필터 존재하는 경우 주문일 오래된 순
+    if 'sort' in used:
+        order_by = """
+            ORDER BY P3.start_time ASC
+        """
+    else:
+        order_by = """
+            ORDER BY P3.start_time DESC
+        """
 
-            orders = cursor.fetchall()
+    return columns, body, order_by
+
+# 결제 완료 리스트 조회 plan (필터 존재 여부 조합 별로 SQL cache)
+ORDER_COMPLETED_PLAN = register_query_plan(
+    'order_completed_list',
+    [
+        (key, lambda filter_info, key=key : bool(filter_info[key]))
+        for key in (
+            'from_date',
+            'to_date',
+            'order_detail_id',
+            'product_name',
+            'product_name_query',
+            'phone_number',
+            'orderer',
+            'order_id',
+            'sort'
+        )
+    ],
+    build_ordercompleted_query
+)
 
-            return orders
+class OrderDao:
 
-    def get_total_num(self, filter_info, db_connection):
+    def get_ordercompleted_list(self, filter_info, db_connection):
 
         """
 
-        총 결제 완료 건수 표출
+        결제 완료 리스트 표출
 
         Args:
-            filters : 필터 리스트
             db_connection : 연결된 db 객체
 
         Returns:
-            총 결제 완료 건수
+            결제 완료 리스트
 
         Author:
             tnwjd060124@gmail.com (손수정)
 
         History:
-            2020-08-25 (tnwjd060124@gmail.com) : 초기 생성
+            2020-08-24 (tnwjd060124@gmail.com) : 초기 생성
             2020-09-01 (tnwjd060124@gmail.com) : 수정
-                주문시 유효한 데이터 조회하도록 조건 추가
+                주문 시 유효한 데이터만 조회하도록 조건 추가
             2020-09-04 (tnwjd060124@gmail.com) : 수정
                 제품명 검색조건 LIKE로 변경
+            2020-09-05 (tnwjd060124@gmail.com) : 수정
+                할인 기간에 따른 할인율 조건 추가
+            2026-10-18 (tnwjd060124@gmail.com) : 필터 조합 별로 cache 된 SQL 사용
 
         """
 
         with db_connection.cursor() as cursor:
 
-            count_num = """
-            SELECT
-                COUNT(*) AS total_number
-
-            FROM
-                orders AS P1
-            """
+            cursor.execute(ORDER_COMPLETED_PLAN.compile(filter_info).list_sql, filter_info)
 
-            # 조회 기간 필터 존재하는 경우 추가
-            if filter_info['from_date']:
-                count_num += """
-                INNER JOIN orders_details AS P3
-                ON P1.order_no = P3.order_id
-                AND P3.order_status_id=1
-                AND P3.start_time > %(from_date)s
-                """
-            else:
-                count_num += """
-                INNER JOIN orders_details AS P3
-                ON P1.order_no = P3.order_id
-                AND P3.order_status_id=1
-                """
+            orders = cursor.fetchall()
 
-            # 조회 기간 endDate 필터 존재하는 경우 추가
-            if filter_info['to_date']:
-                count_num += """
-                AND P3.start_time < %(to_date)s
-                """
+            return orders
 
-            # 주문 상세정보 필터 존재하는 경우 추가
-            if filter_info['order_detail_id']:
-                count_num += """
-                INNER JOIN order_product AS P2
-                ON P3.order_detail_no = P2.order_detail_id
-                AND P2.order_product_no = %(order_detail_id)s
-                """
-            else:
-                count_num += """
-                INNER JOIN order_product AS P2
-                ON P3.order_detail_no = P2.order_detail_id
-                """
+    def get_total_num(self, filter_info, db_connection):
 
-            # JOIN 추가
-            count_num += """
-            INNER JOIN product_options AS P8
-            ON P2.product_option_id = P8.product_option_no
+        """
 
-            INNER JOIN sizes AS P4
-            ON P8.size_id = P4.size_no
+        총 결제 완료 건수 표출
 
-            INNER JOIN colors AS P5
-            ON P8.color_id = P5.color_no
-            """
+        Args:
+            filters : 필터 리스트
+            db_connection : 연결된 db 객체
 
-            # 제품명 필터 존재하는 경우 추가
-            if filter_info['product_name']:
-                count_num += """
-                INNER JOIN product_details AS P6
-                ON P8.product_id = P6.product_id
-                AND P3.start_time >= P6.start_time
-                AND P6.close_time >= P3.start_time
-                AND P6.name LIKE %(product_name)s
-                """
-            else:
-                count_num += """
-                INNER JOIN product_details AS P6
-                ON P8.product_id = P6.product_id
-                AND P3.start_time >= P6.start_time
-                AND P6.close_time >= P3.start_time
-                """
+        Returns:
+            총 결제 완료 건수
 
-            # JOIN 추가
-            count_num += """
-            INNER JOIN order_status AS P9
-            ON P3.order_status_id = P9.order_status_no
-            """
+        Author:
+            tnwjd060124@gmail.com (손수정)
 
-            # 핸드폰번호 필터 존재하는 경우 추가
-            if filter_info['phone_number']:
-                count_num += """
-                INNER JOIN user_shipping_details AS P7
-                ON P3.user_shipping_id = P7.user_shipping_detail_no
-                AND P7.phone_number = %(phone_number)s
-                """
-            else:
-                count_num += """
-                INNER JOIN user_shipping_details AS P7
-                ON P3.user_shipping_id = P7.user_shipping_detail_no
-                """
+        History:
+            2020-08-25 (tnwjd060124@gmail.com) : 초기 생성
+            2020-09-01 (tnwjd060124@gmail.com) : 수정
+                주문시 유효한 데이터 조회하도록 조건 추가
+            2020-09-04 (tnwjd060124@gmail.com) : 수정
+                제품명 검색조건 LIKE로 변경
+            2026-10-18 (tnwjd060124@gmail.com) : 결제 완료 리스트와 같은 plan 의 count SQL 사용
 
-            # 주문자명 필터 존재하는 경우 추가
-            if filter_info['orderer']:
-                count_num += """
-                INNER JOIN users AS P11
-                ON P1.user_id = P11.user_no
-                AND P11.name = %(orderer)s
-                """
-            else:
-                count_num +="""
-                INNER JOIN users AS P11
-                ON P1.user_id = P11.user_no
-                """
+        """
 
-            # 주문 id 필터 존재하는 경우 추가
-            if filter_info['order_id']:
-                count_num += """
-                WHERE order_no = %(order_id)s
-                """
+        with db_connection.cursor() as cursor:
 
-            cursor.execute(count_num, filter_info)
+            cursor.execute(ORDER_COMPLETED_PLAN.compile(filter_info).count_sql, filter_info)
 
             total_num = cursor.fetchone()
 
@@ -334,6 +252,7 @@ class OrderDao:
 
         History:
             2020-08-24 (tnwjd060124@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : 주문 시점 할인율 계산을 pricing 으로 이동 (할인율, 할인 기간 조회)
 
         """
 
@@ -361,15 +280,9 @@ class OrderDao:
                 P4.additional_address,
                 P4.zip_code,
                 P1.delivery_request,
-                CASE
-                    WHEN P7.discount_rate IS NULL THEN 0 -- 상품 미할인인 경우
-                    ELSE CASE
-                        WHEN P7.discount_start_date IS NULL THEN P7.discount_rate -- 상품 할인이 무기한인 경우
-                        WHEN P1.start_time BETWEEN P7.discount_start_date AND P7.discount_end_date THEN P7.discount_rate -- 상품 할인 기간 유효한 경우
-                        ELSE 0 -- 상품 할인기간이 아닌경우
-                        END
-                    END
-                AS discount_rate
+                P7.discount_rate,
+                P7.discount_start_date,
+                P7.discount_end_date
 
             FROM
                 orders_details P1
@@ -441,6 +354,8 @@ class OrderDao:
             2020-09-04 (tnwjd060124@gmail.com)   : 현재 유효한 데이터 리턴하는 조건 변경
             2020-09-05 (tnwjd060124@gmail.com)   : 할인 기간에 따른 유효한 할인률 조건 변경
             2020-09-08 (minho.lee0716@gmail.com) : DB병합으로 인한 product_option_id 리턴 제거.
+            2026-10-18 (tnwjd060124@gmail.com)   : 적용 할인율 계산을 pricing 으로 이동 (할인율, 할인 기간 조회)
+            2026-10-18 (tnwjd060124@gmail.com)   : product_catalog_current 에 미리 계산된 할인율, 할인가, 대표 이미지 조회
 
         """
 
@@ -455,35 +370,18 @@ class OrderDao:
                     C.color_no AS color_id,
                     S.name AS size_name,
                     S.size_no AS size_id,
-                    PD.name,
-                    PD.price AS original_price,
-                    I.image_small,
-                    CASE
-                        WHEN PD.discount_rate IS NULL THEN 0
-                        ELSE CASE
-                            WHEN PD.discount_start_date IS NULL THEN PD.discount_rate
-                            WHEN NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date THEN PD.discount_rate
-                            ELSE 0
-                            END
-                        END
-                    AS discount_rate
+                    PC.name,
+                    PC.price AS original_price,
+                    PC.thumbnail_image_small AS image_small,
+                    PC.applied_discount_rate AS discount_rate,
+                    PC.sales_price
 
                 FROM products AS P
 
-                LEFT JOIN product_details AS PD
-                ON P.product_no = PD.product_id
-                AND PD.is_activated = True
-                AND PD.is_displayed = True
-                AND PD.close_time = '9999-12-31 23:59:59'
-
-                LEFT JOIN product_images AS PI
-                ON P.product_no = PI.product_id
-                AND PI.is_main = True
-                AND PI.close_time = '9999-12-31 23:59:59'
-
-                LEFT JOIN images AS I
-                ON PI.image_id = I.image_no
-                AND I.is_deleted = False
+                LEFT JOIN product_catalog_current AS PC
+                ON P.product_no = PC.product_id
+                AND PC.is_activated = True
+                AND PC.is_displayed = True
 
                 LEFT JOIN product_options AS PO
                 ON P.product_no = PO.product_id
@@ -1336,13 +1234,15 @@ class OrderDao:
             db_connection : 연결된 db 객체
 
         Returns:
-            product_info : 구매하고자 하는 상품의 정보를 리턴해줍니다. (product_details 테이블의 정보)
+            product_info : 구매하고자 하는 상품의 정보를 리턴해줍니다. (product_catalog_current 테이블의 정보)
 
         Authors:
             minho.lee0716@gmail.com (이민호)
 
         History:
             2020-09-10 (minho.lee0716@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : 적용 할인율 계산을 pricing 으로 이동 (할인율, 할인 기간 조회)
+            2026-10-18 (tnwjd060124@gmail.com) : product_catalog_current 에 미리 계산된 할인율, 할인가 조회
 
         """
 
@@ -1352,24 +1252,16 @@ class OrderDao:
 
                 select_product_info_query = """
                 SELECT
-                    PD.price AS original_price,
-                    CASE
-                        WHEN PD.discount_rate IS NULL THEN 0
-                        ELSE CASE
-                            WHEN PD.discount_start_date IS NULL THEN PD.discount_rate
-                            WHEN NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date THEN PD.discount_rate
-                            ELSE 0
-                            END
-                        END
-                    AS discount_rate
+                    PC.price AS original_price,
+                    PC.applied_discount_rate AS discount_rate,
+                    PC.sales_price
 
                 FROM products AS P
 
-                LEFT JOIN product_details AS PD
-                ON P.product_no = PD.product_id
-                AND PD.is_activated = True
-                AND PD.is_displayed = True
-                AND PD.close_time = '9999-12-31 23:59:59'
+                LEFT JOIN product_catalog_current AS PC
+                ON P.product_no = PC.product_id
+                AND PC.is_activated = True
+                AND PC.is_displayed = True
 
                 WHERE
                     P.is_deleted = False
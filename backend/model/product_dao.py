@@ -1,5 +1,714 @@
 import uuid
 
+from .query_plan  import register_query_plan
+from .name_search import get_name_search_query, get_name_search_join
+from .streaming   import fetch_stream
+
+# product_catalog_current 에 history 테이블의 현재 이력을 저장하는 SQL (WHERE 조건은 사용하는 곳에서 추가)
+# 적용 할인율, 할인가는 pricing 으로 계산해야 하므로 price_expires_at 을 현재 시각으로 두어 바로 다시 계산하도록 함
+# (ProductService.reprice_catalog)
+INSERT_PRODUCT_CATALOG_QUERY = """
+INSERT INTO product_catalog_current (
+    product_id,
+    product_code,
+    created_at,
+    is_activated,
+    is_displayed,
+    main_category_id,
+    sub_category_id,
+    name,
+    simple_description,
+    detail_information,
+    price,
+    discount_rate,
+    discount_start_date,
+    discount_end_date,
+    applied_discount_rate,
+    sales_price,
+    price_expires_at,
+    min_sales_quantity,
+    max_sales_quantity,
+    thumbnail_image_large,
+    thumbnail_image_medium,
+    thumbnail_image_small
+)
+SELECT
+    P.product_no,
+    P.product_code,
+    P.created_at,
+    PD.is_activated,
+    PD.is_displayed,
+    PD.main_category_id,
+    PD.sub_category_id,
+    PD.name,
+    PD.simple_description,
+    PD.detail_information,
+    PD.price,
+    PD.discount_rate,
+    PD.discount_start_date,
+    PD.discount_end_date,
+    0,
+    PD.price,
+    CURRENT_TIMESTAMP,
+    PD.min_sales_quantity,
+    PD.max_sales_quantity,
+    I.image_large,
+    I.image_medium,
+    I.image_small
+
+FROM products AS P
+
+INNER JOIN product_details AS PD
+ON PD.product_id = P.product_no
+AND PD.close_time = '9999-12-31 23:59:59'
+
+LEFT JOIN product_images AS PI
+ON PI.product_id = P.product_no
+AND PI.close_time = '9999-12-31 23:59:59'
+AND PI.is_main = 1
+
+LEFT JOIN images AS I
+ON I.image_no = PI.image_id
+AND I.is_deleted = 0
+
+WHERE
+    P.is_deleted = 0
+"""
+
+def build_registered_product_query(used):
+
+    """
+
+    [상품관리 > 상품관리]
+    등록된 상품 List / Total Count 조회 SQL 을 사용중인 filter 에 맞게 만듭니다.
+
+    Args:
+        used : 사용중인 filter 이름 set
+
+    Returns:
+        (select 컬럼, FROM 이하 본문, ORDER BY 절)
+
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : select_registered_product_list 의 SQL 생성 부분을 분리
+        2026-10-18 (tnwjd060124@gmail.com) : 조회용 테이블(product_catalog_current) 에서 조회
+        2026-10-18 (tnwjd060124@gmail.com) : 적용 할인율 계산을 pricing 으로 이동
+        2026-10-18 (tnwjd060124@gmail.com) : 상품명 검색을 ngram FULLTEXT index 후보 JOIN 으로 변경
+        2026-10-18 (tnwjd060124@gmail.com) : SQL_CALC_FOUND_ROWS 제거
+        2026-10-18 (tnwjd060124@gmail.com) : after / before keyset pagination 조건 추가
+        2026-10-18 (tnwjd060124@gmail.com) : 미리 계산된 적용 할인율, 할인가로 조회 및 할인 여부 필터링
+
+    """
+
+    columns = """
+                    PC.created_at as productRegistDate,
+                    PC.thumbnail_image_small as productSmallImageUrl,
+                    PC.name as productName,
+                    PC.product_id as productNo,
+                    PC.product_code as productCode,
+                    ROUND(PC.price, -1) as sellPrice,
+                    PC.applied_discount_rate as discountRate,
+                    PC.sales_price as discountPrice,
+                    IF(PC.applied_discount_rate > 0, "할인", "미할인") as discountYn,
+                    IF(PC.is_displayed = 1, "진열", "미진열") as productExhibitYn,
+                    IF(PC.is_activated = 1, "판매", "미판매") as productSellYn
+    """
+
+    # 현재 상품 정보는 조회용 테이블(product_catalog_current) 하나에서 조회
+    # 할인율, 할인가는 가격 scheduler 가 할인 시작/종료 시각에 미리 계산해 둔 값 사용
+    body = """
+                FROM product_catalog_current AS PC
+    """
+
+    # 상품명 검색어가 index 로 찾을 수 있는 길이이면 현재 상품명 FULLTEXT(ngram) index 로 찾은 후보 상품만 조회
+    if 'productNameQuery' in used:
+        body += get_name_search_join('PC.product_id', 'productNameQuery')
+
+    body += """
+                WHERE
+                    PC.thumbnail_image_small IS NOT NULL
+    """
+
+    # Filtering 시작
+
+    # 판매 여부 필터링
+    if 'sellYn' in used:
+        body += """
+                    AND PC.is_activated = %(sellYn)s
+        """
+
+    # 할인 여부 필터링 (미리 계산된 적용 할인율로 판단)
+    if 'discountYn' in used:
+        body += """
+                    AND (PC.applied_discount_rate <> 0) = %(discountYn)s
+        """
+
+    # 진열 여부 필터링
+    if 'exhibitionYn' in used:
+        body += """
+                    AND PC.is_displayed = %(exhibitionYn)s
+        """
+
+    # 상품 등록 기간 시작일자 필터링
+    if 'startDate' in used:
+        body += """
+                    AND PC.created_at >= %(startDate)s
+        """
+
+    # 상품 등록 기간 종료일자 필터링
+    if 'endDate' in used:
+        body += """
+                    AND PC.created_at < %(endDate)s
+        """
+
+    # 상품명 일부 일치 조건 필터링 (index 로 찾은 후보도 실제 일치 여부를 확인)
+    if 'productName' in used:
+        body += """
+                    AND PC.name like %(productName)s
+        """
+
+    # 상품 번호 일치 조건 필터링
+    if 'productNo' in used:
+        body += """
+                    AND PC.product_id = %(productNo)s
+        """
+
+    # 상품 코드 일치 조건 필터링
+    if 'productCode' in used:
+        body += """
+                    AND PC.product_code = %(productCode)s
+        """
+
+    # keyset pagination : 다음 페이지 (이전 페이지 마지막 상품 번호 이후)
+    if 'after' in used:
+        body += """
+                    AND PC.product_id < %(after)s
+        """
+
+    # keyset pagination : 이전 페이지 (다음 페이지 첫 상품 번호 이전, 역순으로 조회 후 service 에서 뒤집음)
+    if 'before' in used:
+        body += """
+                    AND PC.product_id > %(before)s
+        """
+
+    # 정렬
+    order_by = f"""
+                ORDER BY
+                    PC.product_id {'ASC' if 'before' in used else 'DESC'}
+    """
+
+    return columns, body, order_by
+
+def build_registered_product_boundary_query(used):
+
+    """
+
+    [상품관리 > 상품관리]
+    등록된 상품 List 의 페이지 별 시작 위치(이전 페이지 마지막 상품 번호) 조회 SQL 을 사용중인 filter 에 맞게 만듭니다.
+    List 조회와 같은 FROM/WHERE 본문에서 %(limit)s 번째 마다의 상품 번호만 조회하므로
+    페이지 번호로 이동할 때 OFFSET 없이 keyset pagination 으로 조회할 수 있습니다.
+
+    Args:
+        used : 사용중인 filter 이름 set
+
+    Returns:
+        (select 컬럼, FROM 이하 본문, ORDER BY 절)
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    columns, body, order_by = build_registered_product_query(used)
+
+    columns = """
+                    B.product_id
+    """
+
+    body = f"""
+                FROM (
+                    SELECT
+                        PC.product_id,
+                        ROW_NUMBER() OVER ({order_by}) AS row_no
+                    {body}
+                ) AS B
+
+                WHERE
+                    MOD(B.row_no, %(limit)s) = 0
+    """
+
+    order_by = """
+                ORDER BY
+                    B.row_no ASC
+    """
+
+    return columns, body, order_by
+
+# 등록된 상품 List 의 filter 이름 (page, limit 을 제외한 검색 조건)
+REGISTERED_PRODUCT_FILTERS = (
+    'sellYn',
+    'discountYn',
+    'exhibitionYn',
+    'startDate',
+    'endDate',
+    'productName',
+    'productNo',
+    'productCode'
+)
+
+# 등록된 상품 List / Total Count 조회 plan (filter 존재 여부 조합 별로 SQL cache)
+REGISTERED_PRODUCT_PLAN = register_query_plan(
+    'registered_product_list',
+    [
+        (key, lambda filter_info, key=key : filter_info[key] is not None)
+        for key in REGISTERED_PRODUCT_FILTERS + ('productNameQuery', 'after', 'before')
+    ],
+    build_registered_product_query,
+    count_alias = 'total'
+)
+
+# 등록된 상품 List 페이지 별 시작 위치 조회 plan (keyset 조건 없이 filter 조합 별로 SQL cache)
+REGISTERED_PRODUCT_BOUNDARY_PLAN = register_query_plan(
+    'registered_product_boundary',
+    [
+        (key, lambda filter_info, key=key : filter_info[key] is not None)
+        for key in REGISTERED_PRODUCT_FILTERS + ('productNameQuery',)
+    ],
+    build_registered_product_boundary_query,
+    paginate = False
+)
+
+# 등록된 상품 List 전체 export 조회 plan (LIMIT 없이 filter 조합 별로 SQL cache)
+REGISTERED_PRODUCT_EXPORT_PLAN = register_query_plan(
+    'registered_product_export',
+    [
+        (key, lambda filter_info, key=key : filter_info[key] is not None)
+        for key in REGISTERED_PRODUCT_FILTERS + ('productNameQuery',)
+    ],
+    build_registered_product_query,
+    paginate = False
+)
+
+def get_registered_product_params(filter_info):
+
+    """
+
+    [상품관리 > 상품관리]
+    등록된 상품 List / Total Count 조회 SQL 에 넘길 parameter 를 만듭니다.
+    filter_info 는 변경하지 않으므로 List 와 Total Count 조회에 같은 filter_info 를 사용할 수 있습니다.
+
+    Args:
+        filter_info : Parameter로 들어온 filter의 Dictionary 객체
+
+    Returns:
+        SQL parameter Dictionary
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : select_registered_product_list 에서 분리
+        2026-10-18 (tnwjd060124@gmail.com) : keyset pagination 위치 추가, OFFSET 0 고정
+
+    """
+
+    params = dict(filter_info)
+
+    # keyset pagination 위치 (없으면 첫 페이지부터)
+    params.setdefault('after', None)
+    params.setdefault('before', None)
+    params['offset'] = 0
+
+    # 상품 등록 기간 종료일자는 해당 일자까지 포함
+    if params['endDate'] is not None :
+        params['endDate'] += 1
+
+    # 상품명 일부 일치 조건 (FULLTEXT index 검색식 + LIKE 확인)
+    params['productNameQuery'] = get_name_search_query(params['productName'])
+
+    if params['productName'] is not None :
+        params['productName'] = f"%{params['productName']}%"
+
+    return params
+
+# 서비스 상품 리스트 정렬 기준 : (정렬 컬럼, 방향)
+# product_id 를 마지막 정렬 key 로 사용하며, 각 정렬은 product_catalog_current 의 같은 순서의 index 를 사용
+PRODUCT_LIST_SORTS = {
+    'newest'     : (None, 'DESC'),                      # 최신 등록순
+    'price_asc'  : ('sales_price', 'ASC'),              # 낮은 가격순 (화면에 보이는 할인가 기준)
+    'price_desc' : ('sales_price', 'DESC'),             # 높은 가격순 (화면에 보이는 할인가 기준)
+    'discount'   : ('applied_discount_rate', 'DESC')    # 할인율 높은순 (현재 할인중인 상품)
+}
+
+def build_product_list_query(page_info):
+
+    """
+
+    서비스 상품 리스트 조회 SQL 을 필터, 정렬 기준, cursor 사용 여부에 맞게 만듭니다.
+
+    Args:
+        page_info : ProductDao.select_product_list 의 page_info
+
+    Returns:
+        SQL
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : select_product_list 의 SQL 생성 부분을 분리, 카테고리 필터 / 정렬 추가
+        2026-10-18 (tnwjd060124@gmail.com) : 미리 계산된 적용 할인율, 할인가 조회, 가격순은 할인가, 할인순은 적용 할인율 index 로 정렬
+
+    """
+
+    sort_column, direction = PRODUCT_LIST_SORTS[page_info['sort']]
+
+    # 정렬 값보다 뒤에 있는 상품을 찾기 위한 비교 연산자
+    operator = '<' if direction == 'DESC' else '>'
+
+    # 현재 상품 정보는 조회용 테이블(product_catalog_current) 하나에서 조회
+    # 할인율, 할인가는 가격 scheduler 가 할인 시작/종료 시각에 미리 계산해 둔 값 사용
+    select_products_query = """
+    SELECT
+        PC.product_id AS product_no,
+        PC.thumbnail_image_medium AS thumbnail_image,
+        PC.name AS product_name,
+        PC.price AS original_price,
+        PC.applied_discount_rate AS discount_rate,
+        PC.sales_price
+    """
+
+    # 다음 페이지 cursor 를 만들기 위한 정렬 값
+    if sort_column:
+        select_products_query += f"""
+        , PC.{sort_column} AS sort_key
+        """
+
+    select_products_query += """
+    FROM product_catalog_current AS PC
+
+    WHERE
+        PC.is_activated = 1
+        AND PC.is_displayed = 1
+        AND PC.thumbnail_image_medium IS NOT NULL
+    """
+
+    # 1차 카테고리 필터링
+    if page_info['main_category_id'] is not None:
+        select_products_query += """
+        AND PC.main_category_id = %(main_category_id)s
+        """
+
+    # 2차 카테고리 필터링
+    if page_info['sub_category_id'] is not None:
+        select_products_query += """
+        AND PC.sub_category_id = %(sub_category_id)s
+        """
+
+    # 할인순은 현재 할인중인 상품만 할인율이 높은 순서로 조회 (applied_discount_rate index range scan)
+    if page_info['sort'] == 'discount':
+        select_products_query += """
+        AND PC.applied_discount_rate > 0
+        """
+
+    # 두번째 페이지부터는 이전 페이지 마지막 상품 이후부터 조회
+    if page_info['cursor'] is not None:
+        if sort_column:
+            select_products_query += f"""
+        AND (
+            PC.{sort_column} {operator} %(sort_key)s
+            OR (PC.{sort_column} = %(sort_key)s AND PC.product_id {operator} %(cursor)s)
+        )
+            """
+        else:
+            select_products_query += f"""
+        AND PC.product_id {operator} %(cursor)s
+            """
+
+    # 같은 정렬 값은 product_id 로 순서를 고정 (index 와 같은 방향)
+    order_by = f'PC.{sort_column} {direction}, ' if sort_column else ''
+
+    select_products_query += f"""
+    ORDER BY
+        {order_by}PC.product_id {direction}
+
+    LIMIT
+        %(limit)s
+    """
+
+    return select_products_query
+
+# 서비스 상품 상세 페이지를 구성하는 조회 SQL (select_product_page 에서 필요한 것만 UNION ALL 로 묶어 한번에 실행)
+#   columns : 조회 결과 컬럼 (다른 조회와 같은 이름이면 같은 타입이어야 함)
+#   order   : 결과 정렬 기준 (최대 FETCH_RESULT_SORT_KEYS 개, 내림차순은 음수로)
+PRODUCT_PAGE_QUERIES = {
+
+    # 상품 상세정보 (미리 계산된 적용 할인율, 할인가)
+    'details' : {
+        'columns' : (
+            'product_id', 'name', 'html', 'original_price', 'min_sales_quantity', 'max_sales_quantity',
+            'discount_rate', 'sales_price'
+        ),
+        'order'   : (),
+        'query'   : """
+        SELECT
+            PC.product_id,
+            PC.name,
+            PC.detail_information AS html,
+            PC.price AS original_price,
+            PC.min_sales_quantity,
+            PC.max_sales_quantity,
+            PC.applied_discount_rate AS discount_rate,
+            PC.sales_price
+
+        FROM product_catalog_current AS PC
+
+        WHERE
+            PC.product_id = %(product_id)s
+            AND PC.is_activated = 1
+            AND PC.is_displayed = 1
+        """
+    },
+
+    # 판매/진열중인 상품 존재 여부
+    'exists' : {
+        'columns' : ('product_id',),
+        'order'   : (),
+        'query'   : """
+        SELECT
+            PC.product_id
+
+        FROM product_catalog_current AS PC
+
+        WHERE
+            PC.product_id = %(product_id)s
+            AND PC.is_activated = 1
+            AND PC.is_displayed = 1
+        """
+    },
+
+    # 상세정보 이미지 (이미지 id 오름차순)
+    'images' : {
+        'columns' : ('image_large',),
+        'order'   : ('R.image_no',),
+        'query'   : """
+        SELECT
+            I.image_no,
+            I.image_large
+
+        FROM product_images AS PI
+
+        INNER JOIN images AS I
+        ON PI.image_id = I.image_no
+        AND I.is_deleted = False
+
+        WHERE
+            PI.product_id = %(product_id)s
+            AND PI.close_time = '9999-12-31 23:59:59'
+        """
+    },
+
+    # 옵션의 색상 (color_id 오름차순)
+    'colors' : {
+        'columns' : ('color_id', 'color_name'),
+        'order'   : ('R.color_id',),
+        'query'   : """
+        SELECT DISTINCT
+            C.color_no AS color_id,
+            C.name AS color_name
+
+        FROM product_options AS PO
+
+        INNER JOIN colors AS C
+        ON PO.color_id = C.color_no
+
+        WHERE
+            PO.product_id = %(product_id)s
+            AND PO.is_deleted = False
+        """
+    },
+
+    # 색상 x 사이즈 별 옵션 id 와 현재 재고 (사이즈는 큰 순서로 넣어줬기 때문에 역순으로 정렬)
+    'stock' : {
+        'columns' : ('color_id', 'color_name', 'size', 'size_id', 'product_option_id', 'quantity'),
+        'order'   : ('R.color_id', '-R.size_id'),
+        'query'   : """
+        SELECT
+            C.color_no AS color_id,
+            C.name AS color_name,
+            S.name AS size,
+            S.size_no AS size_id,
+            PO.product_option_no AS product_option_id,
+            Q.quantity
+
+        FROM product_options AS PO
+
+        INNER JOIN colors AS C
+        ON PO.color_id = C.color_no
+
+        INNER JOIN sizes AS S
+        ON PO.size_id = S.size_no
+
+        INNER JOIN quantities AS Q
+        ON PO.product_option_no = Q.product_option_id
+        AND Q.close_time = '9999-12-31 23:59:59'
+
+        WHERE
+            PO.product_id = %(product_id)s
+            AND PO.is_deleted = False
+        """
+    }
+}
+
+# 서비스 상품 여러 개(장바구니, 최근 본 상품 등)를 한번에 조회하는 SQL (select_product_batch 에서 한번에 실행)
+# 상품 수와 관계없이 IN 조건의 조회 2개를 UNION ALL 로 묶어 가져옵니다. (형식은 PRODUCT_PAGE_QUERIES 와 같음)
+PRODUCT_BATCH_QUERIES = {
+
+    # 판매/진열중인 상품의 정보와 대표 이미지 (미리 계산된 적용 할인율, 할인가)
+    'details' : {
+        'columns' : (
+            'product_id', 'name', 'original_price', 'min_sales_quantity', 'max_sales_quantity',
+            'discount_rate', 'sales_price', 'thumbnail_image'
+        ),
+        'order'   : (),
+        'query'   : """
+        SELECT
+            PC.product_id,
+            PC.name,
+            PC.price AS original_price,
+            PC.min_sales_quantity,
+            PC.max_sales_quantity,
+            PC.applied_discount_rate AS discount_rate,
+            PC.sales_price,
+            PC.thumbnail_image_medium AS thumbnail_image
+
+        FROM product_catalog_current AS PC
+
+        WHERE
+            PC.product_id IN %(product_ids)s
+            AND PC.is_activated = 1
+            AND PC.is_displayed = 1
+        """
+    },
+
+    # 상품 별 옵션의 색상 (상품 id, color_id 오름차순)
+    'colors' : {
+        'columns' : ('product_id', 'color_id', 'color_name'),
+        'order'   : ('R.product_id', 'R.color_id'),
+        'query'   : """
+        SELECT DISTINCT
+            PO.product_id,
+            C.color_no AS color_id,
+            C.name AS color_name
+
+        FROM product_options AS PO
+
+        INNER JOIN colors AS C
+        ON PO.color_id = C.color_no
+
+        WHERE
+            PO.product_id IN %(product_ids)s
+            AND PO.is_deleted = False
+        """
+    }
+}
+
+# fetch_result_sets 의 조회 별 정렬 기준 최대 개수
+FETCH_RESULT_SORT_KEYS = 2
+
+def build_result_sets_query(queries):
+
+    """
+
+    여러 조회 SQL 을 UNION ALL 로 묶은 하나의 SELECT 를 만듭니다.
+    모든 조회의 컬럼을 합친 형태로, 각 조회에 없는 컬럼은 NULL 로 채우고
+    몇 번째 조회의 row 인지(result_set)와 정렬 기준(sort_1, sort_2 ...)을 함께 조회합니다.
+    MySQL 은 UNION 의 컬럼 타입을 모든 조회에서 결정하므로 NULL 로 채운 컬럼도 원래 타입으로 읽힙니다.
+
+    Args:
+        queries : {이름 : {columns, order, query}} (실행 순서대로)
+
+    Returns:
+        SQL
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    columns = list(dict.fromkeys(column for query in queries.values() for column in query['columns']))
+    selects = []
+
+    for index, query in enumerate(queries.values()):
+        if len(query['order']) > FETCH_RESULT_SORT_KEYS:
+            raise ValueError('TOO_MANY_SORT_KEYS')
+
+        sort_keys = list(query['order']) + ['NULL'] * (FETCH_RESULT_SORT_KEYS - len(query['order']))
+        select    = [f'{index} AS result_set'] + [
+            f'R.{column}' if column in query['columns'] else f'NULL AS {column}'
+            for column in columns
+        ] + [
+            f'{sort_key} AS sort_{number}'
+            for number, sort_key in enumerate(sort_keys, 1)
+        ]
+
+        selects.append(f"""
+        (
+            SELECT
+                {', '.join(select)}
+            FROM ({query['query']}) AS R
+        )
+        """)
+
+    order_by = ', '.join(['result_set'] + [f'sort_{number}' for number in range(1, FETCH_RESULT_SORT_KEYS + 1)])
+
+    return 'UNION ALL'.join(selects) + f"""
+        ORDER BY
+            {order_by}
+    """
+
+def fetch_result_sets(db_connection, queries, params):
+
+    """
+
+    여러 조회 SQL 을 UNION ALL 로 묶어 한번의 DB 왕복으로 실행하고 조회 별 결과로 나누어 읽습니다.
+
+    Args:
+        db_connection : 연결된 db 객체
+        queries       : {이름 : {columns, order, query}} (실행 순서대로)
+        params        : 모든 SQL 에 사용하는 parameter
+
+    Returns:
+        {이름 : 조회 결과 row 리스트 (각 조회의 columns 만 포함)}
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    names   = list(queries)
+    results = {name : [] for name in names}
+
+    with db_connection.cursor() as cursor:
+        cursor.execute(build_result_sets_query(queries), params)
+
+        for row in cursor.fetchall():
+            name = names[row['result_set']]
+            results[name].append({column : row[column] for column in queries[name]['columns']})
+
+    return results
+
 class ProductDao:
 
     def insert_product(self, db_connection):
@@ -131,35 +840,38 @@ class ProductDao:
         except Exception as e:
             raise e
 
-    def insert_image(self, image_url, db_connection):
+    def insert_images(self, image_urls, db_connection):
 
         """
 
-        상품 이미지 URL을 Image Size 별로 images 테이블에 insert 하고 image_no(PK)를 Return합니다.
+        여러 상품 이미지 URL 을 한번의 multi-row insert 로 images 테이블에 저장합니다.
 
         Args:
-            image_url     : 사진 사이즈 별 URL(Dictionary)
-                {
-                    'product_image_L' : Large 사이즈 url,
-                    'product_image_M' : Medium 사이즈 url,
-                    'product_image_S' : Small 사이즈 url
-                }
+            image_urls    : 사진 사이즈 별 URL(Dictionary) List
+                [
+                    {
+                        'product_image_L' : Large 사이즈 url,
+                        'product_image_M' : Medium 사이즈 url,
+                        'product_image_S' : Small 사이즈 url
+                    }
+                ]
             db_connection : DATABASE Connection Instance
 
         Returns:
-            image_no(images Table PK)
+            None
 
         Author:
-            sincerity410@gmail.com (이곤호)
+            tnwjd060124@gmail.com (손수정)
 
         History:
-            2020-08-28 (sincerity410@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
+                # executemany 는 INSERT ... VALUES 를 하나의 multi-row insert 로 실행
                 insert_images_query = """
                 INSERT INTO images (
                     image_large,
@@ -172,13 +884,12 @@ class ProductDao:
                 )
                 """
 
-                affected_row = cursor.execute(insert_images_query, image_url)
+                affected_row = cursor.executemany(insert_images_query, image_urls)
 
-                if affected_row <= 0 :
+                if affected_row < len(image_urls) :
                     raise Exception('QUERY_FAILED')
 
-                # 등록한 images 테이블의 row id Return
-                return cursor.lastrowid
+                return None
 
         except KeyError as e:
             raise e
@@ -186,34 +897,90 @@ class ProductDao:
         except Exception as e:
             raise e
 
-    def insert_product_image(self, product_id, image_id, product_image_no, db_connection):
+    def select_image_numbers(self, image_urls, db_connection):
 
         """
 
-        products와 images 테이블의 중간 테이블(product_images)에 상품별 image row id를 insert 합니다.
+        images 테이블에 저장한 URL 들의 image_no(PK)를 Large 사이즈 URL 별로 Return 합니다.
+        multi-row insert 는 lastrowid 로 모든 row id 를 알 수 없으므로 URL 로 다시 조회합니다.
 
         Args:
-            product_id       : business layer로 부터 받은 Parameter
-            image_id         : URL insert한 images 테이블의 row id
-            product_image_no : image 순서 구분을 위한 image Number 정보(ex: product_image_1)
-            db_connection    : DATABASE Connection Instance
+            image_urls    : 사진 사이즈 별 URL(Dictionary) List
+            db_connection : DATABASE Connection Instance
 
         Returns:
-            None
+            { Large 사이즈 url : image_no }
 
         Author:
-            sincerity410@gmail.com (이곤호)
+            tnwjd060124@gmail.com (손수정)
 
         History:
-            2020-08-28 (sincerity410@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
-                # Thumbnail(대표) 사진의 구분
-                is_main = 1 if product_image_no == 'product_image_1' else 0
+                select_image_numbers_query = """
+                SELECT
+                    MAX(image_no) AS image_no,
+                    image_large
+
+                FROM images
+
+                WHERE
+                    image_large IN %s
+                    AND is_deleted = 0
+
+                GROUP BY
+                    image_large
+                """
+
+                cursor.execute(
+                    select_image_numbers_query,
+                    ([image_url['product_image_L'] for image_url in image_urls],)
+                )
+
+                image_numbers = {row['image_large'] : row['image_no'] for row in cursor.fetchall()}
+
+                if len(image_numbers) < len(image_urls) :
+                    raise Exception('QUERY_FAILED')
+
+                return image_numbers
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def insert_product_images(self, product_id, product_images, db_connection):
+
+        """
+
+        products와 images 테이블의 중간 테이블(product_images)에 상품의 모든 image row id를 한번에 insert 합니다.
+
+        Args:
+            product_id     : business layer로 부터 받은 Parameter
+            product_images : (image_id, product_image_no) List
+                image_id         : URL insert한 images 테이블의 row id
+                product_image_no : image 순서 구분을 위한 image Number 정보(ex: product_image_1)
+            db_connection  : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
 
                 insert_product_images_query = """
                 INSERT INTO product_images (
@@ -227,12 +994,15 @@ class ProductDao:
                 )
                 """
 
-                affected_row = cursor.execute(
-                    insert_product_images_query,
-                    (product_id, image_id, is_main)
-                )
+                # Thumbnail(대표) 사진의 구분
+                rows = [
+                    (product_id, image_id, 1 if product_image_no == 'product_image_1' else 0)
+                    for image_id, product_image_no in product_images
+                ]
 
-                if affected_row <= 0 :
+                affected_row = cursor.executemany(insert_product_images_query, rows)
+
+                if affected_row < len(rows) :
                     raise Exception('QUERY_FAILED')
 
                 return None
@@ -243,17 +1013,27 @@ class ProductDao:
         except Exception as e:
             raise e
 
-    def select_product_list(self, db_connection):
+    def select_product_list(self, page_info, db_connection):
 
         """
 
-        서비스 페이지의 상품 전체 리스트를 리턴합니다.
+        서비스 페이지의 상품 리스트를 정렬 기준(sort)에 따라 한 페이지 리턴합니다.
+        OFFSET 대신 이전 페이지 마지막 상품의 (정렬 값, product_no) 이후부터 조회(keyset pagination)하므로
+        product_catalog_current 의 (is_activated, is_displayed[, 카테고리][, 정렬 컬럼], product_id) index range scan 으로
+        카탈로그 크기, 페이지 위치와 관계없이 일정한 시간에 조회됩니다.
 
         Args:
+            page_info     :
+                sort             : PRODUCT_LIST_SORTS 의 정렬 기준
+                main_category_id : 1차 카테고리 (없으면 None)
+                sub_category_id  : 2차 카테고리 (없으면 None)
+                cursor           : 이전 페이지 마지막 상품의 product_no (첫 페이지는 None)
+                sort_key         : 이전 페이지 마지막 상품의 정렬 값 (최신순 또는 첫 페이지는 None)
+                limit            : 조회할 상품 수
             db_connection : 연결된 db 객체
 
         Returns:
-            서비스 페이지의 상품 전체 리스트
+            서비스 페이지의 상품 리스트 (적용 할인율, 할인가 포함, 최신순이 아닌 경우 다음 cursor 를 위한 sort_key 포함)
 
         Authors:
             minho.lee0716@gmail.com (이민호)
@@ -272,126 +1052,108 @@ class ProductDao:
                 현재 이력 조회 조건 변경
             2020-09-05 (tnwjd060124@gmail.com) : 수정
                 할인 기간에 따른 할인률 조회 조건 추가
+            2026-10-18 (tnwjd060124@gmail.com) : keyset pagination 적용
+            2026-10-18 (tnwjd060124@gmail.com) : 조회용 테이블(product_catalog_current) 에서 조회
+            2026-10-18 (tnwjd060124@gmail.com) : 적용 할인율 계산을 pricing 으로 이동 (할인율, 할인 기간 조회)
+            2026-10-18 (tnwjd060124@gmail.com) : 카테고리 필터, 가격순(할인가 기준)/할인순 정렬 추가
+            2026-10-18 (tnwjd060124@gmail.com) : 미리 계산된 적용 할인율, 할인가 조회
 
         """
 
-        with db_connection.cursor() as cursor:
-
-            select_products_query = """
-            SELECT
-                P.product_no,
-                I.image_medium AS thumbnail_image,
-                PD.name AS product_name,
-                PD.price AS original_price,
-                CASE
-                    WHEN PD.discount_rate IS NULL THEN 0 -- discount_rate이 NULL 인 경우 0
-                    ELSE CASE
-                        WHEN PD.discount_start_date IS NULL THEN PD.discount_rate -- 할인 기간이 무기한인 경우
-                        WHEN NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date THEN PD.discount_rate -- 할인기간이 유효한 경우
-                        ELSE 0 -- 할인 기간이 아닌 경우
-                        END
-                    END
-                AS discount_rate
-
-            FROM products AS P
-
-            INNER JOIN product_images as PI
-            ON P.product_no = PI.product_id
-            AND PI.close_time = '9999-12-31 23:59:59'
-            AND PI.is_main = 1
+        # 필터, 정렬 조건에 맞는 SQL 생성
+        select_products_query = build_product_list_query(page_info)
 
-            INNER JOIN images as I
-            ON PI.image_id = I.image_no
-            AND I.is_deleted = 0
-
-            INNER JOIN product_details as PD
-            ON P.product_no = PD.product_id
-            AND PD.is_activated = 1
-            AND PD.is_displayed = 1
-            AND PD.close_time = '9999-12-31 23:59:59'
-
-            WHERE
-                P.is_deleted = False
-
-            ORDER BY
-                P.product_no DESC;
-            """
+        with db_connection.cursor() as cursor:
 
-            # 상품을 등록하고, row의 id를 고려해 전체 리스트에서는 상품 id의 역순으로 리턴해줍니다.
-            # 그러면 상품이 등록된 최신 순으로 전체 리스트에서 볼 수 있습니다.
-            cursor.execute(select_products_query)
+            # 정렬 기준(기본 상품 id의 역순, 최신 등록순)에 맞는 순서로 한 페이지를 리턴해줍니다.
+            cursor.execute(select_products_query, page_info)
             products = cursor.fetchall()
 
             return products
 
-    def select_product_details(self, product_id, db_connection):
+    def select_product_page(self, product_id, parts, db_connection):
 
         """
 
-        서비스 페이지의 상품 상세정보를 리턴합니다.
+        서비스 페이지의 상품 상세정보를 구성하는 정보 중 parts 에 해당하는 것만 한번의 DB 왕복으로 리턴합니다.
+        각 조회 SQL 을 UNION ALL 로 묶어 실행하고 조회 별 결과로 나누어 읽습니다.
 
         Args:
             product_id    : 해당 상품의 id
+            parts         : 조회할 정보 이름 (PRODUCT_PAGE_QUERIES 의 key)
+                details : 상품 상세정보 (적용 할인율, 할인가 포함)
+                exists  : 상품 존재 여부 (상세정보 없이 판매/진열중인 상품인지만 확인)
+                images  : 상세정보 이미지 URL 리스트 (이미지 id 오름차순)
+                colors  : 상품 옵션의 색상 리스트
+                stock   : 색상 x 사이즈 별 옵션 id 와 현재 재고 리스트
             db_connection : 연결된 db 객체
 
         Returns:
-            해당 상품에 대한 상세정보들
+            {
+                details : 상품 상세정보 (판매/진열중인 상품이 없으면 None),
+                exists  : 판매/진열중인 상품 존재 여부,
+                images  : [image_large],
+                colors  : [{color_id, color_name}],
+                stock   : [{color_id, color_name, size, size_id, product_option_id, quantity}]
+            } 중 parts 에 해당하는 값
 
         Authors:
             minho.lee0716@gmail.com (이민호)
+            tnwjd060124@gmail.com (손수정)
 
         History:
-            2020-08-26 (minho.lee0716@gmail.com) : 초기 생성
-            2020-08-30 (minho.lee0716@gmail.com) : 현재 이력만 조회하는 조건 추가
-            2020-08-31 (minho.lee0716@gmail.com) : 키값 수정
-                detail_information > html,
-                product_no > product_id
-            2020-09-04 (tnwjd060124@gmail.com) : 수정
-                현재 이력 조회 조건 변경
-            2020-09-05 (tnwjd060124@gmail.com) : 수정
-                할인 기간에 유효한 조건 조회 변경
+            2026-10-18 (tnwjd060124@gmail.com) : select_product_details, select_product_images,
+                                                 select_product_option_colors, select_etc_options 를 한번의 조회로 통합
+            2026-10-18 (tnwjd060124@gmail.com) : 재고에 옵션 id 추가
+            2026-10-18 (tnwjd060124@gmail.com) : 미리 계산된 적용 할인율, 할인가 조회
 
         """
 
-        with db_connection.cursor() as cursor:
+        # 필요한 조회만 묶어서 한번에 실행
+        queries = {part : query for part, query in PRODUCT_PAGE_QUERIES.items() if part in parts}
+        page    = fetch_result_sets(db_connection, queries, {'product_id' : product_id})
 
-            # 해당 상품의 상세정보들을 검색해주는 쿼리문입니다.
-            select_product_details_query = """
-            SELECT
-                P.product_no AS product_id,
-                PD.name,
-                PD.detail_information AS html,
-                PD.price AS original_price,
-                PD.min_sales_quantity,
-                PD.max_sales_quantity,
-                CASE
-                    WHEN PD.discount_rate IS NULL THEN 0
-                    ELSE CASE
-                        WHEN PD.discount_start_date IS NULL THEN PD.discount_rate
-                        WHEN NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date THEN PD.discount_rate
-                        ELSE 0
-                        END
-                    END
-                AS discount_rate
-
-            FROM products AS P
-
-            INNER JOIN product_details AS PD
-            ON P.product_no = PD.product_id
-            AND PD.is_activated = 1
-            AND PD.is_displayed = 1
-            AND PD.close_time = '9999-12-31 23:59:59'
-
-            WHERE
-                P.is_deleted = 0
-                AND P.product_no = %s;
-            """
+        if 'details' in page:
+            page['details'] = page['details'][0] if page['details'] else None
+
+        if 'exists' in page:
+            page['exists'] = bool(page['exists'])
+
+        # 프론트에게 배열로 사진들을 주기 위해 URL 만 담습니다.
+        if 'images' in page:
+            page['images'] = [image['image_large'] for image in page['images']]
+
+        return page
+
+    def select_product_batch(self, product_ids, db_connection):
+
+        """
+
+        서비스 페이지에서 여러 상품(장바구니, 최근 본 상품 등)의 정보, 대표 이미지, 색상을 한번의 DB 왕복으로 리턴합니다.
+        상품 수와 관계없이 IN 조건의 조회 2개만 실행합니다.
+
+        Args:
+            product_ids   : 상품 id 리스트 (1개 이상)
+            db_connection : 연결된 db 객체
+
+        Returns:
+            {
+                details : [{product_id, name, original_price, min_sales_quantity, max_sales_quantity,
+                            discount_rate, sales_price, thumbnail_image}],
+                colors  : [{product_id, color_id, color_name}]
+            }
+            판매/진열중이 아닌 상품은 포함되지 않습니다.
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
 
-            # 데이터들을 가져온 후, product_details라는 변수에 담아 리턴해줍니다.
-            cursor.execute(select_product_details_query, product_id)
-            product_details = cursor.fetchone()
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : 미리 계산된 적용 할인율, 할인가 조회
+
+        """
 
-            return product_details
+        return fetch_result_sets(db_connection, PRODUCT_BATCH_QUERIES, {'product_ids' : tuple(product_ids)})
 
     def select_color_list(self, db_connection):
 
@@ -489,17 +1251,17 @@ class ProductDao:
         except Exception as e:
             raise e
 
-    def insert_product_option(self, product_info, option, db_connection):
+    def insert_quantity(self, now, product_option_id, option, db_connection):
+
         """
 
-        상품의 옵션 정보 테이블(product_options)에 insert 하고 product_option_no(PK)를 Return 합니다.
+        상품 제고 수량 테이블(quantities)에 insert 합니다.
 
         Args:
-            product_id    : 상품 테이블(products) PK
             db_connection : DATABASE Connection Instance
 
         Returns:
-            product_option_no(PK)
+            None
 
         Author:
             sincerity410@gmail.com (이곤호)
@@ -513,37 +1275,31 @@ class ProductDao:
         try:
             with db_connection.cursor() as cursor:
 
-                insert_product_options_query = """
-                INSERT INTO product_options (
-                    product_id,
-                    color_id,
-                    size_id,
-                    current_quantity,
-                    is_deleted
+                insert_quantities_query = """
+                INSERT INTO quantities (
+                    product_option_id,
+                    quantity,
+                    start_time
                 ) VALUES (
                     %s,
                     %s,
-                    %s,
-                    %s,
-                    DEFAULT
+                    %s
                 )
                 """
 
                 affected_row = cursor.execute(
-                    insert_product_options_query,
+                    insert_quantities_query,
                     (
-                        product_info['product_id'],
-                        option['color_id'],
-                        option['size_id'],
-                        option['quantity']
+                        product_option_id,
+                        option['quantity'],
+                        now
                     )
                 )
 
                 if affected_row <= 0 :
                     raise Exception('QUERY_FAILED')
 
-                # 등록한 product_option 테이블의 row id Return
-                return cursor.lastrowid
+                return None
 
         except KeyError as e:
             raise e
@@ -551,53 +1307,424 @@ class ProductDao:
         except Exception as e:
             raise e
 
-    def insert_quantity(self, now, product_option_id, option, db_connection):
+    def insert_product_options(self, product_id, options, db_connection):
 
         """
 
-        상품 제고 수량 테이블(quantities)에 insert 합니다.
+        상품의 여러 옵션 정보를 한번의 multi-row insert 로 상품 옵션 테이블(product_options)에 저장합니다.
 
         Args:
+            product_id    : 상품 테이블(products) PK
+            options       : 옵션 List
+                color_id : 색상 option id
+                size_id  : 사이즈 option id
+                quantity : 재고수량
             db_connection : DATABASE Connection Instance
 
         Returns:
             None
 
         Author:
-            sincerity410@gmail.com (이곤호)
+            tnwjd060124@gmail.com (손수정)
 
         History:
-            2020-08-29 (sincerity410@gmail.com) : 초기생성
-            2020-09-08 (sincerity410@gmail.com) : 스키마 수정에 따른 함수 수정
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
-                insert_quantities_query = """
-                INSERT INTO quantities (
-                    product_option_id,
-                    quantity,
-                    start_time
+                # executemany 는 INSERT ... VALUES 를 하나의 multi-row insert 로 실행 (is_deleted 는 DEFAULT)
+                insert_product_options_query = """
+                INSERT INTO product_options (
+                    product_id,
+                    color_id,
+                    size_id,
+                    current_quantity
                 ) VALUES (
+                    %s,
                     %s,
                     %s,
                     %s
                 )
                 """
 
-                affected_row = cursor.execute(
-                    insert_quantities_query,
-                    (
-                        product_option_id,
-                        option['quantity'],
-                        now
-                    )
+                rows = [
+                    (product_id, option['color_id'], option['size_id'], option['quantity'])
+                    for option in options
+                ]
+
+                affected_row = cursor.executemany(insert_product_options_query, rows)
+
+                if affected_row < len(rows) :
+                    raise Exception('QUERY_FAILED')
+
+                return None
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def select_product_option_numbers(self, product_id, db_connection):
+
+        """
+
+        상품의 삭제되지 않은 옵션 별 product_option_no(PK)를 Return 합니다.
+        multi-row insert 는 lastrowid 로 모든 row id 를 알 수 없으므로 (color_id, size_id) 로 다시 조회합니다.
+
+        Args:
+            product_id    : 상품 테이블(products) PK
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            { (color_id, size_id) : product_option_no }
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                select_product_options_query = """
+                SELECT
+                    product_option_no,
+                    color_id,
+                    size_id
+
+                FROM
+                    product_options
+
+                WHERE
+                    product_id = %s
+                    AND is_deleted = 0
+                """
+
+                cursor.execute(select_product_options_query, product_id)
+
+                return {
+                    (row['color_id'], row['size_id']) : row['product_option_no']
+                    for row in cursor.fetchall()
+                }
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def insert_quantities(self, now, quantities, db_connection):
+
+        """
+
+        여러 옵션의 재고 수량을 한번의 multi-row insert 로 재고 수량 테이블(quantities)에 저장합니다.
+
+        Args:
+            now           : 선분이력 시작 시간
+            quantities    : (product_option_id, quantity) List
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                insert_quantities_query = """
+                INSERT INTO quantities (
+                    product_option_id,
+                    quantity,
+                    start_time
+                ) VALUES (
+                    %s,
+                    %s,
+                    %s
+                )
+                """
+
+                rows = [
+                    (product_option_id, quantity, now)
+                    for product_option_id, quantity in quantities
+                ]
+
+                affected_row = cursor.executemany(insert_quantities_query, rows)
+
+                if affected_row < len(rows) :
+                    raise Exception('QUERY_FAILED')
+
+                return None
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def insert_products(self, count, db_connection):
+
+        """
+
+        [상품관리 > 상품 일괄등록]
+        products Table 에 상품 count 개를 multi-row insert 로 생성하고 생성된 상품 id 를 Return 합니다.
+
+        multi-row insert 의 auto increment id 는 연속된다는 보장이 없으므로
+        상품마다 고유한 product_code 를 넣고 product_code 로 id 를 다시 조회합니다.
+
+        Args:
+            count         : 생성할 상품 수
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            [상품 id] (생성 순서)
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                # executemany 는 VALUES 에 parameter 만 있어야 multi-row insert 로 실행 (created_at, is_deleted 는 DEFAULT)
+                insert_products_query = """
+                INSERT INTO products (
+                    product_code
+                ) VALUES (
+                    %s
                 )
+                """
+
+                product_codes = [str(uuid.uuid4()) for _ in range(count)]
+
+                affected_row = cursor.executemany(insert_products_query, product_codes)
+
+                if affected_row < count :
+                    raise Exception('QUERY_FAILED')
+
+                select_product_numbers_query = """
+                SELECT
+                    product_no,
+                    product_code
+                FROM
+                    products
+                WHERE
+                    product_code IN %s
+                """
+
+                cursor.execute(select_product_numbers_query, (product_codes,))
+
+                product_numbers = {row['product_code'] : row['product_no'] for row in cursor.fetchall()}
+
+                return [product_numbers[product_code] for product_code in product_codes]
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def insert_product_details(self, product_infos, db_connection):
+
+        """
+
+        [상품관리 > 상품 일괄등록]
+        여러 상품의 상세정보(product_details) 를 multi-row insert 로 저장합니다.
+
+        Args:
+            product_infos : insert_product_detail 의 product_info 와 같은 Dictionary 리스트
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                insert_product_details_query = """
+                INSERT INTO product_details (
+                    product_id,
+                    is_activated,
+                    is_displayed,
+                    main_category_id,
+                    sub_category_id,
+                    name,
+                    simple_description,
+                    detail_information,
+                    price,
+                    discount_rate,
+                    discount_start_date,
+                    discount_end_date,
+                    min_sales_quantity,
+                    max_sales_quantity,
+                    start_time
+                ) VALUES (
+                    %(product_id)s,
+                    %(sellYn)s,
+                    %(exhibitionYn)s,
+                    %(mainCategoryId)s,
+                    %(subCategoryId)s,
+                    %(productName)s,
+                    %(simpleDescription)s,
+                    %(detailInformation)s,
+                    %(price)s,
+                    %(discountRate)s,
+                    %(discountStartDate)s,
+                    %(discountEndDate)s,
+                    %(minSalesQuantity)s,
+                    %(maxSalesQuantity)s,
+                    %(now)s
+                )
+                """
+
+                affected_row = cursor.executemany(insert_product_details_query, product_infos)
+
+                if affected_row < len(product_infos) :
+                    raise Exception('QUERY_FAILED')
+
+                return None
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def insert_option_rows(self, rows, db_connection):
+
+        """
+
+        [상품관리 > 상품 일괄등록]
+        여러 상품의 옵션을 product_options Table 에 multi-row insert 로 저장하고
+        (상품 id, color_id, size_id) 별 옵션 id 를 Return 합니다.
+
+        Args:
+            rows          : [(상품 id, color_id, size_id, 재고수량)]
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            {(상품 id, color_id, size_id) : product_option_no}
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                insert_product_options_query = """
+                INSERT INTO product_options (
+                    product_id,
+                    color_id,
+                    size_id,
+                    current_quantity
+                ) VALUES (
+                    %s,
+                    %s,
+                    %s,
+                    %s
+                )
+                """
+
+                affected_row = cursor.executemany(insert_product_options_query, rows)
+
+                if affected_row < len(rows) :
+                    raise Exception('QUERY_FAILED')
+
+                # multi-row insert 의 row id 는 (상품 id, color_id, size_id) 로 다시 조회
+                select_product_options_query = """
+                SELECT
+                    product_option_no,
+                    product_id,
+                    color_id,
+                    size_id
+                FROM
+                    product_options
+                WHERE
+                    product_id IN %s
+                    AND is_deleted = 0
+                """
+
+                cursor.execute(select_product_options_query, (list({row[0] for row in rows}),))
+
+                return {
+                    (row['product_id'], row['color_id'], row['size_id']) : row['product_option_no']
+                    for row in cursor.fetchall()
+                }
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def refresh_product_catalogs(self, product_ids, db_connection):
+
+        """
+
+        [상품관리 > 상품 일괄등록]
+        여러 상품의 조회용 테이블(product_catalog_current) row 를 한번에 다시 만듭니다.
+
+        Args:
+            product_ids   : 상품 id 리스트
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
 
-                if affected_row <= 0 :
-                    raise Exception('QUERY_FAILED')
+                delete_product_catalog_query = """
+                DELETE FROM product_catalog_current
+                WHERE product_id IN %s
+                """
+
+                cursor.execute(delete_product_catalog_query, (list(product_ids),))
+
+                cursor.execute(
+                    INSERT_PRODUCT_CATALOG_QUERY + """
+                    AND P.product_no IN %s
+                    """,
+                    (list(product_ids),)
+                )
 
                 return None
 
@@ -607,6 +1734,51 @@ class ProductDao:
         except Exception as e:
             raise e
 
+    def select_all_sub_category_list(self, db_connection):
+
+        """
+
+        모든 Sub Category 를 Main Category id 와 함께 Return 합니다. (dimension cache 의 카테고리 tree 용)
+
+        Args:
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            [{sub_category_no, main_category_id, name}]
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                select_sub_categories_query = """
+                SELECT
+                    sub_category_no,
+                    main_category_id,
+                    name
+
+                FROM sub_categories
+
+                ORDER BY
+                    sub_category_no
+                """
+
+                cursor.execute(select_sub_categories_query)
+
+                return cursor.fetchall()
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
     def select_main_category_list(self, db_connection):
 
         """
@@ -710,377 +1882,430 @@ class ProductDao:
         except Exception as e:
             raise e
 
-    def select_product_images(self, product_id, db_connection):
+    def select_registered_product_list(self, filter_info, db_connection):
 
         """
 
-        상품 상세정보의 이미지들을 리턴합니다.
+        [상품관리 > 상품관리]
+        관리자 페이지에서 등록된 상품의 List를 Return 합니다.
 
         Args:
-            product_id    : 해당 상품의 id
-            db_connection : 연결된 db 객체
+            filter_info   : Parameter로 들어온 filter의 Dictionary 객체
+            db_connection : DATABASE Connection Instance
 
         Returns:
-            해당 상품에 대한 상세정보 이미지들
+            [
+                {
+                    productCode          : 상품 코드
+                    productExhibitYn     : 진열 여부
+                    productName          : 상품 이름
+                    productNo            : 상품 번호
+                    productRegistDate    : 상품 등록 일시
+                    productSellYn        : 판매 여부
+                    productSmallImageUrl : SMALL SIZE IMAGE URL
+                    sellPrice            : 상품 가격
+                    price                : 상품 가격 (할인가 계산용)
+                    discount_rate        : 할인율
+                    discount_start_date  : 할인 시작일시
+                    discount_end_date    : 할인 종료일시
+                }
+            ]
 
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-            tnwjd060124@gmail.com (손수정)
+        Author:
+            sincerity410@gmail.com (이곤호)
 
         History:
-            2020-08-27 (minho.lee0716@gmail.com) : 초기 생성
-            2020-08-31 (minho.lee0716@gmail.com) : 현재 이력만 조회하는 조건 추가
-            2020-09-04 (tnwjd060124@gmail.com) : 현재 이력 조회하는 조건 수정
+            2020-09-01 (sincerity410@gmail.com) : 초기생성
+            2020-09-03 (sincerity410@gmail.com) : Filtering 조건 추가
+            2026-10-18 (tnwjd060124@gmail.com)  : filter 조합 별로 cache 된 SQL 사용
+            2026-10-18 (tnwjd060124@gmail.com)  : 상품명 FULLTEXT index 검색식 추가
+            2026-10-18 (tnwjd060124@gmail.com)  : SQL_CALC_FOUND_ROWS 제거, 한 페이지만 조회 (Total Count 는 따로 조회)
+            2026-10-18 (tnwjd060124@gmail.com)  : OFFSET 대신 after / before keyset pagination 사용
 
         """
 
-        with db_connection.cursor() as cursor:
+        try:
+            with db_connection.cursor() as cursor:
 
-            select_product_images_query = """
-            SELECT
-                I.image_large
+                # 한 페이지(LIMIT) 만 조회 (Total Count 는 select_registered_product_count 로 따로 조회)
+                # after / before 상품 번호 기준 keyset pagination (OFFSET 사용하지 않음)
+                params = get_registered_product_params(filter_info)
+
+                cursor.execute(REGISTERED_PRODUCT_PLAN.compile(params).list_sql, params)
+                product_list = cursor.fetchall()
 
-            FROM products AS P
+                return product_list
 
-            LEFT JOIN product_images AS PI
-            ON P.product_no = PI.product_id
-            AND PI.close_time = '9999-12-31 23:59:59'
+        except KeyError as e:
+            raise e
 
-            LEFT JOIN images AS I
-            ON PI.image_id = I.image_no
-            AND I.is_deleted = False
+        except Exception as e:
+            raise e
 
-            WHERE
-                P.product_no = %s
-                AND P.is_deleted = False
+    def select_registered_product_count(self, filter_info, db_connection):
 
-            ORDER BY
-                I.image_no ASC;
-            """
+        """
+
+        [상품관리 > 상품관리]
+        관리자 페이지에서 filter 에 해당하는 등록된 상품의 Total Count를 Return 합니다.
+        List 조회와 같은 FROM/WHERE 본문으로 COUNT(*) 만 조회합니다.
+
+        Args:
+            filter_info   : Parameter로 들어온 filter의 Dictionary 객체
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            검색된 상품 개수
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성 (SQL_CALC_FOUND_ROWS, FOUND_ROWS() 대체)
+            2026-10-18 (tnwjd060124@gmail.com) : keyset pagination 위치 제외
+
+        """
 
-            # 이미지를 순서대로(이미지 id의 오름차순) 정렬해줍니다
+        with db_connection.cursor() as cursor:
 
-            # 쿼리문을 실행한 후,  가져온 모든 이미지의 데이터들을 product_images라는 변수에 담아줍니다.
-            cursor.execute(select_product_images_query, product_id)
-            product_images = cursor.fetchall()
+            # 전체 개수이므로 keyset pagination 위치는 제외
+            params = {**get_registered_product_params(filter_info), 'after' : None, 'before' : None}
 
-            # 최종적으로 프론트에게 배열로 사진들을 주기 위헤 images라는 배열에 담습니다.
-            images = [
-                element['image_large']
-            for element in product_images]
+            cursor.execute(REGISTERED_PRODUCT_PLAN.compile(params).count_sql, params)
 
-            return images
+            return cursor.fetchone()['total']
 
-    def select_product_option_colors(self, product_id, db_connection):
+    def select_registered_product_stream(self, filter_info, db_connection):
 
         """
 
-        서비스 페이지의 상품 상세정보중 컬러들을 리턴합니다.
+        [상품관리 > 상품관리]
+        filter 에 해당하는 등록된 상품 전체를 unbuffered cursor 로 한 row 씩 Return 합니다. (CSV export 용)
+        결과 전체를 메모리에 올리지 않으므로 상품 수와 관계없이 메모리 사용량이 일정합니다.
 
         Args:
-            product_id    : 해당 상품의 id
-            db_connection : 연결된 db 객체
+            filter_info   : Parameter로 들어온 filter의 Dictionary 객체
+            db_connection : DATABASE Connection Instance
 
         Returns:
-            해당 상품에 대한 상세정보의 옵션중 컬러들만 리턴.
+            select_registered_product_list 와 같은 row 의 generator (상품 번호 역순)
 
-        Authors:
-            minho.lee0716@gmail.com (이민호)
+        Author:
             tnwjd060124@gmail.com (손수정)
 
         History:
-            2020-08-30 (minho.lee0716@gmail.com) : 초기 생성
-            2020-08-31 (minho.lee0716@gmail.com) : 현재 이력만 조회하는 조건 추가
-            2020-08-31 (minho.lee0716@gmail.com) : 옵션 전체가 아닌, 컬러만 조회하기
-            2020-09-04 (tnwjd060124@gmail.com)   : 현재 이력만 조회하는 조건 변경
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
 
         """
 
-        with db_connection.cursor() as cursor:
+        params = get_registered_product_params(filter_info)
 
-            # 해당 상품에 대한 컬러들을 검색해주는 쿼리문입니다.
-            select_product_options_query = """
-            SELECT DISTINCT
-                C.color_no AS color_id,
-                C.name AS color_name
+        return fetch_stream(db_connection, REGISTERED_PRODUCT_EXPORT_PLAN.compile(params).list_sql, params)
 
-            FROM products AS P
+    def select_registered_product_boundaries(self, filter_info, db_connection):
 
-            LEFT JOIN product_options AS PO
-            ON P.product_no = PO.product_id
-            AND PO.is_deleted = False
+        """
+
+        [상품관리 > 상품관리]
+        filter 에 해당하는 등록된 상품 List 를 filter_info['limit'] 개씩 나눴을 때
+        각 페이지의 마지막 상품 번호를 Return 합니다.
+        N 페이지는 N-1 번째 값을 after 로 사용하여 keyset pagination 으로 조회합니다.
+
+        상품 번호만 index 로 읽으므로 한 페이지를 OFFSET 으로 조회하는 것보다 가볍고,
+        service 에서 cache 하여 페이지 번호로 이동할 때마다 다시 조회하지 않습니다.
 
-            LEFT JOIN colors AS C
-            ON PO.color_id = C.color_no
+        Args:
+            filter_info   : Parameter로 들어온 filter의 Dictionary 객체
+            db_connection : DATABASE Connection Instance
 
-            WHERE
-                P.product_no = %s
-                AND P.is_deleted = False
+        Returns:
+            [페이지 별 마지막 상품 번호] (상품 번호 역순)
 
-            ORDER BY
-                color_id ASC; -- color_id를 오름차순으로 정렬해줍니다.
-            """
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        with db_connection.cursor() as cursor:
 
-            # 쿼리문을 실행한 후,
-            cursor.execute(select_product_options_query, product_id)
+            params = get_registered_product_params(filter_info)
 
-            # 받아온 모든 컬러의 정보를 colors라는 변수에 담습니다.
-            colors = cursor.fetchall()
+            cursor.execute(REGISTERED_PRODUCT_BOUNDARY_PLAN.compile(params).list_sql, params)
 
-            return colors
+            return [row['product_id'] for row in cursor.fetchall()]
 
-    def select_etc_options(self, product_info, db_connection):
+    def refresh_product_catalog(self, product_id, db_connection):
 
         """
 
-        서비스 페이지의 상품 상세정보중 사이즈와 수량을 리턴합니다.
+        상품의 현재 이력(product_details, 대표 이미지)으로 조회용 테이블(product_catalog_current)의 row 를 다시 만듭니다.
+        상품 등록/수정과 같은 transaction 에서 호출하여 조회용 테이블이 history 테이블과 항상 같도록 합니다.
+        삭제된 상품은 row 가 삭제됩니다.
 
         Args:
-            product_info : {
-                product_id    : 해당 상품의 id
-                color_name    : 해당 상품의 color의 이름
-            }
-            db_connection : 연결된 db 객체
+            product_id    : products 테이블의 PK
+            db_connection : DATABASE Connection Instance
 
         Returns:
-            해당 상품에 대한 상세정보의 옵션중 사이즈와 수량을 리턴
+            None
 
-        Authors:
-            minho.lee0716@gmail.com (이민호)
+        Author:
             tnwjd060124@gmail.com (손수정)
 
         History:
-            2020-08-31 (minho.lee0716@gmail.com) : 초기 생성
-            2020-09-01 (minho.lee0716@gmail.com) : 상품의 id에서 이름을 받는걸로 변경
-            2020-09-01 (minho.lee0716@gmail.com) : 수정
-                DB에서 데이터의 순서에 의해, 마지막에 역순으로 정렬
-            2020-09-04 (tnwjd060124@gmail.com) : 수정
-                현재 이력만 조회하는 조건 수정
-            2020-09-01 (minho.lee0716@gmail.com) : 수정
-                상품과 사이즈를 선택 시, 수량이 1개 이상인 상품만 주도록 쿼리문 변경
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
 
         """
 
-        with db_connection.cursor() as cursor:
+        try:
+            with db_connection.cursor() as cursor:
 
-            # color_id를 주고 해당 컬러의 size들과 수량을 검색해주는 쿼리문 입니다.
-            select_product_etc_options_query = """
-            SELECT
-                S.name AS size,
-                S.size_no AS size_id,
-                Q.quantity
+                delete_product_catalog_query = """
+                DELETE FROM product_catalog_current
+                WHERE product_id = %s
+                """
 
-            FROM products AS P
+                cursor.execute(delete_product_catalog_query, product_id)
 
-            LEFT JOIN product_options AS PO
-            ON P.product_no = PO.product_id
-            AND PO.is_deleted = False
+                cursor.execute(
+                    INSERT_PRODUCT_CATALOG_QUERY + """
+                    AND P.product_no = %s
+                    """,
+                    product_id
+                )
 
-            LEFT JOIN colors AS C
-            ON PO.color_id = C.color_no
+                return None
 
-            LEFT JOIN sizes AS S
-            ON PO.size_id = S.size_no
+        except KeyError as e:
+            raise e
 
-            LEFT JOIN quantities AS Q
-            ON PO.product_option_no = Q.product_option_id
-            AND Q.close_time = '9999-12-31 23:59:59'
+        except Exception as e:
+            raise e
 
-            WHERE
-                P.product_no = %(product_id)s
-                AND P.is_deleted = False
-                AND C.color_no = %(color_id)s
-                AND Q.quantity > 0
+    def rebuild_product_catalog(self, db_connection):
 
-            ORDER BY
-                S.size_no DESC; -- 사이즈는 큰 순서로 넣어줬기 때문에 역순으로 정렬하였습니다.
-            """
+        """
+
+        조회용 테이블(product_catalog_current)의 모든 row 를 history 테이블로부터 다시 만듭니다.
 
-            # 쿼리문을 실행한 후
-            cursor.execute(select_product_etc_options_query, product_info)
+        Args:
+            db_connection : DATABASE Connection Instance
 
-            # 받아온 size와 수량에 대한 모든 데이터들을 etc_options라는 변수에 담아줍니다.
-            etc_options = cursor.fetchall()
+        Returns:
+            생성된 row 수
 
-            return etc_options
+        Author:
+            tnwjd060124@gmail.com (손수정)
 
-    def select_registered_product_list(self, filter_info, db_connection):
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
 
         """
 
-        [상품관리 > 상품관리]
-        관리자 페이지에서 등록된 상품의 List와 Total Count를 Return 합니다.
+        try:
+            with db_connection.cursor() as cursor:
+
+                # TRUNCATE 는 암묵적으로 commit 되므로 DELETE 로 같은 transaction 에서 교체
+                cursor.execute("""
+                DELETE FROM product_catalog_current
+                """)
+
+                return cursor.execute(INSERT_PRODUCT_CATALOG_QUERY)
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def select_catalog_prices(self, product_ids, now, limit, db_connection):
+
+        """
+
+        적용 할인율, 할인가를 다시 계산할 상품의 가격, 할인 정보를 Return 합니다.
+        product_ids 가 있으면 해당 상품들을, 없으면 price_expires_at 이 기준 시각(now)까지인 상품을
+        price_expires_at 순서로 limit 개 조회합니다. (IX_product_catalog_current_price_expires_at)
 
         Args:
-            filter_info   : Parameter로 들어온 filter의 Dictionary 객체
+            product_ids   : 상품 id 리스트 (None 이면 가격이 만료된 상품)
+            now           : 기준 시각
+            limit         : 조회할 최대 상품 수 (product_ids 가 없는 경우)
             db_connection : DATABASE Connection Instance
 
         Returns:
-            data: [
-                [
-                    {
-                        discountPrice        : 할인가
-                        discountRate         : 할인율
-                        discountYn           : 할인 여부
-                        productCode          : 상품 코드
-                        productExhibitYn     : 진열 여부
-                        productName          : 상품 이름
-                        productNo            : 상품 번호
-                        productRegistDate    : 상품 등록 일시
-                        productSellYn        : 판매 여부
-                        productSmallImageUrl : SMALL SIZE IMAGE URL
-                        sellPrice            : 상품 가격
-                    }
-                ],
-                    {
-                        "total": 검색된 상품 개수
-                    }
-            ]
+            [{product_id, price, discount_rate, discount_start_date, discount_end_date, applied_discount_rate, sales_price}]
 
         Author:
-            sincerity410@gmail.com (이곤호)
+            tnwjd060124@gmail.com (손수정)
 
         History:
-            2020-09-01 (sincerity410@gmail.com) : 초기생성
-            2020-09-03 (sincerity410@gmail.com) : Filtering 조건 추가
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
-                select_product_list_query = """
-                -- 상품 조회 Query Start
+                select_catalog_prices_query = """
                 SELECT
-                    SQL_CALC_FOUND_ROWS
-                    P.created_at as productRegistDate,
-                    I.image_small as productSmallImageUrl,
-                    PD.name as productName,
-                    P.product_no as productNo,
-                    P.product_code as productCode,
-                    ROUND(PD.price, -1) as sellPrice,
-                    discountRate,
-                    ROUND(PD.price * (100-discountRate)/100, -1) AS discountPrice,
-                    CASE
-                        WHEN discountRate = 0
-                            THEN "미할인"
-                        ELSE "할인"
-                    END AS discountYn,
-                    IF(PD.is_displayed = 1, "진열", "미진열") as productExhibitYn,
-                    IF(PD.is_activated = 1, "판매", "미판매") as productSellYn
+                    product_id,
+                    price,
+                    discount_rate,
+                    discount_start_date,
+                    discount_end_date,
+                    applied_discount_rate,
+                    sales_price
 
-                FROM (
-                    SELECT products.*,
-                    CASE
-                    	WHEN (product_details.discount_end_date IS NULL AND product_details.discount_start_date IS NULL) AND product_details.discount_rate IS NOT NULL
-                    		THEN product_details.discount_rate
-                    	WHEN (product_details.discount_end_date IS NOT NULL AND product_details.discount_start_date IS NOT NULL) AND (product_details.discount_start_date <= now() AND product_details.discount_end_date >= now())
-                    		THEN product_details.discount_rate
-                    	ELSE 0
-                    END AS discountRate
-                    FROM products
-
-                INNER JOIN product_details
-                ON product_details.product_id = products.product_no
-                AND product_details.close_time = '9999-12-31 23:59:59'
-                ) AS P
+                FROM product_catalog_current
+                """
 
-                INNER JOIN product_images as PI
-                ON P.product_no = PI.product_id
-                AND PI.close_time = '9999-12-31 23:59:59'
-                AND PI.is_main = 1
+                if product_ids is not None:
+                    select_catalog_prices_query += """
+                WHERE
+                    product_id IN %(product_ids)s
+                    """
 
-                INNER JOIN images as I
-                ON PI.image_id = I.image_no
-                AND I.is_deleted = 0
+                else:
+                    select_catalog_prices_query += """
+                WHERE
+                    price_expires_at <= %(now)s
 
-                INNER JOIN product_details as PD
-                ON PD.product_id = P.product_no
-                AND PD.close_time = '9999-12-31 23:59:59'
+                ORDER BY
+                    price_expires_at ASC
+
+                LIMIT
+                    %(limit)s
+                    """
+
+                cursor.execute(
+                    select_catalog_prices_query,
+                    {
+                        'product_ids' : list(product_ids or []),
+                        'now'         : now,
+                        'limit'       : limit
+                    }
+                )
+
+                return cursor.fetchall()
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def update_catalog_prices(self, prices, db_connection):
+
+        """
+
+        미리 계산한 적용 할인율, 할인가, 다음 계산 시각(price_expires_at)을 조회용 테이블에 저장합니다.
+        적용 할인율이나 할인가가 바뀐 상품은 응답 version 이 바뀌도록 갱신일시(updated_at)도 갱신합니다.
+
+        Args:
+            prices        : [{product_id, applied_discount_rate, sales_price, price_expires_at}]
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
 
+                # SET 은 왼쪽부터 적용되므로 updated_at 을 먼저 비교
+                update_catalog_prices_query = """
+                UPDATE
+                    product_catalog_current
+                SET
+                    updated_at            = IF(
+                                                applied_discount_rate <> %(applied_discount_rate)s
+                                                OR sales_price <> %(sales_price)s,
+                                                CURRENT_TIMESTAMP(6),
+                                                updated_at
+                                            ),
+                    applied_discount_rate = %(applied_discount_rate)s,
+                    sales_price           = %(sales_price)s,
+                    price_expires_at      = %(price_expires_at)s
                 WHERE
-                    P.is_deleted = False
+                    product_id = %(product_id)s
                 """
 
-                # Filtering 시작
+                cursor.executemany(update_catalog_prices_query, prices)
 
-                # 판매 여부 필터링
-                if filter_info['sellYn'] is not None :
-                    select_product_list_query += """
-                    AND PD.is_activated = %(sellYn)s
-                    """
+                return None
 
-                # 할인 여부 필터링
-                if filter_info['discountYn'] is not None :
-                    select_product_list_query += """
-                    AND (
-                    CASE
-                        WHEN discountRate = 0
-                            THEN FALSE
-                        ELSE TRUE
-                    END) = %(discountYn)s
-                    """
+        except KeyError as e:
+            raise e
 
-                # 진열 여부 필터링
-                if filter_info['exhibitionYn'] is not None :
-                    select_product_list_query += """
-                    AND PD.is_displayed = %(exhibitionYn)s
-                    """
+        except Exception as e:
+            raise e
 
-                # 상품 등록 기간 시작일자 필터링
-                if filter_info['startDate'] is not None :
-                    select_product_list_query += """
-                    AND P.created_at >= %(startDate)s
-                    """
+    def select_catalog_version(self, product_id, db_connection):
+
+        """
+
+        서비스 상품 리스트, 상세정보 응답의 version 을 계산할 갱신일시와 다음 할인 시작/종료 시각을 Return 합니다.
+        응답 body 를 만들기 전에 304 여부를 판단하기 위한 조회이므로 index 의 첫/끝 값이나 PK 한 row 만 읽습니다.
+
+        - product_id 가 None 이면 전체 상품의 MAX(updated_at), MIN(price_expires_at)
+          (IX_product_catalog_current_updated_at, IX_product_catalog_current_price_expires_at)
+        - product_id 가 있으면 판매/진열중인 해당 상품의 updated_at, price_expires_at
+
+        상품은 삭제되지 않고 판매/진열여부, 할인가가 바뀌면 updated_at 이 갱신되므로
+        리스트에서 빠지는 변경도 MAX(updated_at) 에 반영됩니다.
+
+        Args:
+            product_id    : 상품 id (None 이면 전체 상품)
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            {updated_at, price_expires_at} (판매/진열중인 상품이 없으면 None)
 
-                # 상품 등록 기간 종료일자 필터링
-                if filter_info['endDate'] is not None :
-                    filter_info['endDate'] += 1
-                    select_product_list_query += """
-                    AND P.created_at < %(endDate)s
-                    """
+        Author:
+            tnwjd060124@gmail.com (손수정)
 
-                # 상품명 일부 일치 조건 필터링
-                if filter_info['productName'] is not None :
-                    filter_info['productName'] = f"%{filter_info['productName']}%"
-                    select_product_list_query += """
-                    AND PD.name like %(productName)s
-                    """
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
 
-                # 상품 번호 일치 조건 필터링
-                if filter_info['productNo'] is not None :
-                    select_product_list_query += """
-                    AND P.product_no = %(productNo)s
-                    """
+        """
 
-                # 상품 코드 일치 조건 필터링
-                if filter_info['productCode'] is not None :
-                    select_product_list_query += """
-                    AND P.product_code = %(productCode)s
-                    """
+        try:
+            with db_connection.cursor() as cursor:
 
-                # 정렬 및 Page Nation 적용
-                select_product_list_query += """
-                ORDER BY
-                    P.product_no DESC
+                if product_id is None:
+                    cursor.execute("""
+                    SELECT
+                        MAX(updated_at) AS updated_at,
+                        MIN(price_expires_at) AS price_expires_at
 
-                LIMIT
-                    %(limit)s
-                OFFSET
-                    %(offset)s
-                """
+                    FROM product_catalog_current
+                    """)
 
-                cursor.execute(select_product_list_query, filter_info)
-                product_list = cursor.fetchall()
+                else:
+                    cursor.execute("""
+                    SELECT
+                        updated_at,
+                        price_expires_at
 
-                select_product_count = """
-                SELECT FOUND_ROWS() as total
-                """
+                    FROM product_catalog_current
 
-                cursor.execute(select_product_count)
-                total = cursor.fetchone()
+                    WHERE
+                        product_id = %s
+                        AND is_activated = 1
+                        AND is_displayed = 1
+                    """, (product_id,))
 
-                return product_list, total
+                return cursor.fetchone()
 
         except KeyError as e:
             raise e
@@ -1263,6 +2488,7 @@ class ProductDao:
 
         History:
             2020-09-05 (sincerity410@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com)  : 조회용 테이블(product_catalog_current) 에서 조회
 
         """
 
@@ -1272,34 +2498,29 @@ class ProductDao:
                 # product_id에 해당하는 상품 상세 정보 조회
                 select_product_detail_query = """
                 SELECT
-                	P.product_code as productCode,
-                    PD.is_activated as sellYn,
-                    PD.is_displayed as exhibitYn,
+                    PC.product_code as productCode,
+                    PC.is_activated as sellYn,
+                    PC.is_displayed as exhibitYn,
                     MC.name as mainCategory,
                     SC.name as subCategory,
-                    PD.name as productName,
-                    PD.simple_description as simpleDescription,
-                    PD.detail_information as detailInformation,
-                    PD.price,PD.discount_rate as discountRate,
-                    PD.discount_start_date as discountStartDate,
-                    PD.discount_end_date as discountEndDate,
-                    PD.min_sales_quantity as minSalesQuantity,
-                    PD.max_sales_quantity as maxSalesQuantity
-                FROM products as P
-
-                INNER JOIN product_details as PD
-                ON PD.product_id = P.product_no
-                AND PD.close_time = '9999-12-31 23:59:59'
+                    PC.name as productName,
+                    PC.simple_description as simpleDescription,
+                    PC.detail_information as detailInformation,
+                    PC.price,PC.discount_rate as discountRate,
+                    PC.discount_start_date as discountStartDate,
+                    PC.discount_end_date as discountEndDate,
+                    PC.min_sales_quantity as minSalesQuantity,
+                    PC.max_sales_quantity as maxSalesQuantity
+                FROM product_catalog_current as PC
 
                 INNER JOIN main_categories as MC
-                ON PD.main_category_id = MC.main_category_no
+                ON PC.main_category_id = MC.main_category_no
 
                 INNER JOIN sub_categories as SC
-                ON PD.sub_category_id = SC.sub_category_no
+                ON PC.sub_category_id = SC.sub_category_no
 
                 WHERE
-                    P.product_no = %s
-                    AND P.is_deleted = 0
+                    PC.product_id = %s
                 """
 
                 cursor.execute(select_product_detail_query, product_id)
@@ -1469,9 +2690,10 @@ class ProductDao:
             optionQuantity : 옵션별 수량 List
             [
                 {
-                    color    : 색상 이름
-                    size     : 사이즈 이름
-                    quantity : 옵션별 재고 수량
+                    product_option_id : 상품 옵션 id (product_options Table PK)
+                    color             : 색상 이름
+                    size              : 사이즈 이름
+                    quantity          : 옵션별 재고 수량
                 }
             ]
 
@@ -1480,6 +2702,7 @@ class ProductDao:
 
         History:
             2020-09-07 (sincerity410@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : 옵션 diff 후 바로 변경할 수 있도록 product_option_id 조회
 
         """
 
@@ -1489,6 +2712,7 @@ class ProductDao:
                 # product_id에 해당하는 상품 옵션 조회
                 select_product_option_query = """
                 SELECT
+                    PO.product_option_no AS product_option_id,
                     C.name AS color,
                     S.name AS size,
                     Q.quantity AS quantity
@@ -1653,6 +2877,212 @@ class ProductDao:
         except Exception as e:
             raise e
 
+    def select_current_product_status(self, product_ids, db_connection):
+
+        """
+
+        [상품관리 > 판매/진열여부 일괄변경]
+        상품들의 현재 상세정보(product_details) 이력 id 와 판매/진열여부를 조회하고, 변경이 끝날 때까지 이력 row 를 lock 합니다.
+
+        Args:
+            product_ids   : 상품 id 리스트
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            [{product_detail_no, product_id, is_activated, is_displayed}] (현재 이력이 없는 상품은 제외)
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                select_current_product_status_query = """
+                SELECT
+                    product_detail_no,
+                    product_id,
+                    is_activated,
+                    is_displayed
+                FROM
+                    product_details
+                WHERE
+                    product_id IN %s
+                    AND close_time = '9999-12-31 23:59:59'
+                FOR UPDATE
+                """
+
+                cursor.execute(select_current_product_status_query, (list(product_ids),))
+
+                return cursor.fetchall()
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def update_product_status(self, now, product_detail_numbers, status, db_connection):
+
+        """
+
+        [상품관리 > 판매/진열여부 일괄변경]
+        상세정보 이력 여러 개를 판매/진열여부만 바꾼 새 이력으로 교체합니다.
+        상품 수와 관계없이 새 이력 INSERT ... SELECT, 기존 이력 close UPDATE 두 번만 실행하며,
+        상세 설명(detail_information) 같은 나머지 컬럼은 DB 안에서 복사되므로 application 으로 읽어오지 않습니다.
+
+        Args:
+            now                    : 선분 시작/close 시간
+            product_detail_numbers : 교체할 현재 이력의 product_detail_no 리스트 (select_current_product_status 로 lock 한 row)
+            status                 : {sellYn : 판매여부(1|0|None), exhibitionYn : 진열여부(1|0|None)} (None 이면 기존 값 유지)
+            db_connection          : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                params = {
+                    'now'                    : now,
+                    'sellYn'                 : status['sellYn'],
+                    'exhibitionYn'           : status['exhibitionYn'],
+                    'product_detail_numbers' : list(product_detail_numbers)
+                }
+
+                # 기존 이력을 복사하여 판매/진열여부만 바꾼 새 이력 생성 (close 전에 복사)
+                insert_product_details_query = """
+                INSERT INTO product_details (
+                    product_id,
+                    is_activated,
+                    is_displayed,
+                    main_category_id,
+                    sub_category_id,
+                    name,
+                    simple_description,
+                    detail_information,
+                    price,
+                    discount_rate,
+                    discount_start_date,
+                    discount_end_date,
+                    min_sales_quantity,
+                    max_sales_quantity,
+                    start_time
+                )
+                SELECT
+                    product_id,
+                    COALESCE(%(sellYn)s, is_activated),
+                    COALESCE(%(exhibitionYn)s, is_displayed),
+                    main_category_id,
+                    sub_category_id,
+                    name,
+                    simple_description,
+                    detail_information,
+                    price,
+                    discount_rate,
+                    discount_start_date,
+                    discount_end_date,
+                    min_sales_quantity,
+                    max_sales_quantity,
+                    %(now)s
+                FROM
+                    product_details
+                WHERE
+                    product_detail_no IN %(product_detail_numbers)s
+                """
+
+                affected_row = cursor.execute(insert_product_details_query, params)
+
+                if affected_row < len(params['product_detail_numbers']):
+                    raise Exception('QUERY_FAILED')
+
+                # 기존 이력 close
+                close_product_details_query = """
+                UPDATE
+                    product_details
+                SET
+                    close_time = %(now)s
+                WHERE
+                    product_detail_no IN %(product_detail_numbers)s
+                """
+
+                cursor.execute(close_product_details_query, params)
+
+                return None
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def update_product_catalog_status(self, product_ids, status, db_connection):
+
+        """
+
+        [상품관리 > 판매/진열여부 일괄변경]
+        조회용 테이블(product_catalog_current)의 판매/진열여부만 한번에 갱신합니다.
+        나머지 컬럼은 바뀌지 않으므로 refresh_product_catalogs 처럼 row 를 다시 만들지 않습니다.
+
+        Args:
+            product_ids   : 상품 id 리스트
+            status        : {sellYn : 판매여부(1|0|None), exhibitionYn : 진열여부(1|0|None)} (None 이면 기존 값 유지)
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                update_product_catalog_status_query = """
+                UPDATE
+                    product_catalog_current
+                SET
+                    is_activated = COALESCE(%(sellYn)s, is_activated),
+                    is_displayed = COALESCE(%(exhibitionYn)s, is_displayed),
+                    updated_at   = CURRENT_TIMESTAMP(6)
+                WHERE
+                    product_id IN %(product_ids)s
+                """
+
+                cursor.execute(
+                    update_product_catalog_status_query,
+                    {
+                        'sellYn'       : status['sellYn'],
+                        'exhibitionYn' : status['exhibitionYn'],
+                        'product_ids'  : list(product_ids)
+                    }
+                )
+
+                return None
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
     def delete_product_option(self, now, product_option_id, db_connection):
         """
 
@@ -1749,6 +3179,96 @@ class ProductDao:
         except Exception as e:
             raise e
 
+    def delete_product_options(self, now, product_option_ids, db_connection):
+
+        """
+
+        상품 수정 시, request 에서 빠진 여러 옵션을 한번에 삭제합니다.(Soft Delete)
+
+        Args:
+            now                : deleted_at 시간
+            product_option_ids : 상품 옵션 ID(product_options Table의 PK) List
+            db_connection      : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                delete_product_options_query = """
+                UPDATE
+                    product_options
+                SET
+                    is_deleted = 1,
+                    deleted_at = %s
+                WHERE
+                    product_option_no IN %s
+                """
+
+                cursor.execute(delete_product_options_query, (now, list(product_option_ids)))
+
+                return None
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def close_quantities(self, now, product_option_ids, db_connection):
+
+        """
+
+        상품 수정 시, 수량이 변경된 여러 옵션의 quantities 기존 선분이력을 한번에 close 합니다.
+
+        Args:
+            now                : 선분 close 시간
+            product_option_ids : 상품 옵션 ID(product_options Table의 PK) List
+            db_connection      : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                close_quantities_query = """
+                UPDATE
+                    quantities
+                SET
+                    close_time = %s
+                WHERE
+                    product_option_id IN %s
+                    AND close_time = '9999-12-31 23:59:59'
+                """
+
+                cursor.execute(close_quantities_query, (now, list(product_option_ids)))
+
+                return None
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
     def select_product_option_number(self, product_id, option, db_connection):
         """
 
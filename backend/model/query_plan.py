@@ -0,0 +1,172 @@
+import collections
+
+# 필터 조합 별로 compile 된 SQL
+CompiledQuery = collections.namedtuple('CompiledQuery', ['mask', 'list_sql', 'count_sql'])
+
+class QueryPlan:
+
+    """
+
+    동적 필터 조건으로 만들어지는 조회 SQL 을 필터 조합(bitmask) 별로 한번만 만들어 재사용합니다.
+
+    목록(list) SQL 과 총 개수(count) SQL 은 같은 FROM/JOIN/WHERE 본문에서 만들어지므로
+    두 SQL 의 조건이 서로 달라지지 않습니다.
+
+    Args:
+        name        : plan 이름 (모니터링용)
+        flags       : (flag 이름, filter_info 를 받아 True/False 를 Return 하는 함수) 의 tuple
+                      tuple 의 순서가 bitmask 의 bit 위치가 됩니다.
+        builder     : 사용중인 flag 이름의 frozenset 을 받아 (select 컬럼, FROM 이하 본문, ORDER BY 절) 을 Return 하는 함수
+        count_alias : count SQL 의 결과 컬럼 이름
+        paginate    : True 이면 list SQL 끝에 LIMIT %(limit)s OFFSET %(offset)s 를 붙입니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self, name, flags, builder, count_alias='total_number', paginate=True):
+        self.name        = name
+        self.flags       = tuple(flags)
+        self.builder     = builder
+        self.count_alias = count_alias
+        self.paginate    = paginate
+
+        # bitmask : CompiledQuery (dict 대입은 원자적이므로 동시에 compile 되어도 같은 결과로 덮어씀)
+        self._compiled = {}
+        self._hits     = 0
+        self._misses   = 0
+
+    def get_mask(self, filter_info):
+
+        """
+
+        filter_info 에서 사용중인 필터의 bitmask 를 Return 합니다.
+
+        """
+
+        mask = 0
+
+        for bit, (name, is_used) in enumerate(self.flags):
+            if is_used(filter_info):
+                mask |= 1 << bit
+
+        return mask
+
+    def _build(self, mask):
+        used = frozenset(name for bit, (name, is_used) in enumerate(self.flags) if mask & (1 << bit))
+
+        columns, body, order_by = self.builder(used)
+
+        list_sql = f"""
+            SELECT
+                {columns}
+            {body}
+            {order_by}
+            """
+
+        if self.paginate:
+            list_sql += """
+            LIMIT
+                %(limit)s
+            OFFSET
+                %(offset)s
+            """
+
+        count_sql = f"""
+            SELECT
+                COUNT(*) AS {self.count_alias}
+            {body}
+            """
+
+        return CompiledQuery(mask, list_sql, count_sql)
+
+    def compile(self, filter_info):
+
+        """
+
+        filter_info 의 필터 조합에 해당하는 CompiledQuery 를 Return 합니다.
+        처음 사용하는 조합인 경우에만 SQL 을 만듭니다.
+
+        Args:
+            filter_info : 필터 정보 Dictionary
+
+        Returns:
+            CompiledQuery(mask, list_sql, count_sql)
+
+        """
+
+        mask     = self.get_mask(filter_info)
+        compiled = self._compiled.get(mask)
+
+        if compiled is None:
+            self._misses         += 1
+            compiled              = self._build(mask)
+            self._compiled[mask]  = compiled
+        else:
+            self._hits += 1
+
+        return compiled
+
+    def stats(self):
+
+        """
+
+        모니터링을 위한 plan cache 상태를 Return 합니다.
+
+        Returns:
+            {name, variants, max_variants, hits, misses}
+
+        """
+
+        return {
+            'name'         : self.name,
+            'variants'     : len(self._compiled),
+            'max_variants' : 1 << len(self.flags),
+            'hits'         : self._hits,
+            'misses'       : self._misses
+        }
+
+# 생성된 모든 plan (모니터링용)
+query_plans = []
+
+def register_query_plan(*args, **kwargs):
+
+    """
+
+    QueryPlan 을 생성하고 모니터링 목록에 등록합니다.
+
+    Returns:
+        QueryPlan 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    plan = QueryPlan(*args, **kwargs)
+    query_plans.append(plan)
+
+    return plan
+
+def get_query_plan_stats():
+
+    """
+
+    등록된 모든 QueryPlan 의 cache 상태를 Return 합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    return [plan.stats() for plan in query_plans]
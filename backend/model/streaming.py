@@ -0,0 +1,57 @@
+import pymysql
+
+# SSDictCursor 에서 한번에 읽어오는 row 수
+STREAM_FETCH_SIZE = 100
+
+def fetch_stream(db_connection, query, params=None, fetch_size=STREAM_FETCH_SIZE):
+
+    """
+
+    unbuffered cursor(SSDictCursor) 로 query 를 실행하고 결과 row 를 하나씩 돌려주는 generator 를 Return 합니다.
+    전체 결과를 메모리에 올리지 않으므로 결과 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    query 실행은 호출 시점에 바로 하므로 SQL 에러는 호출한 곳에서 잡을 수 있습니다.
+    generator 를 끝까지 읽거나 close 하기 전까지 같은 connection 으로 다른 query 를 실행할 수 없습니다.
+
+    Args:
+        db_connection : 연결된 db 객체
+        query         : 실행할 SQL
+        params        : SQL parameter
+        fetch_size    : 한번에 읽어오는 row 수
+
+    Returns:
+        row(dict) generator
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    cursor = db_connection.cursor(pymysql.cursors.SSDictCursor)
+
+    try:
+        cursor.execute(query, params)
+
+    except Exception:
+        cursor.close()
+        raise
+
+    return iterate_cursor(cursor, fetch_size)
+
+def iterate_cursor(cursor, fetch_size):
+
+    try:
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+
+            if not rows:
+                return
+
+            yield from rows
+
+    # 중간에 close 되어도 남은 결과를 정리하고 cursor 를 닫음
+    finally:
+        cursor.close()
@@ -1,5 +1,147 @@
 from flask import jsonify
 
+from .query_plan import register_query_plan
+from .streaming  import fetch_stream
+
+def build_user_list_query(used):
+
+    """
+
+    유저 리스트 / 총 유저 수 조회 SQL 을 사용중인 필터에 맞게 만듭니다.
+
+    Args:
+        used : 사용중인 필터 이름 set
+
+    Returns:
+        (select 컬럼, FROM 이하 본문, ORDER BY 절)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : get_user_list, get_total_user 의 SQL 생성 부분을 분리
+
+    """
+
+    columns = """
+                users.user_no,
+                users.name,
+                users.email,
+                users.last_access,
+                users.created_at,
+                user_shipping_details.phone_number,
+                social_networks.name AS social_name
+    """
+
+    body = """
+            FROM
+                users
+
+            LEFT JOIN
+                user_shipping_details
+            ON users.user_no = user_shipping_details.user_id
+
+            LEFT JOIN
+                social_networks
+            ON users.social_id = social_networks.social_network_no
+
+            WHERE
+                users.is_deleted = 0
+    """
+
+    # 회원 번호 filter 기능
+    if 'user_no' in used:
+        body += """
+            AND users.user_no = %(user_no)s
+        """
+
+    # 회원명 filter 기능
+    if 'user_name' in used:
+        body += """
+            AND users.name = %(user_name)s
+        """
+
+    # 이메일 filter 기능
+    if 'email' in used:
+        body += """
+            AND users.email = %(email)s
+        """
+
+    # 최종 접속일 filter 기능
+    if 'lastaccess_from' in used:
+        body += """
+            AND users.last_access >= %(lastaccess_from)s
+        """
+
+    if 'lastaccess_to' in used:
+        body += """
+            AND users.last_access <= %(lastaccess_to)s
+        """
+
+    # 등록일 filter 기능
+    if 'created_from' in used:
+        body += """
+            AND users.created_at >= %(created_from)s
+        """
+
+    if 'created_to' in used:
+        body += """
+            AND users.created_at <= %(created_to)s
+        """
+
+    # 핸드폰 번호 filter 기능
+    if 'phone_number' in used:
+        body += """
+            AND user_shipping_details.phone_number = %(phone_number)s
+        """
+
+    # 소셜 계정 filter 기능 (브랜디 회원은 소셜 계정이 없음)
+    if 'brandi_user' in used:
+        body += """
+            AND users.social_id IS NULL
+        """
+
+    if 'social_network' in used:
+        body += """
+            AND social_networks.name = %(social_network)s
+        """
+
+    if 'sort' in used:
+        order_by = """
+            ORDER BY
+                users.user_no DESC
+        """
+    else:
+        order_by = """
+            ORDER BY
+                users.user_no ASC
+        """
+
+    return columns, body, order_by
+
+# 유저 리스트 조회 plan (필터 존재 여부 조합 별로 SQL cache)
+USER_LIST_PLAN = register_query_plan(
+    'user_list',
+    [
+        (key, lambda filter_info, key=key : bool(filter_info[key]))
+        for key in (
+            'user_no',
+            'user_name',
+            'email',
+            'lastaccess_from',
+            'lastaccess_to',
+            'created_from',
+            'created_to',
+            'phone_number',
+            'sort'
+        )
+    ] + [
+        ('brandi_user', lambda filter_info : filter_info['social_network'] == '브랜디'),
+        ('social_network', lambda filter_info : bool(filter_info['social_network']) and filter_info['social_network'] != '브랜디')
+    ],
+    build_user_list_query
+)
+
 class UserDao:
 
     def signup_user(self, user_info, db_connection):
@@ -242,113 +384,13 @@ class UserDao:
             2020-08-21 (tnwjd060124@gmail.com) : 초기 생성
             2020-08-24 (tnwjd060124@gmail.com) : pagination 기능 추가
             2020-09-02 (tnwjd060124@gmail.com) : 필터 기능 추가
+            2026-10-18 (tnwjd060124@gmail.com) : 필터 조합 별로 cache 된 SQL 사용
 
         """
 
         with db_connection.cursor() as cursor:
 
-            select_user_query = """
-            SELECT
-                users.user_no,
-                users.name,
-                users.email,
-                users.last_access,
-                users.created_at,
-                user_shipping_details.phone_number,
-                social_networks.name AS social_name
-            FROM
-                users
-
-            LEFT JOIN
-                user_shipping_details
-            ON users.user_no = user_shipping_details.user_id
-
-            LEFT JOIN
-                social_networks
-            ON users.social_id = social_networks.social_network_no
-            """
-
-            # 삭제 되지 않은 데이터만 조회
-            select_user_query += """
-            WHERE
-                users.is_deleted = 0
-            """
-
-            # 회원 번호 filter 기능
-            if filter_info['user_no']:
-                select_user_query += """
-                AND users.user_no = %(user_no)s
-                """
-
-            # 회원명 filter 기능
-            if filter_info['user_name']:
-                select_user_query += """
-                AND users.name = %(user_name)s
-                """
-
-            # 이메일 filter 기능
-            if filter_info['email']:
-                select_user_query += """
-                AND users.email = %(email)s
-                """
-
-            # 최종 접속일 filter 기능
-            if filter_info['lastaccess_from']:
-                select_user_query += """
-                AND users.last_access >= %(lastaccess_from)s
-                """
-
-            if filter_info['lastaccess_to']:
-                select_user_query += """
-                AND users.last_access <= %(lastaccess_to)s
-                """
-
-            # 등록일 filter 기능
-            if filter_info['created_from']:
-                select_user_query += """
-                AND users.created_at >= %(created_from)s
-                """
-
-            if filter_info['created_to']:
-                select_user_query += """
-                AND users.created_at <= %(created_to)s
-                """
-
-            # 핸드폰 번호 filter 기능
-            if filter_info['phone_number']:
-                select_user_query += """
-                AND user_shipping_details.phone_number = %(phone_number)s
-                """
-
-            # 소셜 계정 filter 기능
-            if filter_info['social_network']:
-                if filter_info['social_network'] == '브랜디':
-                    select_user_query += """
-                    AND users.social_id IS NULL
-                    """
-                else:
-                    select_user_query += """
-                    AND social_networks.name = %(social_network)s
-                    """
-
-            if filter_info['sort'] :
-                select_user_query += """
-                ORDER BY
-                    users.user_no DESC
-                """
-            else:
-                select_user_query += """
-                ORDER BY
-                    users.user_no ASC
-                """
-
-            select_user_query += """
-            LIMIT
-                %(limit)s
-            OFFSET
-                %(offset)s
-            """
-            cursor.execute(select_user_query, filter_info)
+            cursor.execute(USER_LIST_PLAN.compile(filter_info).list_sql, filter_info)
 
             users = cursor.fetchall()
 
@@ -373,96 +415,19 @@ class UserDao:
         History:
             2020-08-25 (tnwjd060124@gmail.com) : 초기 생성
             2020-09-02 (tnwjd060124@gmail.com) : 필터 기능 추가
+            2026-10-18 (tnwjd060124@gmail.com) : 유저 리스트와 같은 plan 의 count SQL 사용
 
         """
 
         with db_connection.cursor() as cursor:
 
-            select_user_query = """
-            SELECT
-                COUNT(*) AS total_number
-            FROM
-                users
-
-            LEFT JOIN
-                user_shipping_details
-            ON users.user_no = user_shipping_details.user_id
-
-            LEFT JOIN
-                social_networks
-            ON users.social_id = social_networks.social_network_no
-            """
-
-            # 삭제 되지 않은 데이터만 조회
-            select_user_query += """
-            WHERE
-                users.is_deleted = 0
-            """
-
-            # 회원 번호 filter 기능
-            if filter_info['user_no']:
-                select_user_query += """
-                AND users.user_no = %(user_no)s
-                """
-
-            # 회원명 filter 기능
-            if filter_info['user_name']:
-                select_user_query += """
-                AND users.name = %(user_name)s
-                """
-
-            # 이메일 filter 기능
-            if filter_info['email']:
-                select_user_query += """
-                AND users.email = %(email)s
-                """
-
-            # 최종 접속일 filter 기능
-            if filter_info['lastaccess_from']:
-                select_user_query += """
-                AND users.last_access >= %(lastaccess_from)s
-                """
-
-            if filter_info['lastaccess_to']:
-                select_user_query += """
-                AND users.last_access <= %(lastaccess_to)s
-                """
-
-            # 등록일 filter 기능
-            if filter_info['created_from']:
-                select_user_query += """
-                AND users.created_at >= %(created_from)s
-                """
-
-            if filter_info['created_to']:
-                select_user_query += """
-                AND users.created_at <= %(created_to)s
-                """
-
-            # 핸드폰 번호 filter 기능
-            if filter_info['phone_number']:
-                select_user_query += """
-                AND user_shipping_details.phone_number = %(phone_number)s
-                """
-
-            # 소셜 계정 filter 기능
-            if filter_info['social_network']:
-                if filter_info['social_network'] == '브랜디':
-                    select_user_query += """
-                    AND users.social_id IS NULL
-                    """
-                else:
-                    select_user_query += """
-                    AND social_networks.name = %(social_network)s
-                    """
-
-            cursor.execute(select_user_query, filter_info)
+            cursor.execute(USER_LIST_PLAN.compile(filter_info).count_sql, filter_info)
 
             total_number = cursor.fetchone()
 
             return total_number
 
-    def get_user_orders(self, user_info, db_connection):
+    def get_user_orders(self, user_info, db_connection, stream=False):
 
         """
 
@@ -472,6 +437,7 @@ class UserDao:
             user_info:
                 user_no : 유저의 pk
             db_connection : 연결된 db 객체
+            stream : True 이면 전체 주문 정보 대신 row generator 를 Return
 
         Returns:
             유저의 주문 정보
@@ -485,66 +451,71 @@ class UserDao:
                 제품 정보 주문 생성시의 이력으로 조회하는 조건 추가
             2020-09-04 (tnwjd060124@gmail.com) : 수정
                 상품가격  대신 총 결제 금액 리턴하도록 변경
+            2026-10-18 (tnwjd060124@gmail.com) : stream 모드 추가
 
         """
 
-        with db_connection.cursor() as cursor:
+        select_user_orders = """
+        SELECT
+            P1.order_no,
+            P2.order_detail_no,
+            P2.start_time,
+            P7.image_small,
+            P12.product_no,
+            P8.name AS product_name,
+            P9.name AS color,
+            P10.name AS size,
+            P3.quantity,
+            P2.total_price,
+            P11.name AS order_status
 
-            select_user_orders = """
-            SELECT
-                P1.order_no,
-                P2.order_detail_no,
-                P2.start_time,
-                P7.image_small,
-                P12.product_no,
-                P8.name AS product_name,
-                P9.name AS color,
-                P10.name AS size,
-                P3.quantity,
-                P2.total_price,
-                P11.name AS order_status
+        FROM orders AS P1
 
-            FROM orders AS P1
+        INNER JOIN orders_details AS P2
+        ON P1.order_no = P2.order_id
 
-            INNER JOIN orders_details AS P2
-            ON P1.order_no = P2.order_id
+        INNER JOIN order_product AS P3
+        ON P2.order_detail_no = P3.order_detail_id
 
-            INNER JOIN order_product AS P3
-            ON P2.order_detail_no = P3.order_detail_id
+        INNER JOIN product_options AS P4
+        ON P3.product_option_id = P4.product_option_no
 
-            INNER JOIN product_options AS P4
-            ON P3.product_option_id = P4.product_option_no
+        INNER JOIN product_images AS P6
+        ON P4.product_id = P6.product_id
+        AND P6.is_main = 1
+        AND P2.start_time >= P6.start_time
+        AND P6.close_time >= P2.start_time
 
-            INNER JOIN product_images AS P6
-            ON P4.product_id = P6.product_id
-            AND P6.is_main = 1
-            AND P2.start_time >= P6.start_time
-            AND P6.close_time >= P2.start_time
+        INNER JOIN images AS P7
+        ON P7.image_no = P6.image_id
 
-            INNER JOIN images AS P7
-            ON P7.image_no = P6.image_id
+        INNER JOIN product_details AS P8
+        ON P4.product_id = P8.product_id
+        AND P2.start_time >= P8.start_time
+        AND P8.close_time >= P2.start_time
 
-            INNER JOIN product_details AS P8
-            ON P4.product_id = P8.product_id
-            AND P2.start_time >= P8.start_time
-            AND P8.close_time >= P2.start_time
+        INNER JOIN colors AS P9
+        ON P9.color_no = P4.color_id
 
-            INNER JOIN colors AS P9
-            ON P9.color_no = P4.color_id
+        INNER JOIN sizes AS P10
+        ON P10.size_no = P4.size_id
 
-            INNER JOIN sizes AS P10
-            ON P10.size_no = P4.size_id
+        INNER JOIN order_status AS P11
+        ON P11.order_status_no = P2.order_status_id
 
-            INNER JOIN order_status AS P11
-            ON P11.order_status_no = P2.order_status_id
+        INNER JOIN products AS P12
+        ON P12.product_no = P4.product_id
 
-            INNER JOIN products AS P12
-            ON P12.product_no = P4.product_id
+        WHERE P1.user_id = %(user_no)s
 
-            WHERE P1.user_id = %(user_no)s
+        ORDER BY P1.order_no DESC
+        """
 
-            ORDER BY P1.order_no DESC
-            """
+        # stream 모드인 경우 unbuffered cursor 로 한 row 씩 읽어옴
+        if stream:
+            return fetch_stream(db_connection, select_user_orders, user_info)
+
+        with db_connection.cursor() as cursor:
 
             cursor.execute(select_user_orders, user_info)
 
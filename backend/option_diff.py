@@ -0,0 +1,76 @@
+def get_option_key(option):
+
+    """
+
+    옵션을 비교하는 key (색상 이름, 사이즈 이름) 를 Return 합니다.
+
+    Args:
+        option : color, size 를 가진 옵션 Dictionary
+
+    Returns:
+        (color, size)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    return (option['color'], option['size'])
+
+def diff_options(db_options, request_options):
+
+    """
+
+    DB 의 상품 옵션과 상품수정 request 의 옵션을 (색상, 사이즈) key 의 Dictionary 로 한번씩만 읽어 비교합니다.
+    옵션 수가 n, m 일 때 O(n + m) 이며 두 입력은 변경하지 않습니다.
+
+    - added   : request 에만 있는 옵션
+    - removed : DB 에만 있는 옵션
+    - changed : 양쪽에 모두 있고 재고수량만 다른 옵션 (request 옵션에 DB 의 product_option_id 를 더한 값)
+
+    Args:
+        db_options      : [{product_option_id, color, size, quantity}]
+        request_options : [{color, size, quantity}]
+
+    Returns:
+        {added : [옵션], removed : [옵션], changed : [옵션]}
+
+    Raises:
+        Exception('DUPLICATED_OPTION') : request 에 같은 (색상, 사이즈) 옵션이 두 번 이상 있는 경우
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    db_index = {get_option_key(option) : option for option in db_options}
+
+    added, changed = [], []
+    request_keys   = set()
+
+    for option in request_options:
+        key = get_option_key(option)
+
+        if key in request_keys:
+            raise Exception('DUPLICATED_OPTION')
+
+        request_keys.add(key)
+        db_option = db_index.get(key)
+
+        if db_option is None:
+            added.append(option)
+
+        elif int(option['quantity']) != int(db_option['quantity']):
+            changed.append({**option, 'product_option_id' : db_option['product_option_id']})
+
+    return {
+        'added'   : added,
+        'removed' : [option for key, option in db_index.items() if key not in request_keys],
+        'changed' : changed
+    }
@@ -0,0 +1,410 @@
+import time, weakref, threading, collections
+
+import pymysql
+
+class PoolTimeoutError(Exception):
+
+    """
+
+    정해진 대기 시간 안에 connection pool 에서 connection 을 받지 못했을 때 발생합니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    pass
+
+class PooledConnection:
+
+    """
+
+    pool 에서 빌려준 connection 객체입니다.
+    pymysql connection 의 모든 속성을 그대로 위임하고,
+    close() 호출 시 실제 연결을 끊지 않고 pool 에 반납합니다.
+
+    with 문으로 사용하면 블록이 끝날 때 반납합니다. (commit 되지 않은 transaction 은 rollback)
+    close() 없이 버려진 경우에도 garbage collect 될 때 실제 연결을 끊고 pool 의 자리를 돌려받습니다.
+
+    Args:
+        pool       : connection 을 빌려준 ConnectionPool
+        connection : pymysql connection 객체
+        created_at : 실제 연결(physical connection) 생성 시각
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : with 문 지원, 반납 없이 버려진 연결 회수
+
+    """
+
+    def __init__(self, pool, connection, created_at):
+        self._pool       = pool
+        self._connection = connection
+        self._created_at = created_at
+        self._released   = False
+
+        # close() 없이 버려지면 pool 의 자리를 돌려받음 (self 를 참조하지 않도록 connection 만 전달)
+        self._finalizer        = weakref.finalize(self, pool.reclaim, connection)
+        self._finalizer.atexit = False
+
+    def __getattr__(self, name):
+
+        # 반납된 connection 은 더 이상 사용할 수 없음
+        if self._released:
+            raise pymysql.err.InterfaceError(0, 'CONNECTION_ALREADY_RELEASED')
+
+        return getattr(self._connection, name)
+
+    def close(self):
+
+        # 여러번 close 해도 한번만 반납
+        if self._released:
+            return
+
+        self._released = True
+        self._finalizer.detach()
+        self._pool.release(self._connection, self._created_at)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class ConnectionPool:
+
+    """
+
+    thread-safe MySQL connection pool 입니다.
+
+    - 최소(min_size) 개수 만큼 미리 연결을 만들어 두고(pre-warm), 최대(max_size) 개수까지만 연결을 만듭니다.
+    - 모든 연결이 사용중이면 wait_timeout 초 동안 반납을 기다린 후 PoolTimeoutError 를 발생시킵니다.
+    - ping_interval 초 이상 놀고 있던 연결은 빌려주기 전에 ping 으로 살아있는지 확인합니다.
+    - max_lifetime 초가 지난 연결은 반납 시점/대여 시점에 끊고 새로 만듭니다.
+    - time_zone 같은 session 설정은 실제 연결이 생성될 때 한번만 적용됩니다.
+    - 반납되지 않고 버려진 연결은 garbage collect 될 때 끊고 자리를 돌려받습니다. (leaked)
+
+    Args:
+        connect_kwargs : pymysql.connect 에 전달할 인자
+        min_size       : 미리 만들어 둘 연결 수
+        max_size       : 최대 연결 수
+        max_lifetime   : 연결 최대 사용 시간(초)
+        ping_interval  : 대여 전 ping 을 보내는 유휴 시간 기준(초)
+        wait_timeout   : 연결 대기 최대 시간(초)
+        name           : 모니터링 시 구분을 위한 pool 이름
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : 반납 없이 버려진 연결 회수
+
+    """
+
+    def __init__(
+        self,
+        connect_kwargs,
+        min_size      = 2,
+        max_size      = 10,
+        max_lifetime  = 3600,
+        ping_interval = 30,
+        wait_timeout  = 5,
+        name          = 'primary'
+    ):
+        if min_size > max_size:
+            raise ValueError('MIN_SIZE_IS_BIGGER_THAN_MAX_SIZE')
+
+        self.connect_kwargs = connect_kwargs
+        self.min_size       = min_size
+        self.max_size       = max_size
+        self.max_lifetime   = max_lifetime
+        self.ping_interval  = ping_interval
+        self.wait_timeout   = wait_timeout
+        self.name           = name
+
+        # (connection, created_at, last_used_at) 를 담는 유휴 연결 목록
+        self._idle      = collections.deque()
+        self._size      = 0
+        # 버려진 연결의 회수(reclaim)는 gc 가 임의의 시점에 실행하므로,
+        # lock 을 잡고 있는 thread 에서 실행되어도 멈추지 않도록 RLock 사용
+        self._condition = threading.Condition(threading.RLock())
+
+        # 모니터링용 통계
+        self._stats = {
+            'acquired'        : 0,
+            'created'         : 0,
+            'recycled'        : 0,
+            'discarded'       : 0,
+            'leaked'          : 0,
+            'timeouts'        : 0,
+            'waits'           : 0,
+            'total_wait_time' : 0.0,
+            'max_wait_time'   : 0.0
+        }
+
+    def _connect(self):
+
+        # 실제 연결 생성 (session 설정은 init_command 로 연결 시 한번만 적용)
+        connection = pymysql.connect(**self.connect_kwargs)
+
+        with self._condition:
+            self._stats['created'] += 1
+
+        return connection, time.monotonic()
+
+    def _discard(self, connection, stat_key):
+
+        # 실제 연결을 끊고 pool 크기를 줄인 뒤 대기중인 thread 를 깨움
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+        with self._condition:
+            self._size -= 1
+            self._stats[stat_key] += 1
+            self._condition.notify()
+
+    def _is_expired(self, created_at, now):
+        return self.max_lifetime and now - created_at >= self.max_lifetime
+
+    def prewarm(self):
+
+        """
+
+        min_size 만큼 연결을 미리 생성합니다.
+
+        Returns:
+            생성된 연결 수
+
+        """
+
+        created = 0
+
+        while True:
+            with self._condition:
+                if self._size >= self.min_size:
+                    return created
+
+                self._size += 1
+
+            try:
+                connection, created_at = self._connect()
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                raise
+
+            with self._condition:
+                self._idle.append((connection, created_at, time.monotonic()))
+                self._condition.notify()
+
+            created += 1
+
+    def acquire(self, timeout=None):
+
+        """
+
+        pool 에서 연결을 빌려옵니다.
+
+        Args:
+            timeout : 연결 대기 최대 시간(초), None 이면 wait_timeout 사용
+
+        Returns:
+            PooledConnection
+
+        Raises:
+            PoolTimeoutError : timeout 동안 반납된 연결이 없는 경우
+
+        """
+
+        timeout  = self.wait_timeout if timeout is None else timeout
+        started  = time.monotonic()
+        deadline = started + timeout
+        waited   = False
+
+        while True:
+            entry  = None
+            create = False
+
+            with self._condition:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+
+                    if remaining <= 0:
+                        self._stats['timeouts'] += 1
+                        raise PoolTimeoutError(f'{self.name.upper()}_CONNECTION_POOL_TIMEOUT')
+
+                    waited = True
+                    self._condition.wait(remaining)
+
+                if self._idle:
+                    # 최근에 반납된 연결부터 사용 (오래 놀고 있는 연결은 자연스럽게 정리됨)
+                    entry = self._idle.pop()
+                else:
+                    self._size += 1
+                    create = True
+
+            if create:
+                try:
+                    connection, created_at = self._connect()
+                except Exception:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+
+            else:
+                connection, created_at, last_used_at = entry
+                now = time.monotonic()
+
+                # 최대 사용 시간이 지난 연결은 끊고 다시 시도
+                if self._is_expired(created_at, now):
+                    self._discard(connection, 'recycled')
+                    continue
+
+                # 오래 놀고 있던 연결은 살아있는지 확인
+                if now - last_used_at >= self.ping_interval:
+                    try:
+                        connection.ping(reconnect=False)
+                    except Exception:
+                        self._discard(connection, 'discarded')
+                        continue
+
+            wait_time = time.monotonic() - started
+
+            with self._condition:
+                self._stats['acquired'] += 1
+
+                if waited:
+                    self._stats['waits']           += 1
+                    self._stats['total_wait_time'] += wait_time
+                    self._stats['max_wait_time']    = max(self._stats['max_wait_time'], wait_time)
+
+            return PooledConnection(self, connection, created_at)
+
+    def release(self, connection, created_at):
+
+        """
+
+        빌려간 연결을 pool 에 반납합니다.
+        commit 되지 않은 transaction 은 rollback 하여 다음 사용자에게 넘어가지 않도록 하고,
+        autocommit 설정도 기본값(False)으로 되돌립니다.
+
+        Args:
+            connection : pymysql connection 객체
+            created_at : 실제 연결 생성 시각
+
+        """
+
+        if not connection.open:
+            self._discard(connection, 'discarded')
+            return
+
+        if self._is_expired(created_at, time.monotonic()):
+            self._discard(connection, 'recycled')
+            return
+
+        try:
+            connection.rollback()
+
+            # 조회 전용 session 에서 켠 autocommit 을 원래대로 되돌림
+            if connection.get_autocommit():
+                connection.autocommit(False)
+
+        except Exception:
+            self._discard(connection, 'discarded')
+            return
+
+        with self._condition:
+            self._idle.append((connection, created_at, time.monotonic()))
+            self._condition.notify()
+
+    def reclaim(self, connection):
+
+        """
+
+        close() 없이 버려진 PooledConnection 의 자리를 돌려받습니다.
+        연결의 상태(진행중인 transaction, session 변수)를 알 수 없으므로 재사용하지 않고 끊습니다.
+
+        Args:
+            connection : pymysql connection 객체
+
+        """
+
+        self._discard(connection, 'leaked')
+
+    def stats(self):
+
+        """
+
+        모니터링을 위한 pool 상태를 Return 합니다.
+
+        Returns:
+            {
+                name          : pool 이름,
+                size          : 현재 연결 수,
+                in_use        : 사용중인 연결 수,
+                idle          : 유휴 연결 수,
+                min_size      : 최소 연결 수,
+                max_size      : 최대 연결 수,
+                acquired      : 누적 대여 수,
+                created       : 누적 생성 수,
+                recycled      : max_lifetime 으로 교체된 연결 수,
+                discarded     : 끊어져서 버려진 연결 수,
+                leaked        : 반납되지 않고 버려져 회수한 연결 수,
+                timeouts      : 대기 시간 초과 수,
+                waits         : 대기가 발생한 대여 수,
+                avg_wait_time : 대기 발생 시 평균 대기시간(초),
+                max_wait_time : 최대 대기시간(초)
+            }
+
+        """
+
+        with self._condition:
+            stats = dict(self._stats)
+            idle  = len(self._idle)
+            size  = self._size
+
+        total_wait_time = stats.pop('total_wait_time')
+        avg_wait_time   = total_wait_time / stats['waits'] if stats['waits'] else 0.0
+
+        return {
+            'name'          : self.name,
+            'size'          : size,
+            'in_use'        : size - idle,
+            'idle'          : idle,
+            'min_size'      : self.min_size,
+            'max_size'      : self.max_size,
+            'avg_wait_time' : round(avg_wait_time, 6),
+            **stats,
+            'max_wait_time' : round(stats['max_wait_time'], 6)
+        }
+
+    def close_all(self):
+
+        """
+
+        유휴 상태의 모든 연결을 끊습니다.
+
+        """
+
+        with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+
+        for connection, created_at, last_used_at in idle:
+            try:
+                connection.close()
+            except Exception:
+                pass
@@ -0,0 +1,159 @@
+import threading
+
+from connection import get_connection
+from pricing    import get_database_now
+
+# PRICE_SCHEDULER_INTERVAL 설정이 없을 때 사용하는 최대 대기 시간(초)
+DEFAULT_PRICE_SCHEDULER_INTERVAL = 10
+
+class PriceScheduler:
+
+    """
+
+    할인이 시작/종료된(price_expires_at 이 지난) 상품의 적용 할인율, 할인가를 다시 계산하는 background thread 입니다.
+
+    - 다음 할인 시작/종료 시각(MIN(price_expires_at))까지 기다렸다가 계산하고, 바뀐 상품의 cache 를 지웁니다.
+    - 상품 등록/수정 시각이 바뀌어도 깨어나도록 최대 interval 초마다 확인합니다.
+    - 여러 process 가 같은 상품을 계산해도 결과가 같으므로 따로 lock 을 잡지 않습니다.
+      다른 process 는 cache 된 응답 version 이 만료되면(CATALOG_VERSION_TTL) 바뀐 갱신일시로 다시 조회합니다.
+
+    Args:
+        product_service : reprice_catalog, invalidate_catalog 를 가진 ProductService
+        interval        : 최대 대기 시간(초)
+        logger          : 실패 시 경고를 남길 logger
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self, product_service, interval=DEFAULT_PRICE_SCHEDULER_INTERVAL, logger=None):
+        self.product_service = product_service
+        self.interval        = interval
+        self.logger          = logger
+
+        self._thread  = None
+        self._lock    = threading.Lock()
+        self._stopped = threading.Event()
+
+    def run_once(self):
+
+        """
+
+        price_expires_at 이 지난 상품을 한번 계산하고 commit 한 뒤 바뀐 상품의 cache 를 지웁니다.
+
+        Returns:
+            다음 할인 시작/종료 시각 (없으면 None)
+
+        """
+
+        db_connection = get_connection()
+
+        try:
+            product_ids = self.product_service.reprice_catalog(db_connection)
+            expires_at  = self.product_service.product_dao.select_catalog_version(None, db_connection)['price_expires_at']
+            db_connection.commit()
+
+        except Exception:
+            db_connection.rollback()
+            raise
+
+        finally:
+            db_connection.close()
+
+        # commit 된 값을 다시 읽도록 commit 이후에 지움
+        if product_ids:
+            self.product_service.invalidate_catalog(*product_ids)
+
+        return expires_at
+
+    def run(self):
+
+        """
+
+        stop() 이 호출될 때까지 다음 할인 시작/종료 시각마다 run_once() 를 실행합니다.
+
+        """
+
+        while not self._stopped.is_set():
+            wait = self.interval
+
+            try:
+                expires_at = self.run_once()
+
+                if expires_at is not None:
+                    wait = min(wait, max((expires_at - get_database_now()).total_seconds(), 0))
+
+            except Exception as e:
+                if self.logger is not None:
+                    self.logger.warning(f'PRICE_SCHEDULER_FAILED : {e}')
+
+            self._stopped.wait(wait)
+
+    def start(self):
+
+        """
+
+        thread 를 시작합니다. 이미 시작된 경우 아무것도 하지 않습니다.
+
+        """
+
+        with self._lock:
+            if self._thread is not None:
+                return None
+
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self.run, name='price-scheduler', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+
+        """
+
+        thread 를 멈추고 종료될 때까지 기다립니다.
+
+        """
+
+        with self._lock:
+            thread, self._thread = self._thread, None
+
+        self._stopped.set()
+
+        if thread is not None:
+            thread.join()
+
+def init_price_scheduler(app, product_service):
+
+    """
+
+    PriceScheduler 를 생성하고 첫 요청 시 시작하도록 등록합니다.
+    flask CLI 명령처럼 요청을 받지 않는 경우에는 시작하지 않습니다.
+
+    Args:
+        app             : 플라스크 앱 객체 (PRICE_SCHEDULER_ENABLED, PRICE_SCHEDULER_INTERVAL 설정)
+        product_service : ProductService
+
+    Returns:
+        PriceScheduler 객체
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    scheduler = PriceScheduler(
+        product_service,
+        app.config.get('PRICE_SCHEDULER_INTERVAL', DEFAULT_PRICE_SCHEDULER_INTERVAL),
+        app.logger
+    )
+
+    if app.config.get('PRICE_SCHEDULER_ENABLED', True):
+        app.before_first_request(scheduler.start)
+
+    return scheduler
@@ -0,0 +1,281 @@
+import datetime
+
+from utils import DATABASE_TIMEZONE
+
+# 할인 종료일시(discount_end_date)는 해당 초까지 할인 기간에 포함되므로 다음 초에 할인이 끝남
+DISCOUNT_END_MARGIN = datetime.timedelta(seconds=1)
+
+def get_database_now():
+
+    """
+
+    DB 연결의 time_zone(Asia/Seoul) 기준 현재 시각을 Return 합니다.
+    할인 시작/종료일시는 DB 에 time_zone 기준 naive DATETIME 으로 저장되어 있으므로
+    서버의 local time_zone 과 관계없이 같은 기준으로 비교해야 합니다.
+
+    Returns:
+        DATABASE_TIMEZONE 기준 현재 시각 (tzinfo 없음)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    return datetime.datetime.now(DATABASE_TIMEZONE).replace(tzinfo=None)
+
+def get_discount_rate(discount_rate, discount_start_date, discount_end_date, now):
+
+    """
+
+    기준 시각(now)에 적용되는 할인율을 Return 합니다.
+
+    - 할인율이 없으면(NULL, 0) 할인하지 않습니다.
+    - 할인 시작일시가 없으면(NULL) 기간 제한 없이 할인합니다. (무기한 할인)
+    - 할인 시작일시만 있고 종료일시가 없으면 할인하지 않습니다. (NOW() BETWEEN start AND NULL)
+    - 할인 기간은 시작일시, 종료일시를 모두 포함합니다. (start <= now <= end)
+
+    기존 SQL 의 CASE WHEN NOW() BETWEEN discount_start_date AND discount_end_date 조건과 같습니다.
+    상품 리스트, 상세정보, 주문의 현재 할인가는 이 결과를 product_catalog_current 에 미리 계산해 둔 값을 사용합니다.
+
+    Args:
+        discount_rate       : 상품 할인율
+        discount_start_date : 할인 시작일시
+        discount_end_date   : 할인 종료일시
+        now                 : 기준 시각
+
+    Returns:
+        적용되는 할인율 (할인 기간이 아니면 0)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : 종료일시가 없는 할인 기간을 기존 SQL 과 같이 할인하지 않는 것으로 처리
+
+    """
+
+    if not discount_rate:
+        return 0
+
+    # 무기한 할인
+    if discount_start_date is None:
+        return discount_rate
+
+    if discount_end_date is None or not discount_start_date <= now <= discount_end_date:
+        return 0
+
+    return discount_rate
+
+def get_sales_price(original_price, discount_rate):
+
+    """
+
+    할인율이 적용된 판매가를 Return 합니다. (10원 단위 반올림)
+
+    Args:
+        original_price : 상품 가격
+        discount_rate  : 적용되는 할인율
+
+    Returns:
+        할인가
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    return round(original_price * (100 - discount_rate) / 100, -1)
+
+def get_next_boundary(discount_rate, discount_start_date, discount_end_date, now):
+
+    """
+
+    기준 시각(now) 이후 적용 할인율이 바뀌는 가장 가까운 시각을 Return 합니다.
+
+    Args:
+        discount_rate       : 상품 할인율
+        discount_start_date : 할인 시작일시
+        discount_end_date   : 할인 종료일시
+        now                 : 기준 시각
+
+    Returns:
+        할인 시작 / 종료 시각 (앞으로 바뀌지 않는 경우 None)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : get_discount_rate 와 같이 시작일시, 종료일시가 모두 있는 경우만 바뀌는 것으로 처리
+
+    """
+
+    # 할인율이 없거나, 무기한 할인이거나, 종료일시가 없어 할인하지 않는 경우 바뀌지 않음
+    if not discount_rate or discount_start_date is None or discount_end_date is None:
+        return None
+
+    if discount_start_date > discount_end_date:
+        return None
+
+    # 할인 시작 전
+    if now < discount_start_date:
+        return discount_start_date
+
+    # 할인 기간 중
+    if now <= discount_end_date:
+        return discount_end_date + DISCOUNT_END_MARGIN
+
+    return None
+
+def get_last_boundary(discount_rate, discount_start_date, discount_end_date, now):
+
+    """
+
+    기준 시각(now) 까지 적용 할인율이 마지막으로 바뀐 시각을 Return 합니다.
+    응답의 Last-Modified 처럼 가격이 마지막으로 바뀐 시각이 필요한 경우 사용합니다.
+
+    Args:
+        discount_rate       : 상품 할인율
+        discount_start_date : 할인 시작일시
+        discount_end_date   : 할인 종료일시
+        now                 : 기준 시각
+
+    Returns:
+        할인 시작 / 종료 시각 (바뀐 적이 없는 경우 None)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : get_discount_rate 와 같이 시작일시, 종료일시가 모두 있는 경우만 바뀌는 것으로 처리
+
+    """
+
+    if not discount_rate or discount_start_date is None or discount_end_date is None:
+        return None
+
+    if discount_start_date > discount_end_date:
+        return None
+
+    # 할인 종료 후
+    if now > discount_end_date:
+        return discount_end_date + DISCOUNT_END_MARGIN
+
+    # 할인 기간 중
+    if now >= discount_start_date:
+        return discount_start_date
+
+    return None
+
+def get_effective_price(product, now):
+
+    """
+
+    상품의 가격, 할인 정보로 기준 시각(now)의 적용 할인율, 할인가와 그 값이 바뀌는 시각을 Return 합니다.
+    product_catalog_current 에 미리 계산해 두고, price_expires_at 이 지나면 가격 scheduler 가 다시 계산합니다.
+
+    Args:
+        product : price, discount_rate, discount_start_date, discount_end_date 를 가진 Dictionary
+        now     : 기준 시각
+
+    Returns:
+        {
+            applied_discount_rate : 적용 할인율,
+            sales_price           : 할인가,
+            price_expires_at      : 적용 할인율이 다음으로 바뀌는 시각 (바뀌지 않는 경우 None)
+        }
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    discount_rate = get_discount_rate(
+        product['discount_rate'],
+        product['discount_start_date'],
+        product['discount_end_date'],
+        now
+    )
+
+    return {
+        'applied_discount_rate' : discount_rate,
+        'sales_price'           : get_sales_price(product['price'], discount_rate),
+        'price_expires_at'      : get_next_boundary(
+            product['discount_rate'],
+            product['discount_start_date'],
+            product['discount_end_date'],
+            now
+        )
+    }
+
+def apply_discount(row, now, price_key='original_price'):
+
+    """
+
+    DAO 에서 조회한 row 의 할인 정보로 기준 시각(now)의 적용 할인율과 할인가를 계산합니다.
+    주문 상세처럼 현재가 아닌 주문 시점의 할인가가 필요해 미리 계산한 값을 사용할 수 없는 경우에 사용합니다.
+    row 의 discount_start_date, discount_end_date 는 제거되고
+    discount_rate 는 적용 할인율로, sales_price 에 할인가가 저장됩니다.
+
+    Args:
+        row       : price_key, discount_rate, discount_start_date, discount_end_date 를 가진 Dictionary
+        now       : 기준 시각
+        price_key : 상품 가격 key
+
+    Returns:
+        row
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    discount_start_date = row.pop('discount_start_date', None)
+    discount_end_date   = row.pop('discount_end_date', None)
+
+    row['discount_rate'] = get_discount_rate(row['discount_rate'], discount_start_date, discount_end_date, now)
+    row['sales_price']   = get_sales_price(row[price_key], row['discount_rate'])
+
+    return row
+
+def get_price_ttl(price_expires_at, now=None):
+
+    """
+
+    미리 계산된 할인가의 다음 계산 시각(price_expires_at)까지 남은 시간(초)을 Return 합니다.
+    할인가가 포함된 cache 는 이 시간이 지나면 만료되어 가격 scheduler 가 다시 계산한 값을 조회합니다.
+    scheduler 가 아직 계산하지 않은 경우 매 요청마다 조회하지 않도록 최소 1초를 Return 합니다.
+
+    Args:
+        price_expires_at : 다음 계산 시각 (None 이면 바뀌지 않음)
+        now              : 기준 시각 (None 이면 DB time_zone 기준 현재 시각)
+
+    Returns:
+        남은 시간(초) 또는 None
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if price_expires_at is None:
+        return None
+
+    return max((price_expires_at - (now or get_database_now())).total_seconds(), 1)
@@ -0,0 +1,116 @@
+import time, threading, hashlib
+
+from flask import request, current_app, has_request_context
+
+# read-your-writes 보장을 위해 쓰기 이후 primary 로 고정하는 기본 시간(초)
+DEFAULT_READ_YOUR_WRITES_WINDOW = 5
+
+class PrimaryPinTracker:
+
+    """
+
+    쓰기 요청을 보낸 client 를 일정 시간 동안 primary DB 로 고정(pin)하기 위한 저장소입니다.
+    replica 의 복제 지연 때문에 방금 쓴 데이터가 조회되지 않는 것을 막습니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self):
+        self._pinned_until = {}
+        self._lock         = threading.Lock()
+        self._last_pruned  = time.monotonic()
+
+    def pin(self, client_key, window):
+        now = time.monotonic()
+
+        with self._lock:
+            self._pinned_until[client_key] = now + window
+
+            # 만료된 client 정리 (window 마다 한번)
+            if now - self._last_pruned >= window:
+                self._pinned_until = {
+                    key : until for key, until in self._pinned_until.items() if until > now
+                }
+                self._last_pruned = now
+
+    def is_pinned(self, client_key):
+        with self._lock:
+            until = self._pinned_until.get(client_key)
+
+        return until is not None and until > time.monotonic()
+
+primary_pin_tracker = PrimaryPinTracker()
+
+def get_client_key():
+
+    """
+
+    요청을 보낸 client 를 구분하는 key 를 Return 합니다.
+    로그인한 유저는 access_token 으로, 그 외에는 IP 로 구분합니다.
+
+    Returns:
+        client key(sha1 hex)
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    access_token = request.headers.get('Authorization')
+
+    if access_token and access_token != 'null':
+        return hashlib.sha1(access_token.encode('utf-8')).hexdigest()
+
+    return hashlib.sha1(f'{request.remote_addr}'.encode('utf-8')).hexdigest()
+
+def pin_to_primary():
+
+    """
+
+    쓰기(commit) 이후 호출하여 현재 client 의 조회 요청을 READ_YOUR_WRITES_WINDOW 동안 primary 로 보냅니다.
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if not has_request_context():
+        return
+
+    window = current_app.config.get('READ_YOUR_WRITES_WINDOW', DEFAULT_READ_YOUR_WRITES_WINDOW)
+
+    primary_pin_tracker.pin(get_client_key(), window)
+
+def is_pinned_to_primary():
+
+    """
+
+    현재 client 가 최근에 쓰기를 하여 primary 로 고정되어 있는지 확인합니다.
+
+    Returns:
+        True : primary 로 조회해야 하는 경우
+        False : replica 로 조회해도 되는 경우
+
+    Authors:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if not has_request_context():
+        return True
+
+    return primary_pin_tracker.is_pinned(get_client_key())
@@ -1,10 +1,48 @@
 import math, datetime
 
+from db_session        import after_commit
+from pricing           import apply_discount
+from model.name_search import get_name_search_query
+
 class OrderService:
 
-    def __init__(self, order_dao):
+    def __init__(self, order_dao, catalog_cache=None):
         self.order_dao = order_dao
 
+        # 상품 catalog cache (결제로 재고가 바뀐 상품의 stock matrix 를 지우기 위해 사용)
+        self.catalog_cache = catalog_cache
+
+    def invalidate_stock(self, product_id):
+
+        """
+
+        결제로 재고가 바뀐 상품의 stock matrix cache 를 지웁니다.
+        지금 바로 지우고, commit 이후에 한번 더 지워서 commit 전에 다른 요청이 다시 cache 한 값도 제거합니다.
+
+        Args:
+            product_id : products Table PK
+
+        Returns:
+            None
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        if self.catalog_cache is None:
+            return None
+
+        tag = f'product_stock:{int(product_id)}'
+
+        self.catalog_cache.invalidate_tags(tag)
+        after_commit(lambda : self.catalog_cache.invalidate_tags(tag))
+
+        return None
+
     def get_order_list(self, filter_info, db_connection):
 
         """
@@ -58,6 +96,7 @@ class OrderService:
 
         History:
             2020-08-25 (tnwjd060124@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : 상품명 FULLTEXT index 검색식 추가
 
         """
 
@@ -77,6 +116,9 @@ class OrderService:
         if filter_info['to_date']:
             filter_info['to_date'] += 1
 
+        # 상품명 일부 일치 조건 (FULLTEXT index 검색식 + LIKE 확인)
+        filter_info['product_name_query'] = get_name_search_query(filter_info['product_name'])
+
         if filter_info['product_name']:
             filter_info['product_name'] = f"%{filter_info['product_name']}%"
 
@@ -126,6 +168,7 @@ class OrderService:
 
         History:
             2020-08-25 (tnwjd060124@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : 주문 시점 할인가 계산을 pricing 으로 통일
 
         """
 
@@ -135,7 +178,8 @@ class OrderService:
         # dao 메소드 실행결과가 존재하는 경우에만 할인 가격 계산
         if order_detail:
 
-            order_detail['sales_price'] = round((order_detail['original_price'] * (100 - order_detail['discount_rate'])) / 100, -1)
+            # 주문 시점에 적용된 할인율로 계산
+            apply_discount(order_detail, order_detail['order_time'])
 
             return order_detail
 
@@ -166,15 +210,13 @@ class OrderService:
                 상품을 주문할 수 있게 프론트에게 option_detail_id를 리턴해 줍니다.
             2020-09-10 (minho.lee0716@gmail.com) : 수정
                 테이블 변경으로 인해 option_detail_id의 정보는 주지 않습니다.
+            2026-10-18 (tnwjd060124@gmail.com) : 미리 계산된 할인율, 할인가 사용
 
         """
 
-        # 셀러의 판매 상품(내가 고른 상품)에 대한 정보를 리턴해 줍니다.
+        # 셀러의 판매 상품(내가 고른 상품)에 대한 정보(현재 할인율, 할인된 가격 포함)를 리턴해 줍니다.
         seller_product_info = self.order_dao.get_seller_product_info(product_info, db_connection)
 
-        # 할인된 가격 계산
-        seller_product_info['sales_price'] = round(seller_product_info['original_price'] * (100 - seller_product_info['discount_rate'])/ 100, -1)
-
         # 유저의 정보를 넘겨줌으로써 유저의 정보와 배송지 정보를 리턴해 줍니다.
         orderer_info = self.order_dao.get_orderer_info(user_no, db_connection)
 
@@ -200,6 +242,7 @@ class OrderService:
 
         History:
             2020-09-06 (minho.lee0716@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : 재고 변경 후 stock matrix cache invalidate
 
         """
 
@@ -239,6 +282,9 @@ class OrderService:
         # 선분이력을 관리하는 quantities 테이블의 종료시간에 새롭게 생성된 재고의 생성성시간을 넣어주는 메소드를 실행합니다.
         self.order_dao.update_quantities(update_quantity_info, db_connection)
 
+        # 상세 페이지의 색상 x 사이즈 재고 cache 를 지워줍니다.
+        self.invalidate_stock(order_info['product_id'])
+
         return 1
 
     def modify_user_shipping_details(self, order_info, db_connection):
@@ -349,19 +395,19 @@ class OrderService:
 
         History:
             2020-09-10 (minho.lee0716@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : 미리 계산된 할인가 사용
 
         """
 
         # 총 가격을 계산하기 위해, 해당 상품에 대한 원 가격과, 할인율을 가져옵니다.
         product_info = self.order_dao.select_product_info(order_info, db_connection)
 
-        # 가져온 해당 상품에 대한 원 가격과, 할인율 그리고 유저가 구매하고자 하는 수량을 받아온 후,
-        original_price = product_info['original_price']
-        discount_rate  = product_info['discount_rate']
-        quantity       = order_info['quantity']
+        # 가져온 해당 상품의 할인된 가격과, 유저가 구매하고자 하는 수량을 받아온 후,
+        sales_price = product_info['sales_price']
+        quantity    = order_info['quantity']
 
         # 총 가격을 계산해 줍니다.
-        total_price = round(original_price * (100 - discount_rate) / 100, -1) * quantity
+        total_price = sales_price * quantity
 
         # 프론트에서 받아오는 총 가격을 int타입으로 유효성 검사를 진행 하였기에, int타입으로 리턴을 해줍니다.
         return int(total_price)
@@ -1,14 +1,204 @@
-import json, datetime, time, io, math
+import json, datetime, time, io, csv, math, decimal
 from PIL import Image
 
-from utils import ResizeImage
+from utils import ResizeImage, encode_cursor, decode_cursor, make_version
 from config import S3
 
+from cache       import register_cache, DEFAULT_CACHE_CONFIG
+from db_session  import after_commit, transaction
+from dimensions  import register_dimension_cache
+from pricing     import get_database_now, get_effective_price, get_price_ttl
+from option_diff import diff_options, get_option_key
+
+from model.product_dao import REGISTERED_PRODUCT_FILTERS
+
+# 관리자 상품 List 검색 조건 별 Total Count 의 유효 시간(초)
+# 같은 process 의 상품 등록/수정은 바로 invalidate 되고, cache 된 값은 approximate 로 응답
+REGISTERED_PRODUCT_COUNT_TTL = 30
+
+# 상품 일괄등록 시 판매/진열 여부 값
+PRODUCT_IMPORT_FLAGS = {'0' : 0, '1' : 1}
+
+# 상품 일괄등록 시 할인 시작/종료일시 형식 (상품등록과 같음)
+PRODUCT_IMPORT_DATE_FORMAT = '%Y-%m-%d %H:%M'
+
+# 판매/진열여부 일괄변경 시 한번에 처리하는 상품 수 (chunk 마다 SQL 4번)
+PRODUCT_STATUS_CHUNK_SIZE = 1000
+
+# 가격이 만료된 상품의 적용 할인율, 할인가를 한번에 다시 계산하는 상품 수
+REPRICE_CHUNK_SIZE = 1000
+
+# 상품 리스트, 상세정보 응답 version(갱신일시) 의 유효 시간(초)
+# 같은 process 의 상품 등록/수정은 바로 invalidate 되고, 다른 process 의 변경은 이 시간 안에 반영됨
+CATALOG_VERSION_TTL = 5
+
+# 상품 별 stock matrix 의 유효 시간(초)
+# 같은 process 의 결제, 상품 수정은 바로 invalidate 되고, 다른 process 의 결제는 이 시간 안에 반영됨
+STOCK_MATRIX_TTL = 10
+
 class ProductService:
 
-    def __init__(self, product_dao):
+    def __init__(self, product_dao, catalog_cache=None, dimension_cache=None):
         self.product_dao = product_dao
 
+        # 서비스 상품 리스트, 상세정보 cache (상품 등록/수정 시 invalidate)
+        self.catalog_cache = catalog_cache or register_cache(name='catalog', **DEFAULT_CACHE_CONFIG)
+
+        # 색상, 사이즈, 카테고리 snapshot
+        self.dimension_cache = dimension_cache or register_dimension_cache(product_dao)
+
+    def get_dimension_ids(self, options, db_connection):
+
+        """
+
+        옵션들의 색상, 사이즈 이름을 dimension cache 로 id 로 변환합니다. (DB 조회 없음)
+        snapshot 에 없는 이름이 있으면 새로 추가된 색상/사이즈일 수 있으므로 한번 다시 읽고 확인합니다.
+
+        Args:
+            options       : [{color : 색상 이름, size : 사이즈 이름}]
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            ({색상 이름 : color_no}, {사이즈 이름 : size_no})
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        dimensions = self.dimension_cache.get(db_connection)
+
+        if any(option['color'] not in dimensions.color_ids or option['size'] not in dimensions.size_ids for option in options):
+            self.dimension_cache.invalidate()
+            dimensions = self.dimension_cache.get(db_connection)
+
+        if any(option['color'] not in dimensions.color_ids for option in options):
+            raise Exception('INVALID_COLOR_NAME')
+
+        if any(option['size'] not in dimensions.size_ids for option in options):
+            raise Exception('INVALID_SIZE_NAME')
+
+        return dimensions.color_ids, dimensions.size_ids
+
+    def refresh_catalog(self, product_id, db_connection):
+
+        """
+
+        상품 등록/수정 후 같은 transaction 에서 조회용 테이블(product_catalog_current)을 갱신하고
+        적용 할인율, 할인가를 계산한 뒤 상품 리스트, 상세정보 cache 를 지웁니다.
+
+        Args:
+            product_id    : products Table PK
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : 적용 할인율, 할인가 계산 추가
+
+        """
+
+        try:
+            self.product_dao.refresh_product_catalog(product_id, db_connection)
+            self.reprice_catalog(db_connection, [product_id])
+            self.invalidate_catalog(product_id)
+
+            return None
+
+        except Exception as e:
+            raise e
+
+    def reprice_catalog(self, db_connection, product_ids=None, now=None):
+
+        """
+
+        조회용 테이블(product_catalog_current)의 적용 할인율, 할인가와 다음 계산 시각(price_expires_at)을 pricing 으로 계산하여 저장합니다.
+        상품 리스트, 상세정보, 주문은 이 값을 그대로 사용하므로 row 마다 할인 기간을 확인하지 않습니다.
+
+        - product_ids 가 있으면 해당 상품만 계산합니다. (상품 등록/수정 시)
+        - 없으면 price_expires_at 이 지난(할인이 시작/종료된) 상품을 모두 계산합니다. (가격 scheduler)
+
+        cache 는 지우지 않으므로 호출한 곳에서 commit 후 invalidate_catalog 를 호출합니다.
+
+        Args:
+            db_connection : DATABASE Connection Instance
+            product_ids   : 상품 id 리스트 (None 이면 가격이 만료된 상품)
+            now           : 기준 시각 (None 이면 DB time_zone 기준 현재 시각)
+
+        Returns:
+            적용 할인율 또는 할인가가 바뀐 상품 id 리스트
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        if product_ids is not None and not product_ids:
+            return []
+
+        now     = now or get_database_now()
+        changed = []
+
+        while True:
+            products = self.product_dao.select_catalog_prices(product_ids, now, REPRICE_CHUNK_SIZE, db_connection)
+            prices   = []
+
+            for product in products:
+                price = {'product_id' : product['product_id'], **get_effective_price(product, now)}
+
+                if (price['applied_discount_rate'], price['sales_price']) != (product['applied_discount_rate'], product['sales_price']):
+                    changed.append(product['product_id'])
+
+                prices.append(price)
+
+            if prices:
+                self.product_dao.update_catalog_prices(prices, db_connection)
+
+            # 계산한 상품은 price_expires_at 이 now 이후(또는 NULL)가 되므로 만료된 상품이 남지 않을 때까지 반복
+            if product_ids is not None or len(products) < REPRICE_CHUNK_SIZE:
+                return changed
+
+    def invalidate_catalog(self, *product_ids):
+
+        """
+
+        상품 등록/수정 시 상품 리스트 전체와 해당 상품들의 상세정보, stock matrix cache 를 지웁니다.
+        지금 바로 지우고, commit 이후에 한번 더 지워서 commit 전에 다른 요청이 다시 cache 한 값도 제거합니다.
+
+        Args:
+            product_ids : products Table PK (여러 개)
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : stock matrix 도 함께 invalidate (product tag)
+            2026-10-18 (tnwjd060124@gmail.com) : 여러 상품을 한번에 invalidate
+
+        """
+
+        tags = ('product_list',) + tuple(f'product:{int(product_id)}' for product_id in product_ids)
+
+        self.catalog_cache.invalidate_tags(*tags)
+        after_commit(lambda : self.catalog_cache.invalidate_tags(*tags))
+
+        return None
+
     def create_product(self, product_info, db_connection):
 
         """
@@ -53,6 +243,9 @@ class ProductService:
                                                   quantities) insert 수행
             2020-09-02 (sincerity410@gmail.com) : product_code(unique 값)의 insert로 구조 수정
             2020-09-08 (sincerity410@gmail.com) : 스키마 수정에 따른 함수 수정
+            2026-10-18 (tnwjd060124@gmail.com) : 옵션 insert 를 multi-row insert(insert_options)로 변경
+            2026-10-18 (tnwjd060124@gmail.com) : 상품 리스트, 상세정보 cache invalidate
+            2026-10-18 (tnwjd060124@gmail.com) : 조회용 테이블(product_catalog_current) 갱신
 
         """
 
@@ -67,22 +260,11 @@ class ProductService:
             # nested JSON 구조인 optionQuantity를 form-data request로 받아 JSON 변환
             options = json.loads(product_info['optionQuantity'])
 
-            # 상품 옵션 별 produc_options, option_details, quantities 테이블 insert 수행 
-            for option in options :
-
-                # name으로 입력된 각 옵션의 id를 받아옴
-                color_id = self.product_dao.select_color_id(option, db_connection)
-                size_id  = self.product_dao.select_size_id(option, db_connection)
-
-                # insert_product_option 함수 인자를 줄이기 위해 option 정보 별도 저장
-                option['color_id'] = color_id
-                option['size_id']  = size_id
+            # 상품 옵션 별 product_options, quantities 테이블 insert 수행 (옵션 수와 관계없이 일정한 query 수)
+            self.insert_options(product_info['product_id'], options, product_info['now'], db_connection)
 
-                # 옵션 정보 저장
-                product_option_id  = self.product_dao.insert_product_option(product_info, option, db_connection)
-
-                # 옵션에 해당하는 수량 정보 저장
-                self.product_dao.insert_quantity(product_info['now'], product_option_id, option, db_connection)
+            # 조회용 테이블 갱신 및 새 상품이 노출되도록 상품 리스트 cache 삭제
+            self.refresh_catalog(product_info['product_id'], db_connection)
 
             # Image S3 Upload 및 RDB에 URL Link insert를 위해 product_id return
             return product_info['product_id']
@@ -90,36 +272,577 @@ class ProductService:
         except Exception as e:
             raise e
 
-    def get_product_list(self, db_connection):
+    def parse_import_csv(self, text):
+
+        """
+
+        상품 일괄등록 CSV 를 JSON 일괄등록과 같은 row 리스트로 변환합니다.
+        header 는 상품등록 form 의 key 와 같고, 옵션은 options 컬럼에 "색상:사이즈:수량|색상:사이즈:수량" 형태로 입력합니다.
+        빈 칸은 None 으로 변환하며, 값의 유효성은 validate_import_row 에서 확인합니다.
+
+        Args:
+            text : CSV 문자열 (UTF-8 BOM 허용)
+
+        Returns:
+            [row Dictionary]
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        rows = []
+
+        for row in csv.DictReader(io.StringIO(text.lstrip('\ufeff'))):
+            row = {key.strip() : (value.strip() or None) if value is not None else None for key, value in row.items() if key}
+
+            # 옵션 컬럼은 [{color, size, quantity}] 로 변환 (형식이 틀린 옵션은 validate_import_row 에서 에러 처리)
+            if row.get('options'):
+                row['options'] = [
+                    dict(zip(('color', 'size', 'quantity'), option.split(':')))
+                    for option in row['options'].split('|')
+                ]
+
+            rows.append(row)
+
+        return rows
+
+    def validate_import_row(self, row, lookups):
+
+        """
+
+        상품 일괄등록 row 하나의 유효성을 확인하고, 상품등록과 같은 형태의 상품 정보와 옵션으로 변환합니다.
+        색상, 사이즈, 카테고리는 미리 읽어온 lookups 로 확인하므로 DB 를 조회하지 않습니다.
+
+        Args:
+            row     : 상품등록 form 과 같은 key 의 Dictionary (optionQuantity 대신 options : [{color, size, quantity}])
+            lookups : {colors : {색상 이름 : id}, sizes : {사이즈 이름 : id}, sub_categories : {sub id : main id}}
+
+        Returns:
+            (상품 정보, 옵션 리스트, 에러 리스트) - 에러가 있으면 상품 정보, 옵션은 None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        errors = []
+
+        def get_int(key, minimum, maximum, required=True):
+            value = row.get(key)
+
+            if value is None or value == '':
+                if required:
+                    errors.append(f'{key} : REQUIRED')
+                return None
+
+            try:
+                number = int(value)
+
+            except (TypeError, ValueError):
+                errors.append(f'{key} : INVALID_VALUE')
+                return None
+
+            if not minimum <= number <= maximum:
+                errors.append(f'{key} : OUT_OF_RANGE')
+                return None
+
+            return number
+
+        def get_text(key, max_length, required=True):
+            value = row.get(key)
+
+            if value is None or value == '':
+                if required:
+                    errors.append(f'{key} : REQUIRED')
+                return None
+
+            if not isinstance(value, str) or len(value) > max_length:
+                errors.append(f'{key} : INVALID_VALUE')
+                return None
+
+            return value
+
+        def get_date(key):
+            value = row.get(key)
+
+            if value is None or value == '':
+                return None
+
+            try:
+                return datetime.datetime.strptime(str(value), PRODUCT_IMPORT_DATE_FORMAT)
+
+            except ValueError:
+                errors.append(f'{key} : INVALID_DATE')
+                return None
+
+        product_info = {
+            'mainCategoryId'    : get_int('mainCategoryId', 1, 2 ** 31 - 1),
+            'subCategoryId'     : get_int('subCategoryId', 1, 2 ** 31 - 1),
+            'sellYn'            : PRODUCT_IMPORT_FLAGS.get(str(row.get('sellYn'))),
+            'exhibitionYn'      : PRODUCT_IMPORT_FLAGS.get(str(row.get('exhibitionYn'))),
+            'productName'       : get_text('productName', 100),
+            'simpleDescription' : get_text('simpleDescription', 500, required=False),
+            'detailInformation' : get_text('detailInformation', 2 ** 32 - 1),
+            'price'             : None,
+            'discountRate'      : get_int('discountRate', 0, 100, required=False),
+            'discountStartDate' : get_date('discountStartDate'),
+            'discountEndDate'   : get_date('discountEndDate'),
+            'minSalesQuantity'  : get_int('minSalesQuantity', 1, 20),
+            'maxSalesQuantity'  : get_int('maxSalesQuantity', 1, 20)
+        }
+
+        # 판매 / 진열 여부 (1|0)
+        for key in ('sellYn', 'exhibitionYn'):
+            if product_info[key] is None:
+                errors.append(f'{key} : INVALID_VALUE')
+
+        # 1차 카테고리에 속한 2차 카테고리인지 확인
+        if product_info['mainCategoryId'] is not None and product_info['subCategoryId'] is not None:
+            if lookups['sub_categories'].get(product_info['subCategoryId']) != product_info['mainCategoryId']:
+                errors.append('subCategoryId : INVALID_CATEGORY')
+
+        # 상품 가격 (DECIMAL(10,2))
+        try:
+            product_info['price'] = decimal.Decimal(str(row.get('price')))
+
+            if not decimal.Decimal(0) < product_info['price'] < decimal.Decimal(10 ** 8):
+                errors.append('price : OUT_OF_RANGE')
+
+        except decimal.InvalidOperation:
+            errors.append('price : INVALID_VALUE')
+
+        # 할인 기간
+        if product_info['discountStartDate'] and product_info['discountEndDate']:
+            if product_info['discountStartDate'] > product_info['discountEndDate']:
+                errors.append('discountEndDate : BEFORE_START_DATE')
+
+        # 최소판매 수량이 최대판매 수량보다 크면 최대판매 수량으로 (상품등록과 같음)
+        if product_info['minSalesQuantity'] and product_info['maxSalesQuantity']:
+            product_info['minSalesQuantity'] = min(product_info['minSalesQuantity'], product_info['maxSalesQuantity'])
+
+        # 옵션 : 색상, 사이즈 이름을 id 로 변환, 같은 색상 x 사이즈는 한번만
+        options = []
+        seen    = set()
+
+        if not isinstance(row.get('options'), list) or not row['options']:
+            errors.append('options : REQUIRED')
+
+        else:
+            for index, option in enumerate(row['options'], 1):
+                if not isinstance(option, dict):
+                    errors.append(f'options[{index}] : INVALID_VALUE')
+                    continue
+
+                color_id = lookups['colors'].get(option.get('color'))
+                size_id  = lookups['sizes'].get(option.get('size'))
+
+                if color_id is None:
+                    errors.append(f'options[{index}] : INVALID_COLOR_NAME')
+
+                if size_id is None:
+                    errors.append(f'options[{index}] : INVALID_SIZE_NAME')
+
+                try:
+                    quantity = int(option.get('quantity'))
+
+                    if quantity < 0:
+                        raise ValueError
+
+                except (TypeError, ValueError):
+                    errors.append(f'options[{index}] : INVALID_QUANTITY')
+                    continue
+
+                if color_id is None or size_id is None:
+                    continue
+
+                if (color_id, size_id) in seen:
+                    errors.append(f'options[{index}] : DUPLICATED_OPTION')
+                    continue
+
+                seen.add((color_id, size_id))
+                options.append({'color_id' : color_id, 'size_id' : size_id, 'quantity' : quantity})
+
+        if errors:
+            return None, None, errors
+
+        return product_info, options, []
+
+    def import_products(self, rows, chunk_size, db_connection):
+
+        """
+
+        상품 일괄등록 - Business Layer(service) function
+
+        1. 모든 row 를 먼저 확인합니다. (색상, 사이즈, 카테고리는 한번씩만 읽어 메모리에서 확인)
+        2. 유효한 row 를 chunk_size 개씩 나누어 chunk 마다 하나의 transaction 으로 저장합니다. (transaction 은 이 함수에서 관리)
+           chunk 안의 products, product_details, product_options, quantities, 조회용 테이블은
+           상품 수와 관계없이 Table 마다 multi-row insert 한번으로 저장합니다.
+        3. 실패한 chunk 는 rollback 하고 해당 row 를 에러로 알려준 뒤 다음 chunk 를 계속 저장합니다.
+
+        상품 이미지는 등록하지 않으므로 상품수정에서 이미지를 등록해야 상품 리스트에 노출됩니다.
+
+        Args:
+            rows          : 상품 row 리스트 (validate_import_row 참고)
+            chunk_size    : 한 transaction 으로 저장할 상품 수
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            {
+                total               : 요청 row 수,
+                imported            : 등록된 상품 수,
+                failed              : 실패한 row 수,
+                products            : [{row, product_id}],
+                errors              : [{row, errors}],
+                chunks              : commit 된 chunk 수,
+                elapsed_seconds     : 소요 시간(초),
+                products_per_second : 초당 등록 상품 수
+            }
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : 색상, 사이즈, 카테고리 lookup 을 dimension cache snapshot 으로 변경
+            2026-10-18 (tnwjd060124@gmail.com) : snapshot 에 없는 색상/사이즈가 있으면 한번 다시 읽고 확인
+
+        """
+
+        started = time.perf_counter()
+
+        # 유효성 확인에 사용할 색상, 사이즈, 카테고리 (dimension cache)
+        dimensions = self.dimension_cache.get(db_connection)
+
+        # snapshot 에 없는 이름은 새로 추가된 색상/사이즈일 수 있으므로 한번 다시 읽고 확인 (get_dimension_ids 와 같음)
+        options = [
+            option
+            for row in rows if isinstance(row.get('options'), list)
+            for option in row['options'] if isinstance(option, dict)
+        ]
+
+        if any(option.get('color') not in dimensions.color_ids or option.get('size') not in dimensions.size_ids for option in options):
+            self.dimension_cache.invalidate()
+            dimensions = self.dimension_cache.get(db_connection)
+
+        lookups    = {
+            'colors'         : dimensions.color_ids,
+            'sizes'          : dimensions.size_ids,
+            'sub_categories' : dimensions.sub_category_main_ids
+        }
+
+        valid, errors = [], []
+
+        for row_number, row in enumerate(rows, 1):
+            product_info, options, row_errors = self.validate_import_row(row, lookups)
+
+            if row_errors:
+                errors.append({'row' : row_number, 'errors' : row_errors})
+            else:
+                valid.append((row_number, product_info, options))
+
+        now      = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        products = []
+        chunks   = 0
+
+        for start in range(0, len(valid), chunk_size):
+            chunk = valid[start:start + chunk_size]
+
+            # chunk 마다 commit 하고, 실패한 chunk 만 rollback (commit 후 chunk 상품의 cache 삭제)
+            try:
+                with transaction(db_connection):
+                    product_ids = self.insert_product_chunk(chunk, now, db_connection)
+
+            except Exception as e:
+                errors.extend({'row' : row_number, 'errors' : [f'CHUNK_FAILED : {e}']} for row_number, _, _ in chunk)
+                continue
+
+            chunks += 1
+            products.extend(
+                {'row' : row_number, 'product_id' : product_id}
+                for (row_number, _, _), product_id in zip(chunk, product_ids)
+            )
+
+        elapsed = time.perf_counter() - started
+
+        return {
+            'total'               : len(rows),
+            'imported'            : len(products),
+            'failed'              : len(rows) - len(products),
+            'products'            : products,
+            'errors'              : sorted(errors, key=lambda error : error['row']),
+            'chunks'              : chunks,
+            'elapsed_seconds'     : round(elapsed, 3),
+            'products_per_second' : round(len(products) / elapsed, 1) if elapsed else 0.0
+        }
+
+    def insert_product_chunk(self, chunk, now, db_connection):
+
+        """
+
+        상품 일괄등록의 chunk 하나를 Table 마다 multi-row insert 로 저장합니다. (commit 은 호출한 곳에서)
+
+        Args:
+            chunk         : [(row 번호, 상품 정보, 옵션 리스트)]
+            now           : 선분 시작 시간
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            [상품 id] (chunk 순서)
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : cache 삭제를 invalidate_catalog 로 처리
+            2026-10-18 (tnwjd060124@gmail.com) : 적용 할인율, 할인가 계산 추가
+
+        """
+
+        product_ids = self.product_dao.insert_products(len(chunk), db_connection)
+
+        for (row_number, product_info, options), product_id in zip(chunk, product_ids):
+            product_info['product_id'] = product_id
+            product_info['now']        = now
+
+        self.product_dao.insert_product_details([product_info for _, product_info, _ in chunk], db_connection)
+
+        # 모든 상품의 옵션을 한번에 저장하고 옵션 id 로 재고 저장
+        option_numbers = self.product_dao.insert_option_rows(
+            [
+                (product_info['product_id'], option['color_id'], option['size_id'], option['quantity'])
+                for _, product_info, options in chunk
+                for option in options
+            ],
+            db_connection
+        )
+
+        self.product_dao.insert_quantities(
+            now,
+            [
+                (option_numbers[(product_info['product_id'], option['color_id'], option['size_id'])], option['quantity'])
+                for _, product_info, options in chunk
+                for option in options
+            ],
+            db_connection
+        )
+
+        # 조회용 테이블 갱신, 적용 할인율 / 할인가 계산 및 상품 리스트, 상세정보(없는 상품으로 cache 된 값 포함) cache 삭제
+        self.product_dao.refresh_product_catalogs(product_ids, db_connection)
+        self.reprice_catalog(db_connection, product_ids)
+        self.invalidate_catalog(*product_ids)
+
+        return product_ids
+
+    def get_catalog_version(self, product_id, db_connection):
+
+        """
+
+        상품 리스트(product_id 가 None), 상세정보 응답 version 을 계산할 갱신일시를 Return 합니다.
+        요청마다 DB 를 조회하지 않도록 CATALOG_VERSION_TTL 초(할인 시작/종료가 더 빠르면 그 시각까지) cache 하며,
+        같은 process 의 상품 등록/수정 시 invalidate_catalog 로 지웁니다.
+
+        Args:
+            product_id    : 상품 id (None 이면 전체 상품)
+            db_connection : 연결된 db 객체
+
+        Returns:
+            {updated_at, price_expires_at} (판매/진열중인 상품이 없으면 None)
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        # 조회한 version 의 다음 할인 시작/종료 시각
+        price = {'expires_at' : None}
+
+        def load_version():
+            version = self.product_dao.select_catalog_version(product_id, db_connection)
+
+            if version is not None:
+                price['expires_at'] = version['price_expires_at']
+
+            return version
+
+        def get_ttl():
+            ttl = get_price_ttl(price['expires_at'])
+
+            return CATALOG_VERSION_TTL if ttl is None else min(ttl, CATALOG_VERSION_TTL)
+
+        if product_id is None:
+            return self.catalog_cache.get_or_load(('catalog_version',), load_version, tags=('product_list',), ttl=get_ttl)
+
+        return self.catalog_cache.get_or_load(
+            ('catalog_version', int(product_id)),
+            load_version,
+            tags = (f'product:{int(product_id)}',),
+            ttl  = get_ttl
+        )
+
+    def get_product_list_version(self, page_info, db_connection):
+
+        """
+
+        상품 리스트 한 페이지의 응답 version (ETag, Last-Modified) 을 Return 합니다.
+        페이지를 조회하지 않고 전체 상품의 마지막 갱신일시로 계산하므로, 이전 응답과 같으면 바로 304 를 응답할 수 있습니다.
+        (상품 등록/수정, 판매/진열여부 변경, 할인 시작/종료로 할인가가 바뀌면 갱신일시가 바뀜)
+
+        Args:
+            page_info     : get_product_list 의 page_info
+            db_connection : 연결된 db 객체
+
+        Returns:
+            응답 version (ETag, Last-Modified)
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        updated_at = self.get_catalog_version(None, db_connection)['updated_at']
+
+        return make_version(
+            (
+                'product_list',
+                page_info['sort'],
+                page_info['main_category_id'],
+                page_info['sub_category_id'],
+                page_info['cursor'],
+                page_info['limit'],
+                updated_at
+            ),
+            updated_at
+        )
+
+    def get_product_list(self, page_info, version, db_connection):
 
         """
 
-        브랜디 서비스 페이지 > 상품 전체 리스트
+        브랜디 서비스 페이지 > 상품 리스트 (무한 스크롤)
 
         Args:
+            page_info     :
+                sort             : 정렬 기준 (newest, price_asc, price_desc, discount)
+                main_category_id : 1차 카테고리 (없으면 None)
+                sub_category_id  : 2차 카테고리 (없으면 None)
+                cursor           : 이전 페이지 응답의 next_cursor (첫 페이지는 None)
+                limit            : 한 페이지의 상품 수
+            version       : get_product_list_version 의 응답 version
             db_connection : 연결된 db 객체
 
         Returns:
-            상품 전체 리스트
+            {
+                'data'        : 상품 리스트,
+                'next_cursor' : 다음 페이지 cursor (마지막 페이지인 경우 None)
+            }
 
         Authors:
             minho.lee0716@gmail.com(이민호)
 
         History:
             2020-08-25 (minho.lee0716@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : cursor 기반 pagination 적용
+            2026-10-18 (tnwjd060124@gmail.com) : 페이지 별 결과 cache 적용
+            2026-10-18 (tnwjd060124@gmail.com) : 할인가 계산을 pricing 으로 통일, 할인 시작/종료 시각에 cache 만료
+            2026-10-18 (tnwjd060124@gmail.com) : 카테고리 필터, 가격순(할인가 기준)/할인순 정렬 추가
+            2026-10-18 (tnwjd060124@gmail.com) : cursor 의 정렬 값이 NaN, Infinity 인 경우 INVALID_CURSOR
+            2026-10-18 (tnwjd060124@gmail.com) : product_catalog_current 에 미리 계산된 할인율, 할인가 사용
+            2026-10-18 (tnwjd060124@gmail.com) : 응답 version 별로 결과 cache (version 은 get_product_list_version 에서 먼저 계산)
 
         """
 
-        # 상품의 기준은 진열여부=True, 판매여부=True
-        # 최신으로 등록된 상품을 볼 수 있게 상품의 id를 내림차순으로 정렬.
-        products = self.product_dao.select_product_list(db_connection)
+        # cursor token 에서 이전 페이지 마지막 상품 번호와 정렬 값을 꺼냄
+        cursor   = None
+        sort_key = None
 
-        # 상품마다 할인율이 존재할 경우, 할인가를 추가해 줍니다.
-        for product in products:
-            product['sales_price'] = round(product['original_price'] * (100-product['discount_rate'])/ 100, -1)
+        if page_info['cursor']:
+            try:
+                position = decode_cursor(page_info['cursor'])
+                cursor   = int(position['product_no'])
+
+                # 다른 정렬 기준의 cursor 는 사용할 수 없음 (sort 가 없는 cursor 는 최신순)
+                if position.get('sort', 'newest') != page_info['sort']:
+                    raise ValueError('INVALID_CURSOR')
+
+                # 최신순이 아닌 경우 정렬 값부터 비교
+                if page_info['sort'] != 'newest':
+                    sort_key = decimal.Decimal(position['sort_key'])
+
+                    # NaN, Infinity 는 정렬 값으로 비교할 수 없음
+                    if not sort_key.is_finite():
+                        raise ValueError('INVALID_CURSOR')
+
+            except (KeyError, TypeError, ValueError, decimal.InvalidOperation):
+                raise ValueError('INVALID_CURSOR')
+
+        # 같은 페이지(필터, 정렬, cursor, limit)는 응답 version 이 바뀌기 전까지 cache 된 결과를 사용
+        def load_page():
+
+            # 상품의 기준은 진열여부=True, 판매여부=True
+            # 정렬 기준(기본 최신 등록순)에 따라 정렬.
+            # 다음 페이지 존재 여부를 알기 위해 한 개 더 조회
+            products = self.product_dao.select_product_list(
+                {
+                    'sort'             : page_info['sort'],
+                    'main_category_id' : page_info['main_category_id'],
+                    'sub_category_id'  : page_info['sub_category_id'],
+                    'cursor'           : cursor,
+                    'sort_key'         : sort_key,
+                    'limit'            : page_info['limit'] + 1
+                },
+                db_connection
+            )
 
-        # 모든 상품을 리턴
-        return products
+            next_cursor = None
+
+            if len(products) > page_info['limit']:
+                products = products[:page_info['limit']]
+                position = {'product_no' : products[-1]['product_no']}
+
+                # 최신순이 아닌 경우 정렬 기준과 정렬 값도 cursor 에 저장
+                if page_info['sort'] != 'newest':
+                    position['sort']     = page_info['sort']
+                    position['sort_key'] = str(products[-1]['sort_key'])
+
+                next_cursor = encode_cursor(position)
+
+            # 정렬 값은 cursor 를 만드는 데만 사용
+            for product in products:
+                product.pop('sort_key', None)
+
+            return {
+                'data'        : products,
+                'next_cursor' : next_cursor
+            }
+
+        return self.catalog_cache.get_or_load(
+            (
+                'product_list',
+                page_info['sort'],
+                page_info['main_category_id'],
+                page_info['sub_category_id'],
+                cursor,
+                sort_key,
+                page_info['limit'],
+                version['etag']
+            ),
+            load_page,
+            tags = ('product_list',)
+        )
 
     def upload_product_image(self, images, product_id, s3_connection, db_connection):
 
@@ -143,6 +866,8 @@ class ProductService:
         History:
             2020-08-27 (sincerity410@gmail.com) : 초기생성
             2020-09-02 (sincerity410@gmail.com) : product_code 추가에 따른 구조 수정
+            2026-10-18 (tnwjd060124@gmail.com) : 이미지 insert 를 multi-row insert(insert_images)로 변경
+            2026-10-18 (tnwjd060124@gmail.com) : 조회용 테이블(product_catalog_current) 갱신
 
         """
 
@@ -181,9 +906,132 @@ class ProductService:
             resized_image = resizing()
 
             # 사진크기 별 product_image(최대 5개)에 대해 image URL insert & product_images(매핑테이블) insert
-            for product_image_no, image_url in resized_image.items() :
-                image_no = self.product_dao.insert_image(image_url, db_connection)
-                self.product_dao.insert_product_image(product_id, image_no, product_image_no, db_connection)
+            self.insert_images(product_id, resized_image, db_connection)
+
+            # 조회용 테이블에 대표 이미지 반영
+            self.refresh_catalog(product_id, db_connection)
+
+            return None
+
+        except Exception as e:
+            raise e
+
+    def insert_options(self, product_id, options, now, db_connection):
+
+        """
+
+        상품 옵션 List 를 product_options, quantities 테이블에 multi-row insert 로 저장합니다.
+        옵션 수와 관계없이 옵션 insert, 옵션번호 조회, 수량 insert 의 3번의 query 로 처리합니다. (색상/사이즈는 dimension cache)
+        옵션번호를 (color_id, size_id) 로 다시 찾으므로 같은 색상, 사이즈의 옵션이 두 번 이상 있으면 저장하지 않습니다.
+
+        Args:
+            product_id    : products Table PK
+            options       : 옵션 List
+                {
+                    color    : 색상 이름
+                    size     : 사이즈 이름
+                    quantity : 재고수량
+                }
+            now           : 선분이력 시작 시간
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : 색상/사이즈 id 를 dimension cache 에서 변환
+            2026-10-18 (tnwjd060124@gmail.com) : 같은 색상, 사이즈 옵션 중복 시 DUPLICATED_OPTION
+
+        """
+
+        if not options:
+            return None
+
+        try:
+            # 중복 옵션은 옵션번호 하나에 수량이 두 번 저장되므로 먼저 확인
+            if len({get_option_key(option) for option in options}) < len(options):
+                raise Exception('DUPLICATED_OPTION')
+
+            # name으로 입력된 옵션들의 id를 dimension cache 에서 받아옴
+            color_ids, size_ids = self.get_dimension_ids(options, db_connection)
+
+            for option in options:
+                option['color_id'] = color_ids[option['color']]
+                option['size_id']  = size_ids[option['size']]
+
+            # 옵션 정보 저장
+            self.product_dao.insert_product_options(product_id, options, db_connection)
+
+            # multi-row insert 의 row id 는 (color_id, size_id) 로 다시 조회
+            option_numbers = self.product_dao.select_product_option_numbers(product_id, db_connection)
+
+            # 옵션에 해당하는 수량 정보 저장
+            self.product_dao.insert_quantities(
+                now,
+                [
+                    (option_numbers[(option['color_id'], option['size_id'])], option['quantity'])
+                    for option in options
+                ],
+                db_connection
+            )
+
+            return None
+
+        except Exception as e:
+            raise e
+
+    def insert_images(self, product_id, resized_image, db_connection):
+
+        """
+
+        S3 에 upload 된 상품 이미지 URL 을 images, product_images 테이블에 multi-row insert 로 저장합니다.
+
+        Args:
+            product_id    : products Table PK
+            resized_image : image 순서 별 사진 사이즈 별 URL(Dictionary)
+                {
+                    'product_image_<int>' : {
+                        'product_image_L' : Large 사이즈 url,
+                        'product_image_M' : Medium 사이즈 url,
+                        'product_image_S' : Small 사이즈 url
+                    }
+                }
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        if not resized_image:
+            return None
+
+        try:
+            image_urls = list(resized_image.values())
+
+            self.product_dao.insert_images(image_urls, db_connection)
+
+            # multi-row insert 의 row id 는 Large 사이즈 URL 로 다시 조회
+            image_numbers = self.product_dao.select_image_numbers(image_urls, db_connection)
+
+            self.product_dao.insert_product_images(
+                product_id,
+                [
+                    (image_numbers[image_url['product_image_L']], product_image_no)
+                    for product_image_no, image_url in resized_image.items()
+                ],
+                db_connection
+            )
 
             return None
 
@@ -221,16 +1069,16 @@ class ProductService:
         History:
             2020-08-29 (sincerity410@gmail.com) : 초기생성
             2020-09-02 (sincerity410@gmail.com) : 상품 옵션정보(색상, 사이즈) 통합
+            2026-10-18 (tnwjd060124@gmail.com) : 옵션 목록을 dimension cache 에서 Return (DB 조회 없음)
 
         """
 
         try:
-            # DB connection으로 각 옵션 정보 Return 하는 함수 호출
-            colors = self.product_dao.select_color_list(db_connection)
-            sizes  = self.product_dao.select_size_list(db_connection)
+            # dimension cache 의 옵션 정보 (snapshot 이 유효하면 DB 조회 없음)
+            dimensions = self.dimension_cache.get(db_connection)
 
             # 모든 옵션 정보 Return
-            return {'color' : colors, 'size' : sizes}
+            return {'color' : dimensions.colors, 'size' : dimensions.sizes}
 
         except Exception as e:
             raise e
@@ -257,12 +1105,13 @@ class ProductService:
 
         History:
             2020-08-30 (sincerity410@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : Main Category 목록을 dimension cache 에서 Return
 
         """
 
         try:
-            # DB connection으로 사이즈 정보 Return 하는 select_size_list 함수 호출
-            main_categories = self.product_dao.select_main_category_list(db_connection)
+            # dimension cache 의 Main Category 목록 (snapshot 이 유효하면 DB 조회 없음)
+            main_categories = self.dimension_cache.get(db_connection).main_categories
 
             # 모든 Main Category 정보 Return
             return main_categories
@@ -293,31 +1142,68 @@ class ProductService:
 
         History:
             2020-08-30 (sincerity410@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : Sub Category 목록을 dimension cache 의 카테고리 tree 에서 Return
 
         """
 
         try:
-            # DB connection으로 사이즈 정보 Return 하는 select_size_list 함수 호출
-            sub_categories = self.product_dao.select_sub_category_list(main_cetegory_id, db_connection)
+            # dimension cache 의 카테고리 tree 에서 Sub Category 목록 (snapshot 이 유효하면 DB 조회 없음)
+            sub_categories = self.dimension_cache.get(db_connection).sub_categories.get(main_cetegory_id)
 
-            # 모든 Main Category 정보 Return
+            if not sub_categories:
+                raise Exception('INVALID_MAIN_CATEGORY_ID')
+
+            # 모든 Sub Category 정보 Return
             return sub_categories
 
         except Exception as e:
             raise e
 
-    def get_product_details(self, product_id, db_connection):
+    def get_product_details_version(self, product_id, db_connection):
+
+        """
+
+        상품 상세정보의 응답 version (ETag, Last-Modified) 을 Return 합니다.
+        상세정보, 이미지, 색상을 조회하지 않고 상품의 갱신일시(이미지, 옵션, 할인가 변경 포함)로 계산하므로
+        이전 응답과 같으면 바로 304 를 응답할 수 있습니다.
+
+        Args:
+            product_id    : 상품 고유의 id(pk)
+            db_connection : 연결된 db 객체
+
+        Returns:
+            응답 version (ETag, Last-Modified)
+            판매/진열중인 상품이 없는 경우 None
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        catalog = self.get_catalog_version(product_id, db_connection)
+
+        if catalog is None:
+            return None
+
+        return make_version(('product_details', int(product_id), catalog['updated_at']), catalog['updated_at'])
+
+    def get_product_details(self, product_id, version, db_connection):
 
         """
 
         상품 상세정보 > 이미지들
 
         Args:
-            product_id : 상품 고유의 id(pk)
+            product_id    : 상품 고유의 id(pk)
+            version       : get_product_details_version 의 응답 version
             db_connection : 연결된 db 객체
 
         Returns:
-            해당 상품의 이미지들
+            상품 상세정보
+            상품이 없는 경우 None
 
         Authors:
             minho.lee0716@gmail.com (이민호)
@@ -330,47 +1216,154 @@ class ProductService:
             2020-09-01 (minho.lee0716@gmail.com) : 상품 옵션들중 색상만 주는걸로 변경.
             2020-09-01 (minho.lee0716@gmail.com) : 이미지나 색상이 없을 경우 빈 배열을 리턴하도록 수정.
             2020-09-09 (tnwjd060124@gmail.com) : 상품 id에 해당하는 제품이 없는 경우 다른 정보를 가져오지 않도록 처리
+            2026-10-18 (tnwjd060124@gmail.com) : 상품 별 상세정보 cache 적용
+            2026-10-18 (tnwjd060124@gmail.com) : 할인가 계산을 pricing 으로 통일, 할인 시작/종료 시각에 cache 만료
+            2026-10-18 (tnwjd060124@gmail.com) : 상세정보, 이미지, 색상을 한번의 DB 왕복으로 조회
+            2026-10-18 (tnwjd060124@gmail.com) : product_catalog_current 에 미리 계산된 할인율, 할인가 사용
+            2026-10-18 (tnwjd060124@gmail.com) : 응답 version 별로 결과 cache (version 은 get_product_details_version 에서 먼저 계산)
 
         """
 
-        # 해당 상품의 아이디를 받아 상세정보들을 가져옴.
-        # 상세정보중 이미지들과 옵션들은 따로 가져와서 details에 추가.
-        details = self.product_dao.select_product_details(product_id, db_connection)
+        # 상품 별 상세정보는 응답 version(상품 수정, 할인 시작/종료 시 바뀜)이 바뀌기 전까지 cache 된 결과를 사용
+        def load_details():
 
-        # 상품 아이디에 해당하는 제품이 존재하는 경우
-        if details:
+            # 상세정보, 이미지, 색상을 한번의 DB 왕복으로 가져옴. (재고는 사용하지 않으므로 제외)
+            page    = self.product_dao.select_product_page(product_id, ('details', 'images', 'colors'), db_connection)
+            details = page['details']
 
-            details['image_list'] = self.product_dao.select_product_images(product_id, db_connection)
-            details['colors']     = self.product_dao.select_product_option_colors(product_id, db_connection)
+            # 상품 아이디에 해당하는 제품이 존재하지 않는 경우
+            if not details:
+                return None
 
-            # 할인 가격 계산
-            details['sales_price'] = round(details['original_price'] * (100-details['discount_rate'])/ 100, -1)
+            # 이미지나 색상이 없을 경우 빈 배열
+            details['image_list'] = page['images']
+            details['colors']     = page['colors']
 
-            # 이미지가 없을 때, (배열 안에 null이 들어 있습니다.)
-            # 첫번째 요소가 null이면 빈 배열 반환
-            if not details['image_list'][0]:
-                details['image_list'] = []
+            # 해당 상품의 상세정보들을 리턴
+            return details
 
-            # 마찬가지로 색상이 없을 경우, 빈 배열을 리턴
-            if not details['colors'][0]:
-                details['colors'] = []
+        return self.catalog_cache.get_or_load(
+            ('product_details', int(product_id), version['etag']),
+            load_details,
+            tags = (f'product:{int(product_id)}',)
+        )
 
-            # 해당 상품의 상세정보들을 리턴
-        return details
+    def get_product_batch(self, product_ids, db_connection):
 
-    def get_etc_options(self, product_info, db_connection):
+        """
+
+        장바구니, 최근 본 상품처럼 여러 상품을 한번에 그릴 때 필요한 상품 정보, 대표 이미지, 색상을 리턴
+
+        상품 수와 관계없이 한번의 DB 왕복(IN 조건의 조회 2개)으로 가져오며,
+        판매/진열중이 아니거나 없는 상품은 실패 처리하지 않고 missing 으로 알려줍니다.
+
+        Args:
+            product_ids   : 상품 id 리스트 (중복 없음, 1개 이상)
+            db_connection : 연결된 db 객체
+
+        Returns:
+            {
+                data    : {상품 id : {product_id, name, original_price, discount_rate, sales_price,
+                                      min_sales_quantity, max_sales_quantity, thumbnail_image, colors}},
+                missing : [조회되지 않은 상품 id]
+            }
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : product_catalog_current 에 미리 계산된 할인율, 할인가 사용
+
+        """
+
+        batch = self.product_dao.select_product_batch(product_ids, db_connection)
+
+        # 상품 별 색상 (색상이 없을 경우 빈 배열)
+        colors = {}
+
+        for color in batch['colors']:
+            colors.setdefault(color.pop('product_id'), []).append(color)
+
+        products = {}
+
+        for product in batch['details']:
+            product['colors']              = colors.get(product['product_id'], [])
+            products[product['product_id']] = product
+
+        return {
+            'data'    : products,
+            'missing' : [product_id for product_id in product_ids if product_id not in products]
+        }
+
+    def get_stock_matrix(self, product_id, db_connection):
 
         """
 
-        상품 상세정보에서 색상 선택시 컬러를 리턴
+        상품의 색상 x 사이즈 별 옵션 id 와 현재 재고(stock matrix)를 Return 합니다.
+        상세 페이지에서 색상을 바꿀 때마다 옵션, 색상, 사이즈, 재고 테이블을 JOIN 하지 않도록
+        상품 별로 한번 만든 matrix 를 cache 하고, 결제로 재고가 바뀌거나 상품(옵션)이 수정되면 지웁니다.
 
         Args:
             product_id    : 상품 고유의 id(pk)
-            color_name    : 상품 색상의 이름
             db_connection : 연결된 db 객체
 
         Returns:
-            해당 상품의 이미지들
+            {color_id : [{size, size_id, product_option_id, quantity}]} (사이즈 큰 순서)
+            판매/진열중인 상품이 없는 경우 None
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        def load_stock_matrix():
+
+            # 상세정보, 이미지 없이 상품 존재 여부와 색상 x 사이즈 재고만 한번의 DB 왕복으로 가져옴.
+            page = self.product_dao.select_product_page(product_id, ('exists', 'stock'), db_connection)
+
+            # 판매/진열중인 상품이 없는 경우
+            if not page['exists']:
+                return None
+
+            stock_matrix = {}
+
+            for option in page['stock']:
+                stock_matrix.setdefault(option['color_id'], []).append({
+                    'size'              : option['size'],
+                    'size_id'           : option['size_id'],
+                    'product_option_id' : option['product_option_id'],
+                    'quantity'          : option['quantity']
+                })
+
+            return stock_matrix
+
+        # 다른 process 의 결제로 바뀐 재고는 invalidate 되지 않으므로 짧은 ttl 사용
+        return self.catalog_cache.get_or_load(
+            ('stock_matrix', int(product_id)),
+            load_stock_matrix,
+            tags = (f'product:{int(product_id)}', f'product_stock:{int(product_id)}'),
+            ttl  = STOCK_MATRIX_TTL
+        )
+
+    def get_etc_options(self, product_info, db_connection):
+
+        """
+
+        상품 상세정보에서 색상 선택시 해당 색상의 사이즈와 재고를 리턴
+
+        Args:
+            product_info  :
+                product_id : 상품 고유의 id(pk)
+                color_id   : 상품 색상의 id
+            db_connection : 연결된 db 객체
+
+        Returns:
+            [{size, size_id, quantity}] (재고가 있는 사이즈만, 사이즈 큰 순서)
+            상품이 존재하지 않는 경우 None
 
         Authors:
             minho.lee0716@gmail.com(이민호)
@@ -379,13 +1372,31 @@ class ProductService:
             2020-09-01 (minho.lee0716@gmail.com) : 초기 생성
             2020-09-01 (minho.lee0716@gmail.com) : 상품 옵션에서 색상을 받으면 사이즈를 리턴
             2020-09-01 (minho.lee0716@gmail.com) : 상품에 해당 색상이 없을 시 에러 처리
+            2026-10-18 (tnwjd060124@gmail.com) : 상품 존재 여부와 재고를 한번의 DB 왕복으로 조회,
+                                                 상품이 없는 경우 None 리턴
+            2026-10-18 (tnwjd060124@gmail.com) : cache 된 stock matrix 에서 조회
 
         """
 
         try:
 
-            # 해당 상품의 아이디를 받아 상세정보들을 가져옴.
-            etc_options = self.product_dao.select_etc_options(product_info, db_connection)
+            # 색상을 바꿀 때마다 DB 를 조회하지 않도록 상품 별 stock matrix 사용
+            stock_matrix = self.get_stock_matrix(product_info['product_id'], db_connection)
+
+            # 판매/진열중인 상품이 없는 경우
+            if stock_matrix is None:
+                return None
+
+            # 선택한 색상 중 재고가 1개 이상인 사이즈만 리턴
+            etc_options = [
+                {
+                    'size'     : option['size'],
+                    'size_id'  : option['size_id'],
+                    'quantity' : option['quantity']
+                }
+                for option in stock_matrix.get(int(product_info['color_id']), [])
+                if option['quantity'] > 0
+            ]
 
             # 해당 상품의 색상이 존재하지 않을 경우
             if not etc_options:
@@ -417,7 +1428,9 @@ class ProductService:
                 productNo    : 상품 번호
                 productCode  : 상품 코드
                 limit        : 페이지 당 상품 수
-                page         : 페이지 리스트 시작 기준
+                page         : 페이지 번호 (after, before 가 없는 경우 사용)
+                after        : 다음 페이지 조회 기준 상품 번호 (이전 응답의 next)
+                before       : 이전 페이지 조회 기준 상품 번호 (이전 응답의 prev)
 
             db_connection    : DATABASE Connection Instance
 
@@ -439,7 +1452,10 @@ class ProductService:
                     }
                 ],
                     {
-                        "total": 검색된 상품 개수
+                        "total"       : 검색된 상품 개수,
+                        "approximate" : cache 된 개수 여부 (최근 등록/수정된 상품이 반영되지 않았을 수 있음),
+                        "next"        : 다음 페이지 after (마지막 페이지면 null),
+                        "prev"        : 이전 페이지 before (첫 페이지면 null)
                     }
             ]
 
@@ -448,21 +1464,109 @@ class ProductService:
 
         History:
             2020-09-02 (sincerity410@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com)  : 할인율, 할인가, 할인 여부를 pricing 으로 계산
+            2026-10-18 (tnwjd060124@gmail.com)  : Total Count 를 따로 조회하여 검색 조건 별로 cache, approximate 추가
+            2026-10-18 (tnwjd060124@gmail.com)  : OFFSET 대신 keyset pagination (after / before, 페이지 별 시작 위치 cache)
+            2026-10-18 (tnwjd060124@gmail.com)  : product_catalog_current 에 미리 계산된 할인율, 할인가 사용
 
         """
 
         try:
-            # page 값으로 offset 정보 획득
-            filter_info['offset'] = filter_info['page'] * filter_info['limit'] - filter_info['limit']
-
-            # DB connection으로 (상품 List & Total Count) Return 하는 select_registered_product_list 함수 호출
-            product_list = self.product_dao.select_registered_product_list(filter_info, db_connection)
+            limit     = filter_info['limit']
+            signature = tuple(filter_info[key] for key in REGISTERED_PRODUCT_FILTERS)
+            after     = filter_info.get('after')
+            before    = filter_info.get('before')
+
+            # 페이지 번호로 이동하는 경우 cache 된 페이지 별 시작 위치로 keyset pagination (OFFSET 사용하지 않음)
+            if after is None and before is None and filter_info['page'] > 1:
+                boundaries = self.catalog_cache.get_or_load(
+                    ('registered_product_boundaries',) + signature + (limit,),
+                    lambda : self.product_dao.select_registered_product_boundaries(filter_info, db_connection),
+                    tags = ('product_list',),
+                    ttl  = REGISTERED_PRODUCT_COUNT_TTL
+                )
+
+                # 마지막 페이지 이후는 빈 페이지
+                if filter_info['page'] - 2 >= len(boundaries):
+                    product_list, has_more = [], False
+                else:
+                    after = boundaries[filter_info['page'] - 2]
+
+            if after is not None or before is not None or filter_info['page'] == 1:
+
+                # 다음 / 이전 페이지가 있는지 확인하기 위해 한 개 더 조회
+                product_list = self.product_dao.select_registered_product_list(
+                    {**filter_info, 'after' : after, 'before' : before, 'limit' : limit + 1},
+                    db_connection
+                )
+
+                has_more     = len(product_list) > limit
+                product_list = product_list[:limit]
+
+                # 이전 페이지는 상품 번호 순으로 조회되므로 다시 역순으로
+                if before is not None:
+                    product_list.reverse()
+
+            # 다음 페이지는 next 를 after 로, 이전 페이지는 prev 를 before 로 요청
+            if before is None:
+                next_token = product_list[-1]['productNo'] if has_more else None
+                prev_token = product_list[0]['productNo'] if product_list and after is not None else None
+            else:
+                next_token = product_list[-1]['productNo'] if product_list else None
+                prev_token = product_list[0]['productNo'] if has_more else None
+
+            # Total Count 는 검색 조건 별로 잠시 cache (페이지 이동 시 다시 COUNT 하지 않도록)
+            # cache 된 값이면 그 사이 등록/수정된 상품이 반영되지 않았을 수 있으므로 approximate 로 알려줌
+            loaded = []
+
+            def load_count():
+                loaded.append(True)
+                return self.product_dao.select_registered_product_count(filter_info, db_connection)
+
+            total = self.catalog_cache.get_or_load(
+                ('registered_product_count',) + signature,
+                load_count,
+                tags = ('product_list',),
+                ttl  = REGISTERED_PRODUCT_COUNT_TTL
+            )
 
-            return product_list
+            return product_list, {
+                'total'       : total,
+                'approximate' : not loaded,
+                'next'        : next_token,
+                'prev'        : prev_token
+            }
 
         except Exception as e:
             raise e
 
+    def export_registered_product_list(self, filter_info, db_connection):
+
+        """
+
+        filter 에 해당하는 등록된 상품 전체를 한 row 씩 Return 하는 generator (CSV export 용)
+
+        상품 수와 관계없이 unbuffered cursor 로 한번에 조회하며, 읽은 row 를 바로 넘겨주므로 메모리 사용량이 일정합니다.
+        할인율, 할인가, 할인 여부는 상품 List 와 같이 product_catalog_current 에 미리 계산된 값입니다.
+
+        Args:
+            filter_info   : get_registered_product_list 와 같은 filter (page, limit 제외)
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            get_registered_product_list 의 상품 row generator (상품 번호 역순)
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
+
+        """
+
+        # SQL 은 호출 시점에 실행되므로 SQL 에러는 호출한 곳에서 처리
+        return self.product_dao.select_registered_product_stream(filter_info, db_connection)
+
     def upload_detail_image(self, image, s3_connection):
 
         """
@@ -632,6 +1736,10 @@ class ProductService:
 
         History:
             2020-09-07 (sincerity410@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : 추가된 옵션 insert 를 multi-row insert(insert_options)로 변경
+            2026-10-18 (tnwjd060124@gmail.com) : 상품 리스트, 상세정보 cache invalidate
+            2026-10-18 (tnwjd060124@gmail.com) : 조회용 테이블(product_catalog_current) 갱신
+            2026-10-18 (tnwjd060124@gmail.com) : 옵션 비교를 (색상, 사이즈) key 의 diff_options 로 변경 (update_options)
 
         """
         try:
@@ -651,116 +1759,159 @@ class ProductService:
             # 선분 관리할 시간 생성
             now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-            # 옵션의 변경 발생 -> 옵션정보 수정 및 옵션 삭제(재고수량(quantities Table) 포함)
-            if product_option['optionQuantity'] != option_quantity :
+            # 옵션 추가, 삭제, 수량 변경을 한번에 비교하여 변경 종류 별로 한번씩 저장
+            self.update_options(product_id, product_option['optionQuantity'], option_quantity, now, db_connection)
 
-                # request에만 존재하는 옵션을 저장
-                request_only_option = option_quantity
+            # 상품 상세 정보가 request(form-data)와 DB가 다른 경우
+            if product_detail != product_info:
 
-                # DB의 상품옵션(product_options)에 대해 for Loop
-                for db_option in product_option['optionQuantity']:
+                # 기존 선분은 close 신규 선분은 start 되는 datatime 선언
+                product_info['now'] = now
 
-                    # request에는 없고 DB에만 있는 상품옵션(product_option) 체크를 위한 Bool 변수
-                    is_option_db = False
+                # 새로 생성될 product_detail의 product_id 
+                product_info['product_id'] = product_id
 
-                    # request의 상품옵션(product_options)에 대해 for Loop
-                    for request_option in option_quantity:
+                # 기존 product_details row의 선분 close
+                self.product_dao.close_product_detail(now, product_id, db_connection)
 
-                        # option은 동일, 수량만 변경된 경우
-                        if request_option['color'] == db_option['color'] and request_option['size'] == db_option['size'] and request_option['quantity'] != db_option['quantity']:
+                # product_detail 테이블의 선분 신규 생성
+                self.product_dao.insert_product_detail(product_info, db_connection)
 
-                            # name으로 입력된 각 옵션의 id를 받아옴
-                            color_id = self.product_dao.select_color_id(request_option, db_connection)
-                            size_id  = self.product_dao.select_size_id(request_option, db_connection)
+            # 조회용 테이블 갱신 및 수정된 상품 정보가 노출되도록 상품 리스트, 상세정보 cache 삭제
+            self.refresh_catalog(product_id, db_connection)
 
-                            # insert_product_option 함수 인자를 줄이기 위해 option 정보 별도 저장
-                            request_option['color_id'] = color_id
-                            request_option['size_id']  = size_id
+            return None
 
-                            # 상품옵션 정보 Return
-                            product_option_id = self.product_dao.select_product_option_number(product_id, request_option, db_connection)
+        except Exception as e:
+            raise e
 
-                            # 기존 수량 정보(quantities 테이블) 선분이력 close
-                            self.product_dao.close_quantity(now, product_option_id, db_connection)
+    def update_options(self, product_id, db_options, request_options, now, db_connection):
 
-                            # 옵션에 해당하는 수량 정보 저장(선분 생성)
-                            self.product_dao.insert_quantity(now, product_option_id, request_option, db_connection)
+        """
 
-                            # DB에도 동일한 option 존재 체크
-                            is_option_db = True
+        상품수정 시 DB 옵션과 request 옵션을 diff_options 로 비교하여 변경된 옵션만 저장합니다.
+        옵션 수와 관계없이 삭제(soft delete) 1번, 수량 변경(기존 선분 close, 새 선분 insert) 2번,
+        추가(insert_options) 4번 이하의 query 로 처리합니다.
 
-                            # DB, request 모두 존재하는 옵션인 경우 제거
-                            request_only_option.remove(request_option)
+        Args:
+            product_id      : products Table PK
+            db_options      : select_product_option_to_compare 의 optionQuantity
+            request_options : request 의 optionQuantity
+                {
+                    color    : 색상 이름
+                    size     : 사이즈 이름
+                    quantity : 재고수량
+                }
+            now             : 선분이력 시작/close 시간
+            db_connection   : DATABASE Connection Instance
 
-                            break
+        Returns:
+            diff_options 결과 {added, removed, changed}
 
-                        # request에는 없고, DB에 남은 옵션을 체크
-                        if request_option['color'] == db_option['color'] and request_option['size'] == db_option['size']:
+        Author:
+            tnwjd060124@gmail.com (손수정)
 
-                            # DB에도 동일한 option 존재 체크
-                            is_option_db = True
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
 
-                            # DB, request 모두 존재하는 옵션인 경우 제거
-                            request_only_option.remove(request_option)
+        """
 
-                            break
+        try:
+            diff = diff_options(db_options, request_options)
+
+            # request 에서 빠진 옵션 soft delete
+            if diff['removed']:
+                self.product_dao.delete_product_options(
+                    now,
+                    [option['product_option_id'] for option in diff['removed']],
+                    db_connection
+                )
+
+            # 수량만 변경된 옵션은 기존 수량 선분 close 후 새 선분 생성
+            if diff['changed']:
+                self.product_dao.close_quantities(
+                    now,
+                    [option['product_option_id'] for option in diff['changed']],
+                    db_connection
+                )
+                self.product_dao.insert_quantities(
+                    now,
+                    [(option['product_option_id'], option['quantity']) for option in diff['changed']],
+                    db_connection
+                )
+
+            # request 에만 있는 옵션 추가
+            self.insert_options(product_id, diff['added'], now, db_connection)
+
+            return diff
 
-                    # request(수정사항)에 새로 추가된 상품옵션(product_options) DB 상품옵션 soft delete
-                    if not is_option_db:
+        except Exception as e:
+            raise e
 
-                        # name으로 입력된 각 옵션의 id를 받아옴
-                        color_id = self.product_dao.select_color_id(db_option, db_connection)
-                        size_id  = self.product_dao.select_size_id(db_option, db_connection)
+    def update_product_status(self, product_ids, status, db_connection):
 
-                        # insert_product_option 함수 인자를 줄이기 위해 option 정보 별도 저장
-                        db_option['color_id'] = color_id
-                        db_option['size_id']  = size_id
+        """
 
-                        # 상품 옵션 삭제 처리를 위해 product option number select
-                        product_option_id = self.product_dao.select_product_option_number(product_id, db_option, db_connection)
+        판매/진열여부 일괄변경 - Business Layer(service) function
 
-                        # request(수정사항)에 새로 추가된 상품옵션(product_options) DB 상품옵션 soft delete 실행
-                        self.product_dao.delete_product_option(now, product_option_id, db_connection)
+        상품수정과 달리 이미지, 옵션은 비교하지 않고 상세정보 이력만 판매/진열여부를 바꾼 새 이력으로 교체합니다.
+        PRODUCT_STATUS_CHUNK_SIZE 개씩 나누어 chunk 마다 현재 이력 lock 조회, 새 이력 insert, 기존 이력 close,
+        조회용 테이블 갱신 4번의 SQL 만 실행하므로 상품 수가 늘어도 chunk 당 SQL 수는 같습니다.
+        모든 chunk 는 요청의 transaction 하나로 commit 됩니다.
 
-                # request에만 존재하는 option 정보 product_options 테이블에 insert
-                for option in request_only_option:
+        Args:
+            product_ids   : 상품 id 리스트
+            status        : {sellYn : 판매여부(1|0|None), exhibitionYn : 진열여부(1|0|None)} (None 이면 기존 값 유지)
+            db_connection : DATABASE Connection Instance
 
-                    # name으로 입력된 각 옵션의 id를 받아옴
-                    color_id = self.product_dao.select_color_id(option, db_connection)
-                    size_id  = self.product_dao.select_size_id(option, db_connection)
+        Returns:
+            {
+                updated   : 변경된 상품 id 리스트,
+                unchanged : 이미 요청한 상태인 상품 id 리스트,
+                missing   : 없는(삭제된) 상품 id 리스트
+            }
 
-                    # insert_product_option 함수 인자를 줄이기 위해 option 정보 별도 저장
-                    option['color_id'] = color_id
-                    option['size_id']  = size_id
+        Author:
+            tnwjd060124@gmail.com (손수정)
 
-                    # product_id 설정
-                    product_info['product_id'] = product_id
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기생성
 
-                    # 옵션 정보 저장
-                    product_option_id = self.product_dao.insert_product_option(product_info, option, db_connection)
+        """
 
-                    # 옵션에 해당하는 수량 정보 저장
-                    self.product_dao.insert_quantity(now, product_option_id, option, db_connection)
+        now         = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        product_ids = list(dict.fromkeys(product_ids))
+        result      = {'updated' : [], 'unchanged' : [], 'missing' : []}
 
-            # 상품 상세 정보가 request(form-data)와 DB가 다른 경우
-            if product_detail != product_info:
+        for start in range(0, len(product_ids), PRODUCT_STATUS_CHUNK_SIZE):
+            chunk   = product_ids[start:start + PRODUCT_STATUS_CHUNK_SIZE]
+            current = {row['product_id'] : row for row in self.product_dao.select_current_product_status(chunk, db_connection)}
 
-                # 기존 선분은 close 신규 선분은 start 되는 datatime 선언
-                product_info['now'] = now
+            # 요청한 상태와 다른 상품만 새 이력 생성
+            changed = [
+                row
+                for row in current.values()
+                if (status['sellYn'] is not None and row['is_activated'] != status['sellYn'])
+                or (status['exhibitionYn'] is not None and row['is_displayed'] != status['exhibitionYn'])
+            ]
 
-                # 새로 생성될 product_detail의 product_id 
-                product_info['product_id'] = product_id
+            changed_ids = {row['product_id'] for row in changed}
 
-                # 기존 product_details row의 선분 close
-                self.product_dao.close_product_detail(now, product_id, db_connection)
+            result['missing'].extend(product_id for product_id in chunk if product_id not in current)
+            result['unchanged'].extend(product_id for product_id in chunk if product_id in current and product_id not in changed_ids)
 
-                # product_detail 테이블의 선분 신규 생성
-                self.product_dao.insert_product_detail(product_info, db_connection)
+            if not changed:
+                continue
 
-            return None
+            self.product_dao.update_product_status(now, [row['product_detail_no'] for row in changed], status, db_connection)
+            self.product_dao.update_product_catalog_status(changed_ids, status, db_connection)
 
-        except Exception as e:
-            raise e
+            result['updated'].extend(product_id for product_id in chunk if product_id in changed_ids)
+
+        if result['updated']:
+            self.invalidate_catalog(*result['updated'])
+
+        return result
 
     def update_product_image(self, images, product_id, s3_connection, db_connection):
 
@@ -783,6 +1934,9 @@ class ProductService:
 
         History:
             2020-09-09 (sincerity410@gmail.com) : 초기생성
+            2026-10-18 (tnwjd060124@gmail.com) : 이미지 insert 를 multi-row insert(insert_images)로 변경
+            2026-10-18 (tnwjd060124@gmail.com) : 상품 리스트, 상세정보 cache invalidate
+            2026-10-18 (tnwjd060124@gmail.com) : 조회용 테이블(product_catalog_current) 갱신
 
         """
 
@@ -825,9 +1979,10 @@ class ProductService:
             self.product_dao.delete_image(product_id, db_connection)
 
             # 사진크기 별 product_image(최대 5개)에 대해 image URL insert & product_images(매핑테이블) insert
-            for product_image_no, image_url in resized_image.items() :
-                image_no = self.product_dao.insert_image(image_url, db_connection)
-                self.product_dao.insert_product_image(product_id, image_no, product_image_no, db_connection)
+            self.insert_images(product_id, resized_image, db_connection)
+
+            # 조회용 테이블 갱신 및 수정된 이미지가 노출되도록 상품 리스트, 상세정보 cache 삭제
+            self.refresh_catalog(product_id, db_connection)
 
             return None
 
@@ -183,7 +183,7 @@ class UserService:
 
         return total_number
 
-    def get_user_orders(self, user_info, db_connection):
+    def get_user_orders(self, user_info, db_connection, stream=False):
 
         """
 
@@ -193,6 +193,7 @@ class UserService:
             user_info:
                 user_no : 유저의 pk
             db_connection: 연결된 db 객체
+            stream: True 이면 주문 정보를 한 건씩 돌려주는 generator 를 Return
 
         Returns:
             유저의 주문 정보
@@ -202,6 +203,7 @@ class UserService:
 
         History:
             2020-08-28 (tnwjd060124@gmail.com) : 초기 생성
+            2026-10-18 (tnwjd060124@gmail.com) : stream 모드 추가
 
         """
 
@@ -211,7 +213,7 @@ class UserService:
         if user:
 
             # 유저의 주문 정보를 가져오는 메소드 실행
-            orders = self.user_dao.get_user_orders(user, db_connection)
+            orders = self.user_dao.get_user_orders(user, db_connection, stream)
 
             return orders
 
@@ -0,0 +1,4 @@
+import os, sys
+
+# backend 의 모듈(utils, cache, pricing ...)을 앱과 같이 최상위 이름으로 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,60 @@
+from cache import TTLCache, MISSING
+
+def test_invalidate_tags_removes_only_tagged_entries():
+    cache = TTLCache()
+    cache.set('list', 1, tags=('product_list',))
+    cache.set('detail', 2, tags=('product:1',))
+
+    assert cache.invalidate_tags('product_list') == 1
+    assert cache.get('list') is MISSING
+    assert cache.get('detail') == 2
+
+def test_load_is_not_stored_when_its_tag_is_invalidated_during_load():
+    cache = TTLCache()
+
+    def loader():
+        cache.invalidate_tags('product:1')
+        return 'stale'
+
+    assert cache.get_or_load('detail', loader, tags=('product:1',)) == 'stale'
+    assert cache.get('detail') is MISSING
+    assert cache.stats()['stale_loads'] == 1
+
+def test_load_is_stored_when_another_tag_is_invalidated_during_load():
+    cache = TTLCache()
+
+    def loader():
+        cache.invalidate_tags('product:2')
+        return 'fresh'
+
+    cache.get_or_load('detail', loader, tags=('product:1',))
+
+    assert cache.get('detail') == 'fresh'
+
+def test_load_is_not_stored_when_cache_is_cleared_during_load():
+    cache = TTLCache()
+
+    def loader():
+        cache.clear()
+        return 'stale'
+
+    cache.get_or_load('detail', loader, tags=('product:1',))
+
+    assert cache.get('detail') is MISSING
+
+def test_callable_ttl_is_capped_at_default_ttl(monkeypatch):
+    now   = [1000.0]
+    cache = TTLCache(ttl=60)
+    monkeypatch.setattr('cache.time.monotonic', lambda : now[0])
+
+    cache.get_or_load('short', lambda : 1, ttl=lambda : 5)
+    cache.get_or_load('long', lambda : 2, ttl=lambda : 600)
+    cache.get_or_load('none', lambda : 3, ttl=lambda : None)
+
+    now[0] += 6
+    assert cache.get('short') is MISSING
+    assert cache.get('long') == 2
+
+    now[0] += 60
+    assert cache.get('long') is MISSING
+    assert cache.get('none') is MISSING
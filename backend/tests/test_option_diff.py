@@ -0,0 +1,47 @@
+import copy
+
+import pytest
+
+from option_diff import diff_options
+
+DB_OPTIONS = [
+    {'product_option_id' : 1, 'color' : 'Black', 'size' : 'S', 'quantity' : 10},
+    {'product_option_id' : 2, 'color' : 'Black', 'size' : 'M', 'quantity' : 10},
+    {'product_option_id' : 3, 'color' : 'White', 'size' : 'S', 'quantity' : 10}
+]
+
+def test_diff_options_splits_added_removed_changed():
+    request_options = [
+        {'color' : 'Black', 'size' : 'S', 'quantity' : 10},
+        {'color' : 'Black', 'size' : 'M', 'quantity' : 20},
+        {'color' : 'White', 'size' : 'M', 'quantity' : 5}
+    ]
+
+    assert diff_options(DB_OPTIONS, request_options) == {
+        'added'   : [{'color' : 'White', 'size' : 'M', 'quantity' : 5}],
+        'removed' : [{'product_option_id' : 3, 'color' : 'White', 'size' : 'S', 'quantity' : 10}],
+        'changed' : [{'color' : 'Black', 'size' : 'M', 'quantity' : 20, 'product_option_id' : 2}]
+    }
+
+def test_diff_options_compares_quantity_as_int():
+    request_options = [{'color' : 'Black', 'size' : 'S', 'quantity' : '10'}]
+
+    assert diff_options(DB_OPTIONS[:1], request_options) == {'added' : [], 'removed' : [], 'changed' : []}
+
+def test_diff_options_does_not_modify_inputs():
+    db_options      = copy.deepcopy(DB_OPTIONS)
+    request_options = [{'color' : 'Black', 'size' : 'S', 'quantity' : 30}]
+
+    diff_options(db_options, request_options)
+
+    assert db_options == DB_OPTIONS
+    assert request_options == [{'color' : 'Black', 'size' : 'S', 'quantity' : 30}]
+
+def test_diff_options_rejects_duplicated_request_option():
+    request_options = [
+        {'color' : 'Black', 'size' : 'S', 'quantity' : 10},
+        {'color' : 'Black', 'size' : 'S', 'quantity' : 20}
+    ]
+
+    with pytest.raises(Exception, match='DUPLICATED_OPTION'):
+        diff_options(DB_OPTIONS, request_options)
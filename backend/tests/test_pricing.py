@@ -0,0 +1,101 @@
+import datetime
+
+import pytest
+
+from pricing import (
+    DISCOUNT_END_MARGIN,
+    get_discount_rate,
+    get_effective_price,
+    get_next_boundary,
+    get_last_boundary,
+    get_price_ttl
+)
+
+START = datetime.datetime(2026, 10, 1, 0, 0, 0)
+END   = datetime.datetime(2026, 10, 31, 23, 59, 59)
+
+BEFORE = START - datetime.timedelta(days=1)
+DURING = datetime.datetime(2026, 10, 15, 12, 0, 0)
+AFTER  = END + datetime.timedelta(days=1)
+
+@pytest.mark.parametrize('discount_rate, start, end, now, expected', [
+    # 할인율이 없으면 할인하지 않음
+    (None, START, END, DURING, 0),
+    (0, START, END, DURING, 0),
+    # 시작일시가 없으면 무기한 할인
+    (10, None, None, DURING, 10),
+    (10, None, END, AFTER, 10),
+    # 종료일시만 없으면 할인하지 않음 (NOW() BETWEEN start AND NULL)
+    (10, START, None, DURING, 0),
+    # 시작일시, 종료일시 모두 포함
+    (10, START, END, BEFORE, 0),
+    (10, START, END, START, 10),
+    (10, START, END, DURING, 10),
+    (10, START, END, END, 10),
+    (10, START, END, END + DISCOUNT_END_MARGIN, 0)
+])
+def test_get_discount_rate(discount_rate, start, end, now, expected):
+    assert get_discount_rate(discount_rate, start, end, now) == expected
+
+@pytest.mark.parametrize('now, expected', [
+    (BEFORE, START),
+    (START, END + DISCOUNT_END_MARGIN),
+    (DURING, END + DISCOUNT_END_MARGIN),
+    (END, END + DISCOUNT_END_MARGIN),
+    (AFTER, None)
+])
+def test_get_next_boundary(now, expected):
+    assert get_next_boundary(10, START, END, now) == expected
+
+@pytest.mark.parametrize('now, expected', [
+    (BEFORE, None),
+    (START, START),
+    (DURING, START),
+    (END, START),
+    (END + DISCOUNT_END_MARGIN, END + DISCOUNT_END_MARGIN),
+    (AFTER, END + DISCOUNT_END_MARGIN)
+])
+def test_get_last_boundary(now, expected):
+    assert get_last_boundary(10, START, END, now) == expected
+
+@pytest.mark.parametrize('discount_rate, start, end', [
+    (None, START, END),
+    (0, START, END),
+    (10, None, None),
+    (10, START, None),
+    (10, END, START)
+])
+def test_boundaries_are_none_when_rate_never_changes(discount_rate, start, end):
+    for now in (BEFORE, DURING, AFTER):
+        assert get_next_boundary(discount_rate, start, end, now) is None
+        assert get_last_boundary(discount_rate, start, end, now) is None
+
+def test_next_boundary_changes_the_applied_rate():
+    boundary = get_next_boundary(10, START, END, DURING)
+
+    assert get_discount_rate(10, START, END, boundary - DISCOUNT_END_MARGIN) == 10
+    assert get_discount_rate(10, START, END, boundary) == 0
+
+def test_get_effective_price():
+    product = {
+        'price'               : 15900,
+        'discount_rate'       : 10,
+        'discount_start_date' : START,
+        'discount_end_date'   : END
+    }
+
+    assert get_effective_price(product, DURING) == {
+        'applied_discount_rate' : 10,
+        'sales_price'           : 14310,
+        'price_expires_at'      : END + DISCOUNT_END_MARGIN
+    }
+    assert get_effective_price(product, AFTER) == {
+        'applied_discount_rate' : 0,
+        'sales_price'           : 15900,
+        'price_expires_at'      : None
+    }
+
+def test_get_price_ttl():
+    assert get_price_ttl(None, DURING) is None
+    assert get_price_ttl(DURING + datetime.timedelta(seconds=30), DURING) == 30
+    assert get_price_ttl(DURING - datetime.timedelta(seconds=30), DURING) == 1
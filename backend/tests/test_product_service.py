@@ -0,0 +1,57 @@
+import decimal
+
+import pytest
+
+from cache                   import TTLCache
+from utils                   import encode_cursor
+from service.product_service import ProductService
+
+class ProductListDao:
+
+    # select_product_list 에 전달된 조건을 기록하고 빈 결과를 Return
+    def __init__(self):
+        self.calls = []
+
+    def select_product_list(self, page_info, db_connection):
+        self.calls.append(page_info)
+        return []
+
+def get_page_info(sort, cursor):
+    return {
+        'sort'             : sort,
+        'main_category_id' : None,
+        'sub_category_id'  : None,
+        'cursor'           : cursor,
+        'limit'            : 10
+    }
+
+@pytest.fixture
+def product_dao():
+    return ProductListDao()
+
+@pytest.fixture
+def product_service(product_dao):
+    return ProductService(product_dao, TTLCache(name='test'), dimension_cache=object())
+
+def test_price_cursor_passes_decimal_sort_key(product_service, product_dao):
+    cursor = encode_cursor({'product_no' : 10, 'sort' : 'price_asc', 'sort_key' : '15900.00'})
+
+    product_service.get_product_list(get_page_info('price_asc', cursor), {'etag' : 'v1'}, None)
+
+    assert product_dao.calls[0]['cursor'] == 10
+    assert product_dao.calls[0]['sort_key'] == decimal.Decimal('15900.00')
+
+@pytest.mark.parametrize('sort_key', ['NaN', 'sNaN', 'Infinity', '-Infinity', 'not-a-number'])
+def test_cursor_with_invalid_sort_key_is_rejected(product_service, product_dao, sort_key):
+    cursor = encode_cursor({'product_no' : 10, 'sort' : 'price_asc', 'sort_key' : sort_key})
+
+    with pytest.raises(ValueError, match='INVALID_CURSOR'):
+        product_service.get_product_list(get_page_info('price_asc', cursor), {'etag' : 'v1'}, None)
+
+    assert product_dao.calls == []
+
+def test_cursor_of_another_sort_is_rejected(product_service, product_dao):
+    cursor = encode_cursor({'product_no' : 10, 'sort' : 'discount', 'sort_key' : '10'})
+
+    with pytest.raises(ValueError, match='INVALID_CURSOR'):
+        product_service.get_product_list(get_page_info('price_asc', cursor), {'etag' : 'v1'}, None)
@@ -0,0 +1,27 @@
+import pytest
+
+from utils import encode_cursor, decode_cursor, escape_csv_cell
+
+def test_cursor_round_trip():
+    position = {'product_no' : 1234, 'sort' : 'price_asc', 'sort_key' : '15900'}
+
+    assert decode_cursor(encode_cursor(position)) == position
+
+def test_cursor_is_url_safe_without_padding():
+    token = encode_cursor({'product_no' : 1})
+
+    assert '=' not in token
+    assert '+' not in token and '/' not in token
+
+@pytest.mark.parametrize('token', ['', 'not-a-cursor!', encode_cursor([1, 2]), encode_cursor(1234)])
+def test_decode_cursor_rejects_invalid_token(token):
+    with pytest.raises(ValueError, match='INVALID_CURSOR'):
+        decode_cursor(token)
+
+@pytest.mark.parametrize('value', ['=1+1', '+1', '-1', '@SUM(A1)', '\tcmd', '\rcmd', "=HYPERLINK(\"http://x\")"])
+def test_escape_csv_cell_prefixes_formula_strings(value):
+    assert escape_csv_cell(value) == "'" + value
+
+@pytest.mark.parametrize('value', ['브랜디 티셔츠', 'a=b', '', None, -1, 15900, 1.5])
+def test_escape_csv_cell_keeps_other_values(value):
+    assert escape_csv_cell(value) == value
@@ -1,12 +1,19 @@
-import time, jwt, io
+import time, jwt, io, csv, base64, hashlib, datetime
 from PIL        import Image
 from functools  import wraps
+from werkzeug   import http
 
 from flask_request_validator import AbstractRule
-from flask                   import request, jsonify
+from flask                   import request, jsonify, json, current_app, Response, stream_with_context
 
 from config import SECRET, S3
 
+# DB 연결의 time_zone (Asia/Seoul), DB 에서 조회한 시각을 HTTP header(GMT) 로 변환할 때 사용
+DATABASE_TIMEZONE = datetime.timezone(datetime.timedelta(hours=9))
+
+# 스프레드시트에서 수식으로 해석되는 CSV 셀의 시작 문자
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
 class DatetimeRule(AbstractRule):
 
     def validate(self, value):
@@ -70,6 +77,73 @@ class PageRule(AbstractRule):
 
         return errors
 
+class CursorRule(AbstractRule):
+
+    def validate(self, value):
+
+        """
+
+        cursor 정보로 들어온 token 이 encode_cursor 로 만든 token 인지 확인합니다.
+
+        Args:
+            value: query string cursor
+
+        Returns:
+            errors: decode 할 수 없는 token 이면 value를 담은 list
+                    유효성 검사를 통과하면 빈 list
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        errors = []
+
+        try:
+            decode_cursor(value)
+
+        except ValueError:
+            errors.append(value)
+
+        return errors
+
+class IdListRule(AbstractRule):
+
+    def validate(self, value):
+
+        """
+
+        id 목록으로 들어온 값이 쉼표로 구분된 1 이상의 숫자들인지 확인합니다. (ex. 3,1,2)
+
+        Args:
+            value: query string ids
+
+        Returns:
+            errors: 숫자가 아닌 값이나 0 이하의 값이 있으면 value를 담은 list
+                    유효성 검사를 통과하면 빈 list
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        errors = []
+
+        try:
+            if any(int(product_id) < 1 for product_id in value.split(',')):
+                errors.append(value)
+
+        except ValueError:
+            errors.append(value)
+
+        return errors
+
 class LimitRule(AbstractRule):
 
     def validate(self, value):
@@ -343,3 +417,303 @@ def catch_exception(func, *args, **kwargs):
             return jsonify({"message" : f"INVALID_PARAMETER_{e}"}), 400
 
     return wrapper
+
+def is_stream_response_enabled():
+
+    """
+
+    주문 목록(/mypage/orderlist) 응답을 chunked JSON 으로 stream 할지 여부를 Return 합니다.
+    config 의 STREAM_LIST_RESPONSE 로 설정하며 기본값은 False 입니다.
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    return current_app.config.get('STREAM_LIST_RESPONSE', False)
+
+def stream_json_response(rows, key='data', chunk_size=100):
+
+    """
+
+    row generator 를 {key : [row, ...]} 형태의 JSON 으로 나누어 전송하는 Response 를 Return 합니다.
+    응답 body 는 jsonify({key : list(rows)}) 와 같은 JSON 이지만, 전체 list 를 메모리에 만들지 않습니다.
+
+    요청 context 는 전송이 끝날 때까지 유지되므로 DB session 도 전송이 끝난 뒤 반납됩니다.
+
+    Args:
+        rows       : JSON 으로 변환할 row iterable
+        key        : 최상위 key
+        chunk_size : 한번에 전송할 row 수
+
+    Returns:
+        200, chunked JSON Response
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    def generate():
+        yield f'{{{json.dumps(key)}:['
+
+        chunk     = []
+        separator = ''
+
+        for row in rows:
+            chunk.append(json.dumps(row))
+
+            if len(chunk) >= chunk_size:
+                yield separator + ','.join(chunk)
+
+                chunk     = []
+                separator = ','
+
+        if chunk:
+            yield separator + ','.join(chunk)
+
+        yield ']}'
+
+    return Response(stream_with_context(generate()), status=200, mimetype='application/json')
+
+def escape_csv_cell(value):
+
+    """
+
+    스프레드시트에서 수식으로 실행되지 않도록 수식 시작 문자로 시작하는 문자열 셀 앞에 ' 를 붙입니다.
+    문자열이 아닌 값(숫자, 날짜 등)은 그대로 Return 합니다.
+
+    Args:
+        value : CSV 셀 값
+
+    Returns:
+        CSV 에 쓸 셀 값
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+
+    return value
+
+def stream_csv_response(rows, columns, filename, chunk_size=100):
+
+    """
+
+    row generator 를 CSV 파일로 나누어 전송하는 Response 를 Return 합니다.
+    전체 row 를 메모리에 만들지 않고 chunk_size 개씩 CSV 로 변환하여 바로 전송합니다.
+    Excel 에서 한글이 깨지지 않도록 UTF-8 BOM 을 붙입니다.
+
+    요청 context 는 전송이 끝날 때까지 유지되므로 DB session 도 전송이 끝난 뒤 반납됩니다.
+
+    Args:
+        rows       : CSV 로 변환할 row(dict) iterable
+        columns    : (row key, CSV header) 목록 (CSV 컬럼 순서)
+        filename   : 다운로드 파일 이름
+        chunk_size : 한번에 전송할 row 수
+
+    Returns:
+        200, chunked CSV Response
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+        2026-10-18 (tnwjd060124@gmail.com) : 수식으로 해석되는 문자열 셀을 escape_csv_cell 로 처리
+
+    """
+
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        buffer.write('\ufeff')
+        writer.writerow([header for key, header in columns])
+
+        for index, row in enumerate(rows, 1):
+            writer.writerow([escape_csv_cell(row[key]) for key, header in columns])
+
+            if index % chunk_size == 0:
+                yield buffer.getvalue()
+
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue()
+
+    response = Response(stream_with_context(generate()), status=200, mimetype='text/csv')
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+    return response
+
+def encode_cursor(position):
+
+    """
+
+    keyset pagination 의 다음 페이지 위치를 client 에 전달할 token 으로 만듭니다.
+    client 는 token 의 내용을 알 필요 없이 다음 요청의 cursor 로 그대로 전달합니다.
+
+    Args:
+        position : 마지막 row 의 정렬 key Dictionary (ex: {'product_no' : 1234})
+
+    Returns:
+        url-safe base64 token
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    payload = json.dumps(position, separators=(',', ':')).encode('utf-8')
+
+    return base64.urlsafe_b64encode(payload).rstrip(b'=').decode('ascii')
+
+def decode_cursor(token):
+
+    """
+
+    encode_cursor 로 만든 token 을 정렬 key Dictionary 로 되돌립니다.
+
+    Args:
+        token : cursor token
+
+    Returns:
+        정렬 key Dictionary
+
+    Raises:
+        ValueError('INVALID_CURSOR') : 잘못된 token
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    try:
+        payload  = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        position = json.loads(payload.decode('utf-8'))
+
+    except Exception:
+        raise ValueError('INVALID_CURSOR')
+
+    if not isinstance(position, dict):
+        raise ValueError('INVALID_CURSOR')
+
+    return position
+
+def make_version(fingerprint, last_modified=None, compare_last_modified=True):
+
+    """
+
+    응답 내용이 바뀔 때 함께 바뀌는 값(fingerprint)으로 조건부 요청에 사용할 version 을 만듭니다.
+
+    Args:
+        fingerprint           : 응답 내용의 version 을 나타내는 값 (상품 번호, 갱신일시, 적용 할인율 등의 tuple)
+        last_modified         : 응답 내용이 마지막으로 바뀐 시각 (DB time_zone 기준)
+        compare_last_modified : If-Modified-Since 로도 변경 여부를 판단할지 여부
+                                (목록에서 빠진 row 처럼 last_modified 에 반영되지 않는 변경이 있으면 False)
+
+    Returns:
+        {
+            'etag'                  : fingerprint 의 hash,
+            'last_modified'         : GMT 기준 시각 (없으면 None),
+            'compare_last_modified' : compare_last_modified
+        }
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if last_modified is not None:
+        last_modified = last_modified.replace(tzinfo=DATABASE_TIMEZONE).astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+    return {
+        'etag'                  : hashlib.sha1(repr(fingerprint).encode('utf-8')).hexdigest(),
+        'last_modified'         : last_modified,
+        'compare_last_modified' : compare_last_modified
+    }
+
+def is_not_modified(version):
+
+    """
+
+    요청의 If-None-Match(없으면 If-Modified-Since) 와 version 이 같은지 확인합니다.
+
+    Args:
+        version : make_version() 의 결과
+
+    Returns:
+        이전 응답과 같은 version 이면 True
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    last_modified = version['last_modified'] if version['compare_last_modified'] else None
+
+    return not http.is_resource_modified(request.environ, etag=version['etag'], last_modified=last_modified)
+
+def conditional_json_response(body, version):
+
+    """
+
+    ETag, Last-Modified header 를 붙인 JSON 응답을 Return 합니다.
+    요청의 If-None-Match(없으면 If-Modified-Since) 와 version 이 같으면 JSON 변환 없이 304 를 응답합니다.
+    body 에 함수를 넘기면 304 가 아닌 경우에만 호출하므로, version 을 따로 계산할 수 있으면
+    응답 body 를 만드는 조회 없이 304 를 응답할 수 있습니다.
+
+    Cache-Control: no-cache 로 browser, CDN 이 저장한 응답을 사용하기 전에 항상 다시 확인하도록 합니다.
+
+    Args:
+        body    : JSON 으로 변환할 응답 body 또는 body 를 만드는 함수 (인자 없음)
+        version : make_version() 의 결과
+
+    Returns:
+        200 JSON 응답 또는 304
+
+    Author:
+        tnwjd060124@gmail.com (손수정)
+
+    History:
+        2026-10-18 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if is_not_modified(version):
+        response = Response(status=304)
+    else:
+        response = jsonify(body() if callable(body) else body)
+
+    response.set_etag(version['etag'])
+    response.headers['Cache-Control'] = 'no-cache'
+
+    if version['last_modified'] is not None:
+        response.last_modified = version['last_modified']
+
+    return response